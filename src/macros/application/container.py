@@ -1,58 +1,190 @@
 """Container wires infrastructure adapters to domain ports."""
 
-from macros.domain.model.agent_config import AgentConfig
+from pathlib import Path
+from typing import Iterable, Mapping
+
+from macros.domain.model.agent_config import AgentConfig, resolve_agent_limit
 from macros.domain.ports.agent_port import AgentPort
+from macros.domain.ports.console_port import ConsolePort
+from macros.domain.ports.lifecycle_hooks_port import LifecycleHooks
+from macros.domain.services.hooks import HookDispatcher
 from macros.domain.services.phase_executor import AgentFactory
 from macros.domain.services.prompt_builder import PromptBuilder
 from macros.domain.services.phase_executor import PhaseExecutor
 from macros.domain.services.workflow_executor import WorkflowExecutor
-from macros.infrastructure.persistence import FileRunStore, FileWorkflowStore
+from macros.infrastructure.persistence import (
+    FilePhaseMemo,
+    FileRunStore,
+    FileStepCache,
+    FileWorkflowStore,
+)
 from macros.infrastructure.runtime import (
+    Cassette,
     CursorAgentAdapter,
+    GitWorkspaceAdapter,
+    HostRateLimiter,
+    JsonConsoleAdapter,
+    RateLimitedAgent,
+    RecordingAgent,
+    RecordingCommand,
+    ReplayAgent,
+    ReplayCommand,
     StdConsoleAdapter,
     SubprocessCommandAdapter,
+    get_workspace,
+    load_agent_limits,
+    load_hook_plugins,
 )
+from macros.infrastructure.telemetry import PrometheusTextfileExporter
 
 
 class Container:
-    """Infrastructure wiring -- adapters for external systems."""
+    """Infrastructure wiring -- adapters for external systems.
+
+    With `workspace_dir` every store and adapter is pinned to that repository
+    and `env` is layered over the process environment for agent and command
+    subprocesses, so one process can host containers for several
+    repositories at once. Without it the workspace is resolved per call
+    (see use_workspace()).
+
+    Agents are throttled host-wide per engine/model when
+    .macrocycle/limits.json (or `limits_file`) configures a limit.
+
+    `log_format="json"` swaps the Rich console for NDJSON events on stdout,
+    or on the file descriptor `log_fd`.
+
+    Lifecycle hooks come from `hooks`, add_hook() and installed plugins
+    (the "macrocycle.hooks" entry point group); executors built afterwards
+    call them. Without any, executors skip hook dispatch entirely.
+
+    `record` saves every agent prompt and command result to a cassette file;
+    `replay` serves them back from one instead of calling agents or running
+    commands (sleeping the recorded latencies with `replay_latency`). Both
+    bypass the step cache and the phase memo so every call reaches the
+    cassette.
+
+    `agent_output="json"` asks agents for structured output so the tokens,
+    cost and model of every agent step are recorded on its StepRun;
+    "stream-json" additionally reports tool calls and edits as they happen.
+    """
 
     AGENT_REGISTRY: dict[str, type] = {
         "cursor": CursorAgentAdapter,
     }
 
-    def __init__(self, engine: str = "cursor"):
+    def __init__(
+        self,
+        engine: str = "cursor",
+        metrics_file: str | None = None,
+        workspace_dir: Path | str | None = None,
+        env: Mapping[str, str] | None = None,
+        limits_file: Path | str | None = None,
+        log_format: str = "text",
+        log_fd: int | None = None,
+        hooks: Iterable[LifecycleHooks] = (),
+        record: Path | str | None = None,
+        replay: Path | str | None = None,
+        replay_latency: bool = False,
+        agent_output: str = "text",
+    ):
         if engine not in self.AGENT_REGISTRY:
             raise ValueError(
                 f"Unknown engine '{engine}'. Supported: {sorted(self.AGENT_REGISTRY)}"
             )
+        if record and replay:
+            raise ValueError("record and replay are mutually exclusive")
         self._engine = engine
-        self.console = StdConsoleAdapter()
-        self.workflow_registry = FileWorkflowStore()
-        self.run_store = FileRunStore()
-        self.command = SubprocessCommandAdapter()
+        self._agent_output = agent_output
+        self.workspace_dir = Path(workspace_dir) if workspace_dir else None
+        self.env = dict(env) if env else None
+        self.console: ConsolePort = (
+            JsonConsoleAdapter(fd=log_fd) if log_format == "json" else StdConsoleAdapter()
+        )
+        self.workflow_registry = FileWorkflowStore(workspace_dir=self.workspace_dir)
+        self.run_store = FileRunStore(workspace_dir=self.workspace_dir)
+        self.command = SubprocessCommandAdapter(workspace_dir=self.workspace_dir, env=self.env)
+        self.workspace = GitWorkspaceAdapter(workspace_dir=self.workspace_dir)
+        self.step_cache = FileStepCache(workspace_dir=self.workspace_dir)
+        self.phase_memo = FilePhaseMemo(workspace_dir=self.workspace_dir)
+        self.metrics = PrometheusTextfileExporter(metrics_file) if metrics_file else None
+        self.agent_limits = load_agent_limits(
+            limits_file
+            or (self.workspace_dir or get_workspace()) / ".macrocycle" / "limits.json"
+        )
+        self.rate_limiter = HostRateLimiter()
+        self.hooks: list[LifecycleHooks] = [*hooks, *load_hook_plugins(self.console)]
+        self.cassette: Cassette | None = None
+        self._replaying = bool(replay)
+        self._replay_latency = replay_latency
+        if record:
+            self.cassette = Cassette(record, record=True)
+            self.command = RecordingCommand(self.command, self.cassette)
+        elif replay:
+            self.cassette = Cassette(replay)
+            self.command = ReplayCommand(self.cassette, replay_latency)
+
+    def add_hook(self, hook: LifecycleHooks) -> None:
+        """Register a lifecycle hook for executors built from now on."""
+        self.hooks.append(hook)
 
-    def agent_factory(self) -> AgentFactory:
+    def close(self) -> None:
+        """Flush output that adapters still buffer (the NDJSON console)."""
+        if isinstance(self.console, JsonConsoleAdapter):
+            self.console.close()
+
+    def agent_factory(self, console: ConsolePort | None = None) -> AgentFactory:
         """Returns a factory that creates agent instances from AgentConfig."""
         cls = self.AGENT_REGISTRY[self._engine]
-        console = self.console
+        console = console or self.console
+        workspace_dir = self.workspace_dir
+        env = self.env
+        limits = self.agent_limits
+        limiter = self.rate_limiter
+        cassette = self.cassette
+        output_format = self._agent_output
+        if self._replaying:
+            replay_latency = self._replay_latency
+            return lambda config: ReplayAgent(cassette, replay_latency)
 
         def factory(config: AgentConfig) -> AgentPort:
-            return cls(console=console)
+            agent = cls(
+                console=console, workspace_dir=workspace_dir, env=env,
+                output_format=output_format,
+            )
+            if cassette is not None:
+                agent = RecordingAgent(agent, cassette)
+            match = resolve_agent_limit(limits, config)
+            if match is None:
+                return agent
+            key, limit = match
+            return RateLimitedAgent(agent, limiter, key, limit)
 
         return factory
 
-    def workflow_executor(self) -> WorkflowExecutor:
-        """Build the fully wired workflow executor."""
+    def workflow_executor(self, console: ConsolePort | None = None) -> WorkflowExecutor:
+        """Build the fully wired workflow executor.
+
+        `console` redirects this executor's output (e.g. to a per-job log)
+        while sharing every other adapter with the container.
+        """
+        console = console or self.console
         prompt_builder = PromptBuilder()
+        hooks = HookDispatcher.create(self.hooks, console)
         phase_executor = PhaseExecutor(
-            agent_factory=self.agent_factory(),
+            agent_factory=self.agent_factory(console),
             command=self.command,
             prompt_builder=prompt_builder,
-            console=self.console,
+            console=console,
+            workspace=self.workspace,
+            step_cache=self.step_cache if self.cassette is None else None,
+            hooks=hooks,
         )
         return WorkflowExecutor(
             phase_executor=phase_executor,
             store=self.run_store,
-            console=self.console,
+            console=console,
+            metrics=self.metrics,
+            hooks=hooks,
+            memo=self.phase_memo if self.cassette is None else None,
+            workspace=self.workspace,
         )
@@ -1,3 +1,3 @@
-from .formatters import format_status
+from .formatters import format_status, format_stats, format_report, format_gc
 
-__all__ = ["format_status"]
+__all__ = ["format_status", "format_stats", "format_report", "format_gc"]
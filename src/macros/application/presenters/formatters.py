@@ -1,6 +1,10 @@
 """Formatting functions for CLI presentation."""
 
+from macros.domain.model.report import RunReport, TimeBreakdown
+from macros.domain.model.retention import GcReport
 from macros.domain.model.run import RunInfo
+from macros.domain.model.stats import Percentiles, RunStats
+from macros.domain.model.usage import Usage
 
 
 def format_status(info: RunInfo) -> str:
@@ -10,3 +14,148 @@ def format_status(info: RunInfo) -> str:
         f"  Phases:    {info.phase_count} completed",
         f"  Artifacts: {info.artifacts_dir}",
     ])
+
+
+def format_stats(stats: RunStats) -> str:
+    lines = [f"Runs analyzed: {stats.run_count}"]
+    for ps in stats.phases:
+        lines.extend([
+            "",
+            f"{ps.workflow_id}/{ps.phase_id}",
+            f"  Executions:     {ps.executions}  "
+            f"(converged {ps.converged}, exhausted {ps.exhausted}, failed {ps.failed})",
+            f"  Convergence:    {ps.convergence_rate:.1%}",
+            f"  Iterations:     {_format_iterations(ps.mean_iterations_to_converge, ps.iterations_to_converge)}",
+            f"  Step latency:   {_format_percentiles(ps.step_latency)}",
+            f"  Validation:     {_format_percentiles(ps.validation_latency)}",
+            f"  Exhausted time: {format_seconds(ps.exhausted_seconds)}",
+        ])
+    return "\n".join(lines)
+
+
+def format_report(report: RunReport) -> str:
+    b = report.breakdown
+    lines = [
+        f"Run {report.run_id} ({report.workflow_id}, {report.status})",
+        f"  Started:    {report.started_at.strftime('%Y-%m-%d %H:%M:%S')}",
+        f"  Wall time:  {format_seconds(report.wall_seconds)}",
+        f"  Agent:      {_format_share(b.agent_seconds, report.wall_seconds)}",
+        f"  Commands:   {_format_share(b.command_seconds, report.wall_seconds)}",
+        f"  Validation: {_format_share(b.validation_seconds, report.wall_seconds)}",
+        f"  Overhead:   {_format_share(b.overhead_seconds, report.wall_seconds)}",
+    ]
+    if report.usage is not None:
+        lines.append(f"  Usage:      {format_usage(report.usage)}")
+
+    if report.phases:
+        lines.extend(["", "Phases"])
+    for phase in report.phases:
+        outcome = f"{phase.outcome} ({phase.reason})" if phase.reason else phase.outcome
+        lines.append(
+            f"  {phase.phase_id}  {outcome}  {format_seconds(phase.wall_seconds)}  "
+            f"{_format_breakdown(phase.breakdown)}"
+        )
+        if phase.usage is not None:
+            lines.append(f"    usage  {format_usage(phase.usage)}")
+        if len(phase.iterations) > 1:
+            for it in phase.iterations:
+                lines.append(
+                    f"    #{it.iteration:<3} {format_seconds(it.breakdown.total_seconds)}  "
+                    f"{_format_breakdown(it.breakdown)}"
+                )
+
+    if report.slowest_steps:
+        lines.extend(["", "Slowest steps"])
+    for n, step in enumerate(report.slowest_steps, 1):
+        attempt = f" attempt {step.attempt}" if step.attempt is not None else ""
+        cached = " (cached)" if step.cached else ""
+        lines.append(
+            f"  {n}. {step.phase_id}/{step.step_id} #{step.iteration}{attempt}  "
+            f"{step.kind}  {format_seconds(step.seconds)}{cached}"
+        )
+
+    lines.extend([
+        "",
+        f"Wasted in exhausted phases: {report.wasted_iterations} iteration(s), "
+        f"{format_seconds(report.wasted_seconds)}",
+    ])
+    if report.critical_path_seconds is not None:
+        lines.append(
+            f"Critical path: {format_seconds(report.critical_path_seconds)}; "
+            f"phases in parallel would save at most {format_seconds(report.phase_savings)} "
+            f"(upper bound: only context dependencies, ignores the shared checkout)"
+        )
+    lines.append(
+        f"Command steps in parallel would save at most {format_seconds(report.step_savings)} "
+        f"(upper bound: ignores commands that depend on each other's files)"
+    )
+    return "\n".join(lines)
+
+
+def format_usage(usage: Usage) -> str:
+    parts = [f"prompts {format_bytes(usage.prompt_bytes)}"]
+    if usage.input_tokens is not None or usage.output_tokens is not None:
+        parts.append(f"tokens in {usage.input_tokens or 0:,} out {usage.output_tokens or 0:,}")
+    if usage.cache_read_tokens:
+        parts.append(f"cached {usage.cache_read_tokens:,}")
+    if usage.cost_usd is not None:
+        parts.append(f"cost ${usage.cost_usd:.4f}")
+    return "  ".join(parts)
+
+
+def format_gc(report: GcReport) -> str:
+    counts = (report.deleted, report.packed, report.cache_entries_pruned)
+    if report.dry_run:
+        return "Dry run: would delete {} run(s), pack {}, prune {} cache entries".format(*counts)
+    return "Deleted {} run(s), packed {}, pruned {} cache entries; freed {}".format(
+        *counts, format_bytes(report.bytes_freed)
+    )
+
+
+def format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, secs = divmod(int(round(seconds)), 60)
+    if minutes < 60:
+        return f"{minutes}m {secs:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+def _format_percentiles(p: Percentiles | None) -> str:
+    if p is None:
+        return "-"
+    return (
+        f"p50 {format_seconds(p.p50)}  p95 {format_seconds(p.p95)}  "
+        f"p99 {format_seconds(p.p99)}"
+    )
+
+
+def _format_share(seconds: float, wall: float) -> str:
+    share = f"  ({seconds / wall:.1%})" if wall else ""
+    return f"{format_seconds(seconds)}{share}"
+
+
+def _format_breakdown(b: TimeBreakdown) -> str:
+    return (
+        f"agent {format_seconds(b.agent_seconds)}  commands {format_seconds(b.command_seconds)}  "
+        f"validation {format_seconds(b.validation_seconds)}  "
+        f"overhead {format_seconds(b.overhead_seconds)}"
+    )
+
+
+def _format_iterations(mean: float | None, p: Percentiles | None) -> str:
+    if mean is None or p is None:
+        return "- (never converged)"
+    return f"mean {mean:.2f}  p50 {p.p50:g}  p95 {p.p95:g}  p99 {p.p99:g}"
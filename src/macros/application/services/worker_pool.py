@@ -0,0 +1,146 @@
+"""WorkerPool -- runs queued jobs on a fixed number of threads sharing one Container."""
+
+import threading
+import uuid
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+
+from macros.application.container import Container
+from macros.application.usecases.run_workflow import ExportMode, run_workflow
+from macros.domain.model.job import Job, JobStatus
+from macros.domain.model.run import RunStatus
+from macros.domain.ports.job_queue_port import JobQueuePort
+from macros.infrastructure.runtime.console import FileConsoleAdapter
+
+
+class QueueFullError(Exception):
+    """Raised when a submission would exceed the queue's admission limit."""
+
+
+class WorkerPool:
+    """Admission control plus a pool of workers draining a JobQueuePort.
+
+    Every job gets its own log file; all other adapters (stores, command
+    runner, metrics, parsed-workflow cache) are shared through the container.
+    Isolated jobs run concurrently in their own worktrees; jobs that run in
+    the shared checkout take turns. Jobs left running by a previous process
+    are requeued on start().
+    """
+
+    def __init__(
+        self,
+        container: Container,
+        queue: JobQueuePort,
+        log_dir: Path | str,
+        *,
+        workers: int = 2,
+        max_queued: int = 100,
+        poll_interval: float = 1.0,
+    ) -> None:
+        self._container = container
+        self._queue = queue
+        self._log_dir = Path(log_dir)
+        self._workers = workers
+        self._max_queued = max_queued
+        self._poll_interval = poll_interval
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._admission = threading.Lock()
+        self._checkout = threading.Lock()
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def queue(self) -> JobQueuePort:
+        return self._queue
+
+    def log_path(self, job_id: str) -> Path:
+        return self._log_dir / f"{job_id}.log"
+
+    def submit(
+        self,
+        workflow_id: str,
+        input_text: str,
+        *,
+        stop_after: str | None = None,
+        isolate: bool = False,
+        export: ExportMode = "branch",
+    ) -> Job:
+        """Queue a run. Raises WorkflowNotFoundError / WorkflowValidationError
+        for bad workflows and QueueFullError when admission is refused."""
+        self._container.workflow_registry.load_workflow(workflow_id)
+        job = Job(
+            id=uuid.uuid4().hex[:12],
+            workflow_id=workflow_id,
+            input_text=input_text,
+            status=JobStatus.QUEUED,
+            submitted_at=datetime.now(timezone.utc),
+            stop_after=stop_after,
+            isolate=isolate,
+            export=export,
+        )
+        with self._admission:
+            if self._queue.count(JobStatus.QUEUED) >= self._max_queued:
+                raise QueueFullError(f"queue is full ({self._max_queued} jobs waiting)")
+            self._queue.submit(job)
+        self._wake.set()
+        return job
+
+    def start(self) -> None:
+        requeued = self._queue.requeue_running()
+        if requeued:
+            self._container.console.warn(f"Requeued {requeued} interrupted job(s)")
+        for i in range(self._workers):
+            t = threading.Thread(target=self._work, name=f"macrocycle-worker-{i + 1}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop claiming new jobs and wait for running ones to finish."""
+        self._stopping.set()
+        self._wake.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads.clear()
+
+    def _work(self) -> None:
+        while not self._stopping.is_set():
+            job = self._queue.claim()
+            if job is None:
+                self._wake.wait(self._poll_interval)
+                self._wake.clear()
+                continue
+            self._execute(job)
+
+    def _execute(self, job: Job) -> None:
+        console = FileConsoleAdapter(self.log_path(job.id))
+        self._container.console.info(f"Job {job.id}: {job.workflow_id} started")
+        try:
+            # Only one job at a time may edit the shared checkout.
+            with nullcontext() if job.isolate else self._checkout:
+                run = run_workflow(
+                    self._container,
+                    job.workflow_id,
+                    job.input_text,
+                    stop_after=job.stop_after,
+                    isolate=job.isolate,
+                    export=job.export,
+                    console=console,
+                )
+            job.run_dir = run.artifacts_dir
+            if run.status == RunStatus.COMPLETED:
+                job.status = JobStatus.COMPLETED
+            else:
+                job.status = JobStatus.FAILED
+                job.error = run.failure_reason or f"run {run.status.value}"
+        except Exception as e:  # a failing job must not take its worker down
+            console.warn(f"Job failed: {e}")
+            job.status = JobStatus.FAILED
+            job.error = str(e) or type(e).__name__
+        job.finished_at = datetime.now(timezone.utc)
+        self._queue.update(job)
+        self._container.console.info(f"Job {job.id}: {job.status.value}")
@@ -2,10 +2,16 @@ from .run_workflow import run_workflow
 from .init_workspace import init_workspace
 from .list_workflows import list_workflows
 from .get_status import get_status
+from .get_stats import get_stats
+from .get_report import get_report
+from .collect_garbage import collect_garbage
 
 __all__ = [
     "run_workflow",
     "init_workspace",
     "list_workflows",
     "get_status",
+    "get_stats",
+    "get_report",
+    "collect_garbage",
 ]
@@ -0,0 +1,62 @@
+"""Use case: delete expired runs, pack the rest and prune the caches."""
+
+from macros.application.container import Container
+from macros.domain.model.retention import GcReport, RetentionPolicy
+from macros.domain.model.run import RunStatus
+from macros.domain.services.retention import select_expired
+
+
+def collect_garbage(
+    container: Container,
+    policy: RetentionPolicy,
+    *,
+    pack: bool = False,
+    dry_run: bool = False,
+) -> GcReport:
+    """Apply the retention policy to every run in the workspace.
+
+    With pack, surviving finished runs are compressed into one archive each.
+    An age cutoff also removes run directories left without a readable
+    manifest before then, and prunes step cache and phase memo entries
+    unused since then. A dry run only counts what would happen (bytes_freed
+    stays 0).
+    """
+    store = container.run_store
+    runs = list(store.iter_runs())
+    expired = select_expired(runs, policy)
+    expired_ids = {run.id for run in expired}
+
+    unreadable = []
+    if policy.older_than is not None:
+        unreadable = list(store.iter_unreadable_runs(policy.older_than))
+
+    bytes_freed = 0
+    if not dry_run:
+        for run in expired:
+            bytes_freed += store.delete_run(run.artifacts_dir)
+        for run_dir in unreadable:
+            bytes_freed += store.delete_run(run_dir)
+
+    packed = 0
+    if pack:
+        for run in runs:
+            if run.id in expired_ids or run.status is RunStatus.RUNNING:
+                continue
+            if store.is_packed(run.artifacts_dir):
+                continue
+            if not dry_run:
+                bytes_freed += store.pack_run(run.artifacts_dir)
+            packed += 1
+
+    pruned = 0
+    if policy.older_than is not None:
+        pruned = container.step_cache.prune(policy.older_than, dry_run=dry_run)
+        pruned += container.phase_memo.prune(policy.older_than, dry_run=dry_run)
+
+    return GcReport(
+        deleted=len(expired) + len(unreadable),
+        packed=packed,
+        cache_entries_pruned=pruned,
+        bytes_freed=bytes_freed,
+        dry_run=dry_run,
+    )
@@ -0,0 +1,23 @@
+"""Use case: break down where one run's time went."""
+
+from macros.application.container import Container
+from macros.domain.exceptions import MacrocycleError
+from macros.domain.model.report import RunReport
+from macros.domain.services.run_report import build_report
+
+
+def get_report(container: Container, run_id: str | None = None) -> RunReport | None:
+    """Report on a run, the latest one without run_id; None if it doesn't exist."""
+    if run_id is None:
+        info = container.run_store.get_latest_run()
+        if info is None:
+            return None
+        run_id = info.run_id
+    run = container.run_store.get_run(run_id)
+    if run is None:
+        return None
+    try:
+        workflow = container.workflow_registry.load_workflow(run.workflow_id)
+    except (MacrocycleError, ValueError):
+        workflow = None  # deleted or broken since: report without the phase graph
+    return build_report(run, workflow)
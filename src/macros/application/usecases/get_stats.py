@@ -0,0 +1,17 @@
+"""Use case: aggregate convergence and latency statistics across runs."""
+
+from datetime import datetime
+
+from macros.application.container import Container
+from macros.domain.model.stats import RunStats
+from macros.domain.services.run_statistics import RunStatistics
+
+
+def get_stats(
+    container: Container,
+    *,
+    workflow_id: str | None = None,
+    since: datetime | None = None,
+) -> RunStats:
+    runs = container.run_store.iter_runs(workflow_id=workflow_id, since=since)
+    return RunStatistics().add_all(runs).result()
@@ -1,7 +1,16 @@
 """Use case: run a workflow."""
 
+from typing import Literal
+
 from macros.application.container import Container
+from macros.domain.exceptions import WorkspaceError
 from macros.domain.model.run import Run
+from macros.domain.ports.console_port import ConsolePort
+from macros.domain.services.workflow_validator import WorkflowValidator
+
+ExportMode = Literal["branch", "patch"]
+
+PATCH_ARTIFACT = "changes.patch"
 
 
 def run_workflow(
@@ -10,7 +19,63 @@ def run_workflow(
     input_text: str,
     *,
     stop_after: str | None = None,
+    isolate: bool = False,
+    export: ExportMode = "branch",
+    console: ConsolePort | None = None,
 ) -> Run:
+    console = console or container.console
     workflow = container.workflow_registry.load_workflow(workflow_id)
-    executor = container.workflow_executor()
-    return executor.execute(workflow, input_text, stop_after=stop_after)
+    for warning in WorkflowValidator().warnings(workflow):
+        console.warn(warning)
+    executor = container.workflow_executor(console)
+    if not isolate:
+        return executor.execute(workflow, input_text, stop_after=stop_after)
+
+    workspace = container.workspace
+    workdir = workspace.create_worktree(f"run-{workflow_id}")
+    console.info(f"Isolated worktree: {workdir}")
+    try:
+        run = executor.execute(
+            workflow, input_text, stop_after=stop_after, workdir=workdir
+        )
+    except BaseException:
+        console.warn(f"Run interrupted; worktree kept at {workdir}")
+        raise
+
+    try:
+        _export(container, console, run, workdir, export)
+    finally:
+        workspace.remove_worktree(workdir)
+    return run
+
+
+def _export(
+    container: Container,
+    console: ConsolePort,
+    run: Run,
+    workdir: str,
+    mode: ExportMode,
+) -> None:
+    """Hand the isolated run's changes back as a branch or a patch artifact.
+
+    A branch that cannot be created (e.g. name taken) falls back to a patch
+    so the run's work is never discarded with its worktree.
+    """
+    patch = container.workspace.export_patch(workdir)
+    if not patch.strip():
+        console.info("No changes to export.")
+        return
+
+    if mode == "branch":
+        branch = f"macrocycle/{run.id}"
+        try:
+            container.workspace.export_branch(
+                workdir, branch, f"macrocycle: {run.workflow_id} run {run.id}"
+            )
+            console.info(f"Exported branch: {branch}")
+            return
+        except WorkspaceError as e:
+            console.warn(f"Branch export failed ({e}); writing a patch instead")
+
+    container.run_store.write_artifact(run.artifacts_dir, PATCH_ARTIFACT, patch)
+    console.info(f"Exported patch: {run.artifacts_dir}/{PATCH_ARTIFACT}")
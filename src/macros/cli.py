@@ -7,15 +7,23 @@ from typing import Annotated, Optional
 import typer
 
 from macros.application.container import Container
-from macros.application.presenters import format_status
+from macros.application.presenters import format_gc, format_report, format_stats, format_status
 from macros.application.usecases import (
     init_workspace,
     list_workflows,
     run_workflow,
     get_status,
+    get_stats,
+    get_report,
+    collect_garbage,
 )
-from macros.domain.exceptions import WorkflowNotFoundError
-from macros.infrastructure.runtime import resolve_input
+from macros.application.services.worker_pool import WorkerPool
+from macros.domain.exceptions import PhaseExecutionError, WorkflowNotFoundError, WorkspaceError
+from macros.domain.model.retention import RetentionPolicy
+from macros.infrastructure.persistence import SqliteJobQueue
+from macros.infrastructure.runtime import get_workspace, parse_since, resolve_input
+from macros.infrastructure.telemetry import RunProfiler
+from macros.server import make_server
 
 app = typer.Typer(no_args_is_help=True)
 
@@ -61,15 +69,159 @@ def status() -> None:
     container.console.echo(format_status(info))
 
 
+@app.command()
+def stats(
+    workflow: Optional[str] = typer.Option(None, "--workflow", "-w", help="Only this workflow"),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Only runs since a duration ago (7d, 12h) or an ISO date"
+    ),
+) -> None:
+    """Show convergence and latency statistics across runs."""
+    container = Container()
+    try:
+        since_dt = parse_since(since) if since else None
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--since")
+
+    result = get_stats(container, workflow_id=workflow, since=since_dt)
+    if not result.run_count:
+        container.console.warn("No runs found.")
+        raise typer.Exit(code=1)
+    container.console.echo(format_stats(result))
+
+
+@app.command()
+def report(
+    run_id: Optional[str] = typer.Argument(None, help="Run id (default: the latest run)"),
+) -> None:
+    """Show where a run's time went: phases, iterations, slowest steps."""
+    container = Container()
+    result = get_report(container, run_id)
+    if result is None:
+        container.console.warn(f"Run not found: {run_id}" if run_id else "No runs found.")
+        raise typer.Exit(code=1)
+    container.console.echo(format_report(result))
+
+
+@app.command()
+def gc(
+    keep_last: Optional[int] = typer.Option(
+        None, "--keep-last", min=0, help="Always keep the newest N runs"
+    ),
+    older_than: Optional[str] = typer.Option(
+        None, "--older-than", help="Delete runs started before a duration ago (30d) or an ISO date"
+    ),
+    pack: bool = typer.Option(
+        False, "--pack", help="Compress each remaining finished run into a single .tar.gz"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report what would change"),
+) -> None:
+    """Delete old runs, pack the rest and prune unused step cache entries."""
+    container = Container()
+    try:
+        cutoff = parse_since(older_than) if older_than else None
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--older-than")
+    if keep_last is None and cutoff is None and not pack:
+        container.console.warn("Nothing to do: pass --keep-last, --older-than or --pack.")
+        raise typer.Exit(code=2)
+
+    report = collect_garbage(
+        container,
+        RetentionPolicy(keep_last=keep_last, older_than=cutoff),
+        pack=pack,
+        dry_run=dry_run,
+    )
+    container.console.echo(format_gc(report))
+
+
 @app.command()
 def run(
     workflow_id: str,
     input_text: Optional[str] = typer.Argument(None),
     input_file: str = typer.Option(None, "--input-file", "-i"),
     until: Optional[str] = typer.Option(None, "--until", help="Stop after this phase id"),
+    metrics_file: Optional[str] = typer.Option(
+        None,
+        "--metrics-file",
+        envvar="MACROCYCLE_METRICS_FILE",
+        help="Prometheus textfile-collector path (e.g. /var/lib/node_exporter/macrocycle.prom)",
+    ),
+    isolate: bool = typer.Option(
+        False, "--isolate", help="Run in a private git worktree instead of the workspace"
+    ),
+    export: str = typer.Option(
+        "branch", "--export", help="How to hand back isolated changes: branch or patch"
+    ),
+    log_format: str = typer.Option(
+        "text", "--log-format", help="Console output: text, or json (one NDJSON event per line)"
+    ),
+    log_fd: Optional[int] = typer.Option(
+        None, "--log-fd", help="With --log-format json, write events to this file descriptor"
+    ),
+    record: Optional[str] = typer.Option(
+        None, "--record", help="Save agent and command results to this cassette file"
+    ),
+    replay: Optional[str] = typer.Option(
+        None, "--replay", help="Serve agent and command results from this cassette file"
+    ),
+    replay_latency: bool = typer.Option(
+        False, "--replay-latency", help="With --replay, wait the recorded durations"
+    ),
+    agent_output: str = typer.Option(
+        "text", "--agent-output",
+        help="Agent output: text; json to record tokens and cost; stream-json to also show progress live",
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Profile macrocycle itself; results go to the run dir"
+    ),
+    profile_memory: bool = typer.Option(
+        False, "--profile-memory", help="Also trace allocations per phase (implies --profile)"
+    ),
 ) -> None:
     """Run a workflow with the given input."""
-    container = Container()
+    if export not in ("branch", "patch"):
+        raise typer.BadParameter("must be 'branch' or 'patch'", param_hint="--export")
+    if log_format not in ("text", "json"):
+        raise typer.BadParameter("must be 'text' or 'json'", param_hint="--log-format")
+    if agent_output not in ("text", "json", "stream-json"):
+        raise typer.BadParameter(
+            "must be 'text', 'json' or 'stream-json'", param_hint="--agent-output"
+        )
+    if record and replay:
+        raise typer.BadParameter("cannot be combined with --record", param_hint="--replay")
+    if replay and not Path(replay).is_file():
+        raise typer.BadParameter(f"no such cassette: {replay}", param_hint="--replay")
+    profiler = RunProfiler(memory=profile_memory) if profile or profile_memory else None
+    container = Container(
+        metrics_file=metrics_file,
+        log_format=log_format,
+        log_fd=log_fd,
+        hooks=[profiler] if profiler else (),
+        record=record,
+        replay=replay,
+        replay_latency=replay_latency,
+        agent_output=agent_output,
+    )
+    try:
+        if profiler:
+            profiler.start()
+        _run(container, workflow_id, input_text, input_file, until, isolate, export)
+    finally:
+        if profiler:
+            profiler.close()
+        container.close()
+
+
+def _run(
+    container: Container,
+    workflow_id: str,
+    input_text: Optional[str],
+    input_file: Optional[str],
+    until: Optional[str],
+    isolate: bool,
+    export: str,
+) -> None:
     resolved = resolve_input(input_text, input_file)
 
     if not resolved:
@@ -77,10 +229,65 @@ def run(
         raise typer.Exit(code=2)
 
     try:
-        result = run_workflow(container, workflow_id, resolved, stop_after=until)
+        result = run_workflow(
+            container,
+            workflow_id,
+            resolved,
+            stop_after=until,
+            isolate=isolate,
+            export=export,
+        )
     except WorkflowNotFoundError:
         container.console.warn(f"Workflow not found: {workflow_id}")
         raise typer.Exit(code=1)
+    except WorkspaceError as e:
+        container.console.warn(f"Cannot isolate run: {e}")
+        raise typer.Exit(code=1)
+    except PhaseExecutionError as e:
+        container.console.warn(f"Run aborted: {e}")
+        raise typer.Exit(code=1)
 
     container.console.info(f"Done. Status: {result.status.value}")
     container.console.info(f"Run dir: {result.artifacts_dir}")
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Address to listen on"),
+    port: int = typer.Option(8765, "--port", help="TCP port to listen on"),
+    socket_path: Optional[str] = typer.Option(
+        None, "--socket", help="Listen on this Unix socket instead of TCP"
+    ),
+    workers: int = typer.Option(2, "--workers", min=1, help="Runs executed concurrently"),
+    max_queued: int = typer.Option(
+        100, "--max-queued", min=1, help="Reject submissions (HTTP 429) beyond this many waiting runs"
+    ),
+    isolate: bool = typer.Option(
+        True, "--isolate/--shared", help="Default for runs that don't say: own worktree or shared checkout (one run at a time)"
+    ),
+    metrics_file: Optional[str] = typer.Option(
+        None, "--metrics-file", envvar="MACROCYCLE_METRICS_FILE", help="Prometheus textfile-collector path"
+    ),
+) -> None:
+    """Serve a local HTTP API that queues runs for a pool of workers."""
+    container = Container(metrics_file=metrics_file)
+    state_dir = get_workspace() / ".macrocycle" / "server"
+    pool = WorkerPool(
+        container,
+        SqliteJobQueue(state_dir / "jobs.db"),
+        state_dir / "logs",
+        workers=workers,
+        max_queued=max_queued,
+    )
+    server = make_server(
+        pool, host=host, port=port, socket_path=socket_path, isolate_default=isolate
+    )
+    pool.start()
+    where = socket_path or f"http://{host}:{port}"
+    container.console.info(f"Serving on {where} with {workers} worker(s); Ctrl-C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        container.console.info("Stopping; unfinished runs are requeued on next start")
+    finally:
+        server.server_close()
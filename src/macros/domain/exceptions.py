@@ -15,3 +15,7 @@ class WorkflowNotFoundError(MacrocycleError):
 
 class PhaseExecutionError(MacrocycleError):
     """Raised when phase execution fails unrecoverably."""
+
+
+class WorkspaceError(MacrocycleError):
+    """Raised when a workspace operation (worktree, patch) fails."""
@@ -1,22 +1,50 @@
-from .agent_config import AgentConfig, resolve_agent_config
-from .step import LlmStep, CommandStep, Step
-from .workflow import Validation, Phase, Workflow
+from .artifact import Artifact
+from .usage import Usage, total_usage
+from .agent_config import AgentConfig, AgentLimit, resolve_agent_config, resolve_agent_limit
+from .step import Hedge, LlmStep, CommandStep, Step
+from .workflow import Score, Validation, Speculation, Stagnation, Phase, Workflow
 from .context import ExecutionContext
-from .run import RunStatus, StepRun, PhaseRun, RunInfo, Run
+from .run import RunStatus, StepRun, ValidationRun, PhaseRun, RunInfo, Run
+from .stats import Percentiles, PhaseStats, RunStats
+from .report import TimeBreakdown, IterationReport, PhaseReport, SlowStep, RunReport
+from .job import JobStatus, Job
+from .retention import RetentionPolicy, GcReport
 
 __all__ = [
+    "Artifact",
+    "Usage",
+    "total_usage",
     "AgentConfig",
     "resolve_agent_config",
+    "AgentLimit",
+    "resolve_agent_limit",
+    "Hedge",
     "LlmStep",
     "CommandStep",
     "Step",
+    "Score",
     "Validation",
+    "Speculation",
+    "Stagnation",
     "Phase",
     "Workflow",
     "ExecutionContext",
     "RunStatus",
     "StepRun",
+    "ValidationRun",
     "PhaseRun",
     "RunInfo",
     "Run",
+    "Percentiles",
+    "PhaseStats",
+    "RunStats",
+    "TimeBreakdown",
+    "IterationReport",
+    "PhaseReport",
+    "SlowStep",
+    "RunReport",
+    "JobStatus",
+    "Job",
+    "RetentionPolicy",
+    "GcReport",
 ]
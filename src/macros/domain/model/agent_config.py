@@ -1,6 +1,10 @@
-"""AgentConfig value object -- controls which engine/model executes a step."""
+"""AgentConfig value object -- controls which engine/model executes a step.
+
+AgentLimit throttles how hard an engine/model may be driven host-wide.
+"""
 
 from dataclasses import dataclass
+from typing import Mapping
 
 
 @dataclass(frozen=True)
@@ -37,3 +41,35 @@ def resolve_agent_config(
             model=step_agent.model if step_agent.model is not None else base.model,
         )
     return base
+
+
+@dataclass(frozen=True)
+class AgentLimit:
+    """Host-wide throttle for one engine (or engine/model) across all runs.
+
+    max_concurrency caps simultaneous agent processes; requests_per_minute
+    is enforced by a token bucket holding at most `burst` requests
+    (default: one minute's worth).
+    """
+
+    max_concurrency: int | None = None
+    requests_per_minute: float | None = None
+    burst: int | None = None
+
+
+def resolve_agent_limit(
+    limits: Mapping[str, AgentLimit],
+    config: AgentConfig,
+) -> tuple[str, AgentLimit] | None:
+    """Find the limit for an agent: "engine/model" first, then "engine".
+
+    Returns the matching key with the limit, since agents sharing a key
+    share one budget.
+    """
+    if config.model:
+        key = f"{config.engine}/{config.model}"
+        if key in limits:
+            return key, limits[key]
+    if config.engine in limits:
+        return config.engine, limits[config.engine]
+    return None
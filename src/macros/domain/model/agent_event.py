@@ -0,0 +1,31 @@
+"""AgentEvent -- progress an agent reports while a prompt is still running."""
+
+import json
+from dataclasses import asdict, dataclass
+from typing import Iterable, Literal
+
+AgentEventKind = Literal["init", "message", "tool_call", "edit", "tool_result", "result"]
+
+
+@dataclass(frozen=True)
+class AgentEvent:
+    """One normalized event from an agent's streaming output.
+
+    summary is a short human-readable line ("read src/app.py", "shell: pytest");
+    message text and tool payloads are never kept in full. elapsed_s counts
+    from the start of the prompt.
+    """
+
+    kind: AgentEventKind
+    summary: str
+    elapsed_s: float = 0.0
+    tool: str | None = None
+    path: str | None = None
+
+
+def event_log(events: Iterable[AgentEvent]) -> str:
+    """Compact JSON-lines log of events, without empty fields."""
+    return "".join(
+        json.dumps({k: v for k, v in asdict(e).items() if v is not None}) + "\n"
+        for e in events
+    )
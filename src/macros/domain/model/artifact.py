@@ -0,0 +1,70 @@
+"""Artifact -- handle to a (possibly large) text output kept out of memory."""
+
+from typing import Callable
+
+ArtifactLoader = Callable[[str], str]
+
+
+class Artifact:
+    """Handle to one text output of a run.
+
+    A stored handle carries only a reference and its size; `text` loads the
+    content through the loader of the store that wrote it (which keeps a
+    small LRU). An inline handle simply wraps a string -- used when no store
+    is wired, for old manifests, and in tests.
+
+    Handles compare equal to handles or plain strings with the same text, and
+    str() returns the text.
+    """
+
+    __slots__ = ("ref", "size", "_text", "_loader")
+
+    def __init__(
+        self,
+        text: str | None = None,
+        *,
+        ref: str | None = None,
+        size: int | None = None,
+        loader: ArtifactLoader | None = None,
+    ) -> None:
+        if text is None and (ref is None or loader is None):
+            raise ValueError("Artifact needs either text or a ref with a loader")
+        self.ref = ref
+        self.size = len(text) if text is not None else (size or 0)
+        self._text = text
+        self._loader = loader
+
+    @classmethod
+    def of(cls, value: "str | Artifact") -> "Artifact":
+        return value if isinstance(value, Artifact) else cls(value)
+
+    @property
+    def text(self) -> str:
+        if self._text is not None:
+            return self._text
+        return self._loader(self.ref)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Artifact):
+            if self.ref is not None and self.ref == other.ref:
+                return True
+            return self.size == other.size and self.text == other.text
+        if isinstance(other, str):
+            return self.size == len(other) and self.text == other
+        return NotImplemented
+
+    __hash__ = None  # equal to str, so it must not pretend to hash like one
+
+    def __repr__(self) -> str:
+        if self.ref is not None:
+            return f"Artifact(ref={self.ref!r}, size={self.size})"
+        return f"Artifact({self._text!r})"
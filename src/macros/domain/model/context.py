@@ -3,19 +3,28 @@
 from dataclasses import dataclass, field
 from types import MappingProxyType
 
+from macros.domain.model.artifact import Artifact
+
 
 @dataclass(frozen=True)
 class ExecutionContext:
     """Read-only snapshot of state visible to a phase execution.
 
-    phase_outputs is deliberately a MappingProxyType to enforce immutability.
+    phase_outputs is deliberately a MappingProxyType to enforce immutability;
+    its values are Artifact handles, loaded only when a prompt references them.
     The WorkflowExecutor builds this before each phase, filtering to only
-    the outputs declared in phase.context.
+    the outputs declared in phase.context. workdir is the checkout all
+    agents and commands run in (None = the workspace root). changed_files
+    lists the paths touched since the phase started (None = unknown).
+    run_id identifies the run the phase belongs to (None outside a run).
     """
 
     input: str
-    phase_outputs: MappingProxyType[str, str] = field(
+    phase_outputs: MappingProxyType[str, Artifact | str] = field(
         default_factory=lambda: MappingProxyType({})
     )
     iteration: int = 0
     validation_output: str | None = None
+    workdir: str | None = None
+    changed_files: tuple[str, ...] | None = None
+    run_id: str | None = None
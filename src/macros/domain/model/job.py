@@ -0,0 +1,41 @@
+"""Job -- a queued request to run a workflow (daemon mode)."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Literal
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def terminal(self) -> bool:
+        return self in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+@dataclass
+class Job:
+    """A submitted run and its progress through the queue.
+
+    Mutable: the worker fills in timing and the resulting run once claimed.
+    status is COMPLETED only when the run itself completed; a run that
+    failed or an error before the run started both end as FAILED.
+    """
+
+    id: str
+    workflow_id: str
+    input_text: str
+    status: JobStatus
+    submitted_at: datetime
+    stop_after: str | None = None
+    isolate: bool = False
+    export: Literal["branch", "patch"] = "branch"
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    run_dir: str | None = None
+    error: str | None = None
@@ -0,0 +1,95 @@
+"""Run report -- where one run's wall time went (read model for `report`)."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from macros.domain.model.usage import Usage
+
+
+@dataclass(frozen=True)
+class TimeBreakdown:
+    """Seconds spent in agent steps, command steps, validation and in between.
+
+    overhead is wall time not covered by any step or validation
+    (orchestration, checkpoints, worktrees, snapshots).
+    """
+
+    agent_seconds: float = 0.0
+    command_seconds: float = 0.0
+    validation_seconds: float = 0.0
+    overhead_seconds: float = 0.0
+
+    @property
+    def total_seconds(self) -> float:
+        return (
+            self.agent_seconds + self.command_seconds
+            + self.validation_seconds + self.overhead_seconds
+        )
+
+
+@dataclass(frozen=True)
+class IterationReport:
+    """Time breakdown of one iteration of a phase loop (0 = precheck)."""
+
+    iteration: int
+    breakdown: TimeBreakdown
+
+
+@dataclass(frozen=True)
+class PhaseReport:
+    """Time breakdown of one phase execution and each of its iterations.
+
+    step_savings is how much shorter the phase's iterations would have been
+    with command steps that don't wait on each other running concurrently;
+    an upper bound, as commands may depend on each other's files.
+    """
+
+    phase_id: str
+    outcome: str
+    reason: str | None
+    iterations: tuple[IterationReport, ...]
+    wall_seconds: float
+    breakdown: TimeBreakdown
+    step_savings: float = 0.0
+    usage: Usage | None = None
+
+
+@dataclass(frozen=True)
+class SlowStep:
+    """One step execution, ranked by duration."""
+
+    phase_id: str
+    step_id: str
+    iteration: int
+    kind: str  # "agent" or "command"
+    seconds: float
+    attempt: int | None = None
+    cached: bool = False
+
+
+@dataclass(frozen=True)
+class RunReport:
+    """Time breakdown and critical path of a single run.
+
+    critical_path_seconds is the longest chain of phase executions linked by
+    context (the phase outputs each one reads); phase_savings is the wall
+    time independent phases running concurrently would have saved. That is
+    an upper bound: phases that edit the same checkout are serial in
+    practice. Both are None when the workflow definition is no longer
+    available.
+    """
+
+    run_id: str
+    workflow_id: str
+    status: str
+    started_at: datetime
+    wall_seconds: float
+    breakdown: TimeBreakdown
+    phases: tuple[PhaseReport, ...]
+    slowest_steps: tuple[SlowStep, ...]
+    wasted_iterations: int
+    wasted_seconds: float
+    step_savings: float
+    critical_path_seconds: float | None = None
+    phase_savings: float | None = None
+    usage: Usage | None = None
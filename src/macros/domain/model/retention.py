@@ -0,0 +1,28 @@
+"""Retention value objects -- which runs `gc` removes and what it did."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Which runs garbage collection removes.
+
+    keep_last protects the newest N runs; older_than expires runs started
+    before a cutoff. With both, a run must be outside the newest N *and*
+    older than the cutoff. Runs still marked running are only expired by age.
+    """
+
+    keep_last: int | None = None
+    older_than: datetime | None = None
+
+
+@dataclass(frozen=True)
+class GcReport:
+    """Outcome of one garbage collection pass."""
+
+    deleted: int = 0
+    packed: int = 0
+    cache_entries_pruned: int = 0
+    bytes_freed: int = 0
+    dry_run: bool = False
@@ -6,6 +6,8 @@ from enum import Enum
 from typing import Literal
 
 from macros.domain.model.agent_config import AgentConfig
+from macros.domain.model.artifact import Artifact
+from macros.domain.model.usage import Usage, total_usage
 
 
 class RunStatus(str, Enum):
@@ -16,30 +18,86 @@ class RunStatus(str, Enum):
 
 @dataclass
 class StepRun:
-    """Record of a single step execution within a phase iteration."""
+    """Record of a single step execution within a phase iteration.
+
+    output is an Artifact handle; a plain string is wrapped on construction.
+    usage is what an agent step consumed (None for command steps). events is
+    the compact JSON-lines log of a streaming agent's progress events.
+    hedged is True when a second attempt was raced against a slow agent
+    call; agent_config is then the configuration of the attempt that won.
+    timed_out is True when the agent or command was killed by its timeout.
+    """
 
     step_id: str
     phase_id: str
     iteration: int
     started_at: datetime
     finished_at: datetime
-    output: str
+    output: Artifact
     exit_code: int
     agent_config: AgentConfig | None = None
+    attempt: int | None = None
+    cached: bool = False
+    usage: Usage | None = None
+    events: Artifact | None = None
+    hedged: bool = False
+    timed_out: bool = False
+
+    def __post_init__(self) -> None:
+        self.output = Artifact.of(self.output)
+        if self.events is not None:
+            self.events = Artifact.of(self.events)
+
+
+@dataclass
+class ValidationRun:
+    """Record of a single validation (sensor) execution within a phase iteration.
+
+    incremental is True when the result came from the validation's
+    incremental_command alone (it failed, so the full command was skipped).
+    timed_out is True when the command was killed by its timeout.
+    """
+
+    iteration: int
+    started_at: datetime
+    finished_at: datetime
+    exit_code: int
+    attempt: int | None = None
+    score: float | None = None
+    incremental: bool = False
+    timed_out: bool = False
 
 
 @dataclass
 class PhaseRun:
-    """Record of a complete phase execution (possibly multiple iterations)."""
+    """Record of a complete phase execution (possibly multiple iterations).
+
+    output and validation_output are Artifact handles; plain strings are
+    wrapped on construction. memoized_from is the run whose output was
+    reused instead of executing the phase.
+    """
 
     phase_id: str
     iteration: int
     outcome: Literal["converged", "exhausted", "failed"]
     step_runs: tuple[StepRun, ...]
-    output: str
-    validation_output: str | None
+    output: Artifact
+    validation_output: Artifact | None
     started_at: datetime
     finished_at: datetime
+    validation_runs: tuple[ValidationRun, ...] = ()
+    reason: str | None = None  # why an exhausted phase stopped early, e.g. "stagnated"
+    memoized_from: str | None = None
+
+    def __post_init__(self) -> None:
+        self.output = Artifact.of(self.output)
+        if self.validation_output is not None:
+            self.validation_output = Artifact.of(self.validation_output)
+
+    @property
+    def usage(self) -> Usage | None:
+        """Total agent usage across every step, attempts included."""
+        return total_usage(sr.usage for sr in self.step_runs)
 
 
 @dataclass
@@ -68,3 +126,8 @@ class Run:
     finished_at: datetime | None = None
     failure_reason: str | None = None
     artifacts_dir: str = ""
+
+    @property
+    def usage(self) -> Usage | None:
+        """Total agent usage across every phase execution."""
+        return total_usage(pr.usage for pr in self.phase_runs)
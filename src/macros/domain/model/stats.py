@@ -0,0 +1,41 @@
+"""Cross-run statistics -- read models aggregated from run manifests."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Percentiles:
+    """Distribution summary of a sample (seconds or iterations)."""
+
+    p50: float
+    p95: float
+    p99: float
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    """Convergence and latency profile of one phase across many runs."""
+
+    workflow_id: str
+    phase_id: str
+    executions: int
+    converged: int
+    exhausted: int
+    failed: int
+    mean_iterations_to_converge: float | None
+    iterations_to_converge: Percentiles | None
+    step_latency: Percentiles | None
+    validation_latency: Percentiles | None
+    exhausted_seconds: float
+
+    @property
+    def convergence_rate(self) -> float:
+        return self.converged / self.executions if self.executions else 0.0
+
+
+@dataclass(frozen=True)
+class RunStats:
+    """Aggregate over all runs matching a stats query."""
+
+    run_count: int
+    phases: tuple[PhaseStats, ...]
@@ -6,23 +6,52 @@ from typing import Literal, Union
 from macros.domain.model.agent_config import AgentConfig
 
 
+@dataclass(frozen=True)
+class Hedge:
+    """Tail-latency guard for an agent step.
+
+    When a call is still running after the threshold, a second attempt with
+    the same prompt starts in an isolated worktree (on `model`, default the
+    step's own); the first to finish wins and the other is cancelled.
+    after_seconds fixes the threshold; without it, the threshold is the
+    `percentile` of the step's durations in recent runs, once at least
+    min_samples of them exist (until then the step is not hedged).
+    """
+
+    after_seconds: float | None = None
+    percentile: float = 95
+    min_samples: int = 5
+    model: str | None = None
+
+
 @dataclass(frozen=True)
 class LlmStep:
-    """Execute a prompt via an AI agent (the actuator)."""
+    """Execute a prompt via an AI agent (the actuator).
+
+    hedge optionally races a second attempt against a call that runs long.
+    """
 
     id: str
     prompt: str
     type: Literal["llm"] = "llm"
     agent: AgentConfig | None = None
+    hedge: Hedge | None = None
 
 
 @dataclass(frozen=True)
 class CommandStep:
-    """Execute a shell command (can serve as inline sensor or action)."""
+    """Execute a shell command (can serve as inline sensor or action).
+
+    Declaring inputs (globs relative to the working directory) makes the step
+    cacheable: a successful result is keyed by the command and the inputs'
+    contents, and replayed, outputs (globs) included, instead of re-running.
+    """
 
     id: str
     command: str
     type: Literal["command"] = "command"
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
 
 
 Step = Union[LlmStep, CommandStep]
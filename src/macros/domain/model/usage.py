@@ -0,0 +1,50 @@
+"""Usage value object -- what an agent call consumed (bytes, tokens, dollars)."""
+
+from dataclasses import dataclass
+from typing import Iterable, TypeVar
+
+_N = TypeVar("_N", int, float)
+
+
+@dataclass(frozen=True)
+class Usage:
+    """Resources consumed by one agent call, or a sum of several.
+
+    prompt_bytes is always known; token counts, cost and model are None
+    unless the agent reported them (structured output). Adding usages sums
+    what both sides know, and keeps model only when both agree.
+    """
+
+    prompt_bytes: int = 0
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    cache_read_tokens: int | None = None
+    cost_usd: float | None = None
+    model: str | None = None
+
+    def __add__(self, other: "Usage") -> "Usage":
+        return Usage(
+            prompt_bytes=self.prompt_bytes + other.prompt_bytes,
+            input_tokens=_add(self.input_tokens, other.input_tokens),
+            output_tokens=_add(self.output_tokens, other.output_tokens),
+            cache_read_tokens=_add(self.cache_read_tokens, other.cache_read_tokens),
+            cost_usd=_add(self.cost_usd, other.cost_usd),
+            model=self.model if self.model == other.model else None,
+        )
+
+
+def total_usage(usages: Iterable[Usage | None]) -> Usage | None:
+    """Sum of the given usages, skipping None; None when there are none."""
+    total = None
+    for usage in usages:
+        if usage is not None:
+            total = usage if total is None else total + usage
+    return total
+
+
+def _add(a: _N | None, b: _N | None) -> _N | None:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a + b
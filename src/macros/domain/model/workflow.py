@@ -1,16 +1,66 @@
 """Workflow aggregate -- the definition-time graph of phases."""
 
 from dataclasses import dataclass
+from typing import Literal
 
 from macros.domain.model.agent_config import AgentConfig
 from macros.domain.model.step import Step
 
 
+@dataclass(frozen=True)
+class Score:
+    """How to read a progress score out of validation output.
+
+    Without a pattern the score is the failure count from a pytest, jest,
+    tsc or eslint summary (lower is better). A pattern's first group is
+    parsed as a number from its last match; set maximize when higher is
+    better (e.g. a coverage percentage).
+    """
+
+    pattern: str | None = None
+    maximize: bool = False
+
+
 @dataclass(frozen=True)
 class Validation:
-    """Sensor configuration: a shell command whose exit code signals convergence."""
+    """Sensor configuration: a shell command whose exit code signals convergence.
+
+    score optionally grades failing output so iterations can be compared.
+    incremental_command, when files changed since the phase started, runs
+    first against just those files; the full command only runs once it passes.
+    """
 
     command: str
+    score: Score | None = None
+    incremental_command: str | None = None
+
+
+@dataclass(frozen=True)
+class Speculation:
+    """Best-of-N configuration: concurrent attempts per iteration, each in its
+    own isolated worktree. "first" promotes the first attempt to converge;
+    "best" waits for all and promotes the converging attempt with the
+    smallest change."""
+
+    attempts: int = 2
+    select: Literal["first", "best"] = "first"
+
+
+@dataclass(frozen=True)
+class Stagnation:
+    """Early-stop rules for a phase loop that is no longer making progress.
+
+    The phase ends as exhausted (reason "stagnated") after a failed
+    validation when any enabled rule fires:
+    - identical_output: normalized validation output equals the previous one
+    - unchanged_workspace: the iteration left the workspace byte-identical
+    - no_progress_iterations: the parsed failure count has not dropped below
+      its earlier best for this many consecutive iterations
+    """
+
+    identical_output: bool = True
+    unchanged_workspace: bool = True
+    no_progress_iterations: int | None = None
 
 
 @dataclass(frozen=True)
@@ -19,6 +69,20 @@ class Phase:
 
     Each phase executes its steps, optionally validates via a shell command,
     and iterates until convergence (exit_code == 0) or budget exhaustion.
+    With precheck, validation runs once before any step; if it already
+    passes, the phase converges at iteration 0 without invoking the agent,
+    and its output (what {{PHASE_OUTPUT:id}} reads) is a note saying so.
+    With stagnation, a loop that stopped making progress ends early.
+    With rollback, an iteration that scores worse than the best so far is
+    undone before the next one, and an exhausted phase leaves the workspace
+    in its best-scoring state.
+    With memoize, a converged result is reused by later runs that reach the
+    phase with the same workflow, input, context outputs and workspace.
+    Changed files are tracked when a prompt or command uses
+    {{CHANGED_FILES}} or the validation has an incremental_command; with
+    changed_files, commands also get $MACROCYCLE_CHANGED_FILES otherwise.
+    context lists the phases whose outputs the prompts may read; when empty,
+    it is inferred from the {{PHASE_OUTPUT:id}} references in the prompts.
     """
 
     id: str
@@ -29,6 +93,12 @@ class Phase:
     agent: AgentConfig | None = None
     on_complete: str | None = None
     on_exhausted: str | None = None
+    precheck: bool = False
+    speculation: Speculation | None = None
+    stagnation: Stagnation | None = None
+    rollback: bool = False
+    memoize: bool = False
+    changed_files: bool = False
 
 
 @dataclass(frozen=True)
@@ -1,13 +1,27 @@
 from .agent_port import AgentPort
+from .artifact_store_port import ArtifactStorePort
 from .command_port import CommandPort
 from .console_port import ConsolePort
+from .job_queue_port import JobQueuePort
+from .lifecycle_hooks_port import LifecycleHooks
+from .metrics_port import MetricsPort
+from .phase_memo_port import PhaseMemoPort
 from .run_store_port import RunStorePort
+from .step_cache_port import StepCachePort
 from .workflow_registry_port import WorkflowRegistryPort
+from .workspace_port import WorkspacePort
 
 __all__ = [
     "AgentPort",
+    "ArtifactStorePort",
     "CommandPort",
     "ConsolePort",
+    "JobQueuePort",
+    "LifecycleHooks",
+    "MetricsPort",
+    "PhaseMemoPort",
     "RunStorePort",
+    "StepCachePort",
     "WorkflowRegistryPort",
+    "WorkspacePort",
 ]
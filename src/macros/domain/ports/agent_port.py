@@ -2,10 +2,64 @@
 
 from typing import Callable, Protocol
 
+from macros.domain.model.agent_event import AgentEvent
+from macros.domain.model.usage import Usage
+
+AgentListener = Callable[[AgentEvent], None]
+
+CANCELLED_EXIT_CODE = 130  # what run_prompt returns once cancel() stopped it (128 + SIGINT)
+
 
 class AgentPort(Protocol):
     """Contract for executing prompts via an AI agent (the actuator)."""
 
-    def run_prompt(self, prompt: str) -> tuple[int, str]:
-        """Execute a prompt and return (exit_code, output_text)."""
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
+        """Execute a prompt and return (exit_code, output_text).
+
+        cwd defaults to the workspace root.
+        """
+        ...
+
+    def cancel(self) -> None:
+        """Abort an in-flight run_prompt call (best effort, thread-safe)."""
         ...
+
+    def last_usage(self) -> Usage | None:
+        """Tokens, cost and model of the last completed run_prompt call.
+
+        Optional: agents without it (or returning None) report no usage.
+        """
+        ...
+
+    def set_listener(self, listener: AgentListener | None) -> None:
+        """Receive progress events while run_prompt is still running.
+
+        Optional: only agents that stream their output call it.
+        """
+        ...
+
+    def timed_out(self) -> bool:
+        """True when the last run_prompt call was killed by its timeout.
+
+        Optional: agents without it never report timeouts.
+        """
+        ...
+
+
+def reported_usage(agent: AgentPort) -> Usage | None:
+    """The agent's last_usage(), for agents that implement it."""
+    last_usage = getattr(agent, "last_usage", None)
+    return last_usage() if last_usage is not None else None
+
+
+def reported_timeout(agent: AgentPort) -> bool:
+    """The agent's timed_out(), for agents that implement it."""
+    timed_out = getattr(agent, "timed_out", None)
+    return bool(timed_out()) if timed_out is not None else False
+
+
+def set_listener(agent: AgentPort, listener: AgentListener | None) -> None:
+    """Subscribe to the agent's progress events, for agents that stream them."""
+    subscribe = getattr(agent, "set_listener", None)
+    if subscribe is not None:
+        subscribe(listener)
@@ -0,0 +1,13 @@
+"""Port for storing run outputs outside memory."""
+
+from typing import Protocol
+
+from macros.domain.model.artifact import Artifact
+
+
+class ArtifactStorePort(Protocol):
+    """Contract for persisting text outputs and handing back lazy handles."""
+
+    def put(self, text: str) -> Artifact:
+        """Persist `text` now and return a handle that loads it on demand."""
+        ...
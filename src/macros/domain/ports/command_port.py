@@ -1,11 +1,28 @@
 """Port for shell command execution (the sensor in the control loop)."""
 
-from typing import Protocol
+from typing import Mapping, Protocol
 
 
 class CommandPort(Protocol):
     """Contract for running shell commands used as validation sensors."""
 
-    def run_command(self, command: str, cwd: str | None = None) -> tuple[int, str]:
-        """Execute a shell command. Returns (exit_code, combined_output)."""
+    def run_command(
+        self,
+        command: str,
+        cwd: str | None = None,
+        env: Mapping[str, str] | None = None,
+    ) -> tuple[int, str]:
+        """Execute a shell command with `env` layered over the environment.
+        Returns (exit_code, combined_output)."""
         ...
+
+    def timed_out(self) -> bool:
+        """True when the calling thread's last run_command was killed by its
+        timeout. Optional: adapters without it never report timeouts."""
+        ...
+
+
+def command_timed_out(command: CommandPort) -> bool:
+    """The adapter's timed_out(), for adapters that implement it."""
+    timed_out = getattr(command, "timed_out", None)
+    return bool(timed_out()) if timed_out is not None else False
@@ -1,11 +1,17 @@
 """Port for console output operations."""
 
-from typing import Protocol
+from typing import Any, Protocol
 
 
 class ConsolePort(Protocol):
-    """Contract for console I/O."""
+    """Contract for console I/O.
+
+    event() reports a structured progress event (phase_start, step_end,
+    validation, ...) with JSON-serializable fields. Human-readable consoles
+    ignore events: the info/warn lines already describe the same progress.
+    """
 
     def info(self, msg: str) -> None: ...
     def warn(self, msg: str) -> None: ...
     def echo(self, msg: str) -> None: ...
+    def event(self, name: str, **fields: Any) -> None: ...
@@ -0,0 +1,42 @@
+"""Port for the persistent run queue used in daemon mode."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from macros.domain.model.job import Job, JobStatus
+
+
+class JobQueuePort(Protocol):
+    """Contract for a durable FIFO of jobs shared by concurrent workers."""
+
+    def submit(self, job: Job) -> None:
+        """Persist a new queued job."""
+        ...
+
+    def claim(self) -> Job | None:
+        """Atomically move the oldest queued job to running and return it."""
+        ...
+
+    def update(self, job: Job) -> None:
+        """Persist the job's current state."""
+        ...
+
+    def get(self, job_id: str) -> Job | None:
+        ...
+
+    def list_jobs(self, status: JobStatus | None = None, limit: int = 50) -> list[Job]:
+        """Most recently submitted jobs first."""
+        ...
+
+    def count(self, status: JobStatus) -> int:
+        ...
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that is still queued. Returns False otherwise."""
+        ...
+
+    def requeue_running(self) -> int:
+        """Return jobs left running by a previous process to the queue."""
+        ...
@@ -0,0 +1,49 @@
+"""Port for lifecycle hooks (tracing, metrics and alerting plugins)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from macros.domain.model.agent_event import AgentEvent
+    from macros.domain.model.context import ExecutionContext
+    from macros.domain.model.run import PhaseRun, Run, StepRun, ValidationRun
+    from macros.domain.model.step import Step
+    from macros.domain.model.workflow import Phase, Workflow
+
+
+class LifecycleHooks(Protocol):
+    """Callbacks invoked as a run progresses.
+
+    A hook implements any subset of these methods; missing ones are never
+    called. Hooks run inline on the executing thread (speculative attempts
+    call them concurrently), so they should hand heavy work off. Exceptions
+    are reported on the console and never affect the run. context.run_id
+    ties phase-level callbacks to their run.
+    """
+
+    def on_run_start(self, run: Run, workflow: Workflow) -> None: ...
+
+    def on_phase_start(self, run: Run, phase: Phase) -> None: ...
+
+    def on_iteration(self, context: ExecutionContext, phase: Phase) -> None: ...
+
+    def on_step_start(
+        self, context: ExecutionContext, phase: Phase, step: Step, attempt: int | None
+    ) -> None: ...
+
+    def on_step_end(self, context: ExecutionContext, phase: Phase, step_run: StepRun) -> None: ...
+
+    def on_validation(
+        self, context: ExecutionContext, phase: Phase, validation_run: ValidationRun
+    ) -> None: ...
+
+    def on_agent_event(
+        self, context: ExecutionContext, phase: Phase, step: Step, event: AgentEvent
+    ) -> None: ...
+
+    def on_phase_end(self, run: Run, phase_run: PhaseRun) -> None: ...
+
+    def on_checkpoint(self, run: Run) -> None: ...
+
+    def on_run_end(self, run: Run) -> None: ...
@@ -0,0 +1,24 @@
+"""Port for execution metrics (latency, iterations, convergence)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from macros.domain.model.run import PhaseRun, Run
+
+
+class MetricsPort(Protocol):
+    """Contract for recording aggregate execution metrics."""
+
+    def observe_phase(self, workflow_id: str, phase_run: PhaseRun) -> None:
+        """Record step/validation latencies, iterations and outcome of a phase."""
+        ...
+
+    def observe_run(self, run: Run) -> None:
+        """Record the final status of a run."""
+        ...
+
+    def flush(self) -> None:
+        """Persist everything recorded so far."""
+        ...
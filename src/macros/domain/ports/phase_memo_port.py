@@ -0,0 +1,36 @@
+"""Port for reusing converged phase outputs across runs."""
+
+from datetime import datetime
+from typing import Mapping, Protocol
+
+from macros.domain.model.workflow import Workflow
+
+
+class PhaseMemoPort(Protocol):
+    """Contract for a cross-run memo of converged phase outputs."""
+
+    def key(
+        self,
+        workflow: Workflow,
+        phase_id: str,
+        input_text: str,
+        context: Mapping[str, str],
+        fingerprint: str,
+    ) -> str:
+        """Hash the workflow (its id and definition), the phase id, the input
+        (whitespace-normalized), the phase outputs in `context` and the
+        workspace fingerprint."""
+        ...
+
+    def load(self, key: str) -> tuple[str, str] | None:
+        """On a hit, return the recorded (run_id, output). Returns None on a miss."""
+        ...
+
+    def save(self, key: str, run_id: str, output: str) -> None:
+        """Record the output of a converged phase. Never raises."""
+        ...
+
+    def prune(self, unused_since: datetime, dry_run: bool = False) -> int:
+        """Remove entries not used since `unused_since`. Returns how many
+        were (or, with dry_run, would be) removed."""
+        ...
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Iterator, Protocol
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from macros.domain.model.run import Run, RunInfo
+    from macros.domain.ports.artifact_store_port import ArtifactStorePort
 
 
 class RunStorePort(Protocol):
@@ -19,6 +22,10 @@ class RunStorePort(Protocol):
         """Write text content to a file within the run directory."""
         ...
 
+    def artifact_store(self, run_dir: str) -> ArtifactStorePort | None:
+        """Store for the run's step and phase outputs; None keeps them inline."""
+        ...
+
     def save_manifest(self, run_dir: str, run: Run) -> None:
         """Save run manifest for crash recovery (checkpoint)."""
         ...
@@ -30,3 +37,38 @@ class RunStorePort(Protocol):
     def get_latest_run(self) -> RunInfo | None:
         """Return info about the most recent run, or None."""
         ...
+
+    def get_run(self, run_id: str) -> Run | None:
+        """Load a run by id (its directory or archive name), or None."""
+        ...
+
+    def iter_runs(
+        self,
+        workflow_id: str | None = None,
+        since: datetime | None = None,
+    ) -> Iterator[Run]:
+        """Yield persisted runs one at a time, newest first, optionally filtered.
+
+        Runs without a readable manifest are skipped.
+        """
+        ...
+
+    def iter_unreadable_runs(self, before: datetime) -> Iterator[str]:
+        """Yield run dirs or archives that have no readable manifest and were
+        last modified before the cutoff (crashed before the first checkpoint,
+        or corrupt), which iter_runs() skips."""
+        ...
+
+    def is_packed(self, run_dir: str) -> bool:
+        """True when the run has been packed into a single archive."""
+        ...
+
+    def pack_run(self, run_dir: str) -> int:
+        """Pack a finished run directory into one compressed archive that
+        load_manifest() and iter_runs() still read. Returns bytes saved
+        (0 if the run was already packed)."""
+        ...
+
+    def delete_run(self, run_dir: str) -> int:
+        """Remove a run (directory or archive). Returns bytes freed."""
+        ...
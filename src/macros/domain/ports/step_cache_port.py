@@ -0,0 +1,35 @@
+"""Port for caching the results of deterministic command steps."""
+
+from datetime import datetime
+from typing import Protocol
+
+
+class StepCachePort(Protocol):
+    """Contract for a content-addressed cache of command step results."""
+
+    def key(self, command: str, inputs: tuple[str, ...], cwd: str | None = None) -> str | None:
+        """Hash the command together with the contents of every file matching
+        the `inputs` globs under `cwd` (default: the workspace root).
+        Returns None when the inputs cannot be read (the step is not cached)."""
+        ...
+
+    def restore(self, key: str, cwd: str | None = None) -> tuple[int, str] | None:
+        """On a hit, copy the recorded output files into `cwd` and return the
+        recorded (exit_code, output). Returns None on a miss."""
+        ...
+
+    def save(
+        self,
+        key: str,
+        outputs: tuple[str, ...],
+        exit_code: int,
+        output: str,
+        cwd: str | None = None,
+    ) -> None:
+        """Record a result with the files matching the `outputs` globs. Never raises."""
+        ...
+
+    def prune(self, unused_since: datetime, dry_run: bool = False) -> int:
+        """Remove entries not used since `unused_since`. Returns how many
+        were (or, with dry_run, would be) removed."""
+        ...
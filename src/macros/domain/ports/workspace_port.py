@@ -0,0 +1,58 @@
+"""Port for version-controlled workspace operations (isolated checkouts)."""
+
+from typing import Protocol
+
+
+class WorkspacePort(Protocol):
+    """Contract for creating, promoting, exporting and discarding isolated worktrees."""
+
+    def create_worktree(self, name: str, source: str | None = None) -> str:
+        """Create an isolated checkout mirroring the current state of `source`
+        (default: the workspace root), including uncommitted changes.
+        Returns the checkout path. Raises WorkspaceError on failure."""
+        ...
+
+    def fingerprint(self, path: str | None = None) -> str:
+        """Content hash of the checkout at `path` (default: workspace root),
+        covering uncommitted and untracked files. Equal fingerprints mean
+        identical working trees. Raises WorkspaceError on failure."""
+        ...
+
+    def snapshot(self, path: str | None = None) -> str:
+        """Record the checkout's full working state (tracked and untracked files)
+        without touching HEAD or the index. Returns an id for restore().
+        Raises WorkspaceError on failure."""
+        ...
+
+    def restore(self, snapshot: str, path: str | None = None) -> None:
+        """Bring the checkout's files back to a snapshot() state; HEAD and the
+        index are left alone. Raises WorkspaceError on failure."""
+        ...
+
+    def changed_files(self, since: str, path: str | None = None) -> list[str]:
+        """Paths (relative to the checkout root) added or modified at `path`
+        since the snapshot() `since`. Raises WorkspaceError on failure."""
+        ...
+
+    def change_size(self, worktree: str) -> int:
+        """Number of changed lines in the worktree since it was created."""
+        ...
+
+    def promote(self, worktree: str, target: str | None = None) -> None:
+        """Apply the worktree's changes onto `target` (default: workspace root).
+        Raises WorkspaceError if the changes cannot be applied."""
+        ...
+
+    def export_branch(self, worktree: str, branch: str, message: str) -> None:
+        """Commit the worktree's state (including the agent's own commits) to a
+        new branch in the source repository. Raises WorkspaceError if the
+        branch exists or cannot be created."""
+        ...
+
+    def export_patch(self, worktree: str) -> str:
+        """Binary patch of everything changed in the worktree since it was created."""
+        ...
+
+    def remove_worktree(self, worktree: str) -> None:
+        """Delete the checkout. Never raises."""
+        ...
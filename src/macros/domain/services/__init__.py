@@ -2,10 +2,24 @@ from .workflow_executor import WorkflowExecutor
 from .phase_executor import PhaseExecutor
 from .prompt_builder import PromptBuilder
 from .workflow_validator import WorkflowValidator
+from .run_statistics import RunStatistics
+from .run_report import build_report
+from .stagnation import StagnationDetector
+from .hooks import HookDispatcher
+from .retention import select_expired
+from .context_inference import effective_context, infer_context, referenced_phases
 
 __all__ = [
     "WorkflowExecutor",
     "PhaseExecutor",
     "PromptBuilder",
     "WorkflowValidator",
+    "RunStatistics",
+    "build_report",
+    "StagnationDetector",
+    "HookDispatcher",
+    "select_expired",
+    "effective_context",
+    "infer_context",
+    "referenced_phases",
 ]
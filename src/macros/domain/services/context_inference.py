@@ -0,0 +1,66 @@
+"""Context inference -- which phase outputs each phase actually needs."""
+
+import re
+from dataclasses import replace
+
+from macros.domain.model.step import LlmStep
+from macros.domain.model.workflow import Phase, Workflow
+
+_PHASE_OUTPUT = re.compile(r"\{\{PHASE_OUTPUT:([^}]+)\}\}")
+
+
+def referenced_phases(phase: Phase) -> tuple[str, ...]:
+    """Phase ids whose output the phase's prompts reference, in order of first use."""
+    refs: dict[str, None] = {}
+    for step in phase.steps:
+        if isinstance(step, LlmStep):
+            for phase_id in _PHASE_OUTPUT.findall(step.prompt):
+                refs[phase_id] = None
+    return tuple(refs)
+
+
+def effective_context(phase: Phase) -> tuple[str, ...]:
+    """The declared context, or the outputs the prompts reference when none is declared."""
+    return phase.context or referenced_phases(phase)
+
+
+def infer_context(workflow: Workflow) -> Workflow:
+    """The workflow with every undeclared phase context filled in from its prompts."""
+    phases = tuple(
+        phase if phase.context else replace(phase, context=referenced_phases(phase))
+        for phase in workflow.phases
+    )
+    return replace(workflow, phases=phases)
+
+
+def successors(phase: Phase) -> tuple[str, ...]:
+    return tuple(t for t in (phase.on_complete, phase.on_exhausted) if t is not None)
+
+
+def reachable(workflow: Workflow, start: tuple[str, ...]) -> set[str]:
+    """Ids of the phases reachable from (and including) the start phases."""
+    index = {p.id: p for p in workflow.phases}
+    seen: set[str] = set()
+    pending = [s for s in start if s in index]
+    while pending:
+        phase_id = pending.pop()
+        if phase_id in seen:
+            continue
+        seen.add(phase_id)
+        pending.extend(t for t in successors(index[phase_id]) if t in index)
+    return seen
+
+
+def outputs_needed_after(workflow: Workflow) -> dict[str, frozenset[str]]:
+    """Per phase, the outputs any phase that can still run after it will read.
+
+    Everything else accumulated so far can be dropped once the phase ends.
+    """
+    index = {p.id: p for p in workflow.phases}
+    needed: dict[str, frozenset[str]] = {}
+    for phase in workflow.phases:
+        later = reachable(workflow, successors(phase))
+        needed[phase.id] = frozenset(
+            dep for phase_id in later for dep in effective_context(index[phase_id])
+        )
+    return needed
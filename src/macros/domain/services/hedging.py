@@ -0,0 +1,57 @@
+"""Hedging -- derive agent step hedge thresholds from earlier runs."""
+
+from dataclasses import replace
+from typing import Iterable
+
+from macros.domain.model.run import Run
+from macros.domain.model.step import LlmStep, Step
+from macros.domain.model.workflow import Workflow
+from macros.domain.services.run_statistics import percentile
+
+HISTORY_RUNS = 20  # newest runs a derived threshold is computed from
+
+
+def needs_history(workflow: Workflow) -> bool:
+    """True when some step hedges at a threshold derived from earlier runs."""
+    return any(
+        _derived(step) for phase in workflow.phases for step in phase.steps
+    )
+
+
+def resolve_hedges(workflow: Workflow, runs: Iterable[Run]) -> Workflow:
+    """Copy of the workflow with derived hedge thresholds filled in.
+
+    Samples are the durations of each agent step in `runs`. Speculative
+    attempts are excluded, and so are hedged and timed-out calls, whose
+    durations the hedge or the timeout cut short or stretched. Steps with
+    fewer than their min_samples keep no threshold and run unhedged.
+    """
+    durations: dict[tuple[str, str], list[float]] = {}
+    for run in runs:
+        for pr in run.phase_runs:
+            for sr in pr.step_runs:
+                if sr.agent_config is None or sr.attempt is not None:
+                    continue
+                if sr.hedged or sr.timed_out:
+                    continue
+                durations.setdefault((pr.phase_id, sr.step_id), []).append(
+                    (sr.finished_at - sr.started_at).total_seconds()
+                )
+    phases = tuple(
+        replace(phase, steps=tuple(
+            _resolve(step, durations.get((phase.id, step.id), [])) for step in phase.steps
+        ))
+        for phase in workflow.phases
+    )
+    return replace(workflow, phases=phases)
+
+
+def _resolve(step: Step, samples: list[float]) -> Step:
+    if not _derived(step) or len(samples) < step.hedge.min_samples:
+        return step
+    threshold = percentile(sorted(samples), step.hedge.percentile)
+    return replace(step, hedge=replace(step.hedge, after_seconds=threshold))
+
+
+def _derived(step: Step) -> bool:
+    return isinstance(step, LlmStep) and step.hedge is not None and step.hedge.after_seconds is None
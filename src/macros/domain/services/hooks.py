@@ -0,0 +1,54 @@
+"""HookDispatcher -- fans lifecycle callbacks out to registered hooks."""
+
+from typing import Any, Callable, Iterable
+
+from macros.domain.ports.console_port import ConsolePort
+from macros.domain.ports.lifecycle_hooks_port import LifecycleHooks
+
+HOOK_NAMES = (
+    "on_run_start",
+    "on_phase_start",
+    "on_iteration",
+    "on_step_start",
+    "on_step_end",
+    "on_agent_event",
+    "on_validation",
+    "on_phase_end",
+    "on_checkpoint",
+    "on_run_end",
+)
+
+
+class HookDispatcher:
+    """Calls every hook that implements a callback, isolating their failures.
+
+    Handlers are resolved once at construction, so emitting an event no hook
+    implements is a dict lookup. Executors hold None instead of a dispatcher
+    when nothing is registered (see create()), which makes unused hooks free.
+    """
+
+    def __init__(self, hooks: Iterable[LifecycleHooks], console: ConsolePort) -> None:
+        hooks = tuple(hooks)
+        self._console = console
+        self._handlers: dict[str, tuple[Callable[..., Any], ...]] = {
+            name: tuple(
+                getattr(hook, name) for hook in hooks if callable(getattr(hook, name, None))
+            )
+            for name in HOOK_NAMES
+        }
+
+    @classmethod
+    def create(
+        cls, hooks: Iterable[LifecycleHooks], console: ConsolePort
+    ) -> "HookDispatcher | None":
+        """A dispatcher for the hooks, or None when there are none."""
+        hooks = tuple(hooks)
+        return cls(hooks, console) if hooks else None
+
+    def emit(self, name: str, *args: Any) -> None:
+        for handler in self._handlers[name]:
+            try:
+                handler(*args)
+            except Exception as e:
+                owner = type(getattr(handler, "__self__", handler)).__name__
+                self._console.warn(f"Hook {owner}.{name} failed: {e}")
@@ -1,20 +1,107 @@
 """PhaseExecutor -- inner control loop: iterates steps until validation converges."""
 
+import contextvars
+import shlex
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from typing import Callable
 
+from macros.domain.exceptions import WorkspaceError
 from macros.domain.model.agent_config import AgentConfig, resolve_agent_config
+from macros.domain.model.agent_event import AgentEvent, event_log
+from macros.domain.model.artifact import Artifact
 from macros.domain.model.context import ExecutionContext
-from macros.domain.model.run import PhaseRun, StepRun
+from macros.domain.model.run import PhaseRun, StepRun, ValidationRun
 from macros.domain.model.step import CommandStep, LlmStep, Step
-from macros.domain.model.workflow import Phase
-from macros.domain.ports.agent_port import AgentPort
-from macros.domain.ports.command_port import CommandPort
+from macros.domain.model.usage import Usage
+from macros.domain.model.workflow import Phase, Score, Speculation
+from macros.domain.ports.agent_port import (
+    AgentPort,
+    reported_timeout,
+    reported_usage,
+    set_listener,
+)
+from macros.domain.ports.artifact_store_port import ArtifactStorePort
+from macros.domain.ports.command_port import CommandPort, command_timed_out
 from macros.domain.ports.console_port import ConsolePort
+from macros.domain.ports.step_cache_port import StepCachePort
+from macros.domain.ports.workspace_port import WorkspacePort
+from macros.domain.services.hooks import HookDispatcher
 from macros.domain.services.prompt_builder import PromptBuilder
+from macros.domain.services.stagnation import StagnationDetector
+from macros.domain.services.validation_output import parse_score
 
 AgentFactory = Callable[[AgentConfig], AgentPort]
 
+CHANGED_FILES_ENV = "MACROCYCLE_CHANGED_FILES"
+CHANGED_FILES_VAR = "{{CHANGED_FILES}}"
+
+
+class _AttemptControl:
+    """Cancellation handle for one speculative attempt.
+
+    Tracks the agent currently running on the attempt's behalf so a sibling
+    that converged first can kill it mid-prompt.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._agent: AgentPort | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def bind(self, agent: AgentPort) -> None:
+        with self._lock:
+            self._agent = agent
+            if self._cancelled:
+                agent.cancel()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            if self._agent is not None:
+                self._agent.cancel()
+
+
+@dataclass
+class _Attempt:
+    """Outcome of one speculative attempt in its own worktree."""
+
+    index: int
+    worktree: str
+    step_runs: list[StepRun]
+    validation_run: ValidationRun | None
+    validation_output: str
+    cancelled: bool
+
+    @property
+    def converged(self) -> bool:
+        return (
+            not self.cancelled
+            and self.validation_run is not None
+            and self.validation_run.exit_code == 0
+        )
+
+    @property
+    def output(self) -> Artifact:
+        return self.step_runs[-1].output if self.step_runs else Artifact("")
+
+
+@dataclass(frozen=True)
+class _Checkpoint:
+    """Best-scoring workspace state of a rollback-enabled phase so far."""
+
+    iteration: int
+    score: float
+    snapshot: str
+    validation_output: str
+    output: Artifact
+
 
 class PhaseExecutor:
     """Inner control loop: executes a phase's steps and iterates on validation.
@@ -25,6 +112,31 @@ class PhaseExecutor:
     - Error signal: validation stdout/stderr fed back as {{VALIDATION_OUTPUT}}
     - Gain limit: phase.max_iterations
     - Convergence: validation exit_code == 0
+    - Precheck: optional sensor reading before actuation; already-converged
+      phases finish at iteration 0 with zero agent calls
+    - Speculation: optional best-of-N actuation per iteration; attempts run
+      concurrently in isolated worktrees and the selected one is promoted
+      into the workspace before the next iteration
+    - Stagnation: optional early stop when the error signal stops changing
+      (or stops shrinking) or the actuator stops changing the workspace
+    - Rollback: optional regression guard; the workspace is snapshotted at
+      every new best score, and an iteration that scores worse is reverted
+      to that snapshot so the loop (and an exhausted phase) keeps its best state
+    - Changed files: paths touched since the phase started reach commands
+      as {{CHANGED_FILES}} (shell-quoted) and $MACROCYCLE_CHANGED_FILES (one
+      per line), and prompts as {{CHANGED_FILES}}; an incremental validation
+      command checks just those before the full sensor runs. Only phases
+      that use them pay for the snapshot they are measured against
+    - Step cache: command steps with declared inputs replay a recorded
+      successful result (and output files) when command and inputs are unchanged
+    - Hedging: an agent step with a hedge threshold that is still running
+      past it races a second attempt in a worktree; the first to finish
+      wins and the other is cancelled (speculative attempts are not hedged)
+    - Events: iteration, step start/end and validation results are reported
+      on the console as structured events alongside the log lines, and to
+      lifecycle hooks when any are registered
+    - Artifacts: with an artifact store, step and validation outputs are
+      written out as they are produced and the records hold lazy handles
     """
 
     def __init__(
@@ -33,74 +145,197 @@ class PhaseExecutor:
         command: CommandPort,
         prompt_builder: PromptBuilder,
         console: ConsolePort,
+        workspace: WorkspacePort | None = None,
+        step_cache: StepCachePort | None = None,
+        hooks: HookDispatcher | None = None,
     ) -> None:
         self._agent_factory = agent_factory
         self._command = command
         self._prompt_builder = prompt_builder
         self._console = console
+        self._workspace = workspace
+        self._step_cache = step_cache
+        self._hooks = hooks
 
     def execute(
         self,
         phase: Phase,
         context: ExecutionContext,
         workflow_agent: AgentConfig,
+        artifacts: ArtifactStorePort | None = None,
     ) -> PhaseRun:
         started_at = datetime.now(timezone.utc)
         all_step_runs: list[StepRun] = []
-        last_output = ""
+        validation_runs: list[ValidationRun] = []
+        last_output = Artifact("")
         last_validation_output: str | None = None
 
+        if phase.precheck and phase.validation:
+            exit_code, validation_output, vr = self._validate(phase, 0, cwd=context.workdir)
+            validation_runs.append(vr)
+            if self._hooks is not None:
+                self._hooks.emit("on_validation", context, phase, vr)
+            if exit_code == 0:
+                self._console.info(f"  [{phase.id}] precheck passed, skipping steps")
+                return PhaseRun(
+                    phase_id=phase.id,
+                    iteration=0,
+                    outcome="converged",
+                    step_runs=(),
+                    output=_artifact(_precheck_note(phase), artifacts),
+                    validation_output=_artifact(validation_output, artifacts),
+                    started_at=started_at,
+                    finished_at=datetime.now(timezone.utc),
+                    validation_runs=tuple(validation_runs),
+                )
+            last_validation_output = validation_output
+
+        rollback = phase.rollback and phase.validation is not None
+        if rollback and self._workspace is None:
+            self._console.warn(
+                f"  [{phase.id}] rollback needs a workspace adapter; keeping every iteration"
+            )
+            rollback = False
+        best: _Checkpoint | None = None
+        if rollback and last_validation_output is not None:
+            best, _ = self._track_progress(
+                phase, context.workdir, 0, validation_runs[-1].score,
+                last_validation_output, last_output, None,
+            )
+
+        speculate = phase.speculation is not None and phase.validation is not None
+        if speculate and self._workspace is None:
+            self._console.warn(
+                f"  [{phase.id}] speculation needs a workspace adapter; running sequentially"
+            )
+            speculate = False
+
+        detector = self._start_stagnation(phase, context, last_validation_output)
+        changes_base = self._changes_base(phase, context.workdir)
+
         for iteration in range(1, phase.max_iterations + 1):
+            if iteration == 1 and last_validation_output is None:
+                feedback = context.validation_output
+            else:
+                feedback = last_validation_output
             iter_context = ExecutionContext(
                 input=context.input,
                 phase_outputs=context.phase_outputs,
                 iteration=iteration,
-                validation_output=context.validation_output if iteration == 1 else last_validation_output,
+                validation_output=feedback,
+                workdir=context.workdir,
+                run_id=context.run_id,
             )
 
             self._console.info(
                 f"  [{phase.id}] iteration {iteration}/{phase.max_iterations}"
             )
-
-            step_runs = self._execute_steps(
-                phase.steps, iter_context, phase, workflow_agent
+            self._console.event(
+                "iteration", phase_id=phase.id, iteration=iteration,
+                max_iterations=phase.max_iterations,
             )
-            all_step_runs.extend(step_runs)
+            if self._hooks is not None:
+                self._hooks.emit("on_iteration", iter_context, phase)
 
-            if step_runs:
-                last_output = step_runs[-1].output
+            winner = None
+            if speculate:
+                try:
+                    winner = self._speculate(
+                        phase, iter_context, workflow_agent, changes_base, artifacts
+                    )
+                except WorkspaceError as e:
+                    self._console.warn(f"  [{phase.id}] speculation unavailable ({e}); running sequentially")
+                    speculate = False
 
-            if not phase.validation:
+            if winner is not None:
+                attempts, selected = winner
+                for attempt in attempts:
+                    all_step_runs.extend(attempt.step_runs)
+                    if attempt.validation_run is not None:
+                        validation_runs.append(attempt.validation_run)
+                last_output = selected.output
+                vr = selected.validation_run
+                exit_code = vr.exit_code
+                validation_output = selected.validation_output
+            else:
+                step_runs = self._execute_steps(
+                    phase.steps, iter_context, phase, workflow_agent,
+                    cwd=context.workdir, changes_base=changes_base, artifacts=artifacts,
+                )
+                all_step_runs.extend(step_runs)
+
+                if step_runs:
+                    last_output = step_runs[-1].output
+
+                if not phase.validation:
+                    return PhaseRun(
+                        phase_id=phase.id,
+                        iteration=iteration,
+                        outcome="converged",
+                        step_runs=tuple(all_step_runs),
+                        output=last_output,
+                        validation_output=None,
+                        started_at=started_at,
+                        finished_at=datetime.now(timezone.utc),
+                    )
+
+                exit_code, validation_output, vr = self._validate(
+                    phase, iteration, cwd=context.workdir, changes_base=changes_base
+                )
+                validation_runs.append(vr)
+                if self._hooks is not None:
+                    self._hooks.emit("on_validation", iter_context, phase, vr)
+
+            last_validation_output = validation_output
+
+            if exit_code == 0:
                 return PhaseRun(
                     phase_id=phase.id,
                     iteration=iteration,
                     outcome="converged",
                     step_runs=tuple(all_step_runs),
                     output=last_output,
-                    validation_output=None,
+                    validation_output=_artifact(validation_output, artifacts),
                     started_at=started_at,
                     finished_at=datetime.now(timezone.utc),
+                    validation_runs=tuple(validation_runs),
                 )
 
-            exit_code, validation_output = self._command.run_command(
-                phase.validation.command
-            )
-            last_validation_output = validation_output
+            # Progress is measured against the full sensor only.
+            comparable = not vr.incremental
+            reason = None
+            if detector is not None and comparable and iteration < phase.max_iterations:
+                reason = detector.observe(
+                    validation_output, self._fingerprint(phase, context.workdir)
+                )
 
-            self._console.info(
-                f"  [{phase.id}] validation: exit_code={exit_code}"
-            )
+            if rollback and comparable:
+                best, rolled_back = self._track_progress(
+                    phase, context.workdir, iteration, vr.score,
+                    validation_output, last_output, best,
+                )
+                if rolled_back:
+                    # The workspace is back at the best state; so are the
+                    # feedback and the output describing it.
+                    last_validation_output = best.validation_output
+                    last_output = best.output
+                    if detector is not None:
+                        # The next iteration starts from the restored workspace.
+                        detector.rebase(self._fingerprint(phase, context.workdir))
 
-            if exit_code == 0:
+            if reason is not None:
+                self._console.warn(f"  [{phase.id}] stagnated ({reason}); stopping early")
                 return PhaseRun(
                     phase_id=phase.id,
                     iteration=iteration,
-                    outcome="converged",
+                    outcome="exhausted",
                     step_runs=tuple(all_step_runs),
                     output=last_output,
-                    validation_output=validation_output,
+                    validation_output=_artifact(last_validation_output, artifacts),
                     started_at=started_at,
                     finished_at=datetime.now(timezone.utc),
+                    validation_runs=tuple(validation_runs),
+                    reason="stagnated",
                 )
 
         return PhaseRun(
@@ -109,10 +344,390 @@ class PhaseExecutor:
             outcome="exhausted",
             step_runs=tuple(all_step_runs),
             output=last_output,
-            validation_output=last_validation_output,
+            validation_output=_artifact(last_validation_output, artifacts),
             started_at=started_at,
             finished_at=datetime.now(timezone.utc),
+            validation_runs=tuple(validation_runs),
+        )
+
+    def _start_stagnation(
+        self,
+        phase: Phase,
+        context: ExecutionContext,
+        precheck_output: str | None,
+    ) -> StagnationDetector | None:
+        if phase.stagnation is None or phase.validation is None:
+            return None
+        detector = StagnationDetector(phase.stagnation)
+        detector.start(precheck_output, self._fingerprint(phase, context.workdir))
+        return detector
+
+    def _fingerprint(self, phase: Phase, workdir: str | None) -> str | None:
+        """Workspace fingerprint for stagnation checks; None when unavailable."""
+        if self._workspace is None or not phase.stagnation.unchanged_workspace:
+            return None
+        try:
+            return self._workspace.fingerprint(workdir)
+        except WorkspaceError:
+            return None
+
+    def _track_progress(
+        self,
+        phase: Phase,
+        workdir: str | None,
+        iteration: int,
+        score: float | None,
+        validation_output: str,
+        output: Artifact,
+        best: _Checkpoint | None,
+    ) -> tuple[_Checkpoint | None, bool]:
+        """Snapshot a new best state or roll a regression back to the best one.
+
+        Returns the (possibly new) best checkpoint and whether the workspace
+        was rolled back. Unscored output leaves everything as is; workspace
+        failures are reported and keep the iteration.
+        """
+        if score is None:
+            return best, False
+        maximize = phase.validation.score is not None and phase.validation.score.maximize
+        regressed = best is not None and (score < best.score if maximize else score > best.score)
+        try:
+            if regressed:
+                self._workspace.restore(best.snapshot, workdir)
+                self._console.warn(
+                    f"  [{phase.id}] score {score:g} is worse than {best.score:g} "
+                    f"(iteration {best.iteration}); rolled back"
+                )
+                return best, True
+            snapshot = self._workspace.snapshot(workdir)
+        except WorkspaceError as e:
+            self._console.warn(f"  [{phase.id}] rollback unavailable ({e})")
+            return best, False
+        return _Checkpoint(iteration, score, snapshot, validation_output, output), False
+
+    def _changes_base(self, phase: Phase, workdir: str | None) -> str | None:
+        """Snapshot that changed files are measured against; None when the
+        phase doesn't use them or they are unavailable."""
+        if self._workspace is None or not _uses_changed_files(phase):
+            return None
+        try:
+            return self._workspace.snapshot(workdir)
+        except WorkspaceError:
+            return None
+
+    def _changed_files(self, changes_base: str | None, cwd: str | None) -> tuple[str, ...] | None:
+        if changes_base is None:
+            return None
+        try:
+            return tuple(self._workspace.changed_files(changes_base, cwd))
+        except WorkspaceError:
+            return None
+
+    def _run_command(
+        self, command: str, changed: tuple[str, ...] | None, cwd: str | None
+    ) -> tuple[int, str]:
+        """Run a step or validation command with the changed files filled in."""
+        command, env = _with_changed_files(command, changed)
+        return self._command.run_command(command, cwd=cwd, env=env)
+
+    def _agent_event(
+        self,
+        context: ExecutionContext,
+        phase: Phase,
+        step: Step,
+        attempt: int | None,
+        event: AgentEvent,
+        events: list[AgentEvent],
+        *,
+        hedge: bool = False,
+    ) -> None:
+        """Record a streamed agent event and surface it while the step runs.
+
+        A hedge attempt's events are tagged on the console and not passed to
+        hooks, which only follow the original attempt.
+        """
+        events.append(event)
+        label = f"{phase.id}/{step.id} (hedge)" if hedge else f"{phase.id}/{step.id}"
+        if event.kind in ("tool_call", "edit"):
+            self._console.info(f"{label}: {event.summary}")
+        self._console.event(
+            "agent_event", phase_id=phase.id, step_id=step.id,
+            iteration=context.iteration, attempt=attempt, kind=event.kind,
+            summary=event.summary, tool=event.tool, path=event.path,
+            elapsed_s=event.elapsed_s, **({"hedge": True} if hedge else {}),
+        )
+        if self._hooks is not None and not hedge:
+            self._hooks.emit("on_agent_event", context, phase, step, event)
+
+    def _run_hedged(
+        self,
+        step: LlmStep,
+        phase: Phase,
+        context: ExecutionContext,
+        agent: AgentPort,
+        agent_config: AgentConfig,
+        prompt: str,
+        cwd: str | None,
+        events: list[AgentEvent],
+    ) -> tuple[int, str, AgentPort, AgentConfig, bool, Usage | None]:
+        """Run a prompt, racing a second attempt once it outlasts the hedge threshold.
+
+        The second attempt starts from the workspace as it was before the
+        step, in its own worktree; when it wins, the original is cancelled
+        and the workspace takes the worktree's state. Returns (exit_code,
+        output, agent, agent_config, hedged, loser_usage): the attempt that
+        won, plus what the cancelled one consumed (None when nothing was
+        raced). `events` ends up holding the winner's events. If the
+        winner's state cannot be moved into the workspace, the step fails.
+        """
+        hedge = step.hedge
+        try:
+            before = self._workspace.snapshot(cwd)
+        except WorkspaceError as e:
+            self._console.warn(f"  [{phase.id}] {step.id}: not hedged: {e}")
+            exit_code, output = agent.run_prompt(prompt, cwd=cwd)
+            return exit_code, output, agent, agent_config, False, None
+
+        worktree: str | None = None
+        pool = ThreadPoolExecutor(max_workers=2)
+        try:
+            first = pool.submit(contextvars.copy_context().run, agent.run_prompt, prompt, cwd)
+            if wait([first], timeout=hedge.after_seconds).done:
+                return *first.result(), agent, agent_config, False, None
+
+            try:
+                worktree = self._workspace.create_worktree(
+                    f"{phase.id}-{context.iteration}-{step.id}-hedge", source=cwd
+                )
+                self._workspace.restore(before, worktree)
+            except WorkspaceError as e:
+                self._console.warn(f"  [{phase.id}] {step.id}: hedge not started: {e}")
+                return *first.result(), agent, agent_config, False, None
+
+            hedge_config = replace(agent_config, model=hedge.model or agent_config.model)
+            model = f" on {hedge_config.model}" if hedge_config.model else ""
+            self._console.info(
+                f"  [{phase.id}] {step.id}: still running after "
+                f"{hedge.after_seconds:.0f}s, hedging{model}"
+            )
+            self._console.event(
+                "hedge", phase_id=phase.id, step_id=step.id, iteration=context.iteration,
+                after_s=round(hedge.after_seconds, 3), model=hedge_config.model,
+            )
+            hedge_agent = self._agent_factory(hedge_config)
+            hedge_events: list[AgentEvent] = []
+            set_listener(hedge_agent, lambda event: self._agent_event(
+                context, phase, step, None, event, hedge_events, hedge=True
+            ))
+            second = pool.submit(
+                contextvars.copy_context().run, hedge_agent.run_prompt, prompt, worktree
+            )
+            done, _ = wait([first, second], return_when=FIRST_COMPLETED)
+            if first in done or second.exception() is not None:
+                hedge_agent.cancel()
+                wait([second])
+                self._console.info(f"  [{phase.id}] {step.id}: original attempt won")
+                return (
+                    *first.result(), agent, agent_config, True,
+                    _prompt_usage(hedge_agent, prompt, hedge_config),
+                )
+
+            agent.cancel()
+            wait([first])
+            loser_usage = _prompt_usage(agent, prompt, agent_config)
+            events[:] = hedge_events
+            try:
+                self._workspace.restore(self._workspace.snapshot(worktree), cwd)
+            except WorkspaceError as e:
+                message = f"hedged attempt won but its changes could not be applied: {e}"
+                self._console.warn(f"  [{phase.id}] {step.id}: {message}")
+                return 1, message, hedge_agent, hedge_config, True, loser_usage
+            self._console.info(f"  [{phase.id}] {step.id}: hedged attempt won")
+            return *second.result(), hedge_agent, hedge_config, True, loser_usage
+        finally:
+            pool.shutdown(wait=True)
+            if worktree is not None:
+                self._workspace.remove_worktree(worktree)
+
+    def _run_command_step(
+        self,
+        step: CommandStep,
+        phase: Phase,
+        changed: tuple[str, ...] | None,
+        cwd: str | None,
+    ) -> tuple[int, str, bool, bool]:
+        """Run a command step, replaying a cached result when one matches.
+
+        Returns (exit_code, output, cached, timed_out). Only successful runs
+        are cached.
+        """
+        command, env = _with_changed_files(step.command, changed)
+        key = None
+        if step.inputs and self._step_cache is not None:
+            key = self._step_cache.key(command, step.inputs, cwd)
+        if key is not None:
+            hit = self._step_cache.restore(key, cwd)
+            if hit is not None:
+                self._console.info(f"  [{phase.id}] {step.id}: cached result")
+                return hit[0], hit[1], True, False
+        exit_code, output = self._command.run_command(command, cwd=cwd, env=env)
+        if key is not None and exit_code == 0:
+            self._step_cache.save(key, step.outputs, exit_code, output, cwd)
+        return exit_code, output, False, command_timed_out(self._command)
+
+    def _validate(
+        self,
+        phase: Phase,
+        iteration: int,
+        *,
+        cwd: str | None = None,
+        attempt: int | None = None,
+        changes_base: str | None = None,
+    ) -> tuple[int, str, ValidationRun]:
+        """Run the phase's validation command and record its timing.
+
+        With an incremental command and a known, non-empty set of changed
+        files, the targeted check runs first; its failure is the result. A
+        subset's result is not comparable with the full sensor's, so it is
+        never scored.
+        """
+        started = datetime.now(timezone.utc)
+        label = "precheck" if iteration == 0 else "validation"
+        if attempt is not None:
+            label = f"attempt {attempt} {label}"
+        changed = self._changed_files(changes_base, cwd)
+        incremental = False
+        if phase.validation.incremental_command and changed:
+            exit_code, output = self._run_command(phase.validation.incremental_command, changed, cwd)
+            self._console.info(
+                f"  [{phase.id}] incremental {label} ({len(changed)} file(s)): exit_code={exit_code}"
+            )
+            incremental = exit_code != 0
+        if not incremental:
+            exit_code, output = self._run_command(phase.validation.command, changed, cwd)
+        timed_out = command_timed_out(self._command)
+        score = None
+        if exit_code != 0 and not incremental and (
+            phase.rollback or phase.validation.score is not None
+        ):
+            score = parse_score(output, phase.validation.score or Score())
+        record = ValidationRun(
+            iteration=iteration,
+            started_at=started,
+            finished_at=datetime.now(timezone.utc),
+            exit_code=exit_code,
+            attempt=attempt,
+            score=score,
+            incremental=incremental,
+            timed_out=timed_out,
+        )
+        scored = f" score={score:g}" if score is not None else ""
+        self._console.info(f"  [{phase.id}] {label}: exit_code={exit_code}{scored}")
+        self._console.event(
+            "validation", phase_id=phase.id, iteration=iteration, attempt=attempt,
+            exit_code=exit_code, score=score, incremental=incremental,
+            duration_s=_seconds(record.started_at, record.finished_at),
         )
+        return exit_code, output, record
+
+    def _speculate(
+        self,
+        phase: Phase,
+        context: ExecutionContext,
+        workflow_agent: AgentConfig,
+        changes_base: str | None = None,
+        artifacts: ArtifactStorePort | None = None,
+    ) -> tuple[list[_Attempt], _Attempt]:
+        """Run N attempts concurrently in worktrees and promote the selected one.
+
+        Returns all attempts (ordered by index) and the promoted attempt.
+        """
+        spec = phase.speculation
+        worktrees: list[str] = []
+        try:
+            for i in range(1, spec.attempts + 1):
+                worktrees.append(
+                    self._workspace.create_worktree(
+                        f"{phase.id}-{context.iteration}-{i}", source=context.workdir
+                    )
+                )
+            controls = [_AttemptControl() for _ in worktrees]
+            attempts: list[_Attempt] = []
+
+            with ThreadPoolExecutor(max_workers=len(worktrees)) as pool:
+                # Each attempt runs in a copy of the caller's context so
+                # context-scoped state (e.g. the active workspace) follows it.
+                futures = [
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        self._run_attempt, i + 1, wt, controls[i], phase, context,
+                        workflow_agent, changes_base, artifacts,
+                    )
+                    for i, wt in enumerate(worktrees)
+                ]
+                try:
+                    for future in as_completed(futures):
+                        attempt = future.result()
+                        attempts.append(attempt)
+                        if spec.select == "first" and attempt.converged:
+                            for control in controls:
+                                control.cancel()
+                except BaseException:
+                    for control in controls:
+                        control.cancel()
+                    raise
+
+            selected = self._select(spec, attempts)
+            self._workspace.promote(selected.worktree, target=context.workdir)
+            self._console.info(
+                f"  [{phase.id}] promoted attempt {selected.index}/{spec.attempts}"
+            )
+            return sorted(attempts, key=lambda a: a.index), selected
+        finally:
+            for wt in worktrees:
+                self._workspace.remove_worktree(wt)
+
+    def _run_attempt(
+        self,
+        index: int,
+        worktree: str,
+        control: _AttemptControl,
+        phase: Phase,
+        context: ExecutionContext,
+        workflow_agent: AgentConfig,
+        changes_base: str | None = None,
+        artifacts: ArtifactStorePort | None = None,
+    ) -> _Attempt:
+        step_runs = self._execute_steps(
+            phase.steps, context, phase, workflow_agent,
+            cwd=worktree, attempt=index, control=control, changes_base=changes_base,
+            artifacts=artifacts,
+        )
+        if control.cancelled:
+            return _Attempt(index, worktree, step_runs, None, "", cancelled=True)
+
+        _, output, record = self._validate(
+            phase, context.iteration, cwd=worktree, attempt=index, changes_base=changes_base
+        )
+        if self._hooks is not None:
+            self._hooks.emit("on_validation", context, phase, record)
+        return _Attempt(index, worktree, step_runs, record, output, cancelled=control.cancelled)
+
+    def _select(self, spec: Speculation, attempts: list[_Attempt]) -> _Attempt:
+        """Pick the attempt to promote.
+
+        attempts is in completion order. Without any converging attempt the
+        lowest-index one is promoted so the next iteration builds on it.
+        """
+        converged = [a for a in attempts if a.converged]
+        if not converged:
+            return min(attempts, key=lambda a: a.index)
+        if spec.select == "best":
+            return min(
+                converged,
+                key=lambda a: (self._workspace.change_size(a.worktree), a.index),
+            )
+        return converged[0]
 
     def _execute_steps(
         self,
@@ -120,40 +735,157 @@ class PhaseExecutor:
         context: ExecutionContext,
         phase: Phase,
         workflow_agent: AgentConfig,
+        *,
+        cwd: str | None = None,
+        attempt: int | None = None,
+        control: _AttemptControl | None = None,
+        changes_base: str | None = None,
+        artifacts: ArtifactStorePort | None = None,
     ) -> list[StepRun]:
         results: list[StepRun] = []
         for step in steps:
+            if control is not None and control.cancelled:
+                break
             started = datetime.now(timezone.utc)
+            cached = False
+            hedged = False
+            timed_out = False
+            usage = None
+            events: list[AgentEvent] = []
+            self._console.event(
+                "step_start", phase_id=phase.id, step_id=step.id,
+                iteration=context.iteration, attempt=attempt,
+            )
+            if self._hooks is not None:
+                self._hooks.emit("on_step_start", context, phase, step, attempt)
 
             if isinstance(step, LlmStep):
                 agent_config = resolve_agent_config(
                     step.agent, phase.agent, workflow_agent
                 )
                 agent = self._agent_factory(agent_config)
+                if control is not None:
+                    control.bind(agent)
+                step_context = context
+                if CHANGED_FILES_VAR in step.prompt:
+                    step_context = replace(
+                        context, changed_files=self._changed_files(changes_base, cwd)
+                    )
                 prompt = self._prompt_builder.build(
                     template=step.prompt,
-                    context=context,
+                    context=step_context,
                     step_results=results,
                     max_iterations=phase.max_iterations,
                 )
-                exit_code, output = agent.run_prompt(prompt)
+                def listener(event: AgentEvent) -> None:
+                    self._agent_event(context, phase, step, attempt, event, events)
+
+                set_listener(agent, listener)
+                hedge = step.hedge
+                if (
+                    hedge is not None and hedge.after_seconds is not None
+                    and attempt is None and self._workspace is not None
+                ):
+                    exit_code, output, agent, agent_config, hedged, loser_usage = (
+                        self._run_hedged(
+                            step, phase, context, agent, agent_config, prompt, cwd, events
+                        )
+                    )
+                else:
+                    exit_code, output = agent.run_prompt(prompt, cwd=cwd)
+                    loser_usage = None
+                timed_out = reported_timeout(agent)
+                usage = _prompt_usage(agent, prompt, agent_config)
+                if loser_usage is not None:
+                    # A hedge pays for both attempts; the winner names the model.
+                    usage = replace(usage + loser_usage, model=usage.model)
             elif isinstance(step, CommandStep):
                 agent_config = None
-                exit_code, output = self._command.run_command(step.command)
+                exit_code, output, cached, timed_out = self._run_command_step(
+                    step, phase, self._changed_files(changes_base, cwd), cwd
+                )
             else:
                 raise TypeError(f"Unknown step type: {type(step)}")
 
             finished = datetime.now(timezone.utc)
-            results.append(
-                StepRun(
-                    step_id=step.id,
-                    phase_id=phase.id,
-                    iteration=context.iteration,
-                    started_at=started,
-                    finished_at=finished,
-                    output=output,
-                    exit_code=exit_code,
-                    agent_config=agent_config,
-                )
+            self._console.event(
+                "step_end", phase_id=phase.id, step_id=step.id,
+                iteration=context.iteration, attempt=attempt, exit_code=exit_code,
+                cached=cached, duration_s=_seconds(started, finished),
             )
+            step_run = StepRun(
+                step_id=step.id,
+                phase_id=phase.id,
+                iteration=context.iteration,
+                started_at=started,
+                finished_at=finished,
+                output=_artifact(output, artifacts),
+                exit_code=exit_code,
+                agent_config=agent_config,
+                attempt=attempt,
+                cached=cached,
+                usage=usage,
+                hedged=hedged,
+                timed_out=timed_out,
+                events=_artifact(event_log(events), artifacts) if events else None,
+            )
+            results.append(step_run)
+            if self._hooks is not None:
+                self._hooks.emit("on_step_end", context, phase, step_run)
         return results
+
+
+def _seconds(started: datetime, finished: datetime) -> float:
+    return round((finished - started).total_seconds(), 3)
+
+
+def _artifact(text: str | None, artifacts: ArtifactStorePort | None) -> Artifact | None:
+    """Hand an output to the artifact store, or keep it inline without one."""
+    if text is None:
+        return None
+    return artifacts.put(text) if artifacts is not None else Artifact(text)
+
+
+def _precheck_note(phase: Phase) -> str:
+    """Output of a phase that converged on its precheck, for later phases to read."""
+    return (
+        f"Phase '{phase.id}' made no changes: its validation "
+        f"(`{phase.validation.command}`) already passed."
+    )
+
+
+def _prompt_usage(agent: AgentPort, prompt: str, agent_config: AgentConfig) -> Usage:
+    """What the agent's last call consumed, with the prompt size and model filled in."""
+    usage = reported_usage(agent) or Usage()
+    return replace(
+        usage,
+        prompt_bytes=len(prompt.encode("utf-8")),
+        model=usage.model or agent_config.model,
+    )
+
+
+def _uses_changed_files(phase: Phase) -> bool:
+    """Whether anything in the phase reads the changed files."""
+    if phase.changed_files:
+        return True
+    validation = phase.validation
+    if validation is not None and (
+        validation.incremental_command or CHANGED_FILES_VAR in validation.command
+    ):
+        return True
+    return any(
+        CHANGED_FILES_VAR in (step.prompt if isinstance(step, LlmStep) else step.command)
+        for step in phase.steps
+    )
+
+
+def _with_changed_files(
+    command: str, changed: tuple[str, ...] | None
+) -> tuple[str, dict[str, str] | None]:
+    """Fill {{CHANGED_FILES}} into a command and build its environment."""
+    if CHANGED_FILES_VAR in command:
+        command = command.replace(
+            CHANGED_FILES_VAR, " ".join(shlex.quote(f) for f in changed or ())
+        )
+    env = {CHANGED_FILES_ENV: "\n".join(changed)} if changed is not None else None
+    return command, env
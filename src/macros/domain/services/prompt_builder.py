@@ -2,6 +2,7 @@
 
 import re
 
+from macros.domain.model.artifact import Artifact
 from macros.domain.model.context import ExecutionContext
 from macros.domain.model.run import StepRun
 
@@ -18,6 +19,7 @@ class PromptBuilder:
       {{STEP_OUTPUT:step_id}}   -- output from a prior step in the same phase
       {{ITERATION}}             -- current iteration number (1-based)
       {{VALIDATION_OUTPUT}}     -- error signal from the last validation sensor
+      {{CHANGED_FILES}}         -- files changed since the phase started, one per line
 
     When iteration > 1 and validation_output is present, a feedback block
     is auto-appended to drive the agent toward convergence.
@@ -44,8 +46,9 @@ class PromptBuilder:
         self,
         context: ExecutionContext,
         step_results: list[StepRun],
-    ) -> dict[str, str]:
-        variables: dict[str, str] = {
+    ) -> dict[str, Artifact | str]:
+        """Every variable's value; outputs stay handles until substituted."""
+        variables: dict[str, Artifact | str] = {
             "INPUT": context.input,
             "ITERATION": str(context.iteration),
         }
@@ -53,6 +56,9 @@ class PromptBuilder:
         if context.validation_output is not None:
             variables["VALIDATION_OUTPUT"] = context.validation_output
 
+        if context.changed_files is not None:
+            variables["CHANGED_FILES"] = "\n".join(context.changed_files)
+
         for phase_id, output in context.phase_outputs.items():
             variables[f"PHASE_OUTPUT:{phase_id}"] = output
 
@@ -61,10 +67,11 @@ class PromptBuilder:
 
         return variables
 
-    def _substitute(self, template: str, variables: dict[str, str]) -> str:
+    def _substitute(self, template: str, variables: dict[str, Artifact | str]) -> str:
         def replacer(match: re.Match) -> str:
             key = match.group(1)
-            return variables.get(key, match.group(0))
+            value = variables.get(key)
+            return match.group(0) if value is None else str(value)
 
         return _VAR_PATTERN.sub(replacer, template)
 
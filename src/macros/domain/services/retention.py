@@ -0,0 +1,24 @@
+"""Run retention -- selects the runs a RetentionPolicy expires."""
+
+from typing import Iterable
+
+from macros.domain.model.retention import RetentionPolicy
+from macros.domain.model.run import Run, RunStatus
+
+
+def select_expired(runs: Iterable[Run], policy: RetentionPolicy) -> list[Run]:
+    """Runs (given newest first) that the policy no longer keeps."""
+    if policy.keep_last is None and policy.older_than is None:
+        return []
+    expired = []
+    for index, run in enumerate(runs):
+        if policy.keep_last is not None and index < policy.keep_last:
+            continue
+        if policy.older_than is not None:
+            if run.started_at >= policy.older_than:
+                continue
+        elif run.status is RunStatus.RUNNING:
+            # Possibly still executing; only an age cutoff may remove it.
+            continue
+        expired.append(run)
+    return expired
@@ -0,0 +1,188 @@
+"""Run report -- per-phase and per-iteration time breakdown of a single run."""
+
+from datetime import datetime
+from typing import Iterable, Sequence
+
+from macros.domain.model.report import (
+    IterationReport,
+    PhaseReport,
+    RunReport,
+    SlowStep,
+    TimeBreakdown,
+)
+from macros.domain.model.run import PhaseRun, Run, StepRun, ValidationRun
+from macros.domain.model.workflow import Workflow
+from macros.domain.services.context_inference import effective_context
+
+
+def build_report(run: Run, workflow: Workflow | None = None, slowest: int = 5) -> RunReport:
+    """Break a run's wall time down by phase, iteration and kind of work.
+
+    Parallelism estimates assume an agent step may depend on everything
+    before it (it reads the workspace), while a command step only waits for
+    the agent steps before it; speculative attempts already overlap and are
+    left out. Phases depend on the phases in their context, so the phase
+    estimate needs the workflow definition. Neither models dependencies
+    through the shared checkout (a phase or command editing files another
+    one reads), so both savings are upper bounds.
+    """
+    phases = tuple(_phase_report(pr) for pr in run.phase_runs)
+    busy = _sum_breakdowns(p.breakdown for p in phases)
+    end = run.finished_at or max(
+        (pr.finished_at for pr in run.phase_runs), default=run.started_at
+    )
+    wall = _seconds(run.started_at, end)
+
+    step_runs = [sr for pr in run.phase_runs for sr in pr.step_runs]
+    step_runs.sort(key=_duration, reverse=True)
+    exhausted = [
+        (pr, report) for pr, report in zip(run.phase_runs, phases)
+        if pr.outcome == "exhausted"
+    ]
+
+    critical_path = phase_savings = None
+    if workflow is not None and phases:
+        critical_path = _critical_path(run.phase_runs, workflow)
+        phase_savings = max(0.0, sum(p.wall_seconds for p in phases) - critical_path)
+
+    return RunReport(
+        run_id=run.id,
+        workflow_id=run.workflow_id,
+        status=run.status.value,
+        started_at=run.started_at,
+        wall_seconds=wall,
+        breakdown=TimeBreakdown(
+            agent_seconds=busy.agent_seconds,
+            command_seconds=busy.command_seconds,
+            validation_seconds=busy.validation_seconds,
+            overhead_seconds=max(0.0, wall - _busy(busy)),
+        ),
+        phases=phases,
+        slowest_steps=tuple(_slow_step(sr) for sr in step_runs[:slowest]),
+        wasted_iterations=sum(pr.iteration for pr, _ in exhausted),
+        wasted_seconds=sum(report.wall_seconds for _, report in exhausted),
+        step_savings=sum(p.step_savings for p in phases),
+        critical_path_seconds=critical_path,
+        phase_savings=phase_savings,
+        usage=run.usage,
+    )
+
+
+def _phase_report(pr: PhaseRun) -> PhaseReport:
+    steps: dict[int, list[StepRun]] = {}
+    for sr in pr.step_runs:
+        steps.setdefault(sr.iteration, []).append(sr)
+    validations: dict[int, list[ValidationRun]] = {}
+    for vr in pr.validation_runs:
+        validations.setdefault(vr.iteration, []).append(vr)
+
+    # Each iteration runs until the next one starts, so bookkeeping between
+    # iterations (snapshots, rollbacks) counts as the earlier one's overhead.
+    numbers = sorted(set(steps) | set(validations))
+    starts = [
+        min(r.started_at for r in (*steps.get(i, ()), *validations.get(i, ())))
+        for i in numbers
+    ]
+    bounds = [pr.started_at, *starts[1:], pr.finished_at]
+    iterations = tuple(
+        IterationReport(
+            iteration=i,
+            breakdown=_breakdown(
+                steps.get(i, ()), validations.get(i, ()), _seconds(bounds[n], bounds[n + 1])
+            ),
+        )
+        for n, i in enumerate(numbers)
+    )
+
+    wall = _seconds(pr.started_at, pr.finished_at)
+    return PhaseReport(
+        phase_id=pr.phase_id,
+        outcome=pr.outcome,
+        reason=pr.reason,
+        iterations=iterations,
+        wall_seconds=wall,
+        breakdown=_breakdown(pr.step_runs, pr.validation_runs, wall),
+        step_savings=sum(_step_savings(s) for s in steps.values()),
+        usage=pr.usage,
+    )
+
+
+def _breakdown(
+    step_runs: Sequence[StepRun],
+    validation_runs: Sequence[ValidationRun],
+    wall: float,
+) -> TimeBreakdown:
+    agent = sum(_duration(sr) for sr in step_runs if sr.agent_config is not None)
+    command = sum(_duration(sr) for sr in step_runs if sr.agent_config is None)
+    validation = sum(_seconds(vr.started_at, vr.finished_at) for vr in validation_runs)
+    return TimeBreakdown(
+        agent_seconds=agent,
+        command_seconds=command,
+        validation_seconds=validation,
+        # Speculative attempts overlap, so busy time can exceed the wall.
+        overhead_seconds=max(0.0, wall - agent - command - validation),
+    )
+
+
+def _step_savings(step_runs: list[StepRun]) -> float:
+    """Sequential minus dependency-bound duration of one iteration's steps."""
+    sequential = [sr for sr in step_runs if sr.attempt is None]
+    agents_done = everything_done = 0.0
+    for sr in sequential:
+        if sr.agent_config is not None:
+            everything_done = agents_done = everything_done + _duration(sr)
+        else:
+            everything_done = max(everything_done, agents_done + _duration(sr))
+    return max(0.0, sum(_duration(sr) for sr in sequential) - everything_done)
+
+
+def _critical_path(phase_runs: list[PhaseRun], workflow: Workflow) -> float:
+    """Longest chain of phase executions linked by context and by re-runs."""
+    index = {p.id: p for p in workflow.phases}
+    finished: dict[str, float] = {}
+    longest = 0.0
+    for pr in phase_runs:
+        phase = index.get(pr.phase_id)
+        if phase is None:
+            deps = list(finished)  # unknown now: assume it needed everything before it
+        else:
+            deps = [*effective_context(phase), pr.phase_id]
+        start = max((finished[d] for d in deps if d in finished), default=0.0)
+        finished[pr.phase_id] = start + _seconds(pr.started_at, pr.finished_at)
+        longest = max(longest, finished[pr.phase_id])
+    return longest
+
+
+def _slow_step(sr: StepRun) -> SlowStep:
+    return SlowStep(
+        phase_id=sr.phase_id,
+        step_id=sr.step_id,
+        iteration=sr.iteration,
+        kind="agent" if sr.agent_config is not None else "command",
+        seconds=_duration(sr),
+        attempt=sr.attempt,
+        cached=sr.cached,
+    )
+
+
+def _sum_breakdowns(breakdowns: Iterable[TimeBreakdown]) -> TimeBreakdown:
+    total = TimeBreakdown()
+    for b in breakdowns:
+        total = TimeBreakdown(
+            agent_seconds=total.agent_seconds + b.agent_seconds,
+            command_seconds=total.command_seconds + b.command_seconds,
+            validation_seconds=total.validation_seconds + b.validation_seconds,
+        )
+    return total
+
+
+def _busy(b: TimeBreakdown) -> float:
+    return b.agent_seconds + b.command_seconds + b.validation_seconds
+
+
+def _duration(sr: StepRun) -> float:
+    return _seconds(sr.started_at, sr.finished_at)
+
+
+def _seconds(started: datetime, finished: datetime) -> float:
+    return (finished - started).total_seconds()
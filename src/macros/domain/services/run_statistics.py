@@ -0,0 +1,104 @@
+"""RunStatistics -- streaming aggregation of run manifests into per-phase stats."""
+
+import math
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from macros.domain.model.run import Run
+from macros.domain.model.stats import Percentiles, PhaseStats, RunStats
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Linear-interpolated percentile (q in [0, 100]) of an ascending sample."""
+    if not ordered:
+        raise ValueError("percentile of empty sample")
+    rank = (len(ordered) - 1) * q / 100
+    lo, hi = math.floor(rank), math.ceil(rank)
+    if lo == hi:
+        return ordered[lo]
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (rank - lo)
+
+
+def summarize(values: list[float]) -> Percentiles | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return Percentiles(
+        p50=percentile(ordered, 50),
+        p95=percentile(ordered, 95),
+        p99=percentile(ordered, 99),
+    )
+
+
+@dataclass
+class _PhaseAccumulator:
+    executions: int = 0
+    converged: int = 0
+    exhausted: int = 0
+    failed: int = 0
+    iterations_to_converge: list[float] = field(default_factory=list)
+    step_seconds: list[float] = field(default_factory=list)
+    validation_seconds: list[float] = field(default_factory=list)
+    exhausted_seconds: float = 0.0
+
+
+class RunStatistics:
+    """Aggregates runs one at a time so manifests can be streamed from disk.
+
+    Per (workflow, phase) it tracks outcome counts, iterations needed to
+    converge, step and validation latencies, and wall time spent in phase
+    executions that exhausted their iteration budget.
+    """
+
+    def __init__(self) -> None:
+        self._run_count = 0
+        self._phases: dict[tuple[str, str], _PhaseAccumulator] = {}
+
+    def add(self, run: Run) -> None:
+        self._run_count += 1
+        for pr in run.phase_runs:
+            acc = self._phases.setdefault((run.workflow_id, pr.phase_id), _PhaseAccumulator())
+            acc.executions += 1
+            if pr.outcome == "converged":
+                acc.converged += 1
+                acc.iterations_to_converge.append(pr.iteration)
+            elif pr.outcome == "exhausted":
+                acc.exhausted += 1
+                acc.exhausted_seconds += (pr.finished_at - pr.started_at).total_seconds()
+            else:
+                acc.failed += 1
+
+            acc.step_seconds.extend(
+                (sr.finished_at - sr.started_at).total_seconds() for sr in pr.step_runs
+            )
+            acc.validation_seconds.extend(
+                (vr.finished_at - vr.started_at).total_seconds() for vr in pr.validation_runs
+            )
+
+    def add_all(self, runs: Iterable[Run]) -> "RunStatistics":
+        for run in runs:
+            self.add(run)
+        return self
+
+    def result(self) -> RunStats:
+        phases = []
+        for (workflow_id, phase_id), acc in sorted(self._phases.items()):
+            iterations = acc.iterations_to_converge
+            phases.append(
+                PhaseStats(
+                    workflow_id=workflow_id,
+                    phase_id=phase_id,
+                    executions=acc.executions,
+                    converged=acc.converged,
+                    exhausted=acc.exhausted,
+                    failed=acc.failed,
+                    mean_iterations_to_converge=(
+                        sum(iterations) / len(iterations) if iterations else None
+                    ),
+                    iterations_to_converge=summarize(iterations),
+                    step_latency=summarize(acc.step_seconds),
+                    validation_latency=summarize(acc.validation_seconds),
+                    exhausted_seconds=acc.exhausted_seconds,
+                )
+            )
+        return RunStats(run_count=self._run_count, phases=tuple(phases))
@@ -0,0 +1,60 @@
+"""StagnationDetector -- notices when a phase loop has stopped making progress."""
+
+from macros.domain.model.workflow import Stagnation
+from macros.domain.services.validation_output import output_digest, parse_failure_count
+
+
+class StagnationDetector:
+    """Tracks one phase execution's failed validations against its Stagnation rules.
+
+    Call start() with the state before the first iteration (the precheck
+    output, if any, and the workspace fingerprint), then observe() after
+    every failed validation, and rebase() when the workspace was rolled back
+    underneath it. A fingerprint of None means "unknown" and never counts as
+    unchanged.
+    """
+
+    def __init__(self, config: Stagnation) -> None:
+        self._config = config
+        self._last_digest: str | None = None
+        self._last_fingerprint: str | None = None
+        self._failure_counts: list[int] = []
+
+    def start(self, validation_output: str | None, fingerprint: str | None) -> None:
+        self._last_fingerprint = fingerprint
+        if validation_output is not None:
+            self._last_digest = output_digest(validation_output)
+            self._record_failures(validation_output)
+
+    def rebase(self, fingerprint: str | None) -> None:
+        """Compare the next iteration with this workspace state instead."""
+        self._last_fingerprint = fingerprint
+
+    def observe(self, validation_output: str, fingerprint: str | None) -> str | None:
+        """Record a failed iteration. Returns why the loop is stuck, or None."""
+        digest = output_digest(validation_output)
+        identical = digest == self._last_digest
+        unchanged = fingerprint is not None and fingerprint == self._last_fingerprint
+        self._last_digest = digest
+        self._last_fingerprint = fingerprint
+        self._record_failures(validation_output)
+
+        if self._config.identical_output and identical:
+            return "identical validation output"
+        if self._config.unchanged_workspace and unchanged:
+            return "no workspace changes"
+        window = self._config.no_progress_iterations
+        if window is not None and self._no_progress(window):
+            return f"failure count not decreasing for {window} iteration(s)"
+        return None
+
+    def _record_failures(self, validation_output: str) -> None:
+        count = parse_failure_count(validation_output)
+        if count is not None:
+            self._failure_counts.append(count)
+
+    def _no_progress(self, window: int) -> bool:
+        counts = self._failure_counts
+        if len(counts) <= window:
+            return False
+        return min(counts[-window:]) >= min(counts[:-window])
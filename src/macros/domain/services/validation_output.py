@@ -0,0 +1,67 @@
+"""Helpers for reading validation (sensor) output: normalization, failure counts, scores."""
+
+import hashlib
+import re
+
+from macros.domain.model.workflow import Score
+
+_ANSI = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?")
+_DURATION = re.compile(r"\b\d+(?:\.\d+)?\s*(?:ms|s|sec|secs|seconds?|m|min)\b")
+_ADDRESS = re.compile(r"\b0x[0-9a-fA-F]+\b")
+_TMP_PATH = re.compile(r"/tmp/[^\s:'\"]+")
+_WHITESPACE = re.compile(r"\s+")
+
+# Summary lines, most specific first. Each pattern's numbers are summed.
+_FAILURE_PATTERNS = (
+    re.compile(r"\bFound (\d+) errors?\b"),                 # tsc, mypy
+    re.compile(r"\b(\d+) problems?\b"),                     # eslint
+    re.compile(r"\b(\d+) (?:failed|failing|errors?)\b"),   # pytest, jest, mocha
+)
+
+
+def normalize_output(text: str) -> str:
+    """Strip run-to-run noise (colors, timings, timestamps, addresses, temp paths)."""
+    text = _ANSI.sub("", text)
+    text = _TIMESTAMP.sub("<ts>", text)
+    text = _DURATION.sub("<t>", text)
+    text = _ADDRESS.sub("<addr>", text)
+    text = _TMP_PATH.sub("<tmp>", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def output_digest(text: str) -> str:
+    """Stable hash of the normalized output; equal digests mean "same result"."""
+    return hashlib.sha256(normalize_output(text).encode("utf-8")).hexdigest()
+
+
+def parse_failure_count(text: str) -> int | None:
+    """Failure count from the last test/typecheck/lint summary line, if any.
+
+    Understands pytest ("2 failed, 1 error in 0.3s"), jest/mocha ("Tests: 3
+    failed", "4 failing"), tsc/mypy ("Found 5 errors") and eslint ("12
+    problems"). Returns None when no summary is recognized.
+    """
+    for line in reversed(_ANSI.sub("", text).splitlines()):
+        for pattern in _FAILURE_PATTERNS:
+            counts = pattern.findall(line)
+            if counts:
+                return sum(int(c) for c in counts)
+    return None
+
+
+def parse_score(text: str, score: Score) -> float | None:
+    """Progress score of a validation output, or None when it can't be read."""
+    if score.pattern is None:
+        count = parse_failure_count(text)
+        return float(count) if count is not None else None
+    matches = re.findall(score.pattern, text, re.MULTILINE)
+    if not matches:
+        return None
+    last = matches[-1]
+    if isinstance(last, tuple):
+        last = last[0]
+    try:
+        return float(last)
+    except ValueError:
+        return None
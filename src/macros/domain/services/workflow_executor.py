@@ -1,13 +1,23 @@
 """WorkflowExecutor -- outer control loop: sequences phases, manages context."""
 
 from datetime import datetime, timezone
+from itertools import islice
 from types import MappingProxyType
 
+from macros.domain.exceptions import WorkspaceError
+from macros.domain.model.artifact import Artifact
 from macros.domain.model.context import ExecutionContext
-from macros.domain.model.run import Run, RunStatus
-from macros.domain.model.workflow import Workflow
+from macros.domain.model.run import PhaseRun, Run, RunStatus
+from macros.domain.model.workflow import Phase, Workflow
+from macros.domain.ports.artifact_store_port import ArtifactStorePort
 from macros.domain.ports.console_port import ConsolePort
+from macros.domain.ports.metrics_port import MetricsPort
+from macros.domain.ports.phase_memo_port import PhaseMemoPort
 from macros.domain.ports.run_store_port import RunStorePort
+from macros.domain.ports.workspace_port import WorkspacePort
+from macros.domain.services.context_inference import effective_context, outputs_needed_after
+from macros.domain.services.hedging import HISTORY_RUNS, needs_history, resolve_hedges
+from macros.domain.services.hooks import HookDispatcher
 from macros.domain.services.phase_executor import PhaseExecutor
 
 
@@ -17,8 +27,23 @@ class WorkflowExecutor:
     Responsibilities:
     - Phase sequencing via on_complete / on_exhausted transitions
     - Context accumulation and filtering per phase.context declarations
+      (inferred from the prompts when undeclared); outputs no phase that can
+      still run will read are dropped
     - Checkpoint persistence after each phase (manifest)
+    - Output storage: outputs go to the run's artifact store as they are
+      produced; the context carries handles, loaded only when a prompt
+      references them
     - Global safety limit via max_phase_visits
+    - Hedge thresholds derived from the step durations of recent runs of
+      the workflow, for agent steps that hedge without a fixed threshold
+    - Metrics reporting per phase and per run (optional)
+    - Progress events (run/phase start and end, checkpoints) on the console
+      and to lifecycle hooks (optional)
+    - Phase memoization (optional): a phase with memoize reuses the output
+      of an earlier run that converged on the same workflow, input, context
+      outputs and workspace fingerprint instead of executing. Only phases
+      that left the workspace unchanged are remembered, since a reused
+      output cannot replay edits.
     """
 
     def __init__(
@@ -26,10 +51,18 @@ class WorkflowExecutor:
         phase_executor: PhaseExecutor,
         store: RunStorePort,
         console: ConsolePort,
+        metrics: MetricsPort | None = None,
+        hooks: HookDispatcher | None = None,
+        memo: PhaseMemoPort | None = None,
+        workspace: WorkspacePort | None = None,
     ) -> None:
         self._phase_executor = phase_executor
         self._store = store
         self._console = console
+        self._metrics = metrics
+        self._hooks = hooks
+        self._memo = memo
+        self._workspace = workspace
 
     def execute(
         self,
@@ -37,7 +70,13 @@ class WorkflowExecutor:
         input_text: str,
         *,
         stop_after: str | None = None,
+        workdir: str | None = None,
     ) -> Run:
+        phases = workflow.phases
+        if needs_history(workflow):
+            recent = islice(self._store.iter_runs(workflow_id=workflow.id), HISTORY_RUNS)
+            phases = resolve_hedges(workflow, recent).phases
+
         run_dir = self._store.create_run_dir(workflow.id)
         run = Run(
             id=run_dir.rsplit("/", 1)[-1],
@@ -47,84 +86,197 @@ class WorkflowExecutor:
             artifacts_dir=run_dir,
         )
         self._store.write_artifact(run_dir, "input.txt", input_text)
+        artifacts = self._store.artifact_store(run_dir)
 
         self._console.info(f"Workflow: {workflow.name} ({workflow.agent.engine})")
         self._console.info(f"Artifacts: {run_dir}")
+        self._console.event(
+            "run_start", run_id=run.id, workflow_id=workflow.id, artifacts_dir=run_dir
+        )
+        if self._hooks is not None:
+            self._hooks.emit("on_run_start", run, workflow)
 
-        phase_index = {p.id: p for p in workflow.phases}
-        accumulated_outputs: dict[str, str] = {}
-        visit_count = 0
-        current_phase_id: str | None = workflow.phases[0].id
+        try:
+            phase_index = {p.id: p for p in phases}
+            accumulated_outputs: dict[str, Artifact] = {}
+            needed_after = outputs_needed_after(workflow)
+            visit_count = 0
+            current_phase_id: str | None = workflow.phases[0].id
 
-        while current_phase_id is not None:
-            visit_count += 1
-            if visit_count > workflow.max_phase_visits:
-                run.status = RunStatus.FAILED
-                run.failure_reason = (
-                    f"Exceeded max_phase_visits ({workflow.max_phase_visits})"
-                )
-                break
+            while current_phase_id is not None:
+                visit_count += 1
+                if visit_count > workflow.max_phase_visits:
+                    run.status = RunStatus.FAILED
+                    run.failure_reason = (
+                        f"Exceeded max_phase_visits ({workflow.max_phase_visits})"
+                    )
+                    break
 
-            phase = phase_index[current_phase_id]
-            self._console.info(f"Phase: {phase.id}")
+                phase = phase_index[current_phase_id]
+                self._console.info(f"Phase: {phase.id}")
+                self._console.event(
+                    "phase_start", run_id=run.id, phase_id=phase.id, visit=visit_count
+                )
+                if self._hooks is not None:
+                    self._hooks.emit("on_phase_start", run, phase)
 
-            context = self._build_context(
-                input_text, phase.context, accumulated_outputs
-            )
+                context = self._build_context(
+                    input_text, effective_context(phase), accumulated_outputs, workdir, run.id
+                )
 
-            phase_run = self._phase_executor.execute(
-                phase, context, workflow.agent
-            )
-            run.phase_runs.append(phase_run)
+                memo = self._memo_key(workflow, phase, context)
+                hit = self._memo.load(memo[0]) if memo is not None else None
+                if hit is not None:
+                    source_run, output = hit
+                    phase_run = self._memoized(phase, source_run, output, artifacts)
+                    self._console.info(f"Phase {phase.id}: reusing output of run {source_run}")
+                else:
+                    phase_run = self._phase_executor.execute(
+                        phase, context, workflow.agent, artifacts
+                    )
+                    if memo is not None and phase_run.outcome == "converged":
+                        self._remember(memo, run.id, phase_run, workdir)
+                run.phase_runs.append(phase_run)
 
-            rel_path = f"{phase.id}/output.md"
-            self._store.write_artifact(run_dir, rel_path, phase_run.output)
-            self._store.save_manifest(run_dir, run)
+                rel_path = f"{phase.id}/output.md"
+                self._store.write_artifact(run_dir, rel_path, phase_run.output.text)
+                self._store.save_manifest(run_dir, run)
+                self._console.event(
+                    "checkpoint", run_id=run.id, phase_id=phase.id,
+                    phase_runs=len(run.phase_runs),
+                )
+                if self._hooks is not None:
+                    self._hooks.emit("on_checkpoint", run)
+                if self._metrics is not None:
+                    self._metrics.observe_phase(workflow.id, phase_run)
 
-            accumulated_outputs[phase.id] = phase_run.output
+                accumulated_outputs[phase.id] = phase_run.output
+                for phase_id in accumulated_outputs.keys() - needed_after[phase.id]:
+                    del accumulated_outputs[phase_id]
 
-            self._console.info(
-                f"Phase {phase.id}: {phase_run.outcome} "
-                f"(iter {phase_run.iteration})"
-            )
+                self._console.info(
+                    f"Phase {phase.id}: {phase_run.outcome} "
+                    f"(iter {phase_run.iteration})"
+                )
+                self._console.event(
+                    "phase_end", run_id=run.id, phase_id=phase.id,
+                    outcome=phase_run.outcome, iteration=phase_run.iteration,
+                    reason=phase_run.reason, memoized_from=phase_run.memoized_from,
+                    duration_s=_seconds(phase_run.started_at, phase_run.finished_at),
+                )
+                if self._hooks is not None:
+                    self._hooks.emit("on_phase_end", run, phase_run)
 
-            if stop_after == phase.id:
-                self._console.warn(f"Stopping after --until {stop_after}")
-                break
+                if stop_after == phase.id:
+                    self._console.warn(f"Stopping after --until {stop_after}")
+                    break
 
-            if phase_run.outcome == "converged":
-                current_phase_id = phase.on_complete
-            elif phase_run.outcome == "exhausted":
-                current_phase_id = phase.on_exhausted
+                if phase_run.outcome == "converged":
+                    current_phase_id = phase.on_complete
+                elif phase_run.outcome == "exhausted":
+                    current_phase_id = phase.on_exhausted
+                else:
+                    run.status = RunStatus.FAILED
+                    run.failure_reason = (
+                        f"Phase '{phase.id}' failed at iteration {phase_run.iteration}"
+                    )
+                    break
             else:
-                run.status = RunStatus.FAILED
-                run.failure_reason = (
-                    f"Phase '{phase.id}' failed at iteration {phase_run.iteration}"
-                )
-                break
-        else:
-            pass
+                pass
 
-        if run.status == RunStatus.RUNNING:
-            run.status = RunStatus.COMPLETED
+            if run.status == RunStatus.RUNNING:
+                run.status = RunStatus.COMPLETED
 
-        run.finished_at = datetime.now(timezone.utc)
-        self._store.save_manifest(run_dir, run)
+            run.finished_at = datetime.now(timezone.utc)
+            self._store.save_manifest(run_dir, run)
+            self._console.event(
+                "run_end", run_id=run.id, status=run.status.value,
+                failure_reason=run.failure_reason,
+                duration_s=_seconds(run.started_at, run.finished_at),
+            )
+            if self._hooks is not None:
+                self._hooks.emit("on_run_end", run)
+        except BaseException as e:
+            if run.status is RunStatus.RUNNING:
+                run.status = RunStatus.FAILED
+                run.failure_reason = f"{type(e).__name__}: {e}"
+                run.finished_at = datetime.now(timezone.utc)
+                # Best effort: a manifest left "running" is never collected.
+                try:
+                    self._store.save_manifest(run_dir, run)
+                except Exception as save_error:
+                    self._console.warn(f"Could not checkpoint the failed run: {save_error}")
+            raise
+        finally:
+            # Aborted runs are counted too, so crashes show up in the metrics.
+            if self._metrics is not None:
+                self._metrics.observe_run(run)
+                self._metrics.flush()
         return run
 
+    def _memo_key(
+        self, workflow: Workflow, phase: Phase, context: ExecutionContext
+    ) -> tuple[str, str] | None:
+        """(memo key, workspace fingerprint) for a memoized phase; None when
+        the phase is not memoized or the workspace cannot be fingerprinted."""
+        if not phase.memoize or self._memo is None or self._workspace is None:
+            return None
+        try:
+            fingerprint = self._workspace.fingerprint(context.workdir)
+        except WorkspaceError:
+            return None
+        outputs = {k: v.text for k, v in context.phase_outputs.items()}
+        key = self._memo.key(workflow, phase.id, context.input, outputs, fingerprint)
+        return key, fingerprint
+
+    def _remember(
+        self, memo: tuple[str, str], run_id: str, phase_run: PhaseRun, workdir: str | None
+    ) -> None:
+        key, before = memo
+        try:
+            unchanged = self._workspace.fingerprint(workdir) == before
+        except WorkspaceError:
+            return
+        if unchanged:
+            self._memo.save(key, run_id, phase_run.output.text)
+
+    def _memoized(
+        self,
+        phase: Phase,
+        source_run: str,
+        output: str,
+        artifacts: ArtifactStorePort | None,
+    ) -> PhaseRun:
+        now = datetime.now(timezone.utc)
+        return PhaseRun(
+            phase_id=phase.id,
+            iteration=0,
+            outcome="converged",
+            step_runs=(),
+            output=artifacts.put(output) if artifacts is not None else output,
+            validation_output=None,
+            started_at=now,
+            finished_at=now,
+            memoized_from=source_run,
+        )
+
     def _build_context(
         self,
         input_text: str,
         context_deps: tuple[str, ...],
-        accumulated: dict[str, str],
+        accumulated: dict[str, Artifact],
+        workdir: str | None = None,
+        run_id: str | None = None,
     ) -> ExecutionContext:
-        if context_deps:
-            filtered = {k: v for k, v in accumulated.items() if k in context_deps}
-        else:
-            filtered = dict(accumulated)
-
+        filtered = {k: v for k, v in accumulated.items() if k in context_deps}
         return ExecutionContext(
             input=input_text,
             phase_outputs=MappingProxyType(filtered),
             iteration=1,
+            workdir=workdir,
+            run_id=run_id,
         )
+
+
+def _seconds(started: datetime, finished: datetime) -> float:
+    return round((finished - started).total_seconds(), 3)
@@ -1,8 +1,11 @@
 """WorkflowValidator -- enforces definition-time invariants on Workflow aggregates."""
 
+import re
+
 from macros.domain.model.workflow import Workflow, Phase
-from macros.domain.model.step import LlmStep
+from macros.domain.model.step import CommandStep, LlmStep
 from macros.domain.exceptions import WorkflowValidationError
+from macros.domain.services.context_inference import effective_context, reachable, successors
 
 
 class WorkflowValidator:
@@ -13,9 +16,20 @@ class WorkflowValidator:
     - Phase IDs are unique
     - Step IDs are unique within each phase
     - Transition targets (on_complete, on_exhausted) reference existing phases
-    - Context dependencies reference existing phases
+    - Declared context dependencies reference existing phases (validate
+      before infer_context; inferred ones are only checked by warnings())
     - max_iterations >= 1
+    - precheck requires a validation command
+    - speculation requires a validation command, attempts >= 1 and a known select mode
+    - stagnation requires a validation command and no_progress_iterations >= 1
+    - rollback requires a validation command; a score pattern must compile
+    - command step outputs require inputs (only cached steps restore outputs)
+    - hedge thresholds are positive, percentile in (0, 100], min_samples >= 1
     - max_phase_visits >= 1
+
+    warnings() reports definitions that are valid but suspicious: phase
+    outputs a phase reads (declared or referenced in its prompts) that no
+    path through the workflow can have produced by the time it runs.
     """
 
     def validate(self, workflow: Workflow) -> None:
@@ -24,6 +38,29 @@ class WorkflowValidator:
         self._validate_phase_internals(workflow, phase_ids)
         self._validate_global_limits(workflow)
 
+    def warnings(self, workflow: Workflow) -> list[str]:
+        if not workflow.phases:
+            return []
+        index = {p.id: p for p in workflow.phases}
+        runnable = reachable(workflow, (workflow.phases[0].id,))
+        found: list[str] = []
+        for phase in workflow.phases:
+            if phase.id not in runnable:
+                continue
+            for dep in effective_context(phase):
+                if dep not in index:
+                    found.append(
+                        f"Phase '{phase.id}' references output of unknown phase '{dep}'"
+                    )
+                elif dep not in runnable or phase.id not in reachable(
+                    workflow, successors(index[dep])
+                ):
+                    found.append(
+                        f"Phase '{phase.id}' references output of phase '{dep}', "
+                        f"which can never have run before it"
+                    )
+        return found
+
     def _validate_has_phases(self, workflow: Workflow) -> None:
         if not workflow.phases:
             raise WorkflowValidationError(
@@ -46,6 +83,12 @@ class WorkflowValidator:
             self._validate_transitions(phase, phase_ids, workflow.id)
             self._validate_context_refs(phase, phase_ids, workflow.id)
             self._validate_iteration_budget(phase, workflow.id)
+            self._validate_precheck(phase, workflow.id)
+            self._validate_speculation(phase, workflow.id)
+            self._validate_stagnation(phase, workflow.id)
+            self._validate_scoring(phase, workflow.id)
+            self._validate_cached_steps(phase, workflow.id)
+            self._validate_hedges(phase, workflow.id)
 
     def _validate_unique_step_ids(self, phase: Phase, workflow_id: str) -> None:
         seen: set[str] = set()
@@ -85,6 +128,92 @@ class WorkflowValidator:
                 f"in workflow '{workflow_id}'"
             )
 
+    def _validate_precheck(self, phase: Phase, workflow_id: str) -> None:
+        if phase.precheck and phase.validation is None:
+            raise WorkflowValidationError(
+                f"Phase '{phase.id}' precheck requires a validation command "
+                f"in workflow '{workflow_id}'"
+            )
+
+    def _validate_speculation(self, phase: Phase, workflow_id: str) -> None:
+        spec = phase.speculation
+        if spec is None:
+            return
+        if phase.validation is None:
+            raise WorkflowValidationError(
+                f"Phase '{phase.id}' speculation requires a validation command "
+                f"in workflow '{workflow_id}'"
+            )
+        if spec.attempts < 1:
+            raise WorkflowValidationError(
+                f"Phase '{phase.id}' speculation attempts must be >= 1 "
+                f"in workflow '{workflow_id}'"
+            )
+        if spec.select not in ("first", "best"):
+            raise WorkflowValidationError(
+                f"Phase '{phase.id}' speculation select must be 'first' or 'best' "
+                f"in workflow '{workflow_id}'"
+            )
+
+    def _validate_stagnation(self, phase: Phase, workflow_id: str) -> None:
+        stagnation = phase.stagnation
+        if stagnation is None:
+            return
+        if phase.validation is None:
+            raise WorkflowValidationError(
+                f"Phase '{phase.id}' stagnation requires a validation command "
+                f"in workflow '{workflow_id}'"
+            )
+        window = stagnation.no_progress_iterations
+        if window is not None and window < 1:
+            raise WorkflowValidationError(
+                f"Phase '{phase.id}' stagnation no_progress_iterations must be >= 1 "
+                f"in workflow '{workflow_id}'"
+            )
+
+    def _validate_scoring(self, phase: Phase, workflow_id: str) -> None:
+        if phase.rollback and phase.validation is None:
+            raise WorkflowValidationError(
+                f"Phase '{phase.id}' rollback requires a validation command "
+                f"in workflow '{workflow_id}'"
+            )
+        score = phase.validation.score if phase.validation else None
+        if score is None or score.pattern is None:
+            return
+        try:
+            re.compile(score.pattern)
+        except re.error as e:
+            raise WorkflowValidationError(
+                f"Phase '{phase.id}' validation score pattern is invalid ({e}) "
+                f"in workflow '{workflow_id}'"
+            ) from None
+
+    def _validate_cached_steps(self, phase: Phase, workflow_id: str) -> None:
+        for step in phase.steps:
+            if isinstance(step, CommandStep) and step.outputs and not step.inputs:
+                raise WorkflowValidationError(
+                    f"Step '{step.id}' in phase '{phase.id}' declares outputs "
+                    f"without inputs in workflow '{workflow_id}'"
+                )
+
+    def _validate_hedges(self, phase: Phase, workflow_id: str) -> None:
+        for step in phase.steps:
+            hedge = step.hedge if isinstance(step, LlmStep) else None
+            if hedge is None:
+                continue
+            problem = None
+            if hedge.after_seconds is not None and hedge.after_seconds <= 0:
+                problem = "after_seconds must be > 0"
+            elif not 0 < hedge.percentile <= 100:
+                problem = "percentile must be in (0, 100]"
+            elif hedge.min_samples < 1:
+                problem = "min_samples must be >= 1"
+            if problem is not None:
+                raise WorkflowValidationError(
+                    f"Step '{step.id}' in phase '{phase.id}' hedge {problem} "
+                    f"in workflow '{workflow_id}'"
+                )
+
     def _validate_global_limits(self, workflow: Workflow) -> None:
         if workflow.max_phase_visits < 1:
             raise WorkflowValidationError(
@@ -1,7 +1,15 @@
 from .run_store import FileRunStore
 from .workflow_store import FileWorkflowStore
+from .job_queue import SqliteJobQueue
+from .step_cache import FileStepCache
+from .phase_memo import FilePhaseMemo
+from .artifact_store import FileArtifactStore
 
 __all__ = [
     "FileRunStore",
     "FileWorkflowStore",
+    "SqliteJobQueue",
+    "FileStepCache",
+    "FilePhaseMemo",
+    "FileArtifactStore",
 ]
@@ -0,0 +1,91 @@
+"""FileArtifactStore -- run outputs on disk, loaded on demand through a small LRU."""
+
+import hashlib
+import os
+import tarfile
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from macros.domain.model.artifact import Artifact
+
+BLOBS_DIR = "blobs"
+DEFAULT_MAX_CACHE_BYTES = 8 * 1024 * 1024
+
+
+class FileArtifactStore:
+    """Implements ArtifactStorePort inside one run's artifacts directory.
+
+    Layout:
+      <run_dir>/blobs/<sha256>.txt   (one file per distinct output)
+
+    Blobs are content-addressed, so identical outputs (a step's output that
+    is also its phase's output) are written once. put() writes immediately --
+    a crashed run still has every output it produced -- and keeps the text
+    in an in-memory LRU bounded by max_cache_bytes, so recent outputs (the
+    ones the next phase's prompt is likely to reference) don't hit the disk.
+
+    run_dir may also be a packed run archive; blobs are then read from it
+    and put() is not available.
+    """
+
+    def __init__(self, run_dir: Path | str, max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES) -> None:
+        self._run_dir = Path(run_dir)
+        self._max_cache_bytes = max_cache_bytes
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+
+    def put(self, text: str) -> Artifact:
+        data = text.encode("utf-8")
+        ref = hashlib.sha256(data).hexdigest()
+        path = self._run_dir / BLOBS_DIR / f"{ref}.txt"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{ref}.")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        self._remember(ref, text)
+        return Artifact(ref=ref, size=len(text), loader=self.load)
+
+    def handle(self, ref: str, size: int) -> Artifact:
+        """A lazy handle for a blob written earlier (e.g. read from a manifest)."""
+        return Artifact(ref=ref, size=size, loader=self.load)
+
+    def load(self, ref: str) -> str:
+        with self._lock:
+            text = self._cache.get(ref)
+            if text is not None:
+                self._cache.move_to_end(ref)
+                return text
+        member = f"{BLOBS_DIR}/{ref}.txt"
+        if self._run_dir.is_dir():
+            text = (self._run_dir / member).read_bytes().decode("utf-8")
+        else:
+            with tarfile.open(self._run_dir, "r:gz") as tar:
+                fh = tar.extractfile(member)
+                if fh is None:
+                    raise FileNotFoundError(member)
+                text = fh.read().decode("utf-8")
+        self._remember(ref, text)
+        return text
+
+    def _remember(self, ref: str, text: str) -> None:
+        size = len(text)
+        if size > self._max_cache_bytes:
+            return
+        with self._lock:
+            if ref in self._cache:
+                self._cache.move_to_end(ref)
+                return
+            self._cache[ref] = text
+            self._cache_bytes += size
+            while self._cache_bytes > self._max_cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
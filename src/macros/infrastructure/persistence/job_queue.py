@@ -0,0 +1,174 @@
+"""SqliteJobQueue -- durable run queue shared by daemon workers."""
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+
+from macros.domain.model.job import Job, JobStatus
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,
+    id           TEXT NOT NULL UNIQUE,
+    workflow_id  TEXT NOT NULL,
+    input_text   TEXT NOT NULL,
+    status       TEXT NOT NULL,
+    submitted_at TEXT NOT NULL,
+    stop_after   TEXT,
+    isolate      INTEGER NOT NULL DEFAULT 0,
+    export       TEXT NOT NULL DEFAULT 'branch',
+    started_at   TEXT,
+    finished_at  TEXT,
+    run_dir      TEXT,
+    error        TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, seq);
+"""
+
+_COLUMNS = (
+    "id, workflow_id, input_text, status, submitted_at, stop_after, isolate, "
+    "export, started_at, finished_at, run_dir, error"
+)
+
+
+class SqliteJobQueue:
+    """Implements JobQueuePort with SQLite.
+
+    Every call opens its own connection, so one instance can be shared by
+    worker and request-handler threads; claims take a write lock up front
+    (BEGIN IMMEDIATE) so two workers never receive the same job.
+    """
+
+    def __init__(self, path: Path | str, timeout: float = 30.0) -> None:
+        self._path = Path(path)
+        self._timeout = timeout
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def submit(self, job: Job) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                f"INSERT INTO jobs ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _job_to_row(job),
+            )
+
+    def claim(self) -> Job | None:
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE status = ? ORDER BY seq LIMIT 1",
+                (JobStatus.QUEUED.value,),
+            ).fetchone()
+            if row is None:
+                conn.rollback()
+                return None
+            job = _row_to_job(row)
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.now(timezone.utc)
+            conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ? WHERE id = ?",
+                (job.status.value, job.started_at.isoformat(), job.id),
+            )
+            conn.commit()
+            return job
+
+    def update(self, job: Job) -> None:
+        row = _job_to_row(job)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET workflow_id = ?, input_text = ?, status = ?, "
+                "submitted_at = ?, stop_after = ?, isolate = ?, export = ?, "
+                "started_at = ?, finished_at = ?, run_dir = ?, error = ? WHERE id = ?",
+                (*row[1:], job.id),
+            )
+
+    def get(self, job_id: str) -> Job | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return _row_to_job(row) if row else None
+
+    def list_jobs(self, status: JobStatus | None = None, limit: int = 50) -> list[Job]:
+        query = f"SELECT {_COLUMNS} FROM jobs"
+        params: tuple = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status.value,)
+        query += " ORDER BY seq DESC LIMIT ?"
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, (*params, limit)).fetchall()
+        return [_row_to_job(r) for r in rows]
+
+    def count(self, status: JobStatus) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ?", (status.value,)
+            ).fetchone()[0]
+
+    def cancel(self, job_id: str) -> bool:
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ? WHERE id = ? AND status = ?",
+                (
+                    JobStatus.CANCELLED.value,
+                    datetime.now(timezone.utc).isoformat(),
+                    job_id,
+                    JobStatus.QUEUED.value,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def requeue_running(self) -> int:
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, started_at = NULL WHERE status = ?",
+                (JobStatus.QUEUED.value, JobStatus.RUNNING.value),
+            )
+            return cursor.rowcount
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit: single statements are atomic; claim() opens its own transaction.
+        return sqlite3.connect(self._path, timeout=self._timeout, isolation_level=None)
+
+
+def _job_to_row(job: Job) -> tuple:
+    return (
+        job.id,
+        job.workflow_id,
+        job.input_text,
+        job.status.value,
+        job.submitted_at.isoformat(),
+        job.stop_after,
+        int(job.isolate),
+        job.export,
+        job.started_at.isoformat() if job.started_at else None,
+        job.finished_at.isoformat() if job.finished_at else None,
+        job.run_dir,
+        job.error,
+    )
+
+
+def _row_to_job(row: tuple) -> Job:
+    (
+        job_id, workflow_id, input_text, status, submitted_at, stop_after,
+        isolate, export, started_at, finished_at, run_dir, error,
+    ) = row
+    return Job(
+        id=job_id,
+        workflow_id=workflow_id,
+        input_text=input_text,
+        status=JobStatus(status),
+        submitted_at=datetime.fromisoformat(submitted_at),
+        stop_after=stop_after,
+        isolate=bool(isolate),
+        export=export,
+        started_at=datetime.fromisoformat(started_at) if started_at else None,
+        finished_at=datetime.fromisoformat(finished_at) if finished_at else None,
+        run_dir=run_dir,
+        error=error,
+    )
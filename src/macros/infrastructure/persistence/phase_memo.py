@@ -0,0 +1,102 @@
+"""FilePhaseMemo -- cross-run memo of converged phase outputs on disk."""
+
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Mapping
+
+from macros.domain.model.workflow import Workflow
+from macros.infrastructure.runtime.utils.workspace import get_workspace
+
+
+class FilePhaseMemo:
+    """Implements PhaseMemoPort under the workspace's .macrocycle directory.
+
+    Layout:
+      .macrocycle/cache/phases/<key[:2]>/<key>.json   (run_id, phase_id, output, created_at)
+
+    The workflow's version is a hash of its whole definition, so editing any
+    phase, prompt or agent setting invalidates every entry of that workflow.
+    Entries are written to a temporary file and renamed into place; every
+    hit touches the file, whose mtime therefore records its last use.
+    """
+
+    def __init__(self, workspace_dir: Path | str | None = None) -> None:
+        self._workspace_dir = Path(workspace_dir) if workspace_dir else None
+
+    def key(
+        self,
+        workflow: Workflow,
+        phase_id: str,
+        input_text: str,
+        context: Mapping[str, str],
+        fingerprint: str,
+    ) -> str:
+        digest = hashlib.sha256(workflow.id.encode("utf-8"))
+        for part in (repr(workflow), phase_id, " ".join(input_text.split()), fingerprint):
+            digest.update(b"\0" + part.encode("utf-8"))
+        for dep in sorted(context):
+            digest.update(b"\0context\0" + dep.encode("utf-8") + b"\0")
+            digest.update(hashlib.sha256(context[dep].encode("utf-8")).digest())
+        return digest.hexdigest()
+
+    def load(self, key: str) -> tuple[str, str] | None:
+        path = self._entry(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return data["run_id"], data["output"]
+
+    def save(self, key: str, run_id: str, output: str) -> None:
+        path = self._entry(key)
+        if path.exists():
+            return
+        tmp: str | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{key}.")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({
+                    "run_id": run_id,
+                    "output": output,
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                }, fh, indent=2)
+            os.replace(tmp, path)
+            tmp = None
+        except OSError:
+            # A memo that could not be written only costs a later re-run.
+            pass
+        finally:
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+
+    def prune(self, unused_since: datetime, dry_run: bool = False) -> int:
+        root = self._root()
+        if not root.exists():
+            return 0
+        cutoff = unused_since.timestamp()
+        removed = 0
+        for path in root.glob("*/*.json"):
+            try:
+                if path.stat().st_mtime >= cutoff:
+                    continue
+                if not dry_run:
+                    path.unlink()
+            except OSError:
+                continue
+            removed += 1
+        return removed
+
+    def _entry(self, key: str) -> Path:
+        return self._root() / key[:2] / f"{key}.json"
+
+    def _root(self) -> Path:
+        return (self._workspace_dir or get_workspace()) / ".macrocycle" / "cache" / "phases"
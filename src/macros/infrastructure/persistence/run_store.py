@@ -1,14 +1,26 @@
 """FileRunStore -- file-based run persistence with checkpoint manifests."""
 
 import json
-from datetime import datetime, timezone
+import os
+import shutil
+import tarfile
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterator
 
-from macros.domain.model.run import Run, RunInfo, RunStatus, PhaseRun, StepRun
+from macros.domain.model.artifact import Artifact
+from macros.domain.model.run import Run, RunInfo, RunStatus, PhaseRun, StepRun, ValidationRun
 from macros.domain.model.agent_config import AgentConfig
+from macros.domain.model.usage import Usage
+from macros.infrastructure.persistence.artifact_store import FileArtifactStore
+from macros.infrastructure.runtime.utils.file_lock import atomic_write_text
 from macros.infrastructure.runtime.utils.workspace import get_workspace
 
 
+ARCHIVE_SUFFIX = ".tar.gz"
+
+
 class FileRunStore:
     """Implements RunStorePort using the filesystem.
 
@@ -17,50 +29,187 @@ class FileRunStore:
         input.txt
         manifest.json          (checkpoint after each phase)
         <phase_id>/output.md   (phase output)
+        blobs/<sha256>.txt     (step and phase outputs, see FileArtifactStore)
+      .macrocycle/runs/<timestamp>_<workflow_id>.tar.gz
+                               (a packed run: the same files, manifest first)
+
+    The manifest references outputs stored as blobs by ref and size, so a
+    checkpoint stays small however much the agents wrote; older manifests
+    with inline outputs still load. Outputs of loaded runs are lazy handles.
+    Packed runs are read transparently. Loaded runs report the directory or
+    archive they were read from as artifacts_dir.
+    The workspace is fixed at construction when given, otherwise resolved
+    per call via get_workspace() (honouring use_workspace() scopes).
     """
 
+    def __init__(self, workspace_dir: Path | str | None = None) -> None:
+        self._workspace_dir = Path(workspace_dir) if workspace_dir else None
+
     def create_run_dir(self, workflow_id: str) -> str:
-        ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        run_dir = get_workspace() / ".macrocycle" / "runs" / f"{ts}_{workflow_id}"
-        run_dir.mkdir(parents=True, exist_ok=True)
-        return str(run_dir)
+        runs_dir = self._runs_dir()
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        started = datetime.now(timezone.utc)
+        # Concurrent runs of one workflow can start within the same second;
+        # claim the next free second so ids stay unique and sortable.
+        while True:
+            ts = started.strftime("%Y%m%d_%H%M%S")
+            run_dir = runs_dir / f"{ts}_{workflow_id}"
+            try:
+                run_dir.mkdir()
+                return str(run_dir)
+            except FileExistsError:
+                started += timedelta(seconds=1)
 
     def write_artifact(self, run_dir: str, rel_path: str, content: str) -> None:
         path = Path(run_dir) / rel_path
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(content, encoding="utf-8")
 
+    def artifact_store(self, run_dir: str) -> FileArtifactStore:
+        return FileArtifactStore(run_dir)
+
     def save_manifest(self, run_dir: str, run: Run) -> None:
         data = self._run_to_dict(run)
-        path = Path(run_dir) / "manifest.json"
-        path.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+        # Atomic, so a crash mid-checkpoint leaves the previous manifest.
+        atomic_write_text(Path(run_dir) / "manifest.json", json.dumps(data, indent=2, default=str))
 
     def load_manifest(self, run_dir: str) -> Run | None:
-        path = Path(run_dir) / "manifest.json"
-        if not path.exists():
+        path = Path(run_dir)
+        if path.is_dir():
+            manifest = path / "manifest.json"
+            if not manifest.exists():
+                return None
+            data = json.loads(manifest.read_text(encoding="utf-8"))
+            run = self._dict_to_run(data, FileArtifactStore(path))
+            # Where it was found, not where it was created: workspaces move.
+            run.artifacts_dir = str(path)
+            return run
+        archive = _archive_path(path)
+        try:
+            with tarfile.open(archive, "r:gz") as tar:
+                member = tar.extractfile("manifest.json")
+                data = json.loads(member.read().decode("utf-8"))
+        except (OSError, KeyError, tarfile.TarError):
             return None
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return self._dict_to_run(data)
+        run = self._dict_to_run(data, FileArtifactStore(archive))
+        run.artifacts_dir = str(archive)
+        return run
 
     def get_latest_run(self) -> RunInfo | None:
-        runs_dir = get_workspace() / ".macrocycle" / "runs"
-        if not runs_dir.exists():
-            return None
-        dirs = sorted(runs_dir.iterdir(), reverse=True)
-        for d in dirs:
-            if d.is_dir():
-                manifest = d / "manifest.json"
-                if manifest.exists():
-                    data = json.loads(manifest.read_text(encoding="utf-8"))
-                    return RunInfo(
-                        run_id=data["id"],
-                        workflow_id=data["workflow_id"],
-                        started_at=datetime.fromisoformat(data["started_at"]),
-                        artifacts_dir=str(d),
-                        phase_count=len(data.get("phase_runs", [])),
-                    )
+        for name, path in self._run_entries():
+            run = self._load_readable(path)
+            if run is not None:
+                return RunInfo(
+                    run_id=run.id,
+                    workflow_id=run.workflow_id,
+                    started_at=run.started_at,
+                    artifacts_dir=str(path),
+                    phase_count=len(run.phase_runs),
+                )
         return None
 
+    def get_run(self, run_id: str) -> Run | None:
+        if not run_id or Path(run_id).name != run_id:
+            return None  # an id, never a path
+        return self.load_manifest(str(self._runs_dir() / run_id))
+
+    def is_packed(self, run_dir: str) -> bool:
+        return not Path(run_dir).is_dir() and _archive_path(Path(run_dir)).exists()
+
+    def pack_run(self, run_dir: str) -> int:
+        path = Path(run_dir)
+        if not path.is_dir():
+            return 0
+        archive = _archive_path(path)
+        tmp = archive.with_name(f".{archive.name}.tmp")
+        files = sorted(p for p in path.rglob("*") if p.is_file())
+        # The manifest goes first so listings only decompress the archive's head.
+        files.sort(key=lambda p: p.name != "manifest.json" or p.parent != path)
+        try:
+            with tarfile.open(tmp, "w:gz", compresslevel=6) as tar:
+                for f in files:
+                    tar.add(f, arcname=f.relative_to(path).as_posix())
+            os.replace(tmp, archive)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        size = _disk_usage(path)
+        shutil.rmtree(path)
+        return max(0, size - archive.stat().st_size)
+
+    def delete_run(self, run_dir: str) -> int:
+        path = Path(run_dir)
+        if path.is_dir():
+            size = _disk_usage(path)
+            shutil.rmtree(path)
+            return size
+        archive = _archive_path(path)
+        if not archive.exists():
+            return 0
+        size = archive.stat().st_size
+        archive.unlink()
+        return size
+
+    def iter_runs(
+        self,
+        workflow_id: str | None = None,
+        since: datetime | None = None,
+    ) -> Iterator[Run]:
+        for name, path in self._run_entries():
+            if workflow_id is not None and not name.endswith(f"_{workflow_id}"):
+                continue
+            dir_ts = _dir_timestamp(name)
+            if since is not None and dir_ts is not None and dir_ts < since:
+                # Directory names sort chronologically: everything after is older.
+                break
+            run = self._load_readable(path)
+            if run is None:
+                continue
+            if workflow_id is not None and run.workflow_id != workflow_id:
+                continue
+            if since is not None and run.started_at < since:
+                continue
+            yield run
+
+    def iter_unreadable_runs(self, before: datetime) -> Iterator[str]:
+        cutoff = before.timestamp()
+        for _, path in self._run_entries():
+            if self._load_readable(path) is not None:
+                continue
+            try:
+                if path.stat().st_mtime >= cutoff:
+                    continue  # may be a run that hasn't checkpointed yet
+            except OSError:
+                continue
+            yield str(path)
+
+    def _load_readable(self, path: Path) -> Run | None:
+        """load_manifest(), with a corrupt or truncated manifest as None."""
+        try:
+            return self.load_manifest(str(path))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _run_entries(self) -> list[tuple[str, Path]]:
+        """(run id, run dir or archive), newest first."""
+        runs_dir = self._runs_dir()
+        if not runs_dir.exists():
+            return []
+        entries = []
+        with os.scandir(runs_dir) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    entries.append((entry.name, Path(entry.path)))
+                elif entry.name.endswith(ARCHIVE_SUFFIX):
+                    entries.append((entry.name[: -len(ARCHIVE_SUFFIX)], Path(entry.path)))
+        entries.sort(reverse=True)
+        return entries
+
+    def _runs_dir(self) -> Path:
+        return (self._workspace_dir or get_workspace()) / ".macrocycle" / "runs"
+
     def _run_to_dict(self, run: Run) -> dict:
         return {
             "id": run.id,
@@ -70,20 +219,29 @@ class FileRunStore:
             "finished_at": run.finished_at.isoformat() if run.finished_at else None,
             "failure_reason": run.failure_reason,
             "artifacts_dir": run.artifacts_dir,
+            **_usage_fields(run.usage),
             "phase_runs": [self._phase_run_to_dict(pr) for pr in run.phase_runs],
         }
 
     def _phase_run_to_dict(self, pr: PhaseRun) -> dict:
-        return {
+        result: dict = {
             "phase_id": pr.phase_id,
             "iteration": pr.iteration,
             "outcome": pr.outcome,
-            "output": pr.output,
-            "validation_output": pr.validation_output,
+            **_artifact_fields("output", pr.output),
+            **_artifact_fields("validation_output", pr.validation_output),
             "started_at": pr.started_at.isoformat(),
             "finished_at": pr.finished_at.isoformat(),
+            **_usage_fields(pr.usage),
             "step_runs": [self._step_run_to_dict(sr) for sr in pr.step_runs],
+            "validation_runs": [
+                self._validation_run_to_dict(vr) for vr in pr.validation_runs
+            ],
+            "reason": pr.reason,
         }
+        if pr.memoized_from is not None:
+            result["memoized_from"] = pr.memoized_from
+        return result
 
     def _step_run_to_dict(self, sr: StepRun) -> dict:
         result: dict = {
@@ -92,7 +250,7 @@ class FileRunStore:
             "iteration": sr.iteration,
             "started_at": sr.started_at.isoformat(),
             "finished_at": sr.finished_at.isoformat(),
-            "output": sr.output,
+            **_artifact_fields("output", sr.output),
             "exit_code": sr.exit_code,
         }
         if sr.agent_config:
@@ -100,9 +258,37 @@ class FileRunStore:
                 "engine": sr.agent_config.engine,
                 "model": sr.agent_config.model,
             }
+        if sr.attempt is not None:
+            result["attempt"] = sr.attempt
+        if sr.cached:
+            result["cached"] = True
+        if sr.hedged:
+            result["hedged"] = True
+        if sr.timed_out:
+            result["timed_out"] = True
+        result.update(_usage_fields(sr.usage))
+        if sr.events is not None:
+            result.update(_artifact_fields("events", sr.events))
+        return result
+
+    def _validation_run_to_dict(self, vr: ValidationRun) -> dict:
+        result: dict = {
+            "iteration": vr.iteration,
+            "started_at": vr.started_at.isoformat(),
+            "finished_at": vr.finished_at.isoformat(),
+            "exit_code": vr.exit_code,
+        }
+        if vr.attempt is not None:
+            result["attempt"] = vr.attempt
+        if vr.score is not None:
+            result["score"] = vr.score
+        if vr.incremental:
+            result["incremental"] = True
+        if vr.timed_out:
+            result["timed_out"] = True
         return result
 
-    def _dict_to_run(self, data: dict) -> Run:
+    def _dict_to_run(self, data: dict, artifacts: FileArtifactStore) -> Run:
         return Run(
             id=data["id"],
             workflow_id=data["workflow_id"],
@@ -111,22 +297,29 @@ class FileRunStore:
             finished_at=datetime.fromisoformat(data["finished_at"]) if data.get("finished_at") else None,
             failure_reason=data.get("failure_reason"),
             artifacts_dir=data.get("artifacts_dir", ""),
-            phase_runs=[self._dict_to_phase_run(pr) for pr in data.get("phase_runs", [])],
+            phase_runs=[self._dict_to_phase_run(pr, artifacts) for pr in data.get("phase_runs", [])],
         )
 
-    def _dict_to_phase_run(self, data: dict) -> PhaseRun:
+    def _dict_to_phase_run(self, data: dict, artifacts: FileArtifactStore) -> PhaseRun:
         return PhaseRun(
             phase_id=data["phase_id"],
             iteration=data["iteration"],
             outcome=data["outcome"],
-            output=data.get("output", ""),
-            validation_output=data.get("validation_output"),
+            output=_artifact(data, "output", artifacts) or "",
+            validation_output=_artifact(data, "validation_output", artifacts),
             started_at=datetime.fromisoformat(data["started_at"]),
             finished_at=datetime.fromisoformat(data["finished_at"]),
-            step_runs=tuple(self._dict_to_step_run(sr) for sr in data.get("step_runs", [])),
+            step_runs=tuple(
+                self._dict_to_step_run(sr, artifacts) for sr in data.get("step_runs", [])
+            ),
+            validation_runs=tuple(
+                self._dict_to_validation_run(vr) for vr in data.get("validation_runs", [])
+            ),
+            reason=data.get("reason"),
+            memoized_from=data.get("memoized_from"),
         )
 
-    def _dict_to_step_run(self, data: dict) -> StepRun:
+    def _dict_to_step_run(self, data: dict, artifacts: FileArtifactStore) -> StepRun:
         ac = data.get("agent_config")
         return StepRun(
             step_id=data["step_id"],
@@ -134,7 +327,62 @@ class FileRunStore:
             iteration=data["iteration"],
             started_at=datetime.fromisoformat(data["started_at"]),
             finished_at=datetime.fromisoformat(data["finished_at"]),
-            output=data.get("output", ""),
+            output=_artifact(data, "output", artifacts) or "",
             exit_code=data.get("exit_code", 0),
             agent_config=AgentConfig(engine=ac["engine"], model=ac.get("model")) if ac else None,
+            attempt=data.get("attempt"),
+            cached=data.get("cached", False),
+            hedged=data.get("hedged", False),
+            timed_out=data.get("timed_out", False),
+            usage=Usage(**data["usage"]) if data.get("usage") else None,
+            events=_artifact(data, "events", artifacts),
         )
+
+    def _dict_to_validation_run(self, data: dict) -> ValidationRun:
+        return ValidationRun(
+            iteration=data["iteration"],
+            started_at=datetime.fromisoformat(data["started_at"]),
+            finished_at=datetime.fromisoformat(data["finished_at"]),
+            exit_code=data.get("exit_code", 0),
+            attempt=data.get("attempt"),
+            score=data.get("score"),
+            incremental=data.get("incremental", False),
+            timed_out=data.get("timed_out", False),
+        )
+
+
+def _artifact_fields(name: str, artifact: Artifact | None) -> dict:
+    """Manifest fields for an output: a blob reference, or the text inline."""
+    if artifact is not None and artifact.ref is not None:
+        return {f"{name}_ref": artifact.ref, f"{name}_size": artifact.size}
+    return {name: artifact.text if artifact is not None else None}
+
+
+def _artifact(data: dict, name: str, artifacts: FileArtifactStore) -> Artifact | str | None:
+    ref = data.get(f"{name}_ref")
+    if ref is not None:
+        return artifacts.handle(ref, data.get(f"{name}_size", 0))
+    return data.get(name)
+
+
+def _usage_fields(usage: Usage | None) -> dict:
+    """Manifest fields for a usage; phase and run totals are derived on load."""
+    if usage is None:
+        return {}
+    return {"usage": {k: v for k, v in asdict(usage).items() if v is not None}}
+
+
+def _dir_timestamp(name: str) -> datetime | None:
+    """Parse the UTC timestamp prefix of a run directory name."""
+    try:
+        return datetime.strptime(name[:15], "%Y%m%d_%H%M%S").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def _archive_path(path: Path) -> Path:
+    return path if path.name.endswith(ARCHIVE_SUFFIX) else path.with_name(path.name + ARCHIVE_SUFFIX)
+
+
+def _disk_usage(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
@@ -0,0 +1,137 @@
+"""FileStepCache -- content-addressed cache of command step results on disk."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from macros.infrastructure.runtime.utils.workspace import get_workspace
+
+
+class FileStepCache:
+    """Implements StepCachePort under the workspace's .macrocycle directory.
+
+    Layout:
+      .macrocycle/cache/steps/<key[:2]>/<key>/
+        result.json   (exit_code, output, files, created_at)
+        files/<path>  (copies of the step's declared outputs)
+
+    Entries are written to a temporary directory and renamed into place, so
+    concurrent runs never see half-written entries. Every hit touches
+    result.json, whose mtime therefore records when the entry was last used.
+    Isolated runs work in other checkouts but share the workspace's cache.
+    """
+
+    def __init__(self, workspace_dir: Path | str | None = None) -> None:
+        self._workspace_dir = Path(workspace_dir) if workspace_dir else None
+
+    def key(self, command: str, inputs: tuple[str, ...], cwd: str | None = None) -> str | None:
+        base = self._cwd(cwd)
+        digest = hashlib.sha256(command.encode("utf-8"))
+        try:
+            for pattern in inputs:
+                digest.update(b"\0pattern\0" + pattern.encode("utf-8"))
+                for path in sorted(_files(base, pattern)):
+                    digest.update(b"\0" + path.relative_to(base).as_posix().encode("utf-8") + b"\0")
+                    digest.update(_file_digest(path))
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def restore(self, key: str, cwd: str | None = None) -> tuple[int, str] | None:
+        entry = self._entry(key)
+        result_path = entry / "result.json"
+        try:
+            data = json.loads(result_path.read_text(encoding="utf-8"))
+            base = self._cwd(cwd)
+            for rel in data.get("files", []):
+                target = base / rel
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(entry / "files" / rel, target)
+            os.utime(result_path)
+        except (OSError, ValueError):
+            return None
+        return data["exit_code"], data["output"]
+
+    def save(
+        self,
+        key: str,
+        outputs: tuple[str, ...],
+        exit_code: int,
+        output: str,
+        cwd: str | None = None,
+    ) -> None:
+        entry = self._entry(key)
+        if entry.exists():
+            return
+        base = self._cwd(cwd)
+        tmp: Path | None = None
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp = Path(tempfile.mkdtemp(dir=entry.parent, prefix=f".{key}."))
+            files: list[str] = []
+            for pattern in outputs:
+                for path in _files(base, pattern):
+                    rel = path.relative_to(base).as_posix()
+                    (tmp / "files" / rel).parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(path, tmp / "files" / rel)
+                    files.append(rel)
+            (tmp / "result.json").write_text(
+                json.dumps({
+                    "exit_code": exit_code,
+                    "output": output,
+                    "files": sorted(set(files)),
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                }, indent=2),
+                encoding="utf-8",
+            )
+            os.rename(tmp, entry)
+            tmp = None
+        except OSError:
+            # Lost a race with another run saving the same key, or the disk
+            # is unhappy; either way the step result itself is unaffected.
+            pass
+        finally:
+            if tmp is not None:
+                shutil.rmtree(tmp, ignore_errors=True)
+
+    def prune(self, unused_since: datetime, dry_run: bool = False) -> int:
+        root = self._root()
+        if not root.exists():
+            return 0
+        cutoff = unused_since.timestamp()
+        removed = 0
+        for result_path in root.glob("*/*/result.json"):
+            try:
+                if result_path.stat().st_mtime >= cutoff:
+                    continue
+            except OSError:
+                continue
+            if not dry_run:
+                shutil.rmtree(result_path.parent, ignore_errors=True)
+            removed += 1
+        return removed
+
+    def _entry(self, key: str) -> Path:
+        return self._root() / key[:2] / key
+
+    def _root(self) -> Path:
+        return (self._workspace_dir or get_workspace()) / ".macrocycle" / "cache" / "steps"
+
+    def _cwd(self, cwd: str | None) -> Path:
+        return Path(cwd) if cwd else (self._workspace_dir or get_workspace())
+
+
+def _files(base: Path, pattern: str) -> list[Path]:
+    return [p for p in base.glob(pattern) if p.is_file()]
+
+
+def _file_digest(path: Path) -> bytes:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
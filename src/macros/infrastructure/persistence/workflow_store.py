@@ -6,8 +6,9 @@ from pathlib import Path
 
 from macros.domain.exceptions import WorkflowNotFoundError
 from macros.domain.model.agent_config import AgentConfig
-from macros.domain.model.step import CommandStep, LlmStep, Step
-from macros.domain.model.workflow import Phase, Validation, Workflow
+from macros.domain.model.step import CommandStep, Hedge, LlmStep, Step
+from macros.domain.model.workflow import Phase, Score, Speculation, Stagnation, Validation, Workflow
+from macros.domain.services.context_inference import infer_context
 from macros.domain.services.workflow_validator import WorkflowValidator
 from macros.infrastructure.runtime.utils.workspace import get_workspace
 
@@ -18,10 +19,19 @@ class FileWorkflowStore:
     Looks for workflows in:
       1. .macrocycle/workflows/<id>.json (local, takes precedence)
       2. Packaged defaults (bundled with the package)
+
+    A phase without a declared context gets the phase outputs its prompts
+    reference ({{PHASE_OUTPUT:id}}) as its context. Only declared context
+    must name existing phases; an inferred reference to an unknown phase is
+    a warning (WorkflowValidator.warnings), not a load error.
+    Parsed workflows are immutable and cached until their file changes, so
+    long-lived processes (macrocycle serve) parse each definition once.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, workspace_dir: Path | str | None = None) -> None:
         self._validator = WorkflowValidator()
+        self._workspace_dir = Path(workspace_dir) if workspace_dir else None
+        self._cache: dict[str, tuple[tuple, Workflow]] = {}
 
     def list_workflows(self) -> list[str]:
         local = self._local_dir()
@@ -30,17 +40,33 @@ class FileWorkflowStore:
         return sorted(p.stem for p in local.glob("*.json"))
 
     def load_workflow(self, workflow_id: str) -> Workflow:
+        stamp = self._stamp(workflow_id)
+        cached = self._cache.get(workflow_id)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
         data = self._load_json(workflow_id)
         if data is None:
             raise WorkflowNotFoundError(f"Workflow not found: {workflow_id}")
         workflow = self._parse_workflow(data)
         self._validator.validate(workflow)
+        workflow = infer_context(workflow)
+        self._cache[workflow_id] = (stamp, workflow)
         return workflow
 
+    def _stamp(self, workflow_id: str) -> tuple:
+        """Identity of the definition that would be loaded right now."""
+        local_path = self._local_dir() / f"{workflow_id}.json"
+        try:
+            st = local_path.stat()
+        except OSError:
+            return ("packaged",)
+        return (str(local_path), st.st_mtime_ns, st.st_size)
+
     def init_default_workflows(self) -> None:
         local = self._local_dir()
         local.mkdir(parents=True, exist_ok=True)
-        (get_workspace() / ".macrocycle" / "runs").mkdir(parents=True, exist_ok=True)
+        (self._root() / ".macrocycle" / "runs").mkdir(parents=True, exist_ok=True)
 
         defaults_pkg = resources.files("macros.infrastructure.persistence.defaults")
         for item in defaults_pkg.iterdir():
@@ -49,8 +75,11 @@ class FileWorkflowStore:
                 if not target.exists():
                     target.write_text(item.read_text(encoding="utf-8"), encoding="utf-8")
 
+    def _root(self) -> Path:
+        return self._workspace_dir or get_workspace()
+
     def _local_dir(self) -> Path:
-        return get_workspace() / ".macrocycle" / "workflows"
+        return self._root() / ".macrocycle" / "workflows"
 
     def _load_json(self, workflow_id: str) -> dict | None:
         local_path = self._local_dir() / f"{workflow_id}.json"
@@ -86,7 +115,17 @@ class FileWorkflowStore:
 
         validation = None
         if "validation" in data:
-            validation = Validation(command=data["validation"]["command"])
+            score = None
+            if "score" in data["validation"]:
+                score = Score(
+                    pattern=data["validation"]["score"].get("pattern"),
+                    maximize=data["validation"]["score"].get("maximize", False),
+                )
+            validation = Validation(
+                command=data["validation"]["command"],
+                score=score,
+                incremental_command=data["validation"].get("incremental_command"),
+            )
 
         agent = None
         if "agent" in data:
@@ -95,6 +134,21 @@ class FileWorkflowStore:
                 model=data["agent"].get("model"),
             )
 
+        speculation = None
+        if "speculation" in data:
+            speculation = Speculation(
+                attempts=data["speculation"].get("attempts", 2),
+                select=data["speculation"].get("select", "first"),
+            )
+
+        stagnation = None
+        if "stagnation" in data:
+            stagnation = Stagnation(
+                identical_output=data["stagnation"].get("identical_output", True),
+                unchanged_workspace=data["stagnation"].get("unchanged_workspace", True),
+                no_progress_iterations=data["stagnation"].get("no_progress_iterations"),
+            )
+
         return Phase(
             id=data["id"],
             steps=steps,
@@ -104,12 +158,23 @@ class FileWorkflowStore:
             agent=agent,
             on_complete=data.get("on_complete"),
             on_exhausted=data.get("on_exhausted"),
+            precheck=data.get("precheck", False),
+            speculation=speculation,
+            stagnation=stagnation,
+            rollback=data.get("rollback", False),
+            memoize=data.get("memoize", False),
+            changed_files=data.get("changed_files", False),
         )
 
     def _parse_step(self, data: dict) -> Step:
         step_type = data.get("type", "llm")
         if step_type == "command":
-            return CommandStep(id=data["id"], command=data["command"])
+            return CommandStep(
+                id=data["id"],
+                command=data["command"],
+                inputs=tuple(data.get("inputs", [])),
+                outputs=tuple(data.get("outputs", [])),
+            )
 
         agent = None
         if "agent" in data:
@@ -117,8 +182,17 @@ class FileWorkflowStore:
                 engine=data["agent"].get("engine", "cursor"),
                 model=data["agent"].get("model"),
             )
+        hedge = None
+        if "hedge" in data:
+            hedge = Hedge(
+                after_seconds=data["hedge"].get("after_seconds"),
+                percentile=data["hedge"].get("percentile", 95),
+                min_samples=data["hedge"].get("min_samples", 5),
+                model=data["hedge"].get("model"),
+            )
         return LlmStep(
             id=data["id"],
             prompt=data["prompt"],
             agent=agent,
+            hedge=hedge,
         )
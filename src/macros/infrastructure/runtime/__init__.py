@@ -1,14 +1,39 @@
 from .cursor_agent import CursorAgentAdapter
-from .console import StdConsoleAdapter
+from .console import FileConsoleAdapter, JsonConsoleAdapter, StdConsoleAdapter
 from .subprocess_command import SubprocessCommandAdapter
-from macros.infrastructure.runtime.utils.workspace import get_workspace, set_workspace
+from .git_workspace import GitWorkspaceAdapter
+from .rate_limiter import HostRateLimiter, RateLimitedAgent, load_agent_limits
+from .cassette import Cassette, RecordingAgent, RecordingCommand, ReplayAgent, ReplayCommand
+from .plugins import HOOKS_ENTRY_POINT_GROUP, load_hook_plugins
+from macros.infrastructure.runtime.utils.workspace import (
+    get_workspace,
+    set_workspace,
+    use_workspace,
+)
 from macros.infrastructure.runtime.utils.input_resolver import resolve_input
+from macros.infrastructure.runtime.utils.durations import parse_duration, parse_since
 
 __all__ = [
     "CursorAgentAdapter",
     "StdConsoleAdapter",
+    "FileConsoleAdapter",
+    "JsonConsoleAdapter",
     "SubprocessCommandAdapter",
+    "GitWorkspaceAdapter",
+    "HostRateLimiter",
+    "RateLimitedAgent",
+    "load_agent_limits",
+    "Cassette",
+    "RecordingAgent",
+    "RecordingCommand",
+    "ReplayAgent",
+    "ReplayCommand",
+    "HOOKS_ENTRY_POINT_GROUP",
+    "load_hook_plugins",
     "get_workspace",
     "set_workspace",
+    "use_workspace",
     "resolve_input",
+    "parse_duration",
+    "parse_since",
 ]
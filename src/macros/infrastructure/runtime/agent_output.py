@@ -0,0 +1,192 @@
+"""Structured agent output -- the final result, its usage and streamed events."""
+
+import json
+import time
+from typing import Any
+
+from macros.domain.model.agent_event import AgentEvent
+from macros.domain.model.usage import Usage
+from macros.infrastructure.runtime.utils.text import preview
+
+
+# Field names differ between agent CLIs (and API generations).
+_INPUT_TOKENS = ("input_tokens", "inputTokens", "prompt_tokens")
+_OUTPUT_TOKENS = ("output_tokens", "outputTokens", "completion_tokens")
+_CACHE_READ_TOKENS = ("cache_read_input_tokens", "cacheReadInputTokens", "cache_read_tokens")
+_COST = ("total_cost_usd", "cost_usd", "costUsd")
+
+
+def parse_result(stdout: str) -> tuple[str, Usage | None, bool] | None:
+    """(text, usage, is_error) from `--output-format json` output.
+
+    Accepts a single JSON object or JSON lines ending in a result event
+    ({"type": "result", ...}). Returns None when the output is not
+    structured (e.g. the agent crashed before printing any JSON).
+    """
+    result = _result_event(stdout)
+    if result is None:
+        return None
+    text = result.get("result")
+    if not isinstance(text, str):
+        text = result.get("text") if isinstance(result.get("text"), str) else ""
+    return text.strip(), usage_of(result), bool(result.get("is_error"))
+
+
+def usage_of(event: dict) -> Usage | None:
+    """Usage reported in a result event, or None if it reports none."""
+    usage = event.get("usage") if isinstance(event.get("usage"), dict) else {}
+    model = event.get("model")
+    model_usage = event.get("modelUsage")
+    if not model and isinstance(model_usage, dict) and len(model_usage) == 1:
+        model = next(iter(model_usage))
+    cost = _first(event, _COST)
+    if cost is None:
+        cost = _first(usage, _COST)
+    reported = Usage(
+        input_tokens=_int(_first(usage, _INPUT_TOKENS)),
+        output_tokens=_int(_first(usage, _OUTPUT_TOKENS)),
+        cache_read_tokens=_int(_first(usage, _CACHE_READ_TOKENS)),
+        cost_usd=float(cost) if cost is not None else None,
+        model=model if isinstance(model, str) else None,
+    )
+    return reported if reported != Usage() else None
+
+
+class StreamParser:
+    """Incremental parser for `--output-format stream-json` (one JSON event per line).
+
+    feed() turns each line into zero or more AgentEvents as it arrives, so
+    progress can be shown while the agent is still working; done becomes
+    True once the final result event is seen. Lines that aren't JSON are
+    kept as the fallback output.
+    """
+
+    def __init__(self) -> None:
+        self._started = time.monotonic()
+        self._result: dict | None = None
+        self._model: str | None = None
+        self._unparsed: list[str] = []
+
+    @property
+    def done(self) -> bool:
+        return self._result is not None
+
+    def feed(self, line: str) -> list[AgentEvent]:
+        try:
+            event = json.loads(line)
+        except ValueError:
+            if line.strip():
+                self._unparsed.append(line)
+            return []
+        if not isinstance(event, dict):
+            return []
+        if isinstance(event.get("model"), str):
+            self._model = event["model"]
+        elapsed = round(time.monotonic() - self._started, 3)
+        return [
+            AgentEvent(kind, summary, elapsed, tool, path)
+            for kind, summary, tool, path in self._normalize(event)
+        ]
+
+    def result(self) -> tuple[str, Usage | None, bool] | None:
+        """(text, usage, is_error) once the result event arrived, else None."""
+        if self._result is None:
+            return None
+        result = self._result
+        if self._model and "model" not in result:
+            result = {**result, "model": self._model}
+        text = result.get("result") if isinstance(result.get("result"), str) else ""
+        return text.strip(), usage_of(result), bool(result.get("is_error"))
+
+    def unparsed(self) -> str:
+        return "".join(self._unparsed).strip()
+
+    def _normalize(self, event: dict) -> list[tuple[str, str, str | None, str | None]]:
+        kind = event.get("type")
+        if kind == "system" and event.get("subtype") == "init":
+            return [("init", f"model {self._model}" if self._model else "started", None, None)]
+        if kind == "result":
+            self._result = event
+            return [("result", "failed" if event.get("is_error") else "done", None, None)]
+        if kind == "tool_call":
+            # Cursor: {"subtype": "started", "tool_call": {"readToolCall": {"args": {...}}}}
+            calls = event.get("tool_call") if isinstance(event.get("tool_call"), dict) else {}
+            out = []
+            for key, call in calls.items():
+                tool = key.removesuffix("ToolCall")
+                args = call.get("args", {}) if isinstance(call, dict) else {}
+                if event.get("subtype") == "completed":
+                    ok = isinstance(call, dict) and "success" in (call.get("result") or {})
+                    out.append(("tool_result", f"{tool} {'ok' if ok else 'failed'}", tool, None))
+                else:
+                    out.append(_tool_event(tool, args))
+            return out
+        if kind == "assistant":
+            # Claude-style: content blocks, tool calls as "tool_use" blocks.
+            message = event.get("message") if isinstance(event.get("message"), dict) else {}
+            content = message.get("content")
+            if isinstance(content, str):
+                content = [{"type": "text", "text": content}]
+            out = []
+            for block in content if isinstance(content, list) else []:
+                if not isinstance(block, dict):
+                    continue
+                if block.get("type") == "tool_use":
+                    out.append(_tool_event(str(block.get("name", "tool")), block.get("input") or {}))
+                elif block.get("type") == "text" and str(block.get("text", "")).strip():
+                    out.append(("message", preview(block["text"]), None, None))
+            return out
+        return []
+
+
+_EDIT_TOOLS = {"write", "edit", "multiedit", "delete", "str_replace", "apply_patch"}
+
+
+def _tool_event(tool: str, args: Any) -> tuple[str, str, str | None, str | None]:
+    args = args if isinstance(args, dict) else {}
+    path = args.get("path") or args.get("file_path") or args.get("filePath")
+    command = args.get("command")
+    kind = "edit" if tool.lower() in _EDIT_TOOLS else "tool_call"
+    if isinstance(path, str):
+        return kind, f"{tool} {path}", tool, path
+    if isinstance(command, str):
+        return kind, f"{tool}: {preview(command)}", tool, None
+    return kind, tool, tool, None
+
+
+def _result_event(stdout: str) -> dict | None:
+    text = stdout.strip()
+    if not text:
+        return None
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
+        return data
+    model = None
+    result = None
+    for line in text.splitlines():
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(event, dict):
+            continue
+        model = event.get("model") if isinstance(event.get("model"), str) else model
+        if event.get("type") == "result":
+            result = event
+    if result is not None and model and "model" not in result:
+        result = {**result, "model": model}
+    return result
+
+
+def _first(data: dict, keys: tuple[str, ...]) -> Any:
+    for key in keys:
+        if data.get(key) is not None:
+            return data[key]
+    return None
+
+
+def _int(value: Any) -> int | None:
+    return int(value) if value is not None else None
@@ -0,0 +1,221 @@
+"""Record-and-replay adapters: agent prompts and commands captured as cassettes."""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Mapping
+
+from macros.domain.exceptions import PhaseExecutionError
+from macros.domain.model.usage import Usage
+from macros.domain.ports.agent_port import (
+    CANCELLED_EXIT_CODE,
+    AgentListener,
+    AgentPort,
+    reported_timeout,
+    reported_usage,
+    set_listener,
+)
+from macros.domain.ports.command_port import CommandPort, command_timed_out
+from macros.infrastructure.runtime.utils.text import preview
+
+
+class Cassette:
+    """Recorded (exit_code, output, latency, usage, timed_out) results keyed
+    by prompt or command hash.
+
+    Stored as JSON lines, one call per line, in call order:
+      {"kind": "agent"|"command", "key": "<sha256>", "exit_code": 0,
+       "output": "...", "latency_s": 1.234, "usage": {...}, "timed_out": true}
+
+    usage is only present for agent calls that reported it, timed_out only
+    for calls killed by their timeout.
+
+    A prompt or command issued several times (e.g. a validation command on
+    every iteration) replays its recordings in order, then keeps returning
+    the last one. Safe to share between threads.
+    """
+
+    def __init__(self, path: Path | str, *, record: bool = False) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], list[dict]] = {}
+        self._cursors: dict[tuple[str, str], int] = {}
+        if record:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._path.write_text("", encoding="utf-8")
+        else:
+            for line in self._path.read_text(encoding="utf-8").splitlines():
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries.setdefault((entry["kind"], entry["key"]), []).append(entry)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def record(
+        self,
+        kind: str,
+        text: str,
+        exit_code: int,
+        output: str,
+        latency_s: float,
+        usage: Usage | None = None,
+        timed_out: bool = False,
+    ) -> None:
+        entry = {
+            "kind": kind,
+            "key": _key(text),
+            "exit_code": exit_code,
+            "output": output,
+            "latency_s": round(latency_s, 3),
+        }
+        if usage is not None:
+            entry["usage"] = {k: v for k, v in asdict(usage).items() if v is not None}
+        if timed_out:
+            entry["timed_out"] = True
+        line = json.dumps(entry)
+        with self._lock, self._path.open("a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+
+    def play(self, kind: str, text: str) -> tuple[int, str, float, Usage | None, bool]:
+        """The next recorded result for this prompt/command.
+
+        Raises PhaseExecutionError when nothing was recorded for it: the
+        workflow has diverged from the recording.
+        """
+        slot = (kind, _key(text))
+        with self._lock:
+            entries = self._entries.get(slot)
+            if not entries:
+                raise PhaseExecutionError(
+                    f"No recorded {kind} result in {self._path} for: {preview(text)}"
+                )
+            index = self._cursors.get(slot, 0)
+            self._cursors[slot] = index + 1
+            entry = entries[min(index, len(entries) - 1)]
+        usage = Usage(**entry["usage"]) if entry.get("usage") else None
+        return (
+            entry["exit_code"], entry["output"], entry.get("latency_s", 0.0), usage,
+            entry.get("timed_out", False),
+        )
+
+
+class RecordingAgent:
+    """AgentPort decorator that records every prompt's result to a cassette."""
+
+    def __init__(self, inner: AgentPort, cassette: Cassette) -> None:
+        self._inner = inner
+        self._cassette = cassette
+
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
+        started = time.monotonic()
+        exit_code, output = self._inner.run_prompt(prompt, cwd=cwd)
+        self._cassette.record(
+            "agent", prompt, exit_code, output, time.monotonic() - started,
+            reported_usage(self._inner), reported_timeout(self._inner),
+        )
+        return exit_code, output
+
+    def cancel(self) -> None:
+        self._inner.cancel()
+
+    def last_usage(self) -> Usage | None:
+        return reported_usage(self._inner)
+
+    def timed_out(self) -> bool:
+        return reported_timeout(self._inner)
+
+    def set_listener(self, listener: AgentListener | None) -> None:
+        set_listener(self._inner, listener)
+
+
+class ReplayAgent:
+    """AgentPort serving recorded results; optionally sleeps the recorded latency.
+
+    The workspace is left untouched, so validation commands should be
+    replayed from the same cassette (see ReplayCommand).
+    """
+
+    def __init__(self, cassette: Cassette, reproduce_latency: bool = False) -> None:
+        self._cassette = cassette
+        self._reproduce_latency = reproduce_latency
+        self._cancelled = threading.Event()
+        self._usage: Usage | None = None
+        self._timed_out = False
+
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
+        exit_code, output, latency, self._usage, self._timed_out = self._cassette.play(
+            "agent", prompt
+        )
+        if self._reproduce_latency and self._cancelled.wait(latency):
+            self._usage = None
+            self._timed_out = False
+            return CANCELLED_EXIT_CODE, "Agent cancelled."
+        return exit_code, output
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def last_usage(self) -> Usage | None:
+        return self._usage
+
+    def timed_out(self) -> bool:
+        return self._timed_out
+
+
+class RecordingCommand:
+    """CommandPort decorator that records every command's result to a cassette."""
+
+    def __init__(self, inner: CommandPort, cassette: Cassette) -> None:
+        self._inner = inner
+        self._cassette = cassette
+
+    def run_command(
+        self,
+        command: str,
+        cwd: str | None = None,
+        env: Mapping[str, str] | None = None,
+    ) -> tuple[int, str]:
+        started = time.monotonic()
+        exit_code, output = self._inner.run_command(command, cwd=cwd, env=env)
+        self._cassette.record(
+            "command", command, exit_code, output, time.monotonic() - started,
+            timed_out=command_timed_out(self._inner),
+        )
+        return exit_code, output
+
+    def timed_out(self) -> bool:
+        return command_timed_out(self._inner)
+
+
+class ReplayCommand:
+    """CommandPort serving recorded results; optionally sleeps the recorded latency."""
+
+    def __init__(self, cassette: Cassette, reproduce_latency: bool = False) -> None:
+        self._cassette = cassette
+        self._reproduce_latency = reproduce_latency
+        self._local = threading.local()
+
+    def run_command(
+        self,
+        command: str,
+        cwd: str | None = None,
+        env: Mapping[str, str] | None = None,
+    ) -> tuple[int, str]:
+        exit_code, output, latency, _, self._local.timed_out = self._cassette.play(
+            "command", command
+        )
+        if self._reproduce_latency:
+            time.sleep(latency)
+        return exit_code, output
+
+    def timed_out(self) -> bool:
+        return getattr(self._local, "timed_out", False)
+
+
+def _key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -1,4 +1,14 @@
-"""Console adapter using Rich for formatting."""
+"""Console adapters: Rich for the terminal, plain text for log files, NDJSON for machines."""
+
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TextIO
 
 from rich.console import Console
 
@@ -19,3 +29,120 @@ class StdConsoleAdapter(ConsolePort):
 
     def echo(self, msg: str) -> None:
         self._c.print(msg)
+
+    def event(self, name: str, **fields: Any) -> None:
+        pass
+
+
+class FileConsoleAdapter(ConsolePort):
+    """Plain-text console writing to a log file (one per daemon job).
+
+    Lines are flushed as they are written so the log can be tailed while
+    the run is in progress. Safe to share between threads.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def info(self, msg: str) -> None:
+        self._write(f"INFO {msg}")
+
+    def warn(self, msg: str) -> None:
+        self._write(f"WARN {msg}")
+
+    def echo(self, msg: str) -> None:
+        self._write(msg)
+
+    def event(self, name: str, **fields: Any) -> None:
+        pass
+
+    def _write(self, line: str) -> None:
+        with self._lock, self._path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class JsonConsoleAdapter(ConsolePort):
+    """NDJSON console: one JSON object per line, for orchestrators.
+
+    Every line has "ts" (UTC ISO-8601) and "event"; messages become
+    {"event": "log", "level": "info"|"warn"|"echo", "msg": ...} and
+    structured events carry their own fields. Lines are serialized by the
+    caller and written by a background thread, so a slow reader never
+    stalls a run; close() (also run at exit) drains what is queued, and
+    lines emitted after it are written synchronously.
+    Writes to stdout by default, or to an inherited file descriptor.
+    """
+
+    _CLOSE = None
+
+    def __init__(self, stream: TextIO | None = None, *, fd: int | None = None) -> None:
+        if fd is not None:
+            stream = os.fdopen(fd, "w", encoding="utf-8", closefd=False)
+        self._stream = stream or sys.stdout
+        self._queue: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._writer = threading.Thread(target=self._drain, name="macrocycle-json-console", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def info(self, msg: str) -> None:
+        self._emit({"event": "log", "level": "info", "msg": msg})
+
+    def warn(self, msg: str) -> None:
+        self._emit({"event": "log", "level": "warn", "msg": msg})
+
+    def echo(self, msg: str) -> None:
+        self._emit({"event": "log", "level": "echo", "msg": msg})
+
+    def event(self, name: str, **fields: Any) -> None:
+        self._emit({"event": name, **fields})
+
+    def close(self) -> None:
+        """Write everything queued so far and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(self._CLOSE)
+        self._writer.join()
+        atexit.unregister(self.close)
+
+    def _emit(self, record: dict[str, Any]) -> None:
+        line = json.dumps(
+            {"ts": datetime.now(timezone.utc).isoformat(), **record},
+            default=str,
+            separators=(",", ":"),
+        )
+        with self._lock:
+            if not self._closed:
+                self._queue.put(line)
+                return
+            # The writer is gone; write after whatever it still had queued.
+            self._writer.join()
+            self._write(line)
+            self._flush()
+
+    def _drain(self) -> None:
+        while True:
+            line = self._queue.get()
+            if line is self._CLOSE:
+                self._flush()
+                return
+            self._write(line)
+            if self._queue.empty():
+                self._flush()
+
+    def _write(self, line: str) -> None:
+        try:
+            self._stream.write(line + "\n")
+        except (OSError, ValueError):
+            pass  # reader went away; keep going so callers never block
+
+    def _flush(self) -> None:
+        try:
+            self._stream.flush()
+        except (OSError, ValueError):
+            pass
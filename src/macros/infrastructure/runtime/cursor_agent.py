@@ -1,11 +1,21 @@
+import os
+import signal
 import subprocess
+import threading
+from pathlib import Path
+from typing import Callable, Mapping
 
-from macros.domain.ports.agent_port import AgentPort
+from macros.domain.model.agent_event import AgentEvent
+from macros.domain.model.usage import Usage
+from macros.domain.ports.agent_port import CANCELLED_EXIT_CODE, AgentPort
 from macros.domain.ports.console_port import ConsolePort
+from macros.infrastructure.runtime.agent_output import StreamParser, parse_result
 from macros.infrastructure.runtime.utils.workspace import get_workspace
 
 
 TIMEOUT_SECONDS = 300  # Avoid hanging indefinitely
+OUTPUT_FORMATS = ("text", "json", "stream-json")
+RESULT_GRACE_SECONDS = 2  # how long an agent may take to exit after its result
 
 
 class CursorAgentAdapter(AgentPort):
@@ -13,6 +23,15 @@ class CursorAgentAdapter(AgentPort):
 
     Cursor docs show using headless automation like:
       agent -p --force --output-format text "..."
+
+    With output_format="json" the agent prints one JSON result object; its
+    text is returned as usual and the tokens, cost and model it reports are
+    kept for last_usage(). Output that isn't JSON is returned verbatim.
+
+    With output_format="stream-json" events are parsed line by line while
+    the agent works and passed to the set_listener() callback (tool calls,
+    edits, messages); the call returns as soon as the result event arrives,
+    killing an agent that doesn't exit within RESULT_GRACE_SECONDS.
     """
 
     def __init__(
@@ -21,35 +40,163 @@ class CursorAgentAdapter(AgentPort):
         binary: str = "agent",
         extra_args: list[str] | None = None,
         timeout: int = TIMEOUT_SECONDS,
+        workspace_dir: Path | str | None = None,
+        env: Mapping[str, str] | None = None,
+        output_format: str = "text",
     ) -> None:
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unknown output format '{output_format}'. Supported: {list(OUTPUT_FORMATS)}"
+            )
         self._console = console
         self._binary = binary
         self._extra_args = extra_args or []
         self._timeout = timeout
+        self._workspace_dir = str(workspace_dir) if workspace_dir else None
+        self._env = dict(env) if env else None
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+        self._cancelled = False
+        self._output_format = output_format
+        self._usage: Usage | None = None
+        self._timed_out = False
+        self._listener: Callable[[AgentEvent], None] | None = None
 
-    def run_prompt(self, prompt: str) -> tuple[int, str]:
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
+        self._usage = None
+        self._timed_out = False
         cmd = [
             self._binary,
             "--print",
             "--force",
             "--output-format",
-            "text",
+            self._output_format,
             *self._extra_args,
             prompt,
         ]
 
         try:
-            proc = subprocess.run(
-                cmd,
-                cwd=str(get_workspace()),
-                text=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                timeout=self._timeout,
-            )
-            out = (proc.stdout or "").strip()
-            return proc.returncode, out
+            with self._lock:
+                if self._cancelled:
+                    return CANCELLED_EXIT_CODE, "Agent cancelled."
+                self._proc = subprocess.Popen(
+                    cmd,
+                    cwd=cwd or self._workspace_dir or str(get_workspace()),
+                    env={**os.environ, **self._env} if self._env else None,
+                    text=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True,
+                )
         except FileNotFoundError:
             return 127, f"Agent binary '{self._binary}' not found. Ensure it's on PATH."
+
+        proc = self._proc
+        if self._output_format == "stream-json":
+            try:
+                return self._stream(proc)
+            finally:
+                with self._lock:
+                    self._proc = None
+        try:
+            out, _ = proc.communicate(timeout=self._timeout)
         except subprocess.TimeoutExpired:
+            _kill(proc)
+            proc.communicate()
+            self._timed_out = True
             return 124, f"Agent timed out after {self._timeout}s."
+        finally:
+            with self._lock:
+                self._proc = None
+
+        if self._cancelled:
+            return CANCELLED_EXIT_CODE, "Agent cancelled."
+        if self._output_format == "json":
+            return self._structured(proc.returncode, out or "")
+        return proc.returncode, (out or "").strip()
+
+    def last_usage(self) -> Usage | None:
+        return self._usage
+
+    def timed_out(self) -> bool:
+        return self._timed_out
+
+    def _structured(self, exit_code: int, out: str) -> tuple[int, str]:
+        parsed = parse_result(out)
+        if parsed is None:
+            return exit_code, out.strip()
+        text, self._usage, is_error = parsed
+        if is_error:
+            exit_code = exit_code or 1
+        return exit_code, text
+
+    def _stream(self, proc: subprocess.Popen) -> tuple[int, str]:
+        """Parse events as they arrive and return as soon as the result is in."""
+        parser = StreamParser()
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            _kill(proc)
+
+        watchdog = threading.Timer(self._timeout, expire)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            for line in proc.stdout:
+                for event in parser.feed(line):
+                    self._notify(event)
+                if parser.done:
+                    break
+        finally:
+            watchdog.cancel()
+
+        result = parser.result()
+        if result is not None:
+            # The answer is complete; don't wait for a slow shutdown.
+            try:
+                proc.wait(timeout=RESULT_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                _kill(proc)
+        proc.stdout.close()
+        proc.wait()
+
+        if self._cancelled:
+            return CANCELLED_EXIT_CODE, "Agent cancelled."
+        if timed_out.is_set():
+            self._timed_out = True
+            return 124, f"Agent timed out after {self._timeout}s."
+        if result is None:
+            return proc.returncode, parser.unparsed()
+        text, self._usage, is_error = result
+        if is_error:
+            return max(proc.returncode, 1), text
+        return 0, text
+
+    def set_listener(self, listener: Callable[[AgentEvent], None] | None) -> None:
+        self._listener = listener
+
+    def _notify(self, event: AgentEvent) -> None:
+        if self._listener is None:
+            return
+        try:
+            self._listener(event)
+        except Exception as e:
+            self._console.warn(f"Agent event listener failed: {e}")
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            if self._proc is not None and self._proc.poll() is None:
+                _kill(self._proc)
+
+
+def _kill(proc: subprocess.Popen) -> None:
+    """Kill the agent and any tools it spawned (its whole process group)."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:  # pragma: no cover - non-POSIX platforms
+            proc.kill()
+    except ProcessLookupError:
+        pass
@@ -0,0 +1,169 @@
+"""GitWorkspaceAdapter -- isolated checkouts via `git worktree`."""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from macros.domain.exceptions import WorkspaceError
+from macros.infrastructure.runtime.utils.workspace import get_workspace
+
+
+class GitWorkspaceAdapter:
+    """Implements WorkspacePort with git worktrees and binary patches.
+
+    A worktree starts from a snapshot commit of the source checkout that
+    includes uncommitted and untracked (non-ignored) files, built with a
+    throwaway index so the user's staging area is never touched. Promotion
+    diffs the worktree against that snapshot and applies the patch to the
+    target checkout, which must still be in the snapshotted state.
+    Exports either commit the worktree's state onto a new branch or render
+    the same diff as a standalone patch. Snapshots use the same commits and
+    restore applies the diff from the current state back to one.
+    """
+
+    def __init__(self, workspace_dir: Path | str | None = None) -> None:
+        self._workspace_dir = str(workspace_dir) if workspace_dir else None
+        # Base commit per worktree: agents may commit inside a worktree, so its
+        # HEAD is not a reliable reference for "what changed".
+        self._bases: dict[str, str] = {}
+
+    def create_worktree(self, name: str, source: str | None = None) -> str:
+        src = source or self._workspace_dir or str(get_workspace())
+        base = self._snapshot(src)
+        parent = tempfile.mkdtemp(prefix="macrocycle-")
+        path = str(Path(parent) / name)
+        try:
+            self._git(src, "worktree", "add", "--detach", path, base)
+        except WorkspaceError:
+            shutil.rmtree(parent, ignore_errors=True)
+            raise
+        self._bases[path] = base
+        return path
+
+    def fingerprint(self, path: str | None = None) -> str:
+        return self._working_tree(path or self._workspace_dir or str(get_workspace()))[1]
+
+    def snapshot(self, path: str | None = None) -> str:
+        return self._snapshot(path or self._workspace_dir or str(get_workspace()))
+
+    def restore(self, snapshot: str, path: str | None = None) -> None:
+        dst = path or self._workspace_dir or str(get_workspace())
+        patch = self._git(dst, "diff", "--binary", self._snapshot(dst), snapshot)
+        if not patch.strip():
+            return
+        self._git(dst, "apply", "--binary", "--whitespace=nowarn", "-", stdin=patch)
+
+    def changed_files(self, since: str, path: str | None = None) -> list[str]:
+        dst = path or self._workspace_dir or str(get_workspace())
+        tree = self._working_tree(dst)[1]
+        out = self._git(dst, "diff", "--name-only", "--no-renames", "--diff-filter=d", "-z", since, tree)
+        return [name for name in out.split("\0") if name]
+
+    def change_size(self, worktree: str) -> int:
+        out = self._git(worktree, "diff", "--numstat", self._base(worktree), self._snapshot(worktree))
+        total = 0
+        for line in out.splitlines():
+            added, deleted, _ = line.split("\t", 2)
+            # Binary files report "-"; count them as a single change.
+            total += (int(added) if added.isdigit() else 1) + (int(deleted) if deleted.isdigit() else 0)
+        return total
+
+    def promote(self, worktree: str, target: str | None = None) -> None:
+        dst = target or self._workspace_dir or str(get_workspace())
+        patch = self.export_patch(worktree)
+        if not patch.strip():
+            return
+        self._git(dst, "apply", "--binary", "--whitespace=nowarn", "-", stdin=patch)
+
+    def export_branch(self, worktree: str, branch: str, message: str) -> None:
+        commit = self._snapshot(worktree, message=message)
+        self._git(worktree, "branch", branch, commit)
+
+    def export_patch(self, worktree: str) -> str:
+        return self._git(worktree, "diff", "--binary", self._base(worktree), self._snapshot(worktree))
+
+    def remove_worktree(self, worktree: str) -> None:
+        self._bases.pop(worktree, None)
+        try:
+            common = self._git(worktree, "rev-parse", "--git-common-dir").strip()
+            repo = str((Path(worktree) / common).resolve().parent)
+            self._git(repo, "worktree", "remove", "--force", worktree)
+        except (WorkspaceError, OSError):
+            pass
+        shutil.rmtree(Path(worktree).parent, ignore_errors=True)
+
+    def _base(self, worktree: str) -> str:
+        return self._bases.get(worktree) or "HEAD"
+
+    def _snapshot(self, cwd: str, message: str = "macrocycle snapshot") -> str:
+        """Commit the full working state (tracked + untracked) without touching HEAD or the index.
+
+        A clean checkout snapshots to HEAD itself, so no empty commit is made.
+        """
+        head, tree = self._working_tree(cwd)
+        if head and tree == self._git(cwd, "rev-parse", f"{head}^{{tree}}").strip():
+            return head
+        parents = ["-p", head] if head else []
+        return self._git(cwd, "commit-tree", tree, *parents, "-m", message).strip()
+
+    def _working_tree(self, cwd: str) -> tuple[str | None, str]:
+        """(HEAD, tree object of the working state), built in a throwaway index.
+
+        The throwaway index starts as a copy of the real one so git's stat
+        cache lets `add -A` skip rehashing unchanged files.
+        """
+        fd, index = tempfile.mkstemp(prefix="macrocycle-index-")
+        os.close(fd)
+        os.unlink(index)
+        env = {"GIT_INDEX_FILE": index}
+        try:
+            head = self._rev_parse_head(cwd)
+            real_index = Path(cwd, self._git(cwd, "rev-parse", "--git-path", "index").strip())
+            if real_index.exists():
+                shutil.copyfile(real_index, index)
+            elif head:
+                self._git(cwd, "read-tree", head, env=env)
+            # macrocycle's own state (runs, caches) is never part of the work.
+            self._git(cwd, "add", "-A", "--", ".", ":(exclude).macrocycle", env=env)
+            return head, self._git(cwd, "write-tree", env=env).strip()
+        finally:
+            Path(index).unlink(missing_ok=True)
+
+    def _rev_parse_head(self, cwd: str) -> str | None:
+        try:
+            return self._git(cwd, "rev-parse", "--verify", "-q", "HEAD").strip() or None
+        except WorkspaceError:
+            return None
+
+    def _git(
+        self,
+        cwd: str,
+        *args: str,
+        stdin: str | None = None,
+        env: dict[str, str] | None = None,
+    ) -> str:
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=cwd,
+                input=stdin,
+                capture_output=True,
+                text=True,
+                env={
+                    **os.environ,
+                    "GIT_AUTHOR_NAME": "macrocycle",
+                    "GIT_AUTHOR_EMAIL": "macrocycle@localhost",
+                    "GIT_COMMITTER_NAME": "macrocycle",
+                    "GIT_COMMITTER_EMAIL": "macrocycle@localhost",
+                    **(env or {}),
+                },
+            )
+        except FileNotFoundError:
+            raise WorkspaceError("git is not installed or not on PATH") from None
+        if result.returncode != 0:
+            raise WorkspaceError(
+                f"git {' '.join(args[:2])} failed in {cwd}: {result.stderr.strip()}"
+            )
+        return result.stdout
@@ -0,0 +1,28 @@
+"""Plugin discovery through package entry points."""
+
+from importlib.metadata import entry_points
+
+from macros.domain.ports.console_port import ConsolePort
+from macros.domain.ports.lifecycle_hooks_port import LifecycleHooks
+
+HOOKS_ENTRY_POINT_GROUP = "macrocycle.hooks"
+
+
+def load_hook_plugins(console: ConsolePort) -> list[LifecycleHooks]:
+    """Instantiate every installed lifecycle hook plugin.
+
+    A plugin registers a zero-argument factory (usually its hook class)
+    under the "macrocycle.hooks" entry point group:
+
+        [project.entry-points."macrocycle.hooks"]
+        tracing = "my_tracing.hooks:TracingHooks"
+
+    Plugins that fail to load are reported and skipped.
+    """
+    hooks: list[LifecycleHooks] = []
+    for ep in entry_points(group=HOOKS_ENTRY_POINT_GROUP):
+        try:
+            hooks.append(ep.load()())
+        except Exception as e:
+            console.warn(f"Could not load hook plugin '{ep.name}': {e}")
+    return hooks
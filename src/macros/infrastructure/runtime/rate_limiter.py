@@ -0,0 +1,165 @@
+"""Host-wide agent throttling: concurrency slots and token-bucket rate limits."""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+from macros.domain.model.agent_config import AgentLimit
+from macros.domain.model.usage import Usage
+from macros.domain.ports.agent_port import (
+    CANCELLED_EXIT_CODE,
+    AgentListener,
+    AgentPort,
+    reported_timeout,
+    reported_usage,
+    set_listener,
+)
+from macros.infrastructure.runtime.utils.file_lock import atomic_write_text, file_lock, try_lock
+
+
+SLOT_POLL_SECONDS = 0.25
+
+
+def default_lock_dir() -> Path:
+    """$MACROCYCLE_LOCK_DIR, else a per-host directory under the system temp dir."""
+    configured = os.environ.get("MACROCYCLE_LOCK_DIR")
+    return Path(configured) if configured else Path(tempfile.gettempdir()) / "macrocycle-locks"
+
+
+def load_agent_limits(path: Path | str) -> dict[str, AgentLimit]:
+    """Read limits.json: {"<engine>" | "<engine>/<model>": {"max_concurrency": int,
+    "requests_per_minute": number, "burst": int}}. A missing file means no limits."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    limits: dict[str, AgentLimit] = {}
+    for key, entry in data.items():
+        limit = AgentLimit(
+            max_concurrency=entry.get("max_concurrency"),
+            requests_per_minute=entry.get("requests_per_minute"),
+            burst=entry.get("burst"),
+        )
+        if limit.max_concurrency is not None and limit.max_concurrency < 1:
+            raise ValueError(f"{path}: {key}.max_concurrency must be >= 1")
+        if limit.requests_per_minute is not None and limit.requests_per_minute <= 0:
+            raise ValueError(f"{path}: {key}.requests_per_minute must be > 0")
+        if limit.burst is not None and limit.burst < 1:
+            raise ValueError(f"{path}: {key}.burst must be >= 1")
+        limits[key] = limit
+    return limits
+
+
+class HostRateLimiter:
+    """Coordinates agent launches between every macrocycle process on the host.
+
+    Concurrency: max_concurrency lock files per key act as a counting
+    semaphore; a process holds one flock'ed slot for the whole prompt.
+    Rate: a token bucket per key lives in a small JSON file updated under
+    an exclusive lock, refilling at requests_per_minute / 60 tokens per second.
+    """
+
+    def __init__(self, lock_dir: Path | str | None = None) -> None:
+        self._dir = Path(lock_dir) if lock_dir else default_lock_dir()
+
+    @contextmanager
+    def acquire(
+        self,
+        key: str,
+        limit: AgentLimit,
+        cancelled: threading.Event | None = None,
+    ) -> Iterator[bool]:
+        """Wait for a slot and a token. Yields False if cancelled while waiting."""
+        cancelled = cancelled or threading.Event()
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+        slot: IO | None = None
+        try:
+            if limit.max_concurrency is not None:
+                slot = self._take_slot(name, limit.max_concurrency, cancelled)
+                if slot is None:
+                    yield False
+                    return
+            yield self._take_token(name, limit, cancelled)
+        finally:
+            if slot is not None:
+                slot.close()
+
+    def _take_slot(
+        self, name: str, max_concurrency: int, cancelled: threading.Event
+    ) -> IO | None:
+        """Hold the first free slot lock; None if cancelled while all are taken."""
+        while not cancelled.is_set():
+            for i in range(max_concurrency):
+                fh = try_lock(self._dir / f"{name}.slot{i}")
+                if fh is not None:
+                    return fh
+            cancelled.wait(SLOT_POLL_SECONDS)
+        return None
+
+    def _take_token(self, name: str, limit: AgentLimit, cancelled: threading.Event) -> bool:
+        if limit.requests_per_minute is None:
+            return True
+        rate = limit.requests_per_minute / 60
+        capacity = float(limit.burst or max(1.0, limit.requests_per_minute))
+        state_path = self._dir / f"{name}.bucket.json"
+        while not cancelled.is_set():
+            with file_lock(self._dir / f"{name}.bucket.lock"):
+                now = time.time()
+                try:
+                    state = json.loads(state_path.read_text(encoding="utf-8"))
+                    tokens, updated = state["tokens"], state["updated"]
+                except (OSError, ValueError, KeyError):
+                    tokens, updated = capacity, now
+                tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+                if tokens >= 1:
+                    tokens -= 1
+                    wait = 0.0
+                else:
+                    wait = (1 - tokens) / rate
+                atomic_write_text(state_path, json.dumps({"tokens": tokens, "updated": now}))
+            if wait == 0.0:
+                return True
+            cancelled.wait(wait)
+        return False
+
+
+class RateLimitedAgent:
+    """AgentPort decorator that waits for the host-wide budget before each prompt."""
+
+    def __init__(
+        self,
+        inner: AgentPort,
+        limiter: HostRateLimiter,
+        key: str,
+        limit: AgentLimit,
+    ) -> None:
+        self._inner = inner
+        self._limiter = limiter
+        self._key = key
+        self._limit = limit
+        self._cancelled = threading.Event()
+
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
+        with self._limiter.acquire(self._key, self._limit, self._cancelled) as acquired:
+            if not acquired:
+                return CANCELLED_EXIT_CODE, "Agent cancelled."
+            return self._inner.run_prompt(prompt, cwd=cwd)
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        self._inner.cancel()
+
+    def last_usage(self) -> Usage | None:
+        return reported_usage(self._inner)
+
+    def timed_out(self) -> bool:
+        return reported_timeout(self._inner)
+
+    def set_listener(self, listener: AgentListener | None) -> None:
+        set_listener(self._inner, listener)
@@ -1,19 +1,63 @@
 """SubprocessCommandAdapter -- runs shell commands via subprocess (the sensor)."""
 
+import os
 import subprocess
+import threading
+from pathlib import Path
+from typing import Mapping
+
+from macros.infrastructure.runtime.utils.workspace import scoped_workspace
+
+
+TIMEOUT_SECONDS = 300
 
 
 class SubprocessCommandAdapter:
-    """Implements CommandPort by running shell commands via subprocess."""
-
-    def run_command(self, command: str, cwd: str | None = None) -> tuple[int, str]:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            timeout=300,
-        )
+    """Implements CommandPort by running shell commands via subprocess.
+
+    Commands run in `cwd`, else the adapter's workspace, else the active
+    use_workspace() scope, else the process cwd. `env` entries are layered
+    over the process environment for every command, and per-call entries
+    over those. timed_out() reports on the calling thread's last command,
+    so one adapter can serve concurrent attempts.
+    """
+
+    def __init__(
+        self,
+        timeout: int = TIMEOUT_SECONDS,
+        workspace_dir: Path | str | None = None,
+        env: Mapping[str, str] | None = None,
+    ) -> None:
+        self._timeout = timeout
+        self._workspace_dir = str(workspace_dir) if workspace_dir else None
+        self._env = dict(env) if env else None
+        self._local = threading.local()
+
+    def run_command(
+        self,
+        command: str,
+        cwd: str | None = None,
+        env: Mapping[str, str] | None = None,
+    ) -> tuple[int, str]:
+        self._local.timed_out = False
+        if cwd is None:
+            scoped = scoped_workspace()
+            cwd = self._workspace_dir or (str(scoped) if scoped else None)
+        try:
+            result = subprocess.run(
+                command,
+                shell=True,
+                capture_output=True,
+                text=True,
+                cwd=cwd,
+                env={**os.environ, **(self._env or {}), **(env or {})} if self._env or env else None,
+                timeout=self._timeout,
+            )
+        except subprocess.TimeoutExpired:
+            self._local.timed_out = True
+            return 124, f"Command timed out after {self._timeout}s: {command}"
         combined = result.stdout + result.stderr
         return result.returncode, combined
+
+    def timed_out(self) -> bool:
+        return getattr(self._local, "timed_out", False)
@@ -0,0 +1,41 @@
+"""Parsing of human-friendly durations and points in time for CLI options."""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+
+_DURATION_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*$")
+_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def parse_duration(text: str) -> timedelta:
+    """Parse '90s', '15m', '12h', '30d' or '2w' into a timedelta.
+
+    Raises ValueError for anything else.
+    """
+    match = _DURATION_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Invalid duration '{text}'. Use e.g. 30m, 12h, 7d, 2w.")
+    value, unit = match.groups()
+    return timedelta(**{_UNITS[unit]: float(value)})
+
+
+def parse_since(text: str, now: datetime | None = None) -> datetime:
+    """Parse a relative duration ('7d' = seven days ago) or an ISO date/datetime.
+
+    Naive datetimes are interpreted as UTC. Raises ValueError if unparseable.
+    """
+    now = now or datetime.now(timezone.utc)
+    try:
+        return now - parse_duration(text)
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(text.strip())
+    except ValueError:
+        raise ValueError(
+            f"Invalid time '{text}'. Use a duration (7d, 12h) or an ISO date (2026-03-01)."
+        ) from None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
@@ -0,0 +1,7 @@
+"""Short, single-line renderings of long text for logs and messages."""
+
+
+def preview(text: str, limit: int = 80) -> str:
+    """First non-blank line of `text`, cut to `limit` characters with '...'."""
+    first = text.strip().splitlines()[0] if text.strip() else ""
+    return first if len(first) <= limit else first[: limit - 3] + "..."
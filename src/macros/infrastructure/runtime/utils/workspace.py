@@ -1,26 +1,57 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Iterator
 
-# Module-level singleton - discovered once, used everywhere
+# Process-wide default - discovered once, used when no scope is active
 _workspace: Path | None = None
+_discover_lock = threading.Lock()
+
+# Scoped override - follows threads started via contextvars.copy_context()
+# and asyncio tasks, so one process can host runs for several repositories
+_scoped: ContextVar[Path | None] = ContextVar("macrocycle_workspace", default=None)
 
 
 def get_workspace() -> Path:
-    """Get the workspace root (lazy singleton).
-    
-    Discovers the workspace on first call, then caches it.
+    """Get the workspace root.
+
+    Returns the workspace of the innermost `use_workspace()` scope, else the
+    process-wide default, which is discovered on first call and cached.
     """
+    scoped = _scoped.get()
+    if scoped is not None:
+        return scoped
     global _workspace
     if _workspace is None:
-        _workspace = _discover_workspace()
+        with _discover_lock:
+            if _workspace is None:
+                _workspace = _discover_workspace()
     return _workspace
 
 
 def set_workspace(path: Path | str | None) -> None:
-    """Override the workspace (for testing)."""
+    """Override the process-wide default workspace (for testing)."""
     global _workspace
     _workspace = Path(path) if path else None
 
 
+def scoped_workspace() -> Path | None:
+    """The workspace of the innermost `use_workspace()` scope, if any."""
+    return _scoped.get()
+
+
+@contextmanager
+def use_workspace(path: Path | str) -> Iterator[Path]:
+    """Make `path` the workspace for the current thread or task only."""
+    root = Path(path)
+    token = _scoped.set(root)
+    try:
+        yield root
+    finally:
+        _scoped.reset(token)
+
+
 def _discover_workspace() -> Path:
     """Find the workspace root by walking up the directory tree.
 
@@ -0,0 +1,7 @@
+from .prometheus_textfile import PrometheusTextfileExporter
+from .profiler import RunProfiler
+
+__all__ = [
+    "PrometheusTextfileExporter",
+    "RunProfiler",
+]
@@ -0,0 +1,148 @@
+"""RunProfiler -- cProfile, stack samples and tracemalloc for one run."""
+
+import cProfile
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+from macros.domain.model.run import PhaseRun, Run
+from macros.domain.model.workflow import Workflow
+
+
+PSTATS_FILE = "profile.pstats"
+FOLDED_FILE = "profile.folded"
+MEMORY_FILE = "profile-memory.txt"
+
+
+class RunProfiler:
+    """Lifecycle hook that profiles the orchestrator while it executes a run.
+
+    start() enables cProfile and a sampler thread that records the calling
+    thread's stack every `interval` seconds (wall clock, so waits on agents
+    and commands show up too). The run's directory is learned from
+    on_run_start; on_run_end, or close() for a run that was aborted, writes:
+
+      profile.pstats       cProfile stats (`python -m pstats`, snakeviz)
+      profile.folded       collapsed stacks (flamegraph.pl, speedscope)
+      profile-memory.txt   with memory=True, the top allocators after each
+                           phase (tracemalloc)
+
+    Only the thread that called start() is profiled; speculative attempts
+    run on their own threads.
+    """
+
+    def __init__(self, *, memory: bool = False, interval: float = 0.005, top: int = 15) -> None:
+        self._memory = memory
+        self._top = top
+        self._profile = cProfile.Profile()
+        self._sampler = _StackSampler(interval)
+        self._snapshots: list[tuple[str, tracemalloc.Snapshot]] = []
+        self._run_dir: Path | None = None
+        self._active = False
+        self._owns_tracemalloc = False
+
+    def start(self) -> None:
+        if self._active:
+            return
+        self._active = True
+        if self._memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self._sampler.follow(threading.get_ident())
+        self._profile.enable()
+
+    def close(self) -> None:
+        """Stop profiling and write whatever was collected for the run."""
+        if not self._active:
+            return
+        self._active = False
+        self._profile.disable()
+        self._sampler.stop()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+        if self._run_dir is not None:
+            self._write(self._run_dir)
+
+    def on_run_start(self, run: Run, workflow: Workflow) -> None:
+        self._run_dir = Path(run.artifacts_dir)
+
+    def on_phase_end(self, run: Run, phase_run: PhaseRun) -> None:
+        if self._memory and tracemalloc.is_tracing():
+            label = f"{phase_run.phase_id} (iteration {phase_run.iteration})"
+            self._snapshots.append((label, _snapshot()))
+
+    def on_run_end(self, run: Run) -> None:
+        self.close()
+
+    def _write(self, run_dir: Path) -> None:
+        run_dir.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(run_dir / PSTATS_FILE)
+        folded = "".join(
+            f"{stack} {count}\n" for stack, count in sorted(self._sampler.samples.items())
+        )
+        (run_dir / FOLDED_FILE).write_text(folded, encoding="utf-8")
+        if self._memory:
+            (run_dir / MEMORY_FILE).write_text(self._memory_report(), encoding="utf-8")
+
+    def _memory_report(self) -> str:
+        lines: list[str] = []
+        previous: tracemalloc.Snapshot | None = None
+        for label, snapshot in self._snapshots:
+            stats = snapshot.statistics("lineno")
+            total = sum(s.size for s in stats)
+            lines.append(f"== after {label}: {total / 1024:.1f} KiB traced")
+            lines.extend(f"  {s}" for s in stats[: self._top])
+            if previous is not None:
+                lines.append("  -- growth since the previous phase")
+                growth = [d for d in snapshot.compare_to(previous, "lineno") if d.size_diff > 0]
+                lines.extend(f"  {d}" for d in growth[: self._top])
+            lines.append("")
+            previous = snapshot
+        return "\n".join(lines)
+
+
+class _StackSampler:
+    """Counts one thread's stacks, outermost frame first, in folded format."""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._target: int | None = None
+        self.samples: Counter[str] = Counter()
+
+    def follow(self, thread_id: int) -> None:
+        self._target = thread_id
+        self._thread = threading.Thread(
+            target=self._loop, name="macrocycle-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._done.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _loop(self) -> None:
+        while not self._done.wait(self._interval):
+            frame = sys._current_frames().get(self._target)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                location = f"{_short_path(code.co_filename)}:{code.co_firstlineno}"
+                names.append(f"{code.co_name} ({location})")
+                frame = frame.f_back
+            if names:
+                self.samples[";".join(reversed(names))] += 1
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__),)
+    )
+
+
+def _short_path(filename: str) -> str:
+    return "/".join(Path(filename).parts[-2:]).replace(";", ":")
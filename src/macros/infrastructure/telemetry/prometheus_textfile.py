@@ -0,0 +1,226 @@
+"""PrometheusTextfileExporter -- metrics for the node_exporter textfile collector."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from macros.domain.model.run import PhaseRun, Run
+from macros.domain.model.usage import Usage
+from macros.infrastructure.runtime.utils.file_lock import atomic_write_text, file_lock
+
+
+# Agent steps routinely take minutes; default Prometheus buckets stop at 10s.
+LATENCY_BUCKETS: tuple[float, ...] = (1, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+_HISTOGRAMS = {
+    "macrocycle_step_duration_seconds": "Duration of a single step execution.",
+    "macrocycle_validation_duration_seconds": "Duration of a validation command.",
+}
+_COUNTERS = {
+    "macrocycle_phase_iterations_total": "Iterations executed per phase.",
+    "macrocycle_phase_outcomes_total": "Phase executions by outcome (converged, exhausted, failed).",
+    "macrocycle_timeouts_total": "Steps or validations that hit their timeout.",
+    "macrocycle_runs_total": "Finished runs by final status.",
+    "macrocycle_agent_tokens_total": "Tokens agents reported, by kind (input, output, cache_read).",
+    "macrocycle_agent_cost_usd_total": "Cost in US dollars agents reported.",
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class PrometheusTextfileExporter:
+    """Implements MetricsPort by writing a Prometheus textfile-collector file.
+
+    Counters and histograms are cumulative across runs and processes: each
+    flush merges the pending observations into a JSON state file next to the
+    .prom file under an exclusive lock, then atomically rewrites the .prom
+    file. Long runs flush every `flush_interval` seconds as phases complete.
+    One exporter may be shared by concurrent runs (daemon workers).
+    """
+
+    def __init__(self, path: Path | str, flush_interval: float = 60.0) -> None:
+        self._path = Path(path)
+        self._state_path = self._path.with_name(self._path.name + ".state.json")
+        self._lock_path = self._path.with_name(self._path.name + ".lock")
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._counters: dict[str, dict[Labels, float]] = {}
+        self._histograms: dict[str, dict[Labels, dict]] = {}
+        self._lock = threading.RLock()
+
+    def observe_phase(self, workflow_id: str, phase_run: PhaseRun) -> None:
+        with self._lock:
+            self._observe_phase(workflow_id, phase_run)
+
+    def _observe_phase(self, workflow_id: str, phase_run: PhaseRun) -> None:
+        phase_labels = (("workflow", workflow_id), ("phase", phase_run.phase_id))
+
+        for sr in phase_run.step_runs:
+            config = sr.agent_config
+            labels = phase_labels + (
+                ("step_type", "llm" if config is not None else "command"),
+                ("engine", config.engine if config else ""),
+                ("model", (config.model or "") if config else ""),
+            )
+            self._observe(
+                "macrocycle_step_duration_seconds",
+                labels,
+                (sr.finished_at - sr.started_at).total_seconds(),
+            )
+            if sr.timed_out:
+                self._inc("macrocycle_timeouts_total", labels + (("kind", "step"),))
+            if sr.usage is not None:
+                self._observe_usage(labels, sr.usage)
+
+        for vr in phase_run.validation_runs:
+            self._observe(
+                "macrocycle_validation_duration_seconds",
+                phase_labels,
+                (vr.finished_at - vr.started_at).total_seconds(),
+            )
+            if vr.timed_out:
+                labels = phase_labels + (
+                    ("step_type", "validation"),
+                    ("engine", ""),
+                    ("model", ""),
+                    ("kind", "validation"),
+                )
+                self._inc("macrocycle_timeouts_total", labels)
+
+        self._inc("macrocycle_phase_iterations_total", phase_labels, phase_run.iteration)
+        self._inc(
+            "macrocycle_phase_outcomes_total",
+            phase_labels + (("outcome", phase_run.outcome),),
+        )
+
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def _observe_usage(self, labels: Labels, usage: Usage) -> None:
+        tokens = {
+            "input": usage.input_tokens,
+            "output": usage.output_tokens,
+            "cache_read": usage.cache_read_tokens,
+        }
+        for kind, count in tokens.items():
+            if count:
+                self._inc("macrocycle_agent_tokens_total", labels + (("kind", kind),), count)
+        if usage.cost_usd:
+            self._inc("macrocycle_agent_cost_usd_total", labels, usage.cost_usd)
+
+    def observe_run(self, run: Run) -> None:
+        with self._lock:
+            self._inc(
+                "macrocycle_runs_total",
+                (("workflow", run.workflow_id), ("status", run.status.value)),
+            )
+
+    def flush(self) -> None:
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._counters and not self._histograms:
+                return
+            with file_lock(self._lock_path):
+                state = self._load_state()
+                self._merge_into(state)
+                atomic_write_text(self._state_path, json.dumps(state))
+                atomic_write_text(self._path, _render(state))
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _inc(self, name: str, labels: Labels, value: float = 1) -> None:
+        series = self._counters.setdefault(name, {})
+        series[labels] = series.get(labels, 0) + value
+
+    def _observe(self, name: str, labels: Labels, value: float) -> None:
+        series = self._histograms.setdefault(name, {})
+        hist = series.setdefault(
+            labels, {"buckets": [0] * len(LATENCY_BUCKETS), "sum": 0.0, "count": 0}
+        )
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                hist["buckets"][i] += 1
+        hist["sum"] += value
+        hist["count"] += 1
+
+    def _load_state(self) -> dict:
+        if not self._state_path.exists():
+            return {"counters": {}, "histograms": {}}
+        try:
+            return json.loads(self._state_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return {"counters": {}, "histograms": {}}
+
+    def _merge_into(self, state: dict) -> None:
+        for name, series in self._counters.items():
+            stored = state["counters"].setdefault(name, {})
+            for labels, value in series.items():
+                key = _labels_key(labels)
+                stored[key] = stored.get(key, 0) + value
+
+        for name, series in self._histograms.items():
+            stored = state["histograms"].setdefault(name, {})
+            for labels, hist in series.items():
+                key = _labels_key(labels)
+                prev = stored.get(key)
+                if prev is None or len(prev["buckets"]) != len(hist["buckets"]):
+                    stored[key] = {
+                        "buckets": list(hist["buckets"]),
+                        "sum": hist["sum"],
+                        "count": hist["count"],
+                    }
+                    continue
+                prev["buckets"] = [a + b for a, b in zip(prev["buckets"], hist["buckets"])]
+                prev["sum"] += hist["sum"]
+                prev["count"] += hist["count"]
+
+
+def _labels_key(labels: Labels) -> str:
+    return json.dumps(dict(labels))
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for k, v in labels.items():
+        escaped = str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{k}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _render(state: dict) -> str:
+    lines: list[str] = []
+
+    for name, help_text in _HISTOGRAMS.items():
+        series = state["histograms"].get(name)
+        if not series:
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for key in sorted(series):
+            labels = json.loads(key)
+            hist = series[key]
+            for bound, count in zip(LATENCY_BUCKETS, hist["buckets"]):
+                bucket_labels = {**labels, "le": _format_value(bound)}
+                lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {count}")
+            inf_labels = {**labels, "le": "+Inf"}
+            lines.append(f"{name}_bucket{_format_labels(inf_labels)} {hist['count']}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(hist['sum'])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {hist['count']}")
+
+    for name, help_text in _COUNTERS.items():
+        series = state["counters"].get(name)
+        if not series:
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for key in sorted(series):
+            lines.append(f"{name}{_format_labels(json.loads(key))} {_format_value(series[key])}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,201 @@
+"""HTTP API for daemon mode - thin orchestration layer like the CLI.
+
+Routes (JSON unless noted):
+  GET  /health                  worker count and queue depth
+  POST /runs                    {"workflow", "input", "until"?, "isolate"?, "export"?}
+                                -> 202 job | 404 unknown workflow | 429 queue full
+  GET  /runs?status=&limit=     most recent jobs first
+  GET  /runs/<id>               one job
+  POST /runs/<id>/cancel        cancel a queued job (409 once it has started)
+  GET  /runs/<id>/log?follow=1  text/plain job log; follow streams until the job ends
+"""
+
+import json
+import os
+import socketserver
+import stat
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from macros.application.services.worker_pool import QueueFullError, WorkerPool
+from macros.domain.exceptions import WorkflowNotFoundError, WorkflowValidationError
+from macros.domain.model.job import Job, JobStatus
+
+MAX_BODY_BYTES = 1024 * 1024
+FOLLOW_POLL_SECONDS = 0.5
+
+
+def job_to_dict(job: Job) -> dict:
+    return {
+        "id": job.id,
+        "workflow": job.workflow_id,
+        "status": job.status.value,
+        "submitted_at": job.submitted_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "until": job.stop_after,
+        "isolate": job.isolate,
+        "export": job.export,
+        "run_dir": job.run_dir,
+        "error": job.error,
+    }
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    server_version = "macrocycle"
+    pool: WorkerPool  # set by make_server on a per-server subclass
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        query = parse_qs(url.query)
+
+        if parts == ["health"]:
+            queue = self.pool.queue
+            return self._json(200, {
+                "status": "ok",
+                "workers": self.pool.workers,
+                "queued": queue.count(JobStatus.QUEUED),
+                "running": queue.count(JobStatus.RUNNING),
+            })
+        if parts == ["runs"]:
+            try:
+                status = JobStatus(query["status"][0]) if "status" in query else None
+                limit = int(query.get("limit", ["50"])[0])
+            except ValueError as e:
+                return self._json(400, {"error": str(e)})
+            jobs = self.pool.queue.list_jobs(status=status, limit=limit)
+            return self._json(200, {"runs": [job_to_dict(j) for j in jobs]})
+        if len(parts) == 2 and parts[0] == "runs":
+            job = self.pool.queue.get(parts[1])
+            if job is None:
+                return self._json(404, {"error": f"no such run: {parts[1]}"})
+            return self._json(200, job_to_dict(job))
+        if len(parts) == 3 and parts[0] == "runs" and parts[2] == "log":
+            follow = query.get("follow", ["0"])[0] not in ("0", "false", "")
+            return self._log(parts[1], follow)
+        self._json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        parts = [p for p in urlparse(self.path).path.split("/") if p]
+
+        if parts == ["runs"]:
+            return self._submit()
+        if len(parts) == 3 and parts[0] == "runs" and parts[2] == "cancel":
+            if self.pool.queue.get(parts[1]) is None:
+                return self._json(404, {"error": f"no such run: {parts[1]}"})
+            if not self.pool.queue.cancel(parts[1]):
+                return self._json(409, {"error": "run already started"})
+            return self._json(200, job_to_dict(self.pool.queue.get(parts[1])))
+        self._json(404, {"error": "not found"})
+
+    def _submit(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            return self._json(413, {"error": "request body too large"})
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+            workflow = body["workflow"]
+            input_text = body["input"]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            return self._json(400, {"error": f"expected JSON with 'workflow' and 'input' ({e})"})
+        export = body.get("export", "branch")
+        if export not in ("branch", "patch"):
+            return self._json(400, {"error": "export must be 'branch' or 'patch'"})
+
+        try:
+            job = self.pool.submit(
+                workflow,
+                input_text,
+                stop_after=body.get("until"),
+                isolate=bool(body.get("isolate", self.server.isolate_default)),
+                export=export,
+            )
+        except WorkflowNotFoundError as e:
+            return self._json(404, {"error": str(e)})
+        except WorkflowValidationError as e:
+            return self._json(400, {"error": str(e)})
+        except QueueFullError as e:
+            return self._json(429, {"error": str(e)}, headers={"Retry-After": "30"})
+        self._json(202, job_to_dict(job), headers={"Location": f"/runs/{job.id}"})
+
+    def _log(self, job_id: str, follow: bool) -> None:
+        if self.pool.queue.get(job_id) is None:
+            return self._json(404, {"error": f"no such run: {job_id}"})
+        path = self.pool.log_path(job_id)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.end_headers()  # HTTP/1.0: the body ends when the connection closes
+
+        offset = 0
+        while True:
+            offset = self._send_file_tail(path, offset)
+            if not follow:
+                return
+            job = self.pool.queue.get(job_id)
+            if job is None or job.status.terminal:
+                self._send_file_tail(path, offset)
+                return
+            time.sleep(FOLLOW_POLL_SECONDS)
+
+    def _send_file_tail(self, path: Path, offset: int) -> int:
+        if not path.exists():
+            return offset
+        with path.open("rb") as f:
+            f.seek(offset)
+            chunk = f.read()
+        if chunk:
+            self.wfile.write(chunk)
+            self.wfile.flush()
+        return offset + len(chunk)
+
+    def _json(self, status: int, payload: dict, headers: dict[str, str] | None = None) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # access logs would drown the job progress lines on the console
+
+
+class _TcpServer(ThreadingHTTPServer):
+    daemon_threads = True
+    isolate_default = True
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    isolate_default = True
+
+    def server_bind(self) -> None:
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name, self.server_port = str(self.server_address), 0
+
+
+def make_server(
+    pool: WorkerPool,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: str | None = None,
+    isolate_default: bool = True,
+) -> socketserver.BaseServer:
+    """Bind the API to a TCP address, or to a Unix socket when socket_path is set."""
+    handler = type("ApiHandler", (_ApiHandler,), {"pool": pool})
+    if socket_path:
+        # A stale socket from a previous server blocks bind(); never remove other files.
+        if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.unlink(socket_path)
+        server: socketserver.BaseServer = _UnixServer(socket_path, handler)
+    else:
+        server = _TcpServer((host, port), handler)
+    server.isolate_default = isolate_default
+    return server
@@ -0,0 +1 @@
+"""Orchestration overhead benchmarks (pytest-benchmark)."""
@@ -0,0 +1,74 @@
+"""Per-step and per-iteration overhead of PhaseExecutor with zero-latency ports."""
+
+import pytest
+
+from macros.domain.model.agent_config import AgentConfig
+from macros.domain.model.context import ExecutionContext
+from macros.domain.model.workflow import Validation
+from macros.tests.benchmarks.synthetic import (
+    KB,
+    MB,
+    make_phase_executor,
+    make_phase_with_steps,
+    payload,
+)
+from macros.tests.helpers import FakeCommand, make_phase
+
+
+@pytest.mark.parametrize("step_count", [1, 10, 100])
+def test_llm_step_overhead(benchmark, step_count):
+    executor = make_phase_executor()
+    phase = make_phase_with_steps(step_count)
+    ctx = ExecutionContext(input="bench input")
+
+    result = benchmark(executor.execute, phase, ctx, AgentConfig())
+
+    assert len(result.step_runs) == step_count
+
+
+@pytest.mark.parametrize("step_count", [1, 10, 100])
+def test_command_step_overhead(benchmark, step_count):
+    executor = make_phase_executor()
+    phase = make_phase_with_steps(step_count, command_steps=True)
+    ctx = ExecutionContext(input="bench input")
+
+    result = benchmark(executor.execute, phase, ctx, AgentConfig())
+
+    assert len(result.step_runs) == step_count
+
+
+@pytest.mark.parametrize("iterations", [1, 10, 100])
+def test_validation_loop_overhead(benchmark, iterations):
+    phase = make_phase(
+        "loop",
+        max_iterations=iterations,
+        validation=Validation(command="check"),
+    )
+    ctx = ExecutionContext(input="bench input")
+
+    def run():
+        command = FakeCommand(exit_code=1, output="1 failed")
+        return make_phase_executor(command=command).execute(phase, ctx, AgentConfig())
+
+    result = benchmark(run)
+
+    assert result.iteration == iterations
+
+
+@pytest.mark.parametrize("size", [10 * KB, 1 * MB, 10 * MB], ids=["10KB", "1MB", "10MB"])
+def test_feedback_loop_with_large_validation_output(benchmark, size):
+    phase = make_phase(
+        "loop",
+        max_iterations=5,
+        validation=Validation(command="check"),
+    )
+    ctx = ExecutionContext(input="bench input")
+    failure = payload(size)
+
+    def run():
+        command = FakeCommand(exit_code=1, output=failure)
+        return make_phase_executor(command=command).execute(phase, ctx, AgentConfig())
+
+    result = benchmark.pedantic(run, rounds=5, iterations=1)
+
+    assert result.outcome == "exhausted"
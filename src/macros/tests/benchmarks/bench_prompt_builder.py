@@ -0,0 +1,55 @@
+"""Prompt rendering cost with large phase, step and validation outputs."""
+
+from types import MappingProxyType
+
+import pytest
+
+from macros.domain.model.context import ExecutionContext
+from macros.domain.services.prompt_builder import PromptBuilder
+from macros.tests.benchmarks.synthetic import KB, MB, payload
+from macros.tests.helpers import make_step_run
+
+
+SIZES = [10 * KB, 1 * MB, 10 * MB]
+SIZE_IDS = ["10KB", "1MB", "10MB"]
+
+
+@pytest.mark.parametrize("size", SIZES, ids=SIZE_IDS)
+def test_render_phase_output(benchmark, size):
+    builder = PromptBuilder()
+    ctx = ExecutionContext(
+        input="bench input",
+        phase_outputs=MappingProxyType({"analyze": payload(size)}),
+    )
+
+    prompt = benchmark(builder.build, "Plan from:\n{{PHASE_OUTPUT:analyze}}", ctx, [])
+
+    assert len(prompt) > size
+
+
+@pytest.mark.parametrize("size", SIZES, ids=SIZE_IDS)
+def test_render_with_many_unreferenced_outputs(benchmark, size):
+    """Context holding 20 large outputs while the template references only one."""
+    builder = PromptBuilder()
+    outputs = {f"p{i}": payload(size) for i in range(20)}
+    ctx = ExecutionContext(input="bench input", phase_outputs=MappingProxyType(outputs))
+
+    benchmark(builder.build, "Only: {{PHASE_OUTPUT:p0}}", ctx, [])
+
+
+@pytest.mark.parametrize("size", SIZES, ids=SIZE_IDS)
+def test_render_step_outputs_and_feedback(benchmark, size):
+    builder = PromptBuilder()
+    text = payload(size)
+    step_results = [make_step_run(f"s{i}", text) for i in range(5)]
+    ctx = ExecutionContext(input="bench input", iteration=3, validation_output=text)
+
+    prompt = benchmark(
+        builder.build,
+        "Previous: {{STEP_OUTPUT:s4}}\nErrors: {{VALIDATION_OUTPUT}}",
+        ctx,
+        step_results,
+        5,
+    )
+
+    assert "Validation Failed" in prompt
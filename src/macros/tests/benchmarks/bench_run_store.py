@@ -0,0 +1,43 @@
+"""Manifest checkpoint cost of FileRunStore as runs grow."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from macros.infrastructure.persistence.run_store import FileRunStore
+from macros.tests.benchmarks.synthetic import KB, MB, make_run
+
+
+@pytest.fixture
+def run_dir():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield tmp
+
+
+@pytest.mark.parametrize("phase_count", [1, 100, 1000])
+def test_save_manifest_scaling_with_phases(benchmark, run_dir, phase_count):
+    store = FileRunStore()
+    run = make_run(phase_count, output_size=1 * KB)
+
+    benchmark(store.save_manifest, run_dir, run)
+
+    assert (Path(run_dir) / "manifest.json").exists()
+
+
+@pytest.mark.parametrize("size", [10 * KB, 1 * MB, 10 * MB], ids=["10KB", "1MB", "10MB"])
+def test_save_manifest_scaling_with_output_size(benchmark, run_dir, size):
+    store = FileRunStore()
+    run = make_run(5, output_size=size)
+
+    benchmark.pedantic(store.save_manifest, args=(run_dir, run), rounds=5, iterations=1)
+
+
+@pytest.mark.parametrize("phase_count", [1, 100, 1000])
+def test_load_manifest_scaling_with_phases(benchmark, run_dir, phase_count):
+    store = FileRunStore()
+    store.save_manifest(run_dir, make_run(phase_count, output_size=1 * KB))
+
+    run = benchmark(store.load_manifest, run_dir)
+
+    assert len(run.phase_runs) == phase_count
@@ -0,0 +1,72 @@
+"""End-to-end orchestration overhead of WorkflowExecutor on synthetic workflows."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from macros.infrastructure.persistence.run_store import FileRunStore
+from macros.infrastructure.runtime.utils.workspace import set_workspace
+from macros.tests.benchmarks.synthetic import (
+    KB,
+    MB,
+    make_linear_workflow,
+    make_workflow_executor,
+    payload,
+)
+from macros.tests.helpers import init_test_workspace
+
+
+@pytest.fixture
+def workspace():
+    with tempfile.TemporaryDirectory() as tmp:
+        init_test_workspace(Path(tmp))
+        yield Path(tmp)
+        set_workspace(None)
+
+
+@pytest.mark.parametrize("phase_count", [1, 100, 1000])
+def test_in_memory_scaling_with_phases(benchmark, phase_count):
+    workflow = make_linear_workflow(phase_count)
+
+    def run():
+        return make_workflow_executor().execute(workflow, "bench input")
+
+    result = benchmark.pedantic(run, rounds=5, iterations=1)
+
+    assert len(result.phase_runs) == phase_count
+
+
+@pytest.mark.parametrize("size", [10 * KB, 1 * MB, 10 * MB], ids=["10KB", "1MB", "10MB"])
+def test_in_memory_scaling_with_output_size(benchmark, size):
+    workflow = make_linear_workflow(5)
+    output = payload(size)
+
+    def run():
+        return make_workflow_executor(agent_output=output).execute(workflow, "bench input")
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+
+
+@pytest.mark.parametrize("phase_count", [1, 100, 1000])
+def test_checkpointed_scaling_with_phases(benchmark, workspace, phase_count):
+    """Includes per-phase output artifacts and manifest checkpoints on disk."""
+    workflow = make_linear_workflow(phase_count)
+
+    def run():
+        executor = make_workflow_executor(store=FileRunStore())
+        return executor.execute(workflow, "bench input")
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize("size", [10 * KB, 1 * MB, 10 * MB], ids=["10KB", "1MB", "10MB"])
+def test_checkpointed_scaling_with_output_size(benchmark, workspace, size):
+    workflow = make_linear_workflow(5)
+    output = payload(size)
+
+    def run():
+        executor = make_workflow_executor(agent_output=output, store=FileRunStore())
+        return executor.execute(workflow, "bench input")
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
@@ -0,0 +1,146 @@
+"""Synthetic workflows and zero-latency ports for benchmarking executor overhead."""
+
+from datetime import datetime, timedelta, timezone
+
+from macros.domain.model.agent_config import AgentConfig
+from macros.domain.model.run import PhaseRun, Run, RunStatus, StepRun
+from macros.domain.model.step import CommandStep, LlmStep
+from macros.domain.model.workflow import Phase, Validation, Workflow
+from macros.domain.services.phase_executor import PhaseExecutor
+from macros.domain.services.prompt_builder import PromptBuilder
+from macros.domain.services.workflow_executor import WorkflowExecutor
+from macros.tests.helpers import FakeCommand, FakeConsole, FakeRunStore
+
+
+KB = 1024
+MB = 1024 * KB
+
+
+class StaticAgent:
+    """AgentPort that returns a fixed output instantly and retains nothing.
+
+    Unlike FakeAgent it does not record prompts, so memory measured during a
+    benchmark belongs to the executor rather than the test double.
+    """
+
+    def __init__(self, output: str = "OK") -> None:
+        self._output = output
+
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
+        return 0, self._output
+
+    def cancel(self) -> None:
+        pass
+
+
+def payload(size: int) -> str:
+    """Deterministic text of exactly `size` characters."""
+    line = "E   AssertionError: expected 42 but got 41 in test_module.py\n"
+    return (line * (size // len(line) + 1))[:size]
+
+
+def make_linear_workflow(
+    phase_count: int,
+    *,
+    steps_per_phase: int = 1,
+    with_validation: bool = False,
+    max_iterations: int = 1,
+) -> Workflow:
+    """A chain of phases where each prompt consumes the previous phase output."""
+    phases = []
+    for i in range(phase_count):
+        prev = f"{{{{PHASE_OUTPUT:p{i - 1}}}}}" if i else "{{INPUT}}"
+        steps = tuple(
+            LlmStep(id=f"s{j}", prompt=f"Step {j} of phase {i}: {prev}")
+            for j in range(steps_per_phase)
+        )
+        phases.append(
+            Phase(
+                id=f"p{i}",
+                steps=steps,
+                max_iterations=max_iterations,
+                validation=Validation(command="check") if with_validation else None,
+                context=(f"p{i - 1}",) if i else (),
+                on_complete=f"p{i + 1}" if i + 1 < phase_count else None,
+            )
+        )
+    return Workflow(
+        id="bench",
+        name="Benchmark",
+        agent=AgentConfig(),
+        phases=tuple(phases),
+        max_phase_visits=phase_count + 1,
+    )
+
+
+def make_phase_with_steps(step_count: int, *, command_steps: bool = False) -> Phase:
+    """A single phase with `step_count` independent steps and no validation."""
+    if command_steps:
+        steps = tuple(CommandStep(id=f"s{i}", command="true") for i in range(step_count))
+    else:
+        steps = tuple(
+            LlmStep(id=f"s{i}", prompt=f"Step {i}: {{{{INPUT}}}}") for i in range(step_count)
+        )
+    return Phase(id="bench", steps=steps)
+
+
+def make_phase_executor(
+    agent_output: str = "OK",
+    command: FakeCommand | None = None,
+) -> PhaseExecutor:
+    agent = StaticAgent(agent_output)
+    return PhaseExecutor(
+        agent_factory=lambda config: agent,
+        command=command or FakeCommand(exit_code=0),
+        prompt_builder=PromptBuilder(),
+        console=FakeConsole(),
+    )
+
+
+def make_workflow_executor(agent_output: str = "OK", store=None) -> WorkflowExecutor:
+    return WorkflowExecutor(
+        phase_executor=make_phase_executor(agent_output),
+        store=store or FakeRunStore(),
+        console=FakeConsole(),
+    )
+
+
+def make_run(phase_count: int, output_size: int, steps_per_phase: int = 1) -> Run:
+    """A completed Run aggregate with synthetic phase/step records."""
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    output = payload(output_size)
+    phase_runs = []
+    for i in range(phase_count):
+        step_runs = tuple(
+            StepRun(
+                step_id=f"s{j}",
+                phase_id=f"p{i}",
+                iteration=1,
+                started_at=t0,
+                finished_at=t0 + timedelta(seconds=1),
+                output=output,
+                exit_code=0,
+                agent_config=AgentConfig(),
+            )
+            for j in range(steps_per_phase)
+        )
+        phase_runs.append(
+            PhaseRun(
+                phase_id=f"p{i}",
+                iteration=1,
+                outcome="converged",
+                step_runs=step_runs,
+                output=output,
+                validation_output=None,
+                started_at=t0,
+                finished_at=t0 + timedelta(seconds=steps_per_phase),
+            )
+        )
+    return Run(
+        id="bench",
+        workflow_id="bench",
+        status=RunStatus.COMPLETED,
+        phase_runs=phase_runs,
+        started_at=t0,
+        finished_at=t0 + timedelta(seconds=phase_count),
+    )
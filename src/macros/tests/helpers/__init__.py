@@ -1,6 +1,15 @@
 """Test helpers and utilities."""
 
-from .fakes import FakeAgent, FakeCommand, FakeRunStore, FakeConsole, make_step_run
+from .fakes import (
+    FakeAgent,
+    FakeCommand,
+    FakeRunStore,
+    FakeConsole,
+    FakePhaseMemo,
+    FakeStepCache,
+    FakeWorkspace,
+    make_step_run,
+)
 from .fixtures import (
     make_workflow,
     make_phase,
@@ -15,6 +24,9 @@ __all__ = [
     "FakeCommand",
     "FakeRunStore",
     "FakeConsole",
+    "FakePhaseMemo",
+    "FakeStepCache",
+    "FakeWorkspace",
     "make_step_run",
     "make_workflow",
     "make_phase",
@@ -1,10 +1,13 @@
 """Fake implementations of ports for testing."""
 
 from datetime import datetime, timezone
+from typing import Iterator
 
 from macros.domain.model.agent_config import AgentConfig
+from macros.domain.model.agent_event import AgentEvent
 from macros.domain.model.run import Run, RunInfo, StepRun
-from macros.domain.ports.agent_port import AgentPort
+from macros.domain.model.usage import Usage
+from macros.domain.ports.agent_port import AgentListener, AgentPort
 from macros.domain.ports.command_port import CommandPort
 from macros.domain.ports.console_port import ConsolePort
 from macros.domain.ports.run_store_port import RunStorePort
@@ -20,17 +23,28 @@ class FakeAgent:
         *,
         auto_increment: bool = False,
         responses: list[tuple[int, str]] | None = None,
+        usage: Usage | None = None,
+        events: list[AgentEvent] | None = None,
     ):
         self.text = text
         self.code = code
         self.auto_increment = auto_increment
         self._responses = responses
         self.prompts: list[str] = []
+        self.cwds: list[str | None] = []
         self.call_count = 0
+        self.cancelled = False
+        self.usage = usage
+        self.events = events or []
+        self.listener: AgentListener | None = None
 
-    def run_prompt(self, prompt: str) -> tuple[int, str]:
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
         self.prompts.append(prompt)
+        self.cwds.append(cwd)
         self.call_count += 1
+        if self.listener is not None:
+            for event in self.events:
+                self.listener(event)
 
         if self._responses and self.call_count <= len(self._responses):
             return self._responses[self.call_count - 1]
@@ -40,6 +54,15 @@ class FakeAgent:
 
         return self.code, self.text
 
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def last_usage(self) -> Usage | None:
+        return self.usage
+
+    def set_listener(self, listener: AgentListener | None) -> None:
+        self.listener = listener
+
 
 class FakeCommand:
     """Test double for CommandPort. Returns canned validation results."""
@@ -55,10 +78,16 @@ class FakeCommand:
         self.output = output
         self._responses = responses
         self.commands: list[str] = []
+        self.cwds: list[str | None] = []
+        self.envs: list[dict[str, str] | None] = []
         self.call_count = 0
 
-    def run_command(self, command: str, cwd: str | None = None) -> tuple[int, str]:
+    def run_command(
+        self, command: str, cwd: str | None = None, env: dict[str, str] | None = None
+    ) -> tuple[int, str]:
         self.commands.append(command)
+        self.cwds.append(cwd)
+        self.envs.append(env)
         self.call_count += 1
 
         if self._responses and self.call_count <= len(self._responses):
@@ -80,6 +109,9 @@ class FakeRunStore:
     def write_artifact(self, run_dir: str, rel_path: str, content: str) -> None:
         self.artifacts.append((run_dir, rel_path, content))
 
+    def artifact_store(self, run_dir: str) -> None:
+        return None  # outputs stay inline
+
     def save_manifest(self, run_dir: str, run: Run) -> None:
         self.manifests.append(run)
 
@@ -89,12 +121,146 @@ class FakeRunStore:
     def get_latest_run(self) -> RunInfo | None:
         return None
 
+    def get_run(self, run_id: str) -> Run | None:
+        for run in reversed(self.manifests):
+            if run.id == run_id:
+                return run
+        return None
+
+    def iter_runs(
+        self,
+        workflow_id: str | None = None,
+        since: datetime | None = None,
+    ) -> Iterator[Run]:
+        latest: dict[str, Run] = {}
+        for run in self.manifests:
+            latest[run.id] = run
+        for run in reversed(list(latest.values())):
+            if workflow_id is not None and run.workflow_id != workflow_id:
+                continue
+            if since is not None and run.started_at < since:
+                continue
+            yield run
+
+    def iter_unreadable_runs(self, before: datetime) -> Iterator[str]:
+        return iter(())
+
+
+class FakeWorkspace:
+    """In-memory WorkspacePort: worktrees are just names, promotions are recorded."""
+
+    def __init__(
+        self,
+        change_sizes: dict[str, int] | None = None,
+        patch: str = "",
+        fingerprints: list[str] | None = None,
+        changes: list[str] | None = None,
+    ) -> None:
+        self.created: list[str] = []
+        self.sources: list[str | None] = []
+        self.promoted: list[tuple[str, str | None]] = []
+        self.branches: list[tuple[str, str]] = []
+        self.removed: list[str] = []
+        self._change_sizes = change_sizes or {}
+        self._patch = patch
+        self._fingerprints = list(fingerprints or [])
+        self.fingerprinted: list[str | None] = []
+        self.snapshots: list[str] = []
+        self.restored: list[tuple[str, str | None]] = []
+        self.changes = list(changes or [])
+
+    def create_worktree(self, name: str, source: str | None = None) -> str:
+        path = f"/tmp/worktrees/{name}"
+        self.created.append(path)
+        self.sources.append(source)
+        return path
+
+    def fingerprint(self, path: str | None = None) -> str:
+        """Pops the next canned fingerprint; a unique one once they run out."""
+        self.fingerprinted.append(path)
+        if self._fingerprints:
+            return self._fingerprints.pop(0)
+        return f"fp-{len(self.fingerprinted)}"
+
+    def snapshot(self, path: str | None = None) -> str:
+        snapshot = f"snap-{len(self.snapshots) + 1}"
+        self.snapshots.append(snapshot)
+        return snapshot
+
+    def restore(self, snapshot: str, path: str | None = None) -> None:
+        self.restored.append((snapshot, path))
+
+    def changed_files(self, since: str, path: str | None = None) -> list[str]:
+        return list(self.changes)
+
+    def change_size(self, worktree: str) -> int:
+        return self._change_sizes.get(worktree, 0)
+
+    def promote(self, worktree: str, target: str | None = None) -> None:
+        self.promoted.append((worktree, target))
+
+    def export_branch(self, worktree: str, branch: str, message: str) -> None:
+        self.branches.append((worktree, branch))
+
+    def export_patch(self, worktree: str) -> str:
+        return self._patch
+
+    def remove_worktree(self, worktree: str) -> None:
+        self.removed.append(worktree)
+
+
+class FakeStepCache:
+    """In-memory StepCachePort keyed by command and the inputs' current contents."""
+
+    def __init__(self, contents: dict[str, str] | None = None) -> None:
+        self.contents = contents if contents is not None else {}
+        self.entries: dict[str, tuple[int, str]] = {}
+
+    def key(self, command: str, inputs: tuple[str, ...], cwd: str | None = None) -> str | None:
+        return repr((command, [(i, self.contents.get(i)) for i in inputs]))
+
+    def restore(self, key: str, cwd: str | None = None) -> tuple[int, str] | None:
+        return self.entries.get(key)
+
+    def save(
+        self,
+        key: str,
+        outputs: tuple[str, ...],
+        exit_code: int,
+        output: str,
+        cwd: str | None = None,
+    ) -> None:
+        self.entries[key] = (exit_code, output)
+
+    def prune(self, unused_since, dry_run: bool = False) -> int:
+        return 0
+
+
+class FakePhaseMemo:
+    """In-memory PhaseMemoPort keyed by everything the real key hashes."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, tuple[str, str]] = {}
+
+    def key(self, workflow, phase_id, input_text, context, fingerprint) -> str:
+        return repr((workflow.id, phase_id, input_text, sorted(context.items()), fingerprint))
+
+    def load(self, key: str) -> tuple[str, str] | None:
+        return self.entries.get(key)
+
+    def save(self, key: str, run_id: str, output: str) -> None:
+        self.entries[key] = (run_id, output)
+
+    def prune(self, unused_since, dry_run: bool = False) -> int:
+        return 0
+
 
 class FakeConsole:
-    """Silent console for testing. Captures messages."""
+    """Silent console for testing. Captures messages and events."""
 
     def __init__(self) -> None:
         self.messages: list[str] = []
+        self.events: list[tuple[str, dict]] = []
 
     def info(self, msg: str) -> None:
         self.messages.append(f"INFO: {msg}")
@@ -105,6 +271,9 @@ class FakeConsole:
     def echo(self, msg: str) -> None:
         self.messages.append(msg)
 
+    def event(self, name: str, **fields) -> None:
+        self.events.append((name, fields))
+
 
 def make_step_run(step_id: str, output: str, exit_code: int = 0) -> StepRun:
     """Create a StepRun for testing."""
@@ -5,7 +5,7 @@ from pathlib import Path
 
 from macros.domain.model.agent_config import AgentConfig
 from macros.domain.model.step import LlmStep, CommandStep
-from macros.domain.model.workflow import Phase, Validation, Workflow
+from macros.domain.model.workflow import Phase, Speculation, Stagnation, Validation, Workflow
 from macros.infrastructure.runtime.utils.workspace import set_workspace
 
 
@@ -42,6 +42,12 @@ def make_phase(
     on_complete: str | None = None,
     on_exhausted: str | None = None,
     agent: AgentConfig | None = None,
+    precheck: bool = False,
+    speculation: Speculation | None = None,
+    stagnation: Stagnation | None = None,
+    rollback: bool = False,
+    memoize: bool = False,
+    changed_files: bool = False,
 ) -> Phase:
     """Build a Phase with sensible defaults for testing."""
     if steps is None:
@@ -55,6 +61,12 @@ def make_phase(
         on_complete=on_complete,
         on_exhausted=on_exhausted,
         agent=agent,
+        precheck=precheck,
+        speculation=speculation,
+        stagnation=stagnation,
+        rollback=rollback,
+        memoize=memoize,
+        changed_files=changed_files,
     )
 
 
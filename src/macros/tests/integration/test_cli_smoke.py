@@ -1,6 +1,9 @@
 """Integration tests for the CLI."""
 
+import json
+import os
 import unittest
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
 
@@ -8,10 +11,13 @@ from typer.testing import CliRunner
 
 from macros.cli import app
 from macros.application.container import Container
+from macros.domain.model.run import Run, RunStatus
+from macros.infrastructure.persistence import FileRunStore
 from macros.infrastructure.runtime.utils.workspace import set_workspace
 from macros.tests.helpers import (
     FakeAgent,
     FakeCommand,
+    FakeWorkspace,
     init_test_workspace,
     write_workflow_to_workspace,
     init_runs_dir,
@@ -52,8 +58,8 @@ class TestCliRun(unittest.TestCase):
             write_workflow_to_workspace(Path.cwd(), SAMPLE_WORKFLOW_DICT)
             init_runs_dir(Path.cwd())
 
-            def make_test_container():
-                container = Container()
+            def make_test_container(**kwargs):
+                container = Container(**kwargs)
                 container.command = FakeCommand(exit_code=0, output="passed")
                 return container
 
@@ -68,6 +74,149 @@ class TestCliRun(unittest.TestCase):
             self.assertEqual(result.exit_code, 0, msg=result.output)
             self.assertIn("Done", result.output)
 
+    def test_run_profile_writes_profiles_to_run_dir(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+            write_workflow_to_workspace(Path.cwd(), SAMPLE_WORKFLOW_DICT)
+            init_runs_dir(Path.cwd())
+
+            def make_test_container(**kwargs):
+                container = Container(**kwargs)
+                container.command = FakeCommand(exit_code=0, output="passed")
+                return container
+
+            with patch("macros.cli.Container", make_test_container):
+                with patch(
+                    "macros.infrastructure.runtime.cursor_agent.CursorAgentAdapter.run_prompt",
+                    return_value=(0, "agent output"),
+                ):
+                    result = self.runner.invoke(app, [
+                        "run", "sample", "Test input", "--until", "analyze", "--profile-memory",
+                    ])
+
+            self.assertEqual(result.exit_code, 0, msg=result.output)
+            (run_dir,) = (Path.cwd() / ".macrocycle" / "runs").iterdir()
+            for name in ("profile.pstats", "profile.folded", "profile-memory.txt"):
+                self.assertTrue((run_dir / name).is_file(), name)
+
+    def _invoke_isolated(self, workspace: FakeWorkspace, *args: str):
+        def make_test_container(**kwargs):
+            container = Container(**kwargs)
+            container.command = FakeCommand(exit_code=0, output="passed")
+            container.workspace = workspace
+            return container
+
+        with patch("macros.cli.Container", make_test_container):
+            with patch(
+                "macros.infrastructure.runtime.cursor_agent.CursorAgentAdapter.run_prompt",
+                return_value=(0, "agent output"),
+            ):
+                return self.runner.invoke(app, [
+                    "run", "sample", "Test input", "--until", "analyze", "--isolate", *args
+                ])
+
+    def test_run_isolated_exports_branch(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+            write_workflow_to_workspace(Path.cwd(), SAMPLE_WORKFLOW_DICT)
+            workspace = FakeWorkspace(patch="diff --git a/x b/x\n")
+
+            result = self._invoke_isolated(workspace)
+
+            self.assertEqual(result.exit_code, 0, msg=result.output)
+            self.assertEqual(workspace.created, ["/tmp/worktrees/run-sample"])
+            self.assertEqual(len(workspace.branches), 1)
+            self.assertTrue(workspace.branches[0][1].startswith("macrocycle/"))
+            self.assertEqual(workspace.removed, workspace.created)
+
+    def test_run_isolated_exports_patch_artifact(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+            write_workflow_to_workspace(Path.cwd(), SAMPLE_WORKFLOW_DICT)
+            workspace = FakeWorkspace(patch="diff --git a/x b/x\n")
+
+            result = self._invoke_isolated(workspace, "--export", "patch")
+
+            self.assertEqual(result.exit_code, 0, msg=result.output)
+            patches = list(Path(".macrocycle/runs").glob("*/changes.patch"))
+            self.assertEqual(len(patches), 1)
+            self.assertEqual(patches[0].read_text(), "diff --git a/x b/x\n")
+            self.assertEqual(workspace.branches, [])
+
+    def test_run_isolated_outside_git_repo_exits_with_error(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+            write_workflow_to_workspace(Path.cwd(), SAMPLE_WORKFLOW_DICT)
+
+            result = self.runner.invoke(app, ["run", "sample", "input", "--isolate"])
+
+            self.assertEqual(result.exit_code, 1)
+
+    def test_run_json_log_format_emits_ndjson_events(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+            write_workflow_to_workspace(Path.cwd(), SAMPLE_WORKFLOW_DICT)
+
+            with patch(
+                "macros.infrastructure.runtime.cursor_agent.CursorAgentAdapter.run_prompt",
+                return_value=(0, "agent output"),
+            ):
+                result = self.runner.invoke(app, [
+                    "run", "sample", "Test input", "--until", "analyze", "--log-format", "json"
+                ])
+
+            self.assertEqual(result.exit_code, 0, msg=result.output)
+            records = [json.loads(line) for line in result.output.splitlines()]
+            events = [r["event"] for r in records]
+            self.assertEqual(events[0], "log")
+            self.assertIn("step_end", events)
+            self.assertEqual(records[-1]["msg"].split(":")[0], "Run dir")
+            self.assertEqual(
+                next(r for r in records if r["event"] == "run_end")["status"], "completed"
+            )
+
+    def test_run_replays_a_recorded_cassette(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+            write_workflow_to_workspace(Path.cwd(), SAMPLE_WORKFLOW_DICT)
+
+            with patch(
+                "macros.infrastructure.runtime.cursor_agent.CursorAgentAdapter.run_prompt",
+                return_value=(0, "recorded analysis"),
+            ) as agent:
+                recorded = self.runner.invoke(app, [
+                    "run", "sample", "Test input", "--until", "analyze", "--record", "run.cassette"
+                ])
+            self.assertEqual(recorded.exit_code, 0, msg=recorded.output)
+            self.assertEqual(agent.call_count, 1)
+
+            with patch(
+                "macros.infrastructure.runtime.cursor_agent.CursorAgentAdapter.run_prompt",
+            ) as agent:
+                replayed = self.runner.invoke(app, [
+                    "run", "sample", "Test input", "--until", "analyze", "--replay", "run.cassette"
+                ])
+            self.assertEqual(replayed.exit_code, 0, msg=replayed.output)
+            agent.assert_not_called()
+            outputs = sorted(Path(".macrocycle/runs").glob("*/analyze/output.md"))
+            self.assertEqual([p.read_text() for p in outputs], ["recorded analysis"] * 2)
+
+            diverged = self.runner.invoke(app, [
+                "run", "sample", "Other input", "--until", "analyze", "--replay", "run.cassette"
+            ])
+            self.assertEqual(diverged.exit_code, 1)
+            self.assertIn("No recorded agent result", diverged.output)
+
+    def test_run_rejects_unknown_log_format(self):
+        result = self.runner.invoke(app, ["run", "sample", "input", "--log-format", "xml"])
+
+        self.assertEqual(result.exit_code, 2)
+
+    def test_run_rejects_unknown_export_mode(self):
+        result = self.runner.invoke(app, ["run", "sample", "input", "--export", "zip"])
+
+        self.assertEqual(result.exit_code, 2)
+
     def test_run_missing_workflow_exits_with_error(self):
         with self.runner.isolated_filesystem():
             init_test_workspace(Path.cwd())
@@ -110,3 +259,131 @@ class TestCliList(unittest.TestCase):
 
             self.assertEqual(result.exit_code, 0)
             self.assertIn("sample", result.output)
+
+
+class TestCliStats(unittest.TestCase):
+
+    def setUp(self):
+        self.runner = CliRunner()
+
+    def tearDown(self):
+        set_workspace(None)
+
+    def test_stats_without_runs_exits_with_error(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+            init_runs_dir(Path.cwd())
+
+            result = self.runner.invoke(app, ["stats"])
+
+            self.assertEqual(result.exit_code, 1)
+
+    def test_stats_reports_phases_after_run(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+            write_workflow_to_workspace(Path.cwd(), SAMPLE_WORKFLOW_DICT)
+            init_runs_dir(Path.cwd())
+
+            def make_test_container(**kwargs):
+                container = Container(**kwargs)
+                container.command = FakeCommand(exit_code=0, output="passed")
+                return container
+
+            with patch("macros.cli.Container", make_test_container):
+                with patch(
+                    "macros.infrastructure.runtime.cursor_agent.CursorAgentAdapter.run_prompt",
+                    return_value=(0, "agent output"),
+                ):
+                    self.runner.invoke(app, ["run", "sample", "Test input"])
+
+            result = self.runner.invoke(app, ["stats", "--workflow", "sample", "--since", "1d"])
+
+            self.assertEqual(result.exit_code, 0, msg=result.output)
+            self.assertIn("sample/implement", result.output)
+            self.assertIn("Convergence:    100.0%", result.output)
+
+    def test_stats_rejects_invalid_since(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+
+            result = self.runner.invoke(app, ["stats", "--since", "last tuesday"])
+
+            self.assertEqual(result.exit_code, 2)
+
+    def test_report_breaks_down_the_latest_run(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+            write_workflow_to_workspace(Path.cwd(), SAMPLE_WORKFLOW_DICT)
+            init_runs_dir(Path.cwd())
+
+            def make_test_container(**kwargs):
+                container = Container(**kwargs)
+                container.command = FakeCommand(exit_code=0, output="passed")
+                return container
+
+            with patch("macros.cli.Container", make_test_container):
+                with patch(
+                    "macros.infrastructure.runtime.cursor_agent.CursorAgentAdapter.run_prompt",
+                    return_value=(0, "agent output"),
+                ):
+                    self.runner.invoke(app, ["run", "sample", "Test input"])
+
+            result = self.runner.invoke(app, ["report"])
+
+            self.assertEqual(result.exit_code, 0, msg=result.output)
+            self.assertIn("Wall time:", result.output)
+            self.assertIn("implement  converged", result.output)
+            self.assertIn("Critical path:", result.output)
+
+    def test_report_unknown_run_exits_with_error(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+            init_runs_dir(Path.cwd())
+
+            result = self.runner.invoke(app, ["report", "20260101_000000_nope"])
+
+            self.assertEqual(result.exit_code, 1)
+            self.assertIn("Run not found", result.output)
+
+    def test_gc_keeps_newest_runs_and_packs_the_rest(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+            store = FileRunStore()
+            for day in (1, 2, 3):
+                run_dir = store.create_run_dir("sample")
+                started = datetime(2026, 3, day, tzinfo=timezone.utc)
+                store.save_manifest(run_dir, Run(
+                    id=Path(run_dir).name, workflow_id="sample",
+                    status=RunStatus.COMPLETED, started_at=started, artifacts_dir=run_dir,
+                ))
+
+            result = self.runner.invoke(app, ["gc", "--keep-last", "2", "--pack"])
+
+            self.assertEqual(result.exit_code, 0, msg=result.output)
+            self.assertIn("Deleted 1 run(s), packed 2", result.output)
+            runs = list(store.iter_runs())
+            self.assertEqual(len(runs), 2)
+            self.assertTrue(all(r.artifacts_dir.endswith(".tar.gz") for r in runs))
+
+    def test_gc_removes_old_run_dirs_without_a_manifest(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+            store = FileRunStore()
+            crashed = Path(store.create_run_dir("sample"))
+            (crashed / "step.log").write_text("partial", encoding="utf-8")
+            old = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+            os.utime(crashed, (old, old))
+
+            result = self.runner.invoke(app, ["gc", "--older-than", "30d"])
+
+            self.assertEqual(result.exit_code, 0, msg=result.output)
+            self.assertIn("Deleted 1 run(s)", result.output)
+            self.assertFalse(crashed.exists())
+
+    def test_gc_without_options_exits_with_error(self):
+        with self.runner.isolated_filesystem():
+            init_test_workspace(Path.cwd())
+
+            result = self.runner.invoke(app, ["gc"])
+
+            self.assertEqual(result.exit_code, 2)
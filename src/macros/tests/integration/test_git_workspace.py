@@ -0,0 +1,141 @@
+"""Integration tests for GitWorkspaceAdapter against a real git repository."""
+
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from macros.domain.exceptions import WorkspaceError
+from macros.infrastructure.runtime.git_workspace import GitWorkspaceAdapter
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd, check=True, capture_output=True, text=True,
+    ).stdout
+
+
+@unittest.skipIf(shutil.which("git") is None, "git not installed")
+class TestGitWorkspaceAdapter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self.tmp.name)
+        _git(self.repo, "init", "-q")
+        (self.repo / "app.py").write_text("x = 1\n")
+        _git(self.repo, "add", ".")
+        _git(self.repo, "commit", "-qm", "init")
+        self.adapter = GitWorkspaceAdapter()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_worktree_mirrors_uncommitted_and_untracked_files(self):
+        (self.repo / "app.py").write_text("x = 2\n")
+        (self.repo / "new.py").write_text("y = 1\n")
+
+        wt = self.adapter.create_worktree("attempt-1", str(self.repo))
+        try:
+            self.assertEqual(Path(wt, "app.py").read_text(), "x = 2\n")
+            self.assertEqual(Path(wt, "new.py").read_text(), "y = 1\n")
+        finally:
+            self.adapter.remove_worktree(wt)
+
+    def test_promote_applies_changes_without_touching_index(self):
+        (self.repo / "app.py").write_text("x = 2\n")
+        wt = self.adapter.create_worktree("attempt-1", str(self.repo))
+        Path(wt, "app.py").write_text("x = 3\n")
+        Path(wt, "added.py").write_text("z = 1\n")
+
+        self.assertEqual(self.adapter.change_size(wt), 3)
+        self.adapter.promote(wt, str(self.repo))
+        self.adapter.remove_worktree(wt)
+
+        self.assertEqual((self.repo / "app.py").read_text(), "x = 3\n")
+        self.assertEqual((self.repo / "added.py").read_text(), "z = 1\n")
+        self.assertEqual(_git(self.repo, "diff", "--cached", "--name-only"), "")
+        self.assertFalse(Path(wt).exists())
+        self.assertNotIn(wt, _git(self.repo, "worktree", "list"))
+
+    def test_restore_returns_files_to_snapshot(self):
+        (self.repo / "app.py").write_text("x = 2\n")
+        snapshot = self.adapter.snapshot(str(self.repo))
+        (self.repo / "app.py").write_text("x = 3\n")
+        (self.repo / "scratch.py").write_text("junk\n")
+
+        self.adapter.restore(snapshot, str(self.repo))
+
+        self.assertEqual((self.repo / "app.py").read_text(), "x = 2\n")
+        self.assertFalse((self.repo / "scratch.py").exists())
+        self.assertEqual(_git(self.repo, "rev-list", "--count", "HEAD"), "1\n")
+
+    def test_changed_files_lists_added_and_modified_paths(self):
+        (self.repo / "gone.py").write_text("old\n")
+        base = self.adapter.snapshot(str(self.repo))
+        (self.repo / "app.py").write_text("x = 2\n")
+        (self.repo / "new file.py").write_text("y = 1\n")
+        (self.repo / "gone.py").unlink()
+        (self.repo / ".macrocycle" / "cache").mkdir(parents=True)
+        (self.repo / ".macrocycle" / "cache" / "entry.json").write_text("{}")
+
+        changed = self.adapter.changed_files(base, str(self.repo))
+
+        self.assertEqual(sorted(changed), ["app.py", "new file.py"])
+
+    def test_create_outside_repository_raises(self):
+        with tempfile.TemporaryDirectory() as plain:
+            with self.assertRaises(WorkspaceError):
+                self.adapter.create_worktree("attempt-1", plain)
+
+    def test_export_branch_includes_commits_and_uncommitted_changes(self):
+        wt = self.adapter.create_worktree("run", str(self.repo))
+        try:
+            Path(wt, "app.py").write_text("x = 2\n")
+            _git(Path(wt), "commit", "-qam", "agent commit")
+            Path(wt, "notes.md").write_text("done\n")
+
+            self.adapter.export_branch(wt, "macrocycle/run-1", "macrocycle run run-1")
+        finally:
+            self.adapter.remove_worktree(wt)
+
+        files = _git(self.repo, "ls-tree", "--name-only", "macrocycle/run-1")
+        self.assertEqual(files.split(), ["app.py", "notes.md"])
+        self.assertEqual(_git(self.repo, "show", "macrocycle/run-1:app.py"), "x = 2\n")
+        self.assertEqual((self.repo / "app.py").read_text(), "x = 1\n")
+
+    def test_export_branch_refuses_existing_branch(self):
+        _git(self.repo, "branch", "taken")
+        wt = self.adapter.create_worktree("run", str(self.repo))
+        try:
+            with self.assertRaises(WorkspaceError):
+                self.adapter.export_branch(wt, "taken", "msg")
+        finally:
+            self.adapter.remove_worktree(wt)
+
+    def test_export_patch_is_relative_to_creation_state(self):
+        wt = self.adapter.create_worktree("run", str(self.repo))
+        try:
+            Path(wt, "app.py").write_text("x = 2\n")
+            _git(Path(wt), "commit", "-qam", "agent commit")
+
+            patch = self.adapter.export_patch(wt)
+        finally:
+            self.adapter.remove_worktree(wt)
+
+        subprocess.run(["git", "apply", "-"], cwd=self.repo, input=patch, text=True, check=True)
+        self.assertEqual((self.repo / "app.py").read_text(), "x = 2\n")
+
+    def test_nested_worktree_promotes_into_its_source_worktree(self):
+        outer = self.adapter.create_worktree("run", str(self.repo))
+        try:
+            inner = self.adapter.create_worktree("attempt-1", outer)
+            Path(inner, "app.py").write_text("x = 3\n")
+            self.adapter.promote(inner, outer)
+            self.adapter.remove_worktree(inner)
+
+            self.assertEqual(Path(outer, "app.py").read_text(), "x = 3\n")
+            self.assertEqual((self.repo / "app.py").read_text(), "x = 1\n")
+        finally:
+            self.adapter.remove_worktree(outer)
@@ -0,0 +1,160 @@
+"""Integration tests for the daemon HTTP API and worker pool."""
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from macros.application.container import Container
+from macros.application.services.worker_pool import WorkerPool
+from macros.infrastructure.persistence.job_queue import SqliteJobQueue
+from macros.infrastructure.runtime.utils.workspace import set_workspace
+from macros.server import make_server
+from macros.tests.helpers import (
+    FakeAgent,
+    FakeCommand,
+    SAMPLE_WORKFLOW_DICT,
+    init_test_workspace,
+    write_workflow_to_workspace,
+)
+
+
+class _FakeAgentContainer(Container):
+    def agent_factory(self, console=None):
+        return lambda config: FakeAgent(text="agent output")
+
+
+class _OverlapAgent(FakeAgent):
+    """Slow agent that records how many runs were inside it at once."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.1)
+        with cls.lock:
+            cls.active -= 1
+        return super().run_prompt(prompt, cwd)
+
+
+class _OverlapAgentContainer(Container):
+    def agent_factory(self, console=None):
+        return lambda config: _OverlapAgent()
+
+
+class TestServer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        init_test_workspace(self.root)
+        write_workflow_to_workspace(self.root, SAMPLE_WORKFLOW_DICT)
+        self.container = _FakeAgentContainer(workspace_dir=self.root)
+        self.container.command = FakeCommand(exit_code=0, output="passed")
+
+    def tearDown(self):
+        if hasattr(self, "server"):
+            self.server.shutdown()
+            self.server.server_close()
+            self.pool.stop(timeout=5)
+        set_workspace(None)
+        self.tmp.cleanup()
+
+    def _start(self, workers: int = 1, max_queued: int = 10, start_workers: bool = True):
+        state = self.root / ".macrocycle" / "server"
+        self.pool = WorkerPool(
+            self.container,
+            SqliteJobQueue(state / "jobs.db"),
+            state / "logs",
+            workers=workers,
+            max_queued=max_queued,
+            poll_interval=0.05,
+        )
+        self.server = make_server(self.pool, port=0, isolate_default=False)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        if start_workers:
+            self.pool.start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def _request(self, method: str, path: str, body: dict | None = None):
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(self.base + path, data=data, method=method)
+        try:
+            with urllib.request.urlopen(req, timeout=10) as resp:
+                return resp.status, resp.read().decode()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read().decode()
+
+    def _wait_for(self, job_id: str) -> dict:
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            _, body = self._request("GET", f"/runs/{job_id}")
+            job = json.loads(body)
+            if job["status"] in ("completed", "failed", "cancelled"):
+                return job
+            time.sleep(0.05)
+        self.fail(f"job {job_id} did not finish")
+
+    def test_submitted_run_completes_with_log(self):
+        self._start()
+
+        status, body = self._request("POST", "/runs", {"workflow": "sample", "input": "bug"})
+        self.assertEqual(status, 202, body)
+        job = self._wait_for(json.loads(body)["id"])
+
+        self.assertEqual(job["status"], "completed", job)
+        self.assertTrue(Path(job["run_dir"], "manifest.json").exists())
+        _, log = self._request("GET", f"/runs/{job['id']}/log?follow=1")
+        self.assertIn("Phase: implement", log)
+
+    def test_shared_checkout_jobs_do_not_overlap(self):
+        self.container = _OverlapAgentContainer(workspace_dir=self.root)
+        self.container.command = FakeCommand(exit_code=0, output="passed")
+        _OverlapAgent.peak = 0
+        self._start(workers=2)
+
+        ids = [
+            json.loads(self._request("POST", "/runs", {"workflow": "sample", "input": i})[1])["id"]
+            for i in ("a", "b")
+        ]
+        jobs = [self._wait_for(job_id) for job_id in ids]
+
+        self.assertEqual([j["status"] for j in jobs], ["completed", "completed"])
+        self.assertEqual(_OverlapAgent.peak, 1)
+
+    def test_unknown_workflow_is_rejected(self):
+        self._start()
+
+        status, _ = self._request("POST", "/runs", {"workflow": "nope", "input": "bug"})
+
+        self.assertEqual(status, 404)
+
+    def test_full_queue_returns_429_and_queued_run_can_be_cancelled(self):
+        self._start(max_queued=1, start_workers=False)
+
+        status, body = self._request("POST", "/runs", {"workflow": "sample", "input": "a"})
+        rejected, _ = self._request("POST", "/runs", {"workflow": "sample", "input": "b"})
+        job_id = json.loads(body)["id"]
+        cancelled, body = self._request("POST", f"/runs/{job_id}/cancel")
+
+        self.assertEqual(status, 202)
+        self.assertEqual(rejected, 429)
+        self.assertEqual(cancelled, 200)
+        self.assertEqual(json.loads(body)["status"], "cancelled")
+
+    def test_health_reports_queue_depth(self):
+        self._start(workers=3, start_workers=False)
+        self._request("POST", "/runs", {"workflow": "sample", "input": "a"})
+
+        _, body = self._request("GET", "/health")
+
+        self.assertEqual(json.loads(body), {"status": "ok", "workers": 3, "queued": 1, "running": 0})
@@ -0,0 +1,238 @@
+"""Tests for structured agent output -- results, usage, streamed events and the cursor adapter."""
+
+import json
+import os
+import stat
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from macros.domain.model.agent_event import AgentEvent, event_log
+from macros.domain.model.usage import Usage, total_usage
+from macros.infrastructure.runtime.agent_output import StreamParser, parse_result
+from macros.infrastructure.runtime.cursor_agent import CursorAgentAdapter
+from macros.tests.helpers import FakeConsole
+
+
+RESULT = {
+    "type": "result",
+    "subtype": "success",
+    "is_error": False,
+    "result": "  Fixed the bug.\n",
+    "usage": {"input_tokens": 1200, "output_tokens": 340, "cache_read_input_tokens": 800},
+    "total_cost_usd": 0.0123,
+}
+
+
+class TestParseResult(unittest.TestCase):
+
+    def test_single_result_object(self):
+        text, usage, is_error = parse_result(json.dumps({**RESULT, "model": "gpt-5"}))
+
+        self.assertEqual(text, "Fixed the bug.")
+        self.assertFalse(is_error)
+        self.assertEqual(usage, Usage(
+            input_tokens=1200, output_tokens=340, cache_read_tokens=800,
+            cost_usd=0.0123, model="gpt-5",
+        ))
+
+    def test_json_lines_take_the_result_event_and_the_session_model(self):
+        lines = [
+            {"type": "system", "subtype": "init", "model": "sonnet"},
+            {"type": "assistant", "message": {"content": "thinking"}},
+            RESULT,
+        ]
+
+        text, usage, _ = parse_result("\n".join(json.dumps(e) for e in lines))
+
+        self.assertEqual(text, "Fixed the bug.")
+        self.assertEqual(usage.model, "sonnet")
+
+    def test_openai_style_usage_and_single_model_usage(self):
+        _, usage, _ = parse_result(json.dumps({
+            "result": "ok",
+            "usage": {"prompt_tokens": 7, "completion_tokens": 3},
+            "modelUsage": {"gpt-5": {"inputTokens": 7}},
+        }))
+
+        self.assertEqual(usage, Usage(input_tokens=7, output_tokens=3, model="gpt-5"))
+
+    def test_result_without_usage(self):
+        self.assertEqual(parse_result('{"result": "ok"}'), ("ok", None, False))
+
+    def test_plain_text_is_not_structured(self):
+        self.assertIsNone(parse_result("Error: not logged in"))
+        self.assertIsNone(parse_result(""))
+
+
+class TestStreamParser(unittest.TestCase):
+
+    def test_cursor_events_become_progress(self):
+        parser = StreamParser()
+        lines = [
+            {"type": "system", "subtype": "init", "model": "gpt-5"},
+            {"type": "tool_call", "subtype": "started",
+             "tool_call": {"readToolCall": {"args": {"path": "src/app.py"}}}},
+            {"type": "tool_call", "subtype": "completed",
+             "tool_call": {"readToolCall": {"args": {}, "result": {"success": {}}}}},
+            {"type": "tool_call", "subtype": "started",
+             "tool_call": {"editToolCall": {"args": {"path": "src/app.py"}}}},
+            {"type": "tool_call", "subtype": "started",
+             "tool_call": {"shellToolCall": {"args": {"command": "pytest -q"}}}},
+        ]
+
+        events = [e for line in lines for e in parser.feed(json.dumps(line) + "\n")]
+
+        self.assertEqual(
+            [(e.kind, e.summary) for e in events],
+            [
+                ("init", "model gpt-5"),
+                ("tool_call", "read src/app.py"),
+                ("tool_result", "read ok"),
+                ("edit", "edit src/app.py"),
+                ("tool_call", "shell: pytest -q"),
+            ],
+        )
+        self.assertEqual(events[3].path, "src/app.py")
+        self.assertFalse(parser.done)
+        self.assertIsNone(parser.result())
+
+    def test_claude_style_tool_use_and_text_blocks(self):
+        parser = StreamParser()
+
+        events = parser.feed(json.dumps({"type": "assistant", "message": {"content": [
+            {"type": "text", "text": "Looking at the failing test.\nDetails..."},
+            {"type": "tool_use", "name": "Write", "input": {"file_path": "a.py", "content": "x"}},
+        ]}}))
+
+        self.assertEqual(
+            [(e.kind, e.summary) for e in events],
+            [("message", "Looking at the failing test."), ("edit", "Write a.py")],
+        )
+
+    def test_result_event_completes_the_stream(self):
+        parser = StreamParser()
+        parser.feed(json.dumps({"type": "system", "subtype": "init", "model": "gpt-5"}))
+
+        events = parser.feed(json.dumps(RESULT))
+
+        self.assertEqual(events[0].kind, "result")
+        self.assertTrue(parser.done)
+        text, usage, is_error = parser.result()
+        self.assertEqual((text, usage.model, usage.input_tokens), ("Fixed the bug.", "gpt-5", 1200))
+
+    def test_non_json_lines_are_kept_as_fallback_output(self):
+        parser = StreamParser()
+
+        self.assertEqual(parser.feed("Error: not logged in\n"), [])
+
+        self.assertEqual(parser.unparsed(), "Error: not logged in")
+
+    def test_event_log_is_compact(self):
+        log = event_log([AgentEvent("tool_call", "read a.py", 1.5, "read", "a.py")])
+
+        self.assertEqual(
+            json.loads(log),
+            {"kind": "tool_call", "summary": "read a.py", "elapsed_s": 1.5, "tool": "read", "path": "a.py"},
+        )
+
+
+class TestUsage(unittest.TestCase):
+
+    def test_sum_keeps_known_values_and_agreeing_model(self):
+        a = Usage(prompt_bytes=10, input_tokens=100, cost_usd=0.5, model="gpt-5")
+        b = Usage(prompt_bytes=5, output_tokens=20, model="gpt-5")
+
+        self.assertEqual(
+            a + b, Usage(prompt_bytes=15, input_tokens=100, output_tokens=20, cost_usd=0.5, model="gpt-5")
+        )
+        self.assertIsNone((a + Usage(model="o3")).model)
+
+    def test_total_skips_missing_usage(self):
+        self.assertIsNone(total_usage([None, None]))
+        self.assertEqual(total_usage([None, Usage(prompt_bytes=3)]), Usage(prompt_bytes=3))
+
+
+@unittest.skipIf(os.name != "posix", "fake agent binary is a shell script")
+class TestCursorAgentJsonOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _agent(
+        self, stdout: str, exit_code: int = 0, hang_after: bool = False, **kwargs
+    ) -> CursorAgentAdapter:
+        out = Path(self.tmp.name) / "out.txt"
+        out.write_text(stdout)
+        binary = Path(self.tmp.name) / "agent"
+        hang = "sleep 30\n" if hang_after else ""
+        binary.write_text(
+            f'#!/bin/sh\necho "$@" > "{self.tmp.name}/args"\ncat "{out}"\n{hang}exit {exit_code}\n'
+        )
+        binary.chmod(binary.stat().st_mode | stat.S_IEXEC)
+        return CursorAgentAdapter(
+            FakeConsole(), binary=str(binary), workspace_dir=self.tmp.name, **kwargs
+        )
+
+    def test_json_output_returns_text_and_keeps_usage(self):
+        agent = self._agent(json.dumps(RESULT), output_format="json")
+
+        result = agent.run_prompt("fix it")
+
+        self.assertEqual(result, (0, "Fixed the bug."))
+        self.assertEqual(agent.last_usage().input_tokens, 1200)
+        self.assertIn("--output-format json", (Path(self.tmp.name) / "args").read_text())
+
+    def test_error_result_fails_the_step(self):
+        agent = self._agent(json.dumps({**RESULT, "is_error": True}), output_format="json")
+
+        exit_code, _ = agent.run_prompt("fix it")
+
+        self.assertEqual(exit_code, 1)
+
+    def test_text_output_reports_no_usage(self):
+        agent = self._agent("plain answer\n")
+
+        self.assertEqual(agent.run_prompt("fix it"), (0, "plain answer"))
+        self.assertIsNone(agent.last_usage())
+
+    def test_stream_json_reports_events_and_returns_on_result(self):
+        # GIVEN an agent that keeps running after printing its result
+        lines = [
+            {"type": "tool_call", "subtype": "started",
+             "tool_call": {"editToolCall": {"args": {"path": "a.py"}}}},
+            RESULT,
+        ]
+        agent = self._agent(
+            "".join(json.dumps(e) + "\n" for e in lines), output_format="stream-json",
+            hang_after=True,
+        )
+        seen = []
+        agent.set_listener(seen.append)
+
+        # WHEN
+        started = time.monotonic()
+        result = agent.run_prompt("fix it")
+
+        # THEN it returns once the grace period is over, not when the agent exits
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual(result, (0, "Fixed the bug."))
+        self.assertEqual([e.kind for e in seen], ["edit", "result"])
+        self.assertEqual(agent.last_usage().cost_usd, 0.0123)
+
+    def test_stream_json_without_result_returns_raw_output(self):
+        agent = self._agent("Error: not logged in\n", exit_code=1, output_format="stream-json")
+
+        self.assertEqual(agent.run_prompt("fix it"), (1, "Error: not logged in"))
+
+    def test_unknown_output_format_is_rejected(self):
+        with self.assertRaises(ValueError):
+            CursorAgentAdapter(FakeConsole(), output_format="xml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Tests for FileArtifactStore and Artifact handles -- storage, laziness and the LRU."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from macros.domain.model.artifact import Artifact
+from macros.infrastructure.persistence.artifact_store import FileArtifactStore
+
+
+class TestArtifact(unittest.TestCase):
+
+    def test_inline_handle_behaves_like_its_text(self):
+        artifact = Artifact("hello")
+
+        self.assertEqual(str(artifact), "hello")
+        self.assertEqual(artifact, "hello")
+        self.assertEqual(artifact, Artifact("hello"))
+        self.assertEqual(len(artifact), 5)
+        self.assertFalse(Artifact(""))
+
+    def test_stored_handle_loads_only_when_read(self):
+        loads = []
+        artifact = Artifact(ref="abc", size=3, loader=lambda ref: loads.append(ref) or "xyz")
+
+        self.assertEqual(len(artifact), 3)
+        self.assertEqual(loads, [])
+        self.assertEqual(artifact.text, "xyz")
+        self.assertEqual(loads, ["abc"])
+
+
+class TestFileArtifactStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.run_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_put_writes_blob_immediately(self):
+        store = FileArtifactStore(self.run_dir)
+
+        artifact = store.put("step output")
+
+        self.assertEqual((self.run_dir / "blobs" / f"{artifact.ref}.txt").read_text(), "step output")
+        self.assertEqual(artifact.size, len("step output"))
+        self.assertEqual(artifact, "step output")
+
+    def test_identical_outputs_share_one_blob(self):
+        store = FileArtifactStore(self.run_dir)
+
+        first, second = store.put("same"), store.put("same")
+
+        self.assertEqual(first.ref, second.ref)
+        self.assertEqual(len(list((self.run_dir / "blobs").iterdir())), 1)
+
+    def test_evicted_outputs_are_reloaded_from_disk(self):
+        store = FileArtifactStore(self.run_dir, max_cache_bytes=10)
+        first = store.put("a" * 6)
+        store.put("b" * 6)  # pushes the first out of the LRU
+        blob = self.run_dir / "blobs" / f"{first.ref}.txt"
+        blob.write_text("from disk")
+
+        self.assertEqual(first.text, "from disk")
+
+    def test_recent_outputs_are_served_from_memory(self):
+        store = FileArtifactStore(self.run_dir, max_cache_bytes=10)
+        artifact = store.put("a" * 6)
+        (self.run_dir / "blobs" / f"{artifact.ref}.txt").unlink()
+
+        self.assertEqual(artifact.text, "a" * 6)
+
+    def test_handle_reads_a_blob_written_earlier(self):
+        ref = FileArtifactStore(self.run_dir).put("earlier").ref
+
+        artifact = FileArtifactStore(self.run_dir).handle(ref, len("earlier"))
+
+        self.assertEqual(artifact.text, "earlier")
+
+    def test_line_endings_survive_a_reload_from_disk(self):
+        ref = FileArtifactStore(self.run_dir).put("x\r\ny\rz").ref
+
+        artifact = FileArtifactStore(self.run_dir).handle(ref, 5)
+
+        self.assertEqual(artifact.text, "x\r\ny\rz")
+
+
+if __name__ == "__main__":
+    unittest.main()
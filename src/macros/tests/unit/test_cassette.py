@@ -0,0 +1,104 @@
+"""Tests for cassettes -- recording and replaying agent and command results."""
+
+import hashlib
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from macros.domain.exceptions import PhaseExecutionError
+from macros.domain.model.usage import Usage
+from macros.infrastructure.runtime.cassette import (
+    Cassette,
+    RecordingAgent,
+    RecordingCommand,
+    ReplayAgent,
+    ReplayCommand,
+)
+from macros.tests.helpers import FakeAgent, FakeCommand
+
+
+class TestCassette(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "run.cassette"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_recorded_results_replay_in_order_then_repeat(self):
+        cassette = Cassette(self.path, record=True)
+        command = RecordingCommand(
+            FakeCommand(responses=[(1, "1 failed"), (0, "passed")]), cassette
+        )
+        command.run_command("pytest")
+        command.run_command("pytest")
+
+        replay = ReplayCommand(Cassette(self.path))
+
+        self.assertEqual(replay.run_command("pytest"), (1, "1 failed"))
+        self.assertEqual(replay.run_command("pytest"), (0, "passed"))
+        self.assertEqual(replay.run_command("pytest"), (0, "passed"))
+
+    def test_agent_results_are_keyed_by_prompt(self):
+        cassette = Cassette(self.path, record=True)
+        agent = RecordingAgent(FakeAgent(auto_increment=True), cassette)
+        agent.run_prompt("first")
+        agent.run_prompt("second")
+
+        replay = ReplayAgent(Cassette(self.path))
+
+        self.assertEqual(replay.run_prompt("second"), (0, "Output from call 2"))
+        self.assertEqual(replay.run_prompt("first"), (0, "Output from call 1"))
+
+    def test_agent_usage_is_recorded_and_replayed(self):
+        usage = Usage(input_tokens=10, output_tokens=5, cost_usd=0.001, model="gpt-5")
+        cassette = Cassette(self.path, record=True)
+        RecordingAgent(FakeAgent(usage=usage), cassette).run_prompt("prompt")
+
+        replay = ReplayAgent(Cassette(self.path))
+        replay.run_prompt("prompt")
+
+        self.assertEqual(replay.last_usage(), usage)
+
+    def test_timeouts_are_recorded_and_replayed(self):
+        command = FakeCommand(responses=[(124, "timed out"), (124, "exit 124")])
+        command.timed_out = lambda: command.call_count == 1
+        recording = RecordingCommand(command, Cassette(self.path, record=True))
+        recording.run_command("slow")
+        recording.run_command("exit 124")
+
+        replay = ReplayCommand(Cassette(self.path))
+        replay.run_command("slow")
+        self.assertTrue(replay.timed_out())
+        replay.run_command("exit 124")
+        self.assertFalse(replay.timed_out())
+
+    def test_unrecorded_prompt_raises(self):
+        Cassette(self.path, record=True)
+
+        with self.assertRaises(PhaseExecutionError) as ctx:
+            ReplayAgent(Cassette(self.path)).run_prompt("never recorded\nmore")
+        self.assertIn("never recorded", str(ctx.exception))
+
+    def test_recording_starts_a_fresh_cassette(self):
+        RecordingCommand(FakeCommand(), Cassette(self.path, record=True)).run_command("make")
+
+        Cassette(self.path, record=True)
+
+        self.assertEqual(self.path.read_text(), "")
+
+    def test_replayed_latency_is_cancellable(self):
+        self.path.write_text(
+            '{"kind": "agent", "key": "%s", "exit_code": 0, "output": "slow", "latency_s": 30}\n'
+            % hashlib.sha256(b"p").hexdigest()
+        )
+        agent = ReplayAgent(Cassette(self.path), reproduce_latency=True)
+        threading.Timer(0.05, agent.cancel).start()
+
+        self.assertEqual(agent.run_prompt("p")[0], 130)
+
+
+if __name__ == "__main__":
+    unittest.main()
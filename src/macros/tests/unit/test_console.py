@@ -0,0 +1,67 @@
+"""Tests for JsonConsoleAdapter -- NDJSON events through the background writer."""
+
+import io
+import json
+import os
+import unittest
+
+from macros.infrastructure.runtime.console import JsonConsoleAdapter
+
+
+class TestJsonConsoleAdapter(unittest.TestCase):
+
+    def test_messages_and_events_become_one_json_object_per_line(self):
+        stream = io.StringIO()
+        console = JsonConsoleAdapter(stream)
+
+        console.info("Phase: analyze")
+        console.event("step_end", phase_id="analyze", step_id="s1", duration_s=1.5)
+        console.warn("careful")
+        console.close()
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([r["event"] for r in records], ["log", "step_end", "log"])
+        self.assertEqual(records[0]["level"], "info")
+        self.assertEqual(records[0]["msg"], "Phase: analyze")
+        self.assertEqual(records[1]["duration_s"], 1.5)
+        self.assertEqual(records[2]["level"], "warn")
+        self.assertIn("ts", records[1])
+
+    def test_writes_to_file_descriptor(self):
+        read_fd, write_fd = os.pipe()
+        try:
+            console = JsonConsoleAdapter(fd=write_fd)
+            console.event("run_end", run_id="r1", status="completed")
+            console.close()
+            os.close(write_fd)
+            with os.fdopen(read_fd, encoding="utf-8") as reader:
+                record = json.loads(reader.readline())
+        finally:
+            for fd in (read_fd, write_fd):
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+        self.assertEqual(record["event"], "run_end")
+        self.assertEqual(record["status"], "completed")
+
+    def test_lines_emitted_after_close_are_written(self):
+        stream = io.StringIO()
+        console = JsonConsoleAdapter(stream)
+        console.info("before")
+        console.close()
+
+        console.event("run_end", run_id="r1")
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([r["event"] for r in records], ["log", "run_end"])
+
+    def test_close_is_idempotent(self):
+        console = JsonConsoleAdapter(io.StringIO())
+        console.close()
+        console.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""Tests for context inference -- prompt references and output lifetimes."""
+
+import unittest
+
+from macros.domain.model.step import CommandStep, LlmStep
+from macros.domain.services.context_inference import (
+    effective_context,
+    infer_context,
+    outputs_needed_after,
+    referenced_phases,
+)
+from macros.tests.helpers import make_phase, make_workflow
+
+
+class TestContextInference(unittest.TestCase):
+
+    def test_referenced_phases_in_order_of_first_use(self):
+        phase = make_phase("c", steps=(
+            LlmStep(id="s1", prompt="{{PHASE_OUTPUT:b}} then {{PHASE_OUTPUT:a}}"),
+            LlmStep(id="s2", prompt="again {{PHASE_OUTPUT:b}} and {{STEP_OUTPUT:s1}}"),
+            CommandStep(id="t", command="echo '{{PHASE_OUTPUT:x}}'"),
+        ))
+
+        self.assertEqual(referenced_phases(phase), ("b", "a"))
+
+    def test_declared_context_wins_over_references(self):
+        phase = make_phase("c", context=("a", "b"),
+                           steps=(LlmStep(id="s1", prompt="{{PHASE_OUTPUT:a}}"),))
+
+        self.assertEqual(effective_context(phase), ("a", "b"))
+
+    def test_infer_context_fills_only_undeclared_phases(self):
+        wf = make_workflow(phases=(
+            make_phase("a", on_complete="b"),
+            make_phase("b", steps=(LlmStep(id="s1", prompt="{{PHASE_OUTPUT:a}}"),)),
+            make_phase("c", context=("b",)),
+        ))
+
+        inferred = infer_context(wf)
+
+        self.assertEqual([p.context for p in inferred.phases], [(), ("a",), ("b",)])
+
+    def test_outputs_are_dropped_once_no_later_phase_reads_them(self):
+        wf = make_workflow(phases=(
+            make_phase("a", on_complete="b"),
+            make_phase("b", on_complete="c",
+                       steps=(LlmStep(id="s1", prompt="{{PHASE_OUTPUT:a}}"),)),
+            make_phase("c", steps=(LlmStep(id="s1", prompt="{{PHASE_OUTPUT:b}}"),)),
+        ))
+
+        needed = outputs_needed_after(wf)
+
+        self.assertEqual(needed["a"], {"a", "b"})
+        self.assertEqual(needed["b"], {"b"})
+        self.assertEqual(needed["c"], set())
+
+    def test_loops_keep_outputs_read_on_a_later_visit(self):
+        wf = make_workflow(phases=(
+            make_phase("plan", on_complete="build",
+                       steps=(LlmStep(id="s1", prompt="{{PHASE_OUTPUT:review}}"),)),
+            make_phase("build", on_complete="review"),
+            make_phase("review", on_exhausted="plan"),
+        ))
+
+        self.assertIn("review", outputs_needed_after(wf)["review"])
+
+
+if __name__ == "__main__":
+    unittest.main()
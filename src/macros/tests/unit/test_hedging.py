@@ -0,0 +1,87 @@
+"""Tests for resolve_hedges -- hedge thresholds derived from earlier runs."""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from macros.domain.model.agent_config import AgentConfig
+from macros.domain.model.run import PhaseRun, Run, RunStatus, StepRun
+from macros.domain.model.step import Hedge, LlmStep
+from macros.domain.services.hedging import needs_history, resolve_hedges
+from macros.tests.helpers import make_phase, make_workflow
+
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _run(
+    *seconds: float,
+    step_id: str = "code",
+    attempt: int | None = None,
+    hedged: bool = False,
+    timed_out: bool = False,
+) -> Run:
+    step_runs = tuple(
+        StepRun(
+            step_id, "fix", 1, T0, T0 + timedelta(seconds=s), "", 0,
+            agent_config=AgentConfig(), attempt=attempt, hedged=hedged, timed_out=timed_out,
+        )
+        for s in seconds
+    )
+    return Run(
+        id="r", workflow_id="wf", status=RunStatus.COMPLETED,
+        phase_runs=[PhaseRun("fix", 1, "converged", step_runs, "", None, T0, T0)],
+    )
+
+
+def _workflow(hedge: Hedge):
+    step = LlmStep(id="code", prompt="fix", hedge=hedge)
+    return make_workflow(phases=(make_phase("fix", steps=(step,)),))
+
+
+def _threshold(workflow) -> float | None:
+    return workflow.phases[0].steps[0].hedge.after_seconds
+
+
+class TestResolveHedges(unittest.TestCase):
+
+    def test_threshold_is_the_percentile_of_recent_durations(self):
+        workflow = _workflow(Hedge(percentile=50, min_samples=3))
+        self.assertTrue(needs_history(workflow))
+
+        resolved = resolve_hedges(workflow, [_run(10, 30), _run(20)])
+
+        self.assertEqual(_threshold(resolved), 20)
+        self.assertFalse(needs_history(resolved))
+
+    def test_too_few_samples_leave_the_step_unhedged(self):
+        workflow = _workflow(Hedge(min_samples=5))
+
+        resolved = resolve_hedges(workflow, [_run(10, 20, 30)])
+
+        self.assertIsNone(_threshold(resolved))
+
+    def test_hedged_and_timed_out_calls_are_not_samples(self):
+        workflow = _workflow(Hedge(percentile=100, min_samples=1))
+
+        resolved = resolve_hedges(
+            workflow, [_run(5, hedged=True), _run(300, timed_out=True), _run(40)]
+        )
+
+        self.assertEqual(_threshold(resolved), 40)
+
+    def test_speculative_attempts_and_other_steps_are_not_samples(self):
+        workflow = _workflow(Hedge(min_samples=1))
+
+        resolved = resolve_hedges(workflow, [_run(10, attempt=1), _run(10, step_id="review")])
+
+        self.assertIsNone(_threshold(resolved))
+
+    def test_fixed_thresholds_need_no_history(self):
+        workflow = _workflow(Hedge(after_seconds=90))
+
+        self.assertFalse(needs_history(workflow))
+        self.assertEqual(_threshold(resolve_hedges(workflow, [_run(1, 2, 3, 4, 5)])), 90)
+
+
+if __name__ == "__main__":
+    unittest.main()
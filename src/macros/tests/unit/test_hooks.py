@@ -0,0 +1,181 @@
+"""Tests for lifecycle hooks -- dispatch, failure isolation and executor callbacks."""
+
+import unittest
+from unittest.mock import patch
+
+from macros.domain.model.agent_event import AgentEvent
+from macros.domain.model.workflow import Validation
+from macros.domain.services.hooks import HookDispatcher
+from macros.domain.services.phase_executor import PhaseExecutor
+from macros.domain.services.prompt_builder import PromptBuilder
+from macros.domain.services.workflow_executor import WorkflowExecutor
+from macros.infrastructure.runtime.plugins import load_hook_plugins
+from macros.tests.helpers import (
+    FakeAgent,
+    FakeCommand,
+    FakeConsole,
+    FakeRunStore,
+    make_phase,
+    make_workflow,
+)
+
+
+class RecordingHooks:
+    """Implements every callback and records (name, run id) pairs."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str | None]] = []
+
+    def on_run_start(self, run, workflow):
+        self.calls.append(("on_run_start", run.id))
+
+    def on_phase_start(self, run, phase):
+        self.calls.append(("on_phase_start", run.id))
+
+    def on_iteration(self, context, phase):
+        self.calls.append(("on_iteration", context.run_id))
+
+    def on_step_start(self, context, phase, step, attempt):
+        self.calls.append(("on_step_start", context.run_id))
+
+    def on_step_end(self, context, phase, step_run):
+        self.calls.append(("on_step_end", context.run_id))
+
+    def on_agent_event(self, context, phase, step, event):
+        self.calls.append(("on_agent_event", context.run_id))
+
+    def on_validation(self, context, phase, validation_run):
+        self.calls.append(("on_validation", context.run_id))
+
+    def on_phase_end(self, run, phase_run):
+        self.calls.append(("on_phase_end", run.id))
+
+    def on_checkpoint(self, run):
+        self.calls.append(("on_checkpoint", run.id))
+
+    def on_run_end(self, run):
+        self.calls.append(("on_run_end", run.id))
+
+
+class StepEndOnly:
+    def __init__(self) -> None:
+        self.ended: list[str] = []
+
+    def on_step_end(self, context, phase, step_run):
+        self.ended.append(step_run.step_id)
+
+
+class FailingHooks:
+    def on_step_start(self, context, phase, step, attempt):
+        raise RuntimeError("tracer down")
+
+
+class TestHookDispatcher(unittest.TestCase):
+
+    def test_create_without_hooks_returns_none(self):
+        self.assertIsNone(HookDispatcher.create([], FakeConsole()))
+
+    def test_only_implemented_callbacks_are_called(self):
+        hook = StepEndOnly()
+        dispatcher = HookDispatcher([hook], FakeConsole())
+
+        dispatcher.emit("on_run_start", None, None)
+        dispatcher.emit("on_step_end", None, None, type("S", (), {"step_id": "s1"})())
+
+        self.assertEqual(hook.ended, ["s1"])
+
+    def test_failing_hook_is_reported_and_others_still_run(self):
+        console = FakeConsole()
+        recorder = RecordingHooks()
+        dispatcher = HookDispatcher([FailingHooks(), recorder], console)
+
+        dispatcher.emit("on_step_start", type("C", (), {"run_id": "r"})(), None, None, None)
+
+        self.assertEqual(recorder.calls, [("on_step_start", "r")])
+        self.assertIn("WARN: Hook FailingHooks.on_step_start failed: tracer down", console.messages)
+
+
+class TestExecutorHooks(unittest.TestCase):
+
+    def _make_executor(self, *hooks, agent: FakeAgent | None = None) -> WorkflowExecutor:
+        console = FakeConsole()
+        dispatcher = HookDispatcher.create(hooks, console)
+        agent = agent or FakeAgent(auto_increment=True)
+        phase_executor = PhaseExecutor(
+            agent_factory=lambda config: agent,
+            command=FakeCommand(responses=[(1, "1 failed"), (0, "ok")]),
+            prompt_builder=PromptBuilder(),
+            console=console,
+            hooks=dispatcher,
+        )
+        return WorkflowExecutor(phase_executor, FakeRunStore(), console, hooks=dispatcher)
+
+    def test_callbacks_follow_the_run(self):
+        hooks = RecordingHooks()
+        executor = self._make_executor(hooks)
+        wf = make_workflow(phases=(
+            make_phase("fix", max_iterations=2, validation=Validation(command="pytest")),
+        ))
+
+        run = executor.execute(wf, "input")
+
+        self.assertEqual([name for name, _ in hooks.calls], [
+            "on_run_start", "on_phase_start",
+            "on_iteration", "on_step_start", "on_step_end", "on_validation",
+            "on_iteration", "on_step_start", "on_step_end", "on_validation",
+            "on_checkpoint", "on_phase_end", "on_run_end",
+        ])
+        self.assertEqual({run_id for _, run_id in hooks.calls}, {run.id})
+
+    def test_streamed_agent_events_reach_hooks_during_the_step(self):
+        hooks = RecordingHooks()
+        agent = FakeAgent(events=[AgentEvent("edit", "edit a.py", 1.0, "edit", "a.py")])
+        executor = self._make_executor(hooks, agent=agent)
+
+        executor.execute(make_workflow(phases=(make_phase("fix"),)), "input")
+
+        names = [name for name, _ in hooks.calls]
+        self.assertEqual(
+            names[names.index("on_step_start"):names.index("on_step_end") + 1],
+            ["on_step_start", "on_agent_event", "on_step_end"],
+        )
+
+    def test_failing_hook_does_not_affect_the_run(self):
+        executor = self._make_executor(FailingHooks())
+        wf = make_workflow(phases=(
+            make_phase("fix", max_iterations=2, validation=Validation(command="pytest")),
+        ))
+
+        run = executor.execute(wf, "input")
+
+        self.assertEqual(run.phase_runs[0].outcome, "converged")
+
+
+class FakeEntryPoint:
+    def __init__(self, name: str, target) -> None:
+        self.name = name
+        self._target = target
+
+    def load(self):
+        if isinstance(self._target, Exception):
+            raise self._target
+        return self._target
+
+
+class TestHookPlugins(unittest.TestCase):
+
+    def test_plugins_are_instantiated_and_broken_ones_skipped(self):
+        console = FakeConsole()
+        eps = [
+            FakeEntryPoint("steps", StepEndOnly),
+            FakeEntryPoint("broken", ImportError("no module named tracer")),
+        ]
+        with patch("macros.infrastructure.runtime.plugins.entry_points", return_value=eps):
+            hooks = load_hook_plugins(console)
+
+        self.assertEqual([type(h) for h in hooks], [StepEndOnly])
+        self.assertIn("broken", console.messages[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
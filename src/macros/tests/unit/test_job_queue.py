@@ -0,0 +1,107 @@
+"""Tests for SqliteJobQueue -- the durable run queue behind macrocycle serve."""
+
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+from macros.domain.model.job import Job, JobStatus
+from macros.infrastructure.persistence.job_queue import SqliteJobQueue
+
+
+def _job(job_id: str) -> Job:
+    return Job(
+        id=job_id,
+        workflow_id="fix",
+        input_text="bug",
+        status=JobStatus.QUEUED,
+        submitted_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
+    )
+
+
+class TestSqliteJobQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.queue = SqliteJobQueue(Path(self.tmp.name) / "jobs.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_claim_is_fifo_and_marks_running(self):
+        self.queue.submit(_job("a"))
+        self.queue.submit(_job("b"))
+
+        first = self.queue.claim()
+
+        self.assertEqual(first.id, "a")
+        self.assertEqual(first.status, JobStatus.RUNNING)
+        self.assertIsNotNone(first.started_at)
+        self.assertEqual(self.queue.get("a").status, JobStatus.RUNNING)
+        self.assertEqual(self.queue.claim().id, "b")
+        self.assertIsNone(self.queue.claim())
+
+    def test_concurrent_claims_never_share_a_job(self):
+        for i in range(20):
+            self.queue.submit(_job(f"j{i}"))
+        claimed: list[str] = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            while (job := self.queue.claim()) is not None:
+                with lock:
+                    claimed.append(job.id)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(sorted(claimed), sorted(f"j{i}" for i in range(20)))
+
+    def test_update_round_trips_result(self):
+        self.queue.submit(_job("a"))
+        job = self.queue.claim()
+        job.status = JobStatus.FAILED
+        job.error = "boom"
+        job.run_dir = "/runs/x"
+        job.finished_at = datetime.now(timezone.utc)
+
+        self.queue.update(job)
+        loaded = self.queue.get("a")
+
+        self.assertEqual(loaded.status, JobStatus.FAILED)
+        self.assertEqual(loaded.error, "boom")
+        self.assertEqual(loaded.run_dir, "/runs/x")
+        self.assertEqual(loaded.finished_at, job.finished_at)
+
+    def test_cancel_only_affects_queued_jobs(self):
+        self.queue.submit(_job("a"))
+        self.queue.submit(_job("b"))
+        self.queue.claim()
+
+        self.assertFalse(self.queue.cancel("a"))
+        self.assertTrue(self.queue.cancel("b"))
+        self.assertEqual(self.queue.get("b").status, JobStatus.CANCELLED)
+
+    def test_requeue_running_recovers_interrupted_jobs(self):
+        self.queue.submit(_job("a"))
+        self.queue.claim()
+
+        reopened = SqliteJobQueue(Path(self.tmp.name) / "jobs.db")
+        self.assertEqual(reopened.requeue_running(), 1)
+
+        self.assertEqual(reopened.count(JobStatus.QUEUED), 1)
+        self.assertEqual(reopened.claim().id, "a")
+
+    def test_list_jobs_newest_first_with_status_filter(self):
+        for job_id in ("a", "b", "c"):
+            self.queue.submit(_job(job_id))
+        self.queue.claim()
+
+        self.assertEqual([j.id for j in self.queue.list_jobs()], ["c", "b", "a"])
+        self.assertEqual(
+            [j.id for j in self.queue.list_jobs(status=JobStatus.QUEUED, limit=1)], ["c"]
+        )
@@ -1,15 +1,27 @@
 """Tests for PhaseExecutor -- the inner feedback control loop."""
 
+import json
+import threading
 import unittest
 from types import MappingProxyType
 
+from macros.domain.exceptions import WorkspaceError
 from macros.domain.model.agent_config import AgentConfig
+from macros.domain.model.agent_event import AgentEvent
 from macros.domain.model.context import ExecutionContext
-from macros.domain.model.step import CommandStep, LlmStep
-from macros.domain.model.workflow import Phase, Validation
+from macros.domain.model.step import CommandStep, Hedge, LlmStep
+from macros.domain.model.usage import Usage
+from macros.domain.model.workflow import Phase, Score, Speculation, Stagnation, Validation
 from macros.domain.services.phase_executor import PhaseExecutor
 from macros.domain.services.prompt_builder import PromptBuilder
-from macros.tests.helpers import FakeAgent, FakeCommand, FakeConsole, make_phase
+from macros.tests.helpers import (
+    FakeAgent,
+    FakeCommand,
+    FakeConsole,
+    FakeStepCache,
+    FakeWorkspace,
+    make_phase,
+)
 
 
 class TestPhaseExecutor(unittest.TestCase):
@@ -102,6 +114,66 @@ class TestPhaseExecutor(unittest.TestCase):
         self.assertEqual(self._agent.call_count, 3)
         self.assertEqual(self._command.call_count, 3)
 
+    def test_validation_runs_recorded_per_iteration(self):
+        executor = self._make_executor(
+            FakeAgent(auto_increment=True),
+            FakeCommand(responses=[(1, "FAILED"), (0, "passed")]),
+        )
+        phase = make_phase(
+            "p",
+            max_iterations=3,
+            validation=Validation(command="pytest"),
+        )
+
+        result = executor.execute(phase, self._ctx(), AgentConfig())
+
+        self.assertEqual([vr.iteration for vr in result.validation_runs], [1, 2])
+        self.assertEqual([vr.exit_code for vr in result.validation_runs], [1, 0])
+
+    def test_precheck_passing_skips_steps(self):
+        executor = self._make_executor(
+            FakeAgent(text="unused"),
+            FakeCommand(exit_code=0, output="all green"),
+        )
+        phase = make_phase(
+            "p",
+            max_iterations=3,
+            validation=Validation(command="pytest"),
+            precheck=True,
+        )
+
+        result = executor.execute(phase, self._ctx(), AgentConfig())
+
+        self.assertEqual(result.outcome, "converged")
+        self.assertEqual(result.iteration, 0)
+        self.assertEqual(result.step_runs, ())
+        self.assertEqual(result.validation_output, "all green")
+        self.assertEqual(
+            result.output.text, "Phase 'p' made no changes: its validation (`pytest`) already passed."
+        )
+        self.assertEqual(self._agent.call_count, 0)
+        self.assertEqual(self._command.call_count, 1)
+
+    def test_precheck_failing_runs_steps_with_its_output(self):
+        executor = self._make_executor(
+            FakeAgent(text="fixed"),
+            FakeCommand(responses=[(1, "test_foo FAILED"), (0, "passed")]),
+        )
+        phase = make_phase(
+            "p",
+            steps=(LlmStep(id="fix", prompt="Fix: {{VALIDATION_OUTPUT}}"),),
+            max_iterations=3,
+            validation=Validation(command="pytest"),
+            precheck=True,
+        )
+
+        result = executor.execute(phase, self._ctx(), AgentConfig())
+
+        self.assertEqual(result.outcome, "converged")
+        self.assertEqual(result.iteration, 1)
+        self.assertEqual(self._agent.prompts[0], "Fix: test_foo FAILED")
+        self.assertEqual([vr.iteration for vr in result.validation_runs], [0, 1])
+
     def test_validation_output_injected_as_feedback(self):
         executor = self._make_executor(
             FakeAgent(auto_increment=True),
@@ -192,6 +264,78 @@ class TestPhaseExecutor(unittest.TestCase):
         self.assertIsNotNone(result.step_runs[0].agent_config)
         self.assertEqual(result.step_runs[0].agent_config.engine, "cursor")
 
+    def test_agent_steps_record_usage_and_prompt_size(self):
+        # GIVEN an agent reporting tokens and cost but no model
+        usage = Usage(input_tokens=1200, output_tokens=300, cost_usd=0.02)
+        executor = self._make_executor(FakeAgent(text="ok", usage=usage))
+        phase = make_phase("p", steps=(
+            LlmStep(id="code", prompt="Fix: {{INPUT}}"),
+            CommandStep(id="lint", command="ruff check ."),
+        ))
+
+        # WHEN
+        result = executor.execute(phase, self._ctx("bug"), AgentConfig(model="gpt-5"))
+
+        # THEN
+        code, lint = result.step_runs
+        self.assertEqual(
+            code.usage,
+            Usage(prompt_bytes=8, input_tokens=1200, output_tokens=300, cost_usd=0.02, model="gpt-5"),
+        )
+        self.assertIsNone(lint.usage)
+        self.assertEqual(result.usage.input_tokens, 1200)
+
+    def test_agents_without_usage_still_record_prompt_size(self):
+        executor = self._make_executor(FakeAgent(text="ok"))
+
+        result = executor.execute(
+            make_phase("p", steps=(LlmStep(id="s1", prompt="héllo"),)), self._ctx(), AgentConfig()
+        )
+
+        self.assertEqual(result.step_runs[0].usage, Usage(prompt_bytes=6))
+
+    def test_streamed_agent_events_are_surfaced_and_logged(self):
+        # GIVEN a streaming agent
+        events = [
+            AgentEvent("tool_call", "read a.py", 0.5, "read", "a.py"),
+            AgentEvent("result", "done", 2.0),
+        ]
+        console = FakeConsole()
+        executor = PhaseExecutor(
+            agent_factory=lambda config: FakeAgent(text="ok", events=events),
+            command=FakeCommand(),
+            prompt_builder=PromptBuilder(),
+            console=console,
+        )
+
+        # WHEN
+        result = executor.execute(make_phase("p"), self._ctx(), AgentConfig())
+
+        # THEN progress is shown live and the step keeps a compact log
+        self.assertIn("INFO: p/s1: read a.py", console.messages)
+        streamed = [f for name, f in console.events if name == "agent_event"]
+        self.assertEqual([f["kind"] for f in streamed], ["tool_call", "result"])
+        self.assertEqual(streamed[0]["step_id"], "s1")
+        log = result.step_runs[0].events.text.splitlines()
+        self.assertEqual(json.loads(log[0])["path"], "a.py")
+
+    def test_non_streaming_agent_steps_have_no_event_log(self):
+        result = self._make_executor().execute(make_phase("p"), self._ctx(), AgentConfig())
+
+        self.assertIsNone(result.step_runs[0].events)
+
+    def test_steps_record_timeouts_reported_by_the_runner(self):
+        agent = FakeAgent(code=124, text="Agent timed out after 300s.")
+        agent.timed_out = lambda: True
+        executor = self._make_executor(agent, FakeCommand(exit_code=124))
+        phase = make_phase(steps=(
+            LlmStep(id="code", prompt="x"), CommandStep(id="lint", command="exit 124"),
+        ))
+
+        result = executor.execute(phase, ExecutionContext(input="x"), AgentConfig())
+
+        self.assertEqual([sr.timed_out for sr in result.step_runs], [True, False])
+
     def test_phase_output_is_last_step_output(self):
         agent = FakeAgent(auto_increment=True)
         executor = self._make_executor(agent)
@@ -206,3 +350,659 @@ class TestPhaseExecutor(unittest.TestCase):
         result = executor.execute(phase, self._ctx(), AgentConfig())
 
         self.assertEqual(result.output, "Output from call 2")
+
+
+class CwdCommand:
+    """CommandPort whose validation result depends on the worktree it runs in."""
+
+    def __init__(self, passing: set[str]) -> None:
+        self._passing = passing
+        self.cwds: list[str | None] = []
+
+    def run_command(self, command: str, cwd: str | None = None, env=None) -> tuple[int, str]:
+        self.cwds.append(cwd)
+        if cwd in self._passing:
+            return 0, "passed"
+        return 1, f"failed in {cwd}"
+
+
+class BlockingAgent:
+    """Returns immediately in `fast_cwd`, otherwise blocks until cancelled.
+
+    Streams `event_summaries` (if any) before answering and reports `usage`.
+    """
+
+    def __init__(
+        self, fast_cwd: str, usage: Usage | None = None, event_summaries: tuple[str, ...] = ()
+    ) -> None:
+        self._fast_cwd = fast_cwd
+        self._cancel = threading.Event()
+        self._usage = usage
+        self._event_summaries = event_summaries
+        self._listener = None
+        self.cancelled = False
+
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
+        for summary in self._event_summaries:
+            if self._listener is not None:
+                self._listener(AgentEvent(kind="tool_call", summary=summary))
+        if cwd == self._fast_cwd:
+            return 0, "fast fix"
+        self._cancel.wait(timeout=5)
+        return 130, "cancelled"
+
+    def last_usage(self) -> Usage | None:
+        return self._usage
+
+    def set_listener(self, listener) -> None:
+        self._listener = listener
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        self._cancel.set()
+
+
+class TestSpeculativePhaseExecutor(unittest.TestCase):
+
+    def _make_executor(self, agent_factory, command, workspace=None) -> PhaseExecutor:
+        self._console = FakeConsole()
+        return PhaseExecutor(
+            agent_factory=agent_factory,
+            command=command,
+            prompt_builder=PromptBuilder(),
+            console=self._console,
+            workspace=workspace,
+        )
+
+    def _phase(self, attempts: int = 3, select: str = "first", max_iterations: int = 2):
+        return make_phase(
+            "fix",
+            max_iterations=max_iterations,
+            validation=Validation(command="pytest"),
+            speculation=Speculation(attempts=attempts, select=select),
+        )
+
+    def test_converging_attempt_is_promoted(self):
+        workspace = FakeWorkspace()
+        agent = FakeAgent(text="patch")
+        command = CwdCommand(passing={"/tmp/worktrees/fix-1-2"})
+        executor = self._make_executor(lambda c: agent, command, workspace)
+
+        result = executor.execute(self._phase(select="best"), ExecutionContext(input="x"), AgentConfig())
+
+        self.assertEqual(result.outcome, "converged")
+        self.assertEqual(result.iteration, 1)
+        self.assertEqual(workspace.promoted, [("/tmp/worktrees/fix-1-2", None)])
+        self.assertEqual(sorted(workspace.removed), sorted(workspace.created))
+        self.assertEqual([sr.attempt for sr in result.step_runs], [1, 2, 3])
+        self.assertEqual(sorted(agent.cwds), sorted(workspace.created))
+
+    def test_best_prefers_smallest_change(self):
+        workspace = FakeWorkspace(change_sizes={
+            "/tmp/worktrees/fix-1-1": 50,
+            "/tmp/worktrees/fix-1-2": 5,
+        })
+        command = CwdCommand(passing={"/tmp/worktrees/fix-1-1", "/tmp/worktrees/fix-1-2"})
+        executor = self._make_executor(lambda c: FakeAgent(), command, workspace)
+
+        executor.execute(self._phase(attempts=2, select="best"), ExecutionContext(input="x"), AgentConfig())
+
+        self.assertEqual(workspace.promoted, [("/tmp/worktrees/fix-1-2", None)])
+
+    def test_first_cancels_slower_attempts(self):
+        workspace = FakeWorkspace()
+        agents: list[BlockingAgent] = []
+
+        def factory(config: AgentConfig) -> BlockingAgent:
+            agent = BlockingAgent(fast_cwd="/tmp/worktrees/fix-1-1")
+            agents.append(agent)
+            return agent
+
+        command = CwdCommand(passing={"/tmp/worktrees/fix-1-1"})
+        executor = self._make_executor(factory, command, workspace)
+
+        result = executor.execute(self._phase(attempts=3), ExecutionContext(input="x"), AgentConfig())
+
+        self.assertEqual(result.outcome, "converged")
+        self.assertEqual(result.output, "fast fix")
+        self.assertEqual(workspace.promoted, [("/tmp/worktrees/fix-1-1", None)])
+        self.assertEqual(sum(a.cancelled for a in agents), 3)
+        self.assertEqual(command.cwds, ["/tmp/worktrees/fix-1-1"])
+
+    def test_no_converging_attempt_promotes_first_and_iterates(self):
+        workspace = FakeWorkspace()
+        command = CwdCommand(passing=set())
+        executor = self._make_executor(lambda c: FakeAgent(), command, workspace)
+
+        result = executor.execute(
+            self._phase(attempts=2, max_iterations=2), ExecutionContext(input="x"), AgentConfig()
+        )
+
+        self.assertEqual(result.outcome, "exhausted")
+        self.assertEqual(
+            [w for w, _ in workspace.promoted],
+            ["/tmp/worktrees/fix-1-1", "/tmp/worktrees/fix-2-1"],
+        )
+        self.assertEqual(len(result.validation_runs), 4)
+        self.assertEqual(result.validation_output, "failed in /tmp/worktrees/fix-2-1")
+
+    def test_without_workspace_runs_sequentially(self):
+        command = FakeCommand(exit_code=0)
+        executor = self._make_executor(lambda c: FakeAgent(), command)
+
+        result = executor.execute(self._phase(), ExecutionContext(input="x"), AgentConfig())
+
+        self.assertEqual(result.outcome, "converged")
+        self.assertEqual(command.cwds, [None])
+        self.assertTrue(any("running sequentially" in m for m in self._console.messages))
+
+    def test_attempts_fork_from_and_promote_into_run_workdir(self):
+        workspace = FakeWorkspace()
+        command = CwdCommand(passing={"/tmp/worktrees/fix-1-1"})
+        executor = self._make_executor(lambda c: FakeAgent(), command, workspace)
+
+        executor.execute(
+            self._phase(attempts=2),
+            ExecutionContext(input="x", workdir="/tmp/run"),
+            AgentConfig(),
+        )
+
+        self.assertEqual(workspace.sources, ["/tmp/run", "/tmp/run"])
+        self.assertEqual(workspace.promoted, [("/tmp/worktrees/fix-1-1", "/tmp/run")])
+
+
+class TestStagnationDetection(unittest.TestCase):
+
+    def _execute(self, command: FakeCommand, stagnation: Stagnation, workspace=None):
+        self._console = FakeConsole()
+        executor = PhaseExecutor(
+            agent_factory=lambda c: FakeAgent(),
+            command=command,
+            prompt_builder=PromptBuilder(),
+            console=self._console,
+            workspace=workspace,
+        )
+        phase = make_phase(
+            "fix",
+            max_iterations=5,
+            validation=Validation(command="pytest"),
+            stagnation=stagnation,
+        )
+        return executor.execute(phase, ExecutionContext(input="x"), AgentConfig())
+
+    def test_identical_output_stops_early(self):
+        command = FakeCommand(responses=[
+            (1, "FAILED test_a - 1 failed in 0.31s"),
+            (1, "FAILED test_a - 1 failed in 0.29s"),  # only the timing differs
+        ])
+
+        result = self._execute(command, Stagnation(unchanged_workspace=False))
+
+        self.assertEqual(result.outcome, "exhausted")
+        self.assertEqual(result.reason, "stagnated")
+        self.assertEqual(result.iteration, 2)
+        self.assertTrue(any("identical validation output" in m for m in self._console.messages))
+
+    def test_unchanged_workspace_stops_early(self):
+        command = FakeCommand(responses=[(1, "3 failed"), (1, "2 failed"), (1, "1 failed")])
+        workspace = FakeWorkspace(fingerprints=["base", "a", "a"])
+
+        result = self._execute(command, Stagnation(identical_output=False), workspace)
+
+        self.assertEqual(result.reason, "stagnated")
+        self.assertEqual(result.iteration, 2)
+
+    def test_failure_count_not_decreasing_stops_after_window(self):
+        command = FakeCommand(responses=[
+            (1, "3 failed"), (1, "4 failed"), (1, "3 failed, 1 error"), (1, "2 failed"),
+        ])
+
+        result = self._execute(
+            command,
+            Stagnation(identical_output=False, unchanged_workspace=False, no_progress_iterations=2),
+        )
+
+        self.assertEqual(result.reason, "stagnated")
+        self.assertEqual(result.iteration, 3)
+
+    def test_progressing_loop_runs_full_budget(self):
+        command = FakeCommand(responses=[(1, f"{n} failed") for n in (5, 4, 3, 2, 1)])
+
+        result = self._execute(command, Stagnation(no_progress_iterations=2), FakeWorkspace())
+
+        self.assertEqual(result.outcome, "exhausted")
+        self.assertIsNone(result.reason)
+        self.assertEqual(result.iteration, 5)
+
+
+class StatefulWorkspace(FakeWorkspace):
+    """FakeWorkspace whose fingerprint follows edits, snapshots and restores."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.state = "base"
+        self._saved: dict[str, str] = {}
+
+    def fingerprint(self, path: str | None = None) -> str:
+        return self.state
+
+    def snapshot(self, path: str | None = None) -> str:
+        snapshot = super().snapshot(path)
+        self._saved[snapshot] = self.state
+        return snapshot
+
+    def restore(self, snapshot: str, path: str | None = None) -> None:
+        super().restore(snapshot, path)
+        self.state = self._saved[snapshot]
+
+
+class EditingAgent(FakeAgent):
+    """FakeAgent that moves a StatefulWorkspace to the next state on each call (None: no edit)."""
+
+    def __init__(self, workspace: StatefulWorkspace, edits: list[str | None]) -> None:
+        super().__init__()
+        self._workspace = workspace
+        self._edits = list(edits)
+
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
+        edit = self._edits.pop(0)
+        if edit is not None:
+            self._workspace.state = edit
+        return super().run_prompt(prompt, cwd)
+
+
+class TestRollback(unittest.TestCase):
+
+    def _execute(self, command: FakeCommand, workspace, *, validation=None, precheck=False, max_iterations=3):
+        self._agent = FakeAgent(auto_increment=True)
+        self._console = FakeConsole()
+        executor = PhaseExecutor(
+            agent_factory=lambda c: self._agent,
+            command=command,
+            prompt_builder=PromptBuilder(),
+            console=self._console,
+            workspace=workspace,
+        )
+        phase = make_phase(
+            "fix",
+            steps=(LlmStep(id="s1", prompt="Fix: {{VALIDATION_OUTPUT}}"),),
+            max_iterations=max_iterations,
+            validation=validation or Validation(command="pytest"),
+            precheck=precheck,
+            rollback=True,
+        )
+        return executor.execute(phase, ExecutionContext(input="x"), AgentConfig())
+
+    def test_regression_rolls_back_and_feeds_back_best_output(self):
+        command = FakeCommand(responses=[(1, "2 failed"), (1, "7 failed"), (1, "1 failed")])
+        workspace = FakeWorkspace()
+
+        result = self._execute(command, workspace)
+
+        self.assertEqual(workspace.snapshots, ["snap-1", "snap-2"])
+        self.assertEqual(workspace.restored, [("snap-1", None)])
+        self.assertTrue(self._agent.prompts[2].startswith("Fix: 2 failed"))
+        self.assertEqual([vr.score for vr in result.validation_runs], [2, 7, 1])
+        self.assertEqual(result.validation_output, "1 failed")
+
+    def test_exhausted_phase_ends_in_best_state(self):
+        command = FakeCommand(responses=[(1, "5 failed"), (1, "3 failed"), (1, "4 failed"), (1, "9 failed")])
+        workspace = FakeWorkspace()
+
+        result = self._execute(command, workspace, precheck=True)
+
+        self.assertEqual(result.outcome, "exhausted")
+        self.assertEqual(workspace.restored, [("snap-2", None), ("snap-2", None)])
+        self.assertEqual(result.validation_output, "3 failed")
+
+    def test_custom_score_pattern_can_maximize(self):
+        command = FakeCommand(responses=[(1, "coverage: 80%"), (1, "coverage: 60%")])
+        workspace = FakeWorkspace()
+        validation = Validation(command="cov", score=Score(pattern=r"coverage: (\d+)%", maximize=True))
+
+        self._execute(command, workspace, validation=validation, max_iterations=2)
+
+        self.assertEqual(workspace.restored, [("snap-1", None)])
+
+    def test_rollback_restores_the_best_iteration_output(self):
+        command = FakeCommand(responses=[(1, "2 failed"), (1, "9 failed")])
+
+        result = self._execute(command, FakeWorkspace(), max_iterations=2)
+
+        self.assertEqual(result.output.text, "Output from call 1")
+
+    def test_stagnation_compares_against_the_rolled_back_workspace(self):
+        # GIVEN an agent that edits twice, then changes nothing after the rollback
+        workspace = StatefulWorkspace()
+        agent = EditingAgent(workspace, edits=["e1", "e2", None])
+        executor = PhaseExecutor(
+            agent_factory=lambda c: agent,
+            command=FakeCommand(responses=[(1, "2 failed"), (1, "9 failed"), (1, "9 failed")]),
+            prompt_builder=PromptBuilder(),
+            console=FakeConsole(),
+            workspace=workspace,
+        )
+        phase = make_phase(
+            "fix",
+            max_iterations=4,
+            validation=Validation(command="pytest"),
+            rollback=True,
+            stagnation=Stagnation(identical_output=False),
+        )
+
+        # WHEN
+        result = executor.execute(phase, ExecutionContext(input="x"), AgentConfig())
+
+        # THEN the third iteration left the restored state untouched
+        self.assertEqual(result.reason, "stagnated")
+        self.assertEqual(result.iteration, 3)
+
+    def test_unscored_output_is_kept(self):
+        command = FakeCommand(responses=[(1, "2 failed"), (1, "segfault")])
+        workspace = FakeWorkspace()
+
+        result = self._execute(command, workspace, max_iterations=2)
+
+        self.assertEqual(workspace.restored, [])
+        self.assertEqual(result.validation_output, "segfault")
+
+
+class TestChangedFiles(unittest.TestCase):
+
+    def _execute(self, command: FakeCommand, workspace, phase: Phase):
+        self._console = FakeConsole()
+        executor = PhaseExecutor(
+            agent_factory=lambda c: FakeAgent(),
+            command=command,
+            prompt_builder=PromptBuilder(),
+            console=self._console,
+            workspace=workspace,
+        )
+        return executor.execute(phase, ExecutionContext(input="x"), AgentConfig())
+
+    def _phase(self, **kwargs) -> Phase:
+        validation = Validation(
+            command="pytest", incremental_command="pytest {{CHANGED_FILES}}"
+        )
+        return make_phase("fix", validation=validation, **kwargs)
+
+    def test_failing_incremental_check_skips_full_command(self):
+        command = FakeCommand(responses=[(1, "1 failed")])
+        workspace = FakeWorkspace(changes=["tests/test_a.py", "my file.py"])
+
+        result = self._execute(command, workspace, self._phase())
+
+        self.assertEqual(command.commands, ["pytest tests/test_a.py 'my file.py'"])
+        self.assertEqual(command.envs[0], {"MACROCYCLE_CHANGED_FILES": "tests/test_a.py\nmy file.py"})
+        self.assertTrue(result.validation_runs[0].incremental)
+
+    def test_passing_incremental_check_escalates_to_full_command(self):
+        command = FakeCommand(exit_code=0)
+        workspace = FakeWorkspace(changes=["tests/test_a.py"])
+
+        result = self._execute(command, workspace, self._phase())
+
+        self.assertEqual(command.commands, ["pytest tests/test_a.py", "pytest"])
+        self.assertEqual(result.outcome, "converged")
+        self.assertFalse(result.validation_runs[0].incremental)
+
+    def test_incremental_results_are_not_compared_with_full_ones(self):
+        # GIVEN a full run at 10 failures, a failing subset, then a full run at 5
+        command = FakeCommand(responses=[
+            (0, "ok"), (1, "10 failed"),
+            (1, "2 failed"),
+            (0, "ok"), (1, "5 failed"),
+        ])
+        workspace = FakeWorkspace(changes=["a.py"])
+        phase = self._phase(max_iterations=3, rollback=True, stagnation=Stagnation(no_progress_iterations=1))
+
+        # WHEN
+        result = self._execute(command, workspace, phase)
+
+        # THEN the subset is unscored, nothing is rolled back and the loop is not stuck
+        self.assertEqual([vr.score for vr in result.validation_runs], [10, None, 5])
+        self.assertEqual(workspace.restored, [])
+        self.assertIsNone(result.reason)
+        self.assertEqual(result.validation_output, "5 failed")
+
+    def test_no_changes_or_no_workspace_runs_full_command_only(self):
+        for workspace in (FakeWorkspace(changes=[]), None):
+            command = FakeCommand(exit_code=0)
+
+            self._execute(command, workspace, self._phase())
+
+            self.assertEqual(command.commands, ["pytest"])
+
+    def test_command_steps_receive_changed_files(self):
+        command = FakeCommand(exit_code=0)
+        workspace = FakeWorkspace(changes=["a.py"])
+        phase = make_phase("fmt", steps=(CommandStep(id="lint", command="ruff --fix {{CHANGED_FILES}}"),))
+
+        self._execute(command, workspace, phase)
+
+        self.assertEqual(command.commands, ["ruff --fix a.py"])
+
+    def test_phases_that_do_not_use_changed_files_take_no_snapshot(self):
+        command = FakeCommand(exit_code=0)
+        workspace = FakeWorkspace(changes=["a.py"])
+        phase = make_phase(
+            "fix",
+            steps=(CommandStep(id="lint", command="ruff check ."),),
+            validation=Validation(command="pytest"),
+        )
+
+        self._execute(command, workspace, phase)
+
+        self.assertEqual(workspace.snapshots, [])
+        self.assertEqual(command.envs, [None, None])
+
+    def test_opt_in_exposes_changed_files_to_plain_commands(self):
+        command = FakeCommand(exit_code=0)
+        workspace = FakeWorkspace(changes=["a.py"])
+        phase = make_phase(
+            "fix", steps=(CommandStep(id="lint", command="./lint.sh"),), changed_files=True
+        )
+
+        self._execute(command, workspace, phase)
+
+        self.assertEqual(command.envs, [{"MACROCYCLE_CHANGED_FILES": "a.py"}])
+
+
+class TestCachedCommandSteps(unittest.TestCase):
+
+    def test_unchanged_inputs_replay_cached_result(self):
+        cache = FakeStepCache({"requirements.txt": "typer"})
+        command = FakeCommand(exit_code=0, output="installed")
+        executor = PhaseExecutor(
+            agent_factory=lambda c: FakeAgent(),
+            command=command,
+            prompt_builder=PromptBuilder(),
+            console=FakeConsole(),
+            step_cache=cache,
+        )
+        step = CommandStep(id="deps", command="pip install -r requirements.txt", inputs=("requirements.txt",))
+        phase = make_phase("setup", steps=(step,))
+
+        first = executor.execute(phase, ExecutionContext(input="x"), AgentConfig())
+        second = executor.execute(phase, ExecutionContext(input="x"), AgentConfig())
+        cache.contents["requirements.txt"] = "typer\nrich"
+        third = executor.execute(phase, ExecutionContext(input="x"), AgentConfig())
+
+        self.assertEqual(command.call_count, 2)
+        self.assertEqual([r.step_runs[0].cached for r in (first, second, third)], [False, True, False])
+        self.assertEqual(second.output, "installed")
+
+    def test_failed_commands_are_not_cached(self):
+        cache = FakeStepCache()
+        command = FakeCommand(exit_code=1, output="network down")
+        executor = PhaseExecutor(
+            agent_factory=lambda c: FakeAgent(),
+            command=command,
+            prompt_builder=PromptBuilder(),
+            console=FakeConsole(),
+            step_cache=cache,
+        )
+        phase = make_phase("setup", steps=(CommandStep(id="deps", command="npm ci", inputs=("package.json",)),))
+
+        executor.execute(phase, ExecutionContext(input="x"), AgentConfig())
+
+        self.assertEqual(cache.entries, {})
+
+
+class DelayedAgent:
+    """Answers after `seconds` unless cancelled first."""
+
+    def __init__(self, seconds: float, text: str) -> None:
+        self._seconds = seconds
+        self._text = text
+        self._cancel = threading.Event()
+        self.cancelled = False
+
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
+        if self._cancel.wait(timeout=self._seconds):
+            return 130, "cancelled"
+        return 0, self._text
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        self._cancel.set()
+
+
+class UnpromotableWorkspace(FakeWorkspace):
+    """Worktrees can be set up, but nothing can be restored into the main checkout."""
+
+    def restore(self, snapshot: str, path: str | None = None) -> None:
+        if path is None:
+            raise WorkspaceError("index.lock exists")
+        super().restore(snapshot, path)
+
+
+class TestHedgedAgentSteps(unittest.TestCase):
+
+    HEDGE_WORKTREE = "/tmp/worktrees/fix-1-code-hedge"
+
+    def _execute(self, agents: dict, hedge: Hedge, workspace: FakeWorkspace):
+        self._console = FakeConsole()
+        executor = PhaseExecutor(
+            agent_factory=lambda config: agents[config.model],
+            command=FakeCommand(),
+            prompt_builder=PromptBuilder(),
+            console=self._console,
+            workspace=workspace,
+        )
+        phase = make_phase("fix", steps=(LlmStep(id="code", prompt="fix", hedge=hedge),))
+        return executor.execute(phase, ExecutionContext(input="x"), AgentConfig(model="big"))
+
+    def test_hedge_wins_when_the_original_call_hangs(self):
+        # GIVEN an original call that never returns and a fast fallback model
+        workspace = FakeWorkspace()
+        original = BlockingAgent(fast_cwd=self.HEDGE_WORKTREE)
+        fallback = BlockingAgent(fast_cwd=self.HEDGE_WORKTREE)
+
+        # WHEN
+        result = self._execute(
+            {"big": original, "small": fallback},
+            Hedge(after_seconds=0.05, model="small"),
+            workspace,
+        )
+
+        # THEN the hedge's result and workspace are kept, the original is killed
+        step_run = result.step_runs[0]
+        self.assertEqual((step_run.exit_code, step_run.output), (0, "fast fix"))
+        self.assertTrue(step_run.hedged)
+        self.assertEqual(step_run.agent_config.model, "small")
+        self.assertTrue(original.cancelled)
+        self.assertEqual(workspace.restored, [
+            ("snap-1", self.HEDGE_WORKTREE),  # hedge starts from the pre-step state
+            ("snap-2", None),                 # workspace takes the hedge's state
+        ])
+        self.assertEqual(workspace.removed, [self.HEDGE_WORKTREE])
+        hedge_events = [f for name, f in self._console.events if name == "hedge"]
+        self.assertEqual(hedge_events[0]["model"], "small")
+
+    def test_both_attempts_are_paid_for_and_only_the_winner_is_logged(self):
+        # GIVEN two attempts that each report usage and stream an event
+        original = BlockingAgent(
+            fast_cwd=self.HEDGE_WORKTREE, event_summaries=("read slow.py",),
+            usage=Usage(input_tokens=100, cost_usd=0.5, model="big"),
+        )
+        fallback = BlockingAgent(
+            fast_cwd=self.HEDGE_WORKTREE, event_summaries=("read fast.py",),
+            usage=Usage(input_tokens=10, cost_usd=0.25, model="small"),
+        )
+
+        # WHEN the hedge wins
+        result = self._execute(
+            {"big": original, "small": fallback},
+            Hedge(after_seconds=0.05, model="small"),
+            FakeWorkspace(),
+        )
+
+        # THEN the usage covers both calls and the event log is the winner's
+        step_run = result.step_runs[0]
+        self.assertEqual(step_run.usage.input_tokens, 110)
+        self.assertEqual(step_run.usage.cost_usd, 0.75)
+        self.assertEqual(step_run.usage.model, "small")
+        self.assertEqual(step_run.usage.prompt_bytes, 2 * len("fix"))
+        self.assertEqual(
+            [json.loads(line)["summary"] for line in step_run.events.text.splitlines()],
+            ["read fast.py"],
+        )
+        hedge_events = [f for name, f in self._console.events if name == "agent_event" and f.get("hedge")]
+        self.assertEqual([f["summary"] for f in hedge_events], ["read fast.py"])
+
+    def test_step_fails_when_the_hedge_cannot_be_promoted(self):
+        # GIVEN a winning hedge whose state cannot be restored into the workspace
+        workspace = UnpromotableWorkspace()
+        original = BlockingAgent(fast_cwd=self.HEDGE_WORKTREE)
+
+        # WHEN
+        result = self._execute(
+            {"big": original, "small": BlockingAgent(fast_cwd=self.HEDGE_WORKTREE)},
+            Hedge(after_seconds=0.05, model="small"),
+            workspace,
+        )
+
+        # THEN the step fails with the reason instead of raising, and the worktree is cleaned up
+        step_run = result.step_runs[0]
+        self.assertEqual(step_run.exit_code, 1)
+        self.assertIn("could not be applied: index.lock exists", step_run.output.text)
+        self.assertTrue(step_run.hedged)
+        self.assertTrue(original.cancelled)
+        self.assertEqual(workspace.removed, [self.HEDGE_WORKTREE])
+        self.assertTrue(any("could not be applied" in m for m in self._console.messages))
+
+    def test_original_result_is_kept_when_it_finishes_first(self):
+        workspace = FakeWorkspace()
+        hedge_agent = BlockingAgent(fast_cwd="elsewhere")
+
+        result = self._execute(
+            {"big": DelayedAgent(0.2, "slow but done"), "small": hedge_agent},
+            Hedge(after_seconds=0.05, model="small"),
+            workspace,
+        )
+
+        step_run = result.step_runs[0]
+        self.assertEqual(step_run.output, "slow but done")
+        self.assertTrue(step_run.hedged)
+        self.assertEqual(step_run.agent_config.model, "big")
+        self.assertTrue(hedge_agent.cancelled)
+        self.assertEqual(workspace.restored, [("snap-1", self.HEDGE_WORKTREE)])
+        self.assertEqual(workspace.removed, [self.HEDGE_WORKTREE])
+
+    def test_calls_under_the_threshold_are_not_hedged(self):
+        workspace = FakeWorkspace()
+
+        result = self._execute({"big": FakeAgent(text="quick")}, Hedge(after_seconds=5), workspace)
+
+        self.assertFalse(result.step_runs[0].hedged)
+        self.assertEqual(result.output, "quick")
+        self.assertEqual(workspace.created, [])
+
+    def test_without_a_threshold_the_step_is_not_hedged(self):
+        workspace = FakeWorkspace()
+
+        result = self._execute({"big": FakeAgent()}, Hedge(), workspace)
+
+        self.assertFalse(result.step_runs[0].hedged)
+        self.assertEqual(workspace.snapshots, [])
@@ -0,0 +1,70 @@
+"""Tests for FilePhaseMemo -- keys, hits and pruning."""
+
+import os
+import tempfile
+import time
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from macros.infrastructure.persistence.phase_memo import FilePhaseMemo
+from macros.tests.helpers import make_phase, make_workflow
+
+
+class TestFilePhaseMemo(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.memo = FilePhaseMemo(workspace_dir=self.root)
+        self.workflow = make_workflow(phases=(make_phase("analyze"),))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _key(self, workflow=None, input_text="fix the bug", context=None, fingerprint="fp"):
+        return self.memo.key(
+            workflow or self.workflow, "analyze", input_text, context or {}, fingerprint
+        )
+
+    def test_key_tracks_workflow_input_context_and_workspace(self):
+        key = self._key()
+
+        self.assertEqual(key, self._key())
+        self.assertNotEqual(key, self._key(input_text="fix another bug"))
+        self.assertNotEqual(key, self._key(context={"triage": "p1"}))
+        self.assertNotEqual(key, self._key(fingerprint="fp2"))
+        edited = replace(self.workflow, phases=(make_phase("analyze", max_iterations=2),))
+        self.assertNotEqual(key, self._key(workflow=edited))
+
+    def test_key_ignores_whitespace_differences_in_the_input(self):
+        self.assertEqual(self._key(input_text="fix  the\nbug "), self._key())
+
+    def test_saved_output_is_loaded_with_its_run(self):
+        key = self._key()
+        self.assertIsNone(self.memo.load(key))
+
+        self.memo.save(key, "run-1", "root cause: typo")
+        self.memo.save(key, "run-2", "ignored, first entry wins")
+
+        self.assertEqual(self.memo.load(key), ("run-1", "root cause: typo"))
+
+    def test_prune_removes_entries_unused_since_cutoff(self):
+        stale, fresh = self._key(fingerprint="old"), self._key(fingerprint="new")
+        self.memo.save(stale, "run-1", "old")
+        self.memo.save(fresh, "run-2", "new")
+        entry = self.root / ".macrocycle" / "cache" / "phases" / stale[:2] / f"{stale}.json"
+        week_ago = time.time() - 7 * 86400
+        os.utime(entry, (week_ago, week_ago))
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=1)
+        self.assertEqual(self.memo.prune(cutoff, dry_run=True), 1)
+        self.assertEqual(self.memo.prune(cutoff), 1)
+
+        self.assertIsNone(self.memo.load(stale))
+        self.assertEqual(self.memo.load(fresh), ("run-2", "new"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Tests for RunProfiler -- orchestrator profiles written into the run dir."""
+
+import pstats
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+from macros.domain.model.run import PhaseRun, Run, RunStatus
+from macros.infrastructure.telemetry import RunProfiler
+from macros.infrastructure.telemetry.profiler import FOLDED_FILE, MEMORY_FILE, PSTATS_FILE
+from macros.tests.helpers import make_workflow
+
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _busy_work() -> list[str]:
+    deadline = time.monotonic() + 0.05
+    chunks = []
+    while time.monotonic() < deadline:
+        chunks.append("x" * 1024)
+    return chunks
+
+
+def _phase_run(phase_id: str) -> PhaseRun:
+    return PhaseRun(
+        phase_id=phase_id,
+        iteration=1,
+        outcome="converged",
+        step_runs=(),
+        output="",
+        validation_output=None,
+        started_at=T0,
+        finished_at=T0,
+    )
+
+
+class TestRunProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.run_dir = Path(self.tmp.name) / "20260101_000000_test"
+        self.run = Run(
+            id=self.run_dir.name, workflow_id="test", status=RunStatus.RUNNING,
+            started_at=T0, artifacts_dir=str(self.run_dir),
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_run_end_writes_pstats_and_collapsed_stacks(self):
+        # GIVEN
+        profiler = RunProfiler(interval=0.001)
+        profiler.start()
+        profiler.on_run_start(self.run, make_workflow())
+
+        # WHEN
+        _busy_work()
+        profiler.on_run_end(self.run)
+
+        # THEN
+        stats = pstats.Stats(str(self.run_dir / PSTATS_FILE))
+        self.assertTrue(any(func[2] == "_busy_work" for func in stats.stats))
+        folded = (self.run_dir / FOLDED_FILE).read_text().splitlines()
+        self.assertTrue(any("_busy_work (unit/test_profiler.py:" in line for line in folded))
+        _, count = folded[0].rsplit(" ", 1)
+        self.assertGreater(int(count), 0)
+        self.assertFalse((self.run_dir / MEMORY_FILE).exists())
+
+    def test_memory_reports_top_allocators_per_phase(self):
+        profiler = RunProfiler(memory=True)
+        profiler.start()
+        profiler.on_run_start(self.run, make_workflow())
+        kept = _busy_work()
+        profiler.on_phase_end(self.run, _phase_run("analyze"))
+        kept += _busy_work()
+        profiler.on_phase_end(self.run, _phase_run("implement"))
+
+        profiler.on_run_end(self.run)
+
+        report = (self.run_dir / MEMORY_FILE).read_text()
+        self.assertIn("== after analyze (iteration 1)", report)
+        self.assertIn("== after implement (iteration 1)", report)
+        self.assertIn("growth since the previous phase", report)
+        self.assertIn("test_profiler.py", report)
+
+    def test_close_before_run_start_writes_nothing(self):
+        profiler = RunProfiler()
+        profiler.start()
+
+        profiler.close()
+        profiler.close()
+
+        self.assertFalse(self.run_dir.exists())
+
+    def test_close_after_aborted_run_still_writes_profile(self):
+        profiler = RunProfiler()
+        profiler.start()
+        profiler.on_run_start(self.run, make_workflow())
+
+        profiler.close()
+
+        self.assertTrue((self.run_dir / PSTATS_FILE).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+"""Tests for PrometheusTextfileExporter -- textfile-collector metrics."""
+
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from macros.domain.model.agent_config import AgentConfig
+from macros.domain.model.run import PhaseRun, Run, RunStatus, StepRun, ValidationRun
+from macros.domain.model.usage import Usage
+from macros.infrastructure.telemetry import PrometheusTextfileExporter
+
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _phase_run(
+    outcome: str = "converged",
+    step_seconds: float = 42,
+    exit_code: int = 0,
+    timed_out: bool = False,
+) -> PhaseRun:
+    step = StepRun(
+        step_id="code",
+        phase_id="implement",
+        iteration=1,
+        started_at=T0,
+        finished_at=T0 + timedelta(seconds=step_seconds),
+        output="done",
+        exit_code=exit_code,
+        agent_config=AgentConfig(engine="cursor", model="gpt-5"),
+        timed_out=timed_out,
+    )
+    validation = ValidationRun(
+        iteration=1,
+        started_at=T0,
+        finished_at=T0 + timedelta(seconds=3),
+        exit_code=1,
+    )
+    return PhaseRun(
+        phase_id="implement",
+        iteration=2,
+        outcome=outcome,
+        step_runs=(step,),
+        output="done",
+        validation_output="FAILED",
+        started_at=T0,
+        finished_at=T0 + timedelta(seconds=50),
+        validation_runs=(validation,),
+    )
+
+
+class TestPrometheusTextfileExporter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "macrocycle.prom"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_flush_writes_histograms_and_counters(self):
+        exporter = PrometheusTextfileExporter(self.path)
+
+        exporter.observe_phase("fix", _phase_run())
+        exporter.flush()
+
+        text = self.path.read_text()
+        self.assertIn("# TYPE macrocycle_step_duration_seconds histogram", text)
+        self.assertIn(
+            'macrocycle_step_duration_seconds_bucket{workflow="fix",phase="implement",'
+            'step_type="llm",engine="cursor",model="gpt-5",le="60"} 1',
+            text,
+        )
+        self.assertIn(
+            'macrocycle_step_duration_seconds_bucket{workflow="fix",phase="implement",'
+            'step_type="llm",engine="cursor",model="gpt-5",le="30"} 0',
+            text,
+        )
+        self.assertIn(
+            'macrocycle_validation_duration_seconds_sum{workflow="fix",phase="implement"} 3',
+            text,
+        )
+        self.assertIn(
+            'macrocycle_phase_iterations_total{workflow="fix",phase="implement"} 2', text
+        )
+        self.assertIn(
+            'macrocycle_phase_outcomes_total{workflow="fix",phase="implement",outcome="converged"} 1',
+            text,
+        )
+
+    def test_counters_accumulate_across_exporters(self):
+        for outcome in ("converged", "exhausted", "exhausted"):
+            exporter = PrometheusTextfileExporter(self.path)
+            exporter.observe_phase("fix", _phase_run(outcome=outcome))
+            exporter.flush()
+
+        text = self.path.read_text()
+        self.assertIn('outcome="exhausted"} 2', text)
+        self.assertIn('outcome="converged"} 1', text)
+        self.assertIn(
+            'macrocycle_step_duration_seconds_count{workflow="fix",phase="implement",'
+            'step_type="llm",engine="cursor",model="gpt-5"} 3',
+            text,
+        )
+
+    def test_agent_tokens_and_cost_counted(self):
+        pr = _phase_run()
+        step = replace(pr.step_runs[0], usage=Usage(input_tokens=900, output_tokens=100, cost_usd=0.5))
+        exporter = PrometheusTextfileExporter(self.path)
+
+        exporter.observe_phase("fix", replace(pr, step_runs=(step,)))
+        exporter.flush()
+
+        text = self.path.read_text()
+        labels = 'workflow="fix",phase="implement",step_type="llm",engine="cursor",model="gpt-5"'
+        self.assertIn(f'macrocycle_agent_tokens_total{{{labels},kind="input"}} 900', text)
+        self.assertIn(f'macrocycle_agent_tokens_total{{{labels},kind="output"}} 100', text)
+        self.assertIn(f"macrocycle_agent_cost_usd_total{{{labels}}} 0.5", text)
+
+    def test_flush_is_idempotent_without_new_observations(self):
+        exporter = PrometheusTextfileExporter(self.path)
+        exporter.observe_phase("fix", _phase_run())
+        exporter.flush()
+        exporter.flush()
+
+        self.assertIn('outcome="converged"} 1', self.path.read_text())
+
+    def test_timeouts_counted(self):
+        exporter = PrometheusTextfileExporter(self.path)
+
+        exporter.observe_phase("fix", _phase_run(step_seconds=300, exit_code=124, timed_out=True))
+        exporter.flush()
+
+        self.assertIn('macrocycle_timeouts_total{workflow="fix",phase="implement",'
+                      'step_type="llm",engine="cursor",model="gpt-5",kind="step"} 1',
+                      self.path.read_text())
+
+    def test_exit_code_124_alone_is_not_a_timeout(self):
+        exporter = PrometheusTextfileExporter(self.path)
+
+        exporter.observe_phase("fix", _phase_run(exit_code=124))
+        exporter.flush()
+
+        self.assertNotIn("macrocycle_timeouts_total", self.path.read_text())
+
+    def test_observe_run_counts_status(self):
+        exporter = PrometheusTextfileExporter(self.path)
+        run = Run(id="r1", workflow_id="fix", status=RunStatus.COMPLETED)
+
+        exporter.observe_run(run)
+        exporter.flush()
+
+        self.assertIn('macrocycle_runs_total{workflow="fix",status="completed"} 1',
+                      self.path.read_text())
+
+    def test_periodic_flush_during_long_runs(self):
+        exporter = PrometheusTextfileExporter(self.path, flush_interval=0)
+
+        exporter.observe_phase("fix", _phase_run())
+
+        self.assertTrue(self.path.exists())
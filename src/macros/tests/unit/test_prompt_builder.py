@@ -3,6 +3,7 @@
 import unittest
 from types import MappingProxyType
 
+from macros.domain.model.artifact import Artifact
 from macros.domain.model.context import ExecutionContext
 from macros.domain.services.prompt_builder import PromptBuilder
 from macros.tests.helpers import make_step_run
@@ -40,6 +41,18 @@ class TestPromptBuilder(unittest.TestCase):
         )
         self.assertEqual(result, "Based on: analysis done")
 
+    def test_phase_outputs_load_only_when_referenced(self):
+        loads = []
+        handle = Artifact(ref="r", size=4, loader=lambda ref: loads.append(ref) or "big!")
+        ctx = self._ctx(phase_outputs=MappingProxyType({"analyze": handle}))
+
+        self.builder.build("No reference: {{INPUT}}", ctx, [])
+        self.assertEqual(loads, [])
+
+        result = self.builder.build("Based on: {{PHASE_OUTPUT:analyze}}", ctx, [])
+        self.assertEqual(result, "Based on: big!")
+        self.assertEqual(loads, ["r"])
+
     def test_substitutes_step_output_variable(self):
         prev = make_step_run("impact", "impact result")
         result = self.builder.build(
@@ -63,6 +76,11 @@ class TestPromptBuilder(unittest.TestCase):
         )
         self.assertIn("Errors: FAILED: 3 tests", result)
 
+    def test_substitutes_changed_files_one_per_line(self):
+        ctx = self._ctx(changed_files=("src/a.py", "src/b.py"))
+        result = self.builder.build("Review:\n{{CHANGED_FILES}}", ctx, [])
+        self.assertEqual(result, "Review:\nsrc/a.py\nsrc/b.py")
+
     def test_unknown_variables_kept_as_is(self):
         result = self.builder.build("{{UNKNOWN}} and {{INPUT}}", self._ctx(), [])
         self.assertEqual(result, "{{UNKNOWN}} and test input")
@@ -0,0 +1,111 @@
+"""Tests for host-wide agent throttling -- limit lookup, slots and token buckets."""
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from macros.domain.model.agent_config import AgentConfig, AgentLimit, resolve_agent_limit
+from macros.infrastructure.runtime.rate_limiter import (
+    HostRateLimiter,
+    RateLimitedAgent,
+    load_agent_limits,
+)
+from macros.tests.helpers import FakeAgent
+
+
+class _SlowAgent(FakeAgent):
+    """Records how many prompts were in flight at once."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
+        with _SlowAgent.lock:
+            _SlowAgent.active += 1
+            _SlowAgent.peak = max(_SlowAgent.peak, _SlowAgent.active)
+        time.sleep(0.05)
+        with _SlowAgent.lock:
+            _SlowAgent.active -= 1
+        return 0, "ok"
+
+
+class TestResolveAgentLimit(unittest.TestCase):
+
+    def test_model_specific_limit_wins_over_engine(self):
+        limits = {"cursor": AgentLimit(max_concurrency=4), "cursor/fast": AgentLimit(max_concurrency=1)}
+
+        self.assertEqual(resolve_agent_limit(limits, AgentConfig(model="fast"))[0], "cursor/fast")
+        self.assertEqual(resolve_agent_limit(limits, AgentConfig(model="other"))[0], "cursor")
+        self.assertIsNone(resolve_agent_limit(limits, AgentConfig(engine="claude")))
+
+
+class TestHostRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.limiter = HostRateLimiter(self.tmp.name)
+        _SlowAgent.active = _SlowAgent.peak = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_max_concurrency_caps_in_flight_prompts(self):
+        limit = AgentLimit(max_concurrency=2)
+
+        def worker() -> None:
+            # Separate limiter instances stand in for separate processes.
+            agent = RateLimitedAgent(_SlowAgent(), HostRateLimiter(self.tmp.name), "cursor", limit)
+            agent.run_prompt("p")
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertLessEqual(_SlowAgent.peak, 2)
+
+    def test_token_bucket_spaces_requests_after_burst(self):
+        limit = AgentLimit(requests_per_minute=1200, burst=1)  # one token per 50ms
+
+        started = time.monotonic()
+        for _ in range(3):
+            with self.limiter.acquire("cursor", limit) as acquired:
+                self.assertTrue(acquired)
+        elapsed = time.monotonic() - started
+
+        self.assertGreaterEqual(elapsed, 0.09)
+
+    def test_cancel_while_waiting_returns_cancelled(self):
+        limit = AgentLimit(max_concurrency=1)
+        inner = FakeAgent()
+        waiting = RateLimitedAgent(inner, self.limiter, "cursor", limit)
+
+        with self.limiter.acquire("cursor", limit):
+            threading.Timer(0.05, waiting.cancel).start()
+            exit_code, _ = waiting.run_prompt("p")
+
+        self.assertEqual(exit_code, 130)
+        self.assertEqual(inner.prompts, [])
+
+
+class TestLoadAgentLimits(unittest.TestCase):
+
+    def test_parses_file_and_rejects_invalid_values(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "limits.json"
+            path.write_text(json.dumps({"cursor": {"max_concurrency": 3, "requests_per_minute": 20}}))
+            self.assertEqual(
+                load_agent_limits(path),
+                {"cursor": AgentLimit(max_concurrency=3, requests_per_minute=20)},
+            )
+
+            path.write_text(json.dumps({"cursor": {"max_concurrency": 0}}))
+            with self.assertRaises(ValueError):
+                load_agent_limits(path)
+
+            self.assertEqual(load_agent_limits(Path(tmp) / "missing.json"), {})
@@ -0,0 +1,42 @@
+"""Tests for run retention -- which runs a RetentionPolicy expires."""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from macros.domain.model.retention import RetentionPolicy
+from macros.domain.model.run import Run, RunStatus
+from macros.domain.services.retention import select_expired
+
+
+T0 = datetime(2026, 3, 10, tzinfo=timezone.utc)
+
+
+def _runs(*statuses: RunStatus) -> list[Run]:
+    """Runs newest first, one day apart."""
+    return [
+        Run(id=f"r{i}", workflow_id="fix", status=status, started_at=T0 - timedelta(days=i))
+        for i, status in enumerate(statuses)
+    ]
+
+
+class TestSelectExpired(unittest.TestCase):
+
+    def test_keep_last_expires_older_finished_runs_only(self):
+        runs = _runs(RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.RUNNING, RunStatus.COMPLETED)
+
+        expired = select_expired(runs, RetentionPolicy(keep_last=1))
+
+        self.assertEqual([r.id for r in expired], ["r1", "r3"])
+
+    def test_age_cutoff_combined_with_keep_last(self):
+        runs = _runs(RunStatus.COMPLETED, RunStatus.COMPLETED, RunStatus.RUNNING, RunStatus.COMPLETED)
+        policy = RetentionPolicy(keep_last=3, older_than=T0 - timedelta(days=1, hours=12))
+
+        self.assertEqual([r.id for r in select_expired(runs, policy)], ["r3"])
+        self.assertEqual(
+            [r.id for r in select_expired(runs, RetentionPolicy(older_than=policy.older_than))],
+            ["r2", "r3"],
+        )
+
+    def test_empty_policy_expires_nothing(self):
+        self.assertEqual(select_expired(_runs(RunStatus.COMPLETED), RetentionPolicy()), [])
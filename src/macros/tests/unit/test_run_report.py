@@ -0,0 +1,213 @@
+"""Tests for build_report -- per-run time breakdown and critical path."""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from macros.domain.model.agent_config import AgentConfig
+from macros.domain.model.run import PhaseRun, Run, RunStatus, StepRun, ValidationRun
+from macros.domain.services.run_report import build_report
+from macros.tests.helpers import make_phase, make_workflow
+
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+AGENT = AgentConfig(engine="cursor")
+
+
+def _at(seconds: float) -> datetime:
+    return T0 + timedelta(seconds=seconds)
+
+
+def _step(
+    step_id: str, start: float, end: float, *, agent: bool = True,
+    iteration: int = 1, phase_id: str = "p", attempt: int | None = None,
+) -> StepRun:
+    return StepRun(
+        step_id=step_id,
+        phase_id=phase_id,
+        iteration=iteration,
+        started_at=_at(start),
+        finished_at=_at(end),
+        output="",
+        exit_code=0,
+        agent_config=AGENT if agent else None,
+        attempt=attempt,
+    )
+
+
+def _validation(start: float, end: float, iteration: int = 1, exit_code: int = 0) -> ValidationRun:
+    return ValidationRun(
+        iteration=iteration, started_at=_at(start), finished_at=_at(end), exit_code=exit_code
+    )
+
+
+def _phase_run(
+    phase_id: str, start: float, end: float, *, steps=(), validations=(),
+    outcome: str = "converged", iteration: int = 1,
+) -> PhaseRun:
+    return PhaseRun(
+        phase_id=phase_id,
+        iteration=iteration,
+        outcome=outcome,
+        step_runs=tuple(steps),
+        output="",
+        validation_output=None,
+        started_at=_at(start),
+        finished_at=_at(end),
+        validation_runs=tuple(validations),
+    )
+
+
+def _run(*phase_runs: PhaseRun, end: float | None = None) -> Run:
+    return Run(
+        id="r1",
+        workflow_id="fix",
+        status=RunStatus.COMPLETED,
+        phase_runs=list(phase_runs),
+        started_at=T0,
+        finished_at=_at(end) if end is not None else None,
+    )
+
+
+class TestTimeBreakdown(unittest.TestCase):
+
+    def test_splits_phase_time_into_agent_command_validation_and_overhead(self):
+        # GIVEN an agent step, a command step and a validation inside a 20s phase
+        pr = _phase_run(
+            "p", 0, 20,
+            steps=[_step("code", 1, 11), _step("lint", 11, 14, agent=False)],
+            validations=[_validation(14, 18)],
+        )
+
+        # WHEN
+        report = build_report(_run(pr, end=21))
+
+        # THEN
+        b = report.phases[0].breakdown
+        self.assertEqual(
+            (b.agent_seconds, b.command_seconds, b.validation_seconds, b.overhead_seconds),
+            (10, 3, 4, 3),
+        )
+        self.assertEqual(report.wall_seconds, 21)
+        self.assertEqual(report.breakdown.overhead_seconds, 4)
+
+    def test_iterations_cover_the_phase_wall_time(self):
+        # GIVEN two iterations with bookkeeping between them
+        pr = _phase_run(
+            "p", 0, 30,
+            steps=[_step("code", 1, 10, iteration=1), _step("code", 15, 25, iteration=2)],
+            validations=[
+                _validation(10, 12, iteration=1, exit_code=1), _validation(25, 28, iteration=2),
+            ],
+            iteration=2,
+        )
+
+        # WHEN
+        phase = build_report(_run(pr)).phases[0]
+
+        # THEN each iteration runs until the next starts
+        first, second = phase.iterations
+        self.assertEqual(first.breakdown.total_seconds, 15)
+        self.assertEqual(first.breakdown.overhead_seconds, 4)
+        self.assertEqual(second.breakdown.total_seconds, 15)
+        self.assertEqual(first.breakdown.total_seconds + second.breakdown.total_seconds, 30)
+
+    def test_run_without_finish_time_ends_at_last_phase(self):
+        report = build_report(_run(_phase_run("p", 0, 12)))
+
+        self.assertEqual(report.wall_seconds, 12)
+
+
+class TestReportFindings(unittest.TestCase):
+
+    def test_slowest_steps_are_ranked_by_duration(self):
+        pr = _phase_run("p", 0, 30, steps=[
+            _step("a", 0, 5), _step("b", 5, 20), _step("c", 20, 22, agent=False),
+        ])
+
+        report = build_report(_run(pr), slowest=2)
+
+        self.assertEqual([s.step_id for s in report.slowest_steps], ["b", "a"])
+        self.assertEqual(report.slowest_steps[0].kind, "agent")
+
+    def test_exhausted_phases_count_as_waste(self):
+        run = _run(
+            _phase_run("analyze", 0, 10),
+            _phase_run("implement", 10, 70, outcome="exhausted", iteration=5),
+        )
+
+        report = build_report(run)
+
+        self.assertEqual(report.wasted_iterations, 5)
+        self.assertEqual(report.wasted_seconds, 60)
+
+    def test_command_steps_after_the_agent_could_run_concurrently(self):
+        # GIVEN an agent step followed by three independent commands
+        pr = _phase_run("p", 0, 40, steps=[
+            _step("code", 0, 10),
+            _step("test", 10, 20, agent=False),
+            _step("lint", 20, 25, agent=False),
+            _step("types", 25, 33, agent=False),
+        ])
+
+        # WHEN
+        report = build_report(_run(pr))
+
+        # THEN the commands only need as long as the slowest of them
+        self.assertEqual(report.step_savings, 13)
+
+    def test_agent_step_waits_for_everything_before_it(self):
+        pr = _phase_run("p", 0, 30, steps=[
+            _step("install", 0, 10, agent=False),
+            _step("code", 10, 20),
+            _step("review", 20, 30),
+        ])
+
+        self.assertEqual(build_report(_run(pr)).step_savings, 0)
+
+    def test_speculative_attempts_are_not_counted_as_savings(self):
+        pr = _phase_run("p", 0, 10, steps=[
+            _step("code", 0, 10, attempt=0), _step("check", 0, 8, agent=False, attempt=1),
+        ])
+
+        self.assertEqual(build_report(_run(pr)).step_savings, 0)
+
+
+class TestCriticalPath(unittest.TestCase):
+
+    def test_phases_reading_the_same_output_could_run_concurrently(self):
+        # GIVEN lint and security both read implement, and nothing reads them
+        workflow = make_workflow(phases=(
+            make_phase("implement", on_complete="lint"),
+            make_phase("lint", context=("implement",), on_complete="security"),
+            make_phase("security", context=("implement",)),
+        ))
+        run = _run(
+            _phase_run("implement", 0, 60),
+            _phase_run("lint", 60, 80),
+            _phase_run("security", 80, 110),
+        )
+
+        # WHEN
+        report = build_report(run, workflow)
+
+        # THEN
+        self.assertEqual(report.critical_path_seconds, 90)
+        self.assertEqual(report.phase_savings, 20)
+
+    def test_rerun_of_a_phase_follows_its_previous_run(self):
+        workflow = make_workflow(phases=(make_phase("a"), make_phase("b")))
+        run = _run(_phase_run("a", 0, 10), _phase_run("b", 10, 15), _phase_run("a", 15, 25))
+
+        report = build_report(run, workflow)
+
+        self.assertEqual(report.critical_path_seconds, 20)
+
+    def test_without_workflow_phase_estimates_are_unknown(self):
+        report = build_report(_run(_phase_run("a", 0, 10)))
+
+        self.assertIsNone(report.critical_path_seconds)
+        self.assertIsNone(report.phase_savings)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Tests for RunStatistics -- cross-run convergence and latency aggregation."""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from macros.domain.model.run import PhaseRun, Run, RunStatus, StepRun, ValidationRun
+from macros.domain.services.run_statistics import RunStatistics, percentile
+
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _phase_run(
+    phase_id: str,
+    outcome: str,
+    iteration: int,
+    step_seconds: float = 10,
+    validation_seconds: float | None = None,
+    duration: float = 60,
+) -> PhaseRun:
+    step = StepRun(
+        step_id="s1",
+        phase_id=phase_id,
+        iteration=iteration,
+        started_at=T0,
+        finished_at=T0 + timedelta(seconds=step_seconds),
+        output="",
+        exit_code=0,
+    )
+    validations = ()
+    if validation_seconds is not None:
+        validations = (
+            ValidationRun(
+                iteration=iteration,
+                started_at=T0,
+                finished_at=T0 + timedelta(seconds=validation_seconds),
+                exit_code=0 if outcome == "converged" else 1,
+            ),
+        )
+    return PhaseRun(
+        phase_id=phase_id,
+        iteration=iteration,
+        outcome=outcome,
+        step_runs=(step,),
+        output="",
+        validation_output=None,
+        started_at=T0,
+        finished_at=T0 + timedelta(seconds=duration),
+        validation_runs=validations,
+    )
+
+
+def _run(*phase_runs: PhaseRun, workflow_id: str = "fix") -> Run:
+    return Run(
+        id="r",
+        workflow_id=workflow_id,
+        status=RunStatus.COMPLETED,
+        phase_runs=list(phase_runs),
+        started_at=T0,
+    )
+
+
+class TestPercentile(unittest.TestCase):
+
+    def test_interpolates_between_ranks(self):
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2.5)
+
+    def test_extremes(self):
+        self.assertEqual(percentile([1, 2, 3], 0), 1)
+        self.assertEqual(percentile([1, 2, 3], 100), 3)
+
+    def test_empty_sample_rejected(self):
+        with self.assertRaises(ValueError):
+            percentile([], 50)
+
+
+class TestRunStatistics(unittest.TestCase):
+
+    def test_convergence_rate_and_outcome_counts(self):
+        stats = RunStatistics().add_all([
+            _run(_phase_run("implement", "converged", 2)),
+            _run(_phase_run("implement", "converged", 4)),
+            _run(_phase_run("implement", "exhausted", 5, duration=300)),
+            _run(_phase_run("implement", "failed", 1)),
+        ]).result()
+
+        self.assertEqual(stats.run_count, 4)
+        ps = stats.phases[0]
+        self.assertEqual(ps.executions, 4)
+        self.assertEqual((ps.converged, ps.exhausted, ps.failed), (2, 1, 1))
+        self.assertEqual(ps.convergence_rate, 0.5)
+        self.assertEqual(ps.mean_iterations_to_converge, 3)
+        self.assertEqual(ps.exhausted_seconds, 300)
+
+    def test_latency_percentiles(self):
+        runs = [
+            _run(_phase_run("implement", "converged", 1, step_seconds=s, validation_seconds=s / 10))
+            for s in range(1, 101)
+        ]
+
+        ps = RunStatistics().add_all(runs).result().phases[0]
+
+        self.assertAlmostEqual(ps.step_latency.p50, 50.5)
+        self.assertAlmostEqual(ps.step_latency.p99, 99.01)
+        self.assertAlmostEqual(ps.validation_latency.p50, 5.05)
+
+    def test_phases_grouped_by_workflow(self):
+        stats = RunStatistics().add_all([
+            _run(_phase_run("analyze", "converged", 1), workflow_id="fix"),
+            _run(_phase_run("analyze", "converged", 1), workflow_id="review"),
+        ]).result()
+
+        self.assertEqual(
+            [(p.workflow_id, p.phase_id) for p in stats.phases],
+            [("fix", "analyze"), ("review", "analyze")],
+        )
+
+    def test_never_converged_has_no_iteration_stats(self):
+        ps = RunStatistics().add_all([
+            _run(_phase_run("implement", "exhausted", 3)),
+        ]).result().phases[0]
+
+        self.assertIsNone(ps.mean_iterations_to_converge)
+        self.assertIsNone(ps.iterations_to_converge)
+        self.assertIsNone(ps.validation_latency)
@@ -0,0 +1,277 @@
+"""Tests for FileRunStore -- manifests, checkpoints and run queries."""
+
+import json
+import os
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from macros.domain.model.run import PhaseRun, Run, RunStatus, ValidationRun
+from macros.domain.model.usage import Usage
+from macros.infrastructure.persistence.run_store import FileRunStore
+from macros.infrastructure.runtime.utils.workspace import set_workspace
+from macros.tests.helpers import init_test_workspace, make_step_run
+
+
+T0 = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class TestFileRunStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.workspace = Path(self.tmp.name)
+        init_test_workspace(self.workspace)
+        self.store = FileRunStore()
+
+    def tearDown(self):
+        set_workspace(None)
+        self.tmp.cleanup()
+
+    def _save_run(self, dir_name: str, workflow_id: str, started_at: datetime) -> str:
+        run_dir = self.workspace / ".macrocycle" / "runs" / dir_name
+        run_dir.mkdir(parents=True)
+        run = Run(
+            id=dir_name,
+            workflow_id=workflow_id,
+            status=RunStatus.COMPLETED,
+            started_at=started_at,
+            artifacts_dir=str(run_dir),
+        )
+        self.store.save_manifest(str(run_dir), run)
+        return str(run_dir)
+
+    def test_manifest_round_trips_validation_runs(self):
+        run_dir = self._save_run("20260301_120000_fix", "fix", T0)
+        run = self.store.load_manifest(run_dir)
+        run.phase_runs.append(PhaseRun(
+            phase_id="implement",
+            iteration=1,
+            outcome="converged",
+            step_runs=(make_step_run("code", "done"),),
+            output="done",
+            validation_output="ok",
+            started_at=T0,
+            finished_at=T0 + timedelta(seconds=5),
+            validation_runs=(ValidationRun(1, T0, T0 + timedelta(seconds=2), 0),),
+        ))
+        self.store.save_manifest(run_dir, run)
+
+        loaded = self.store.load_manifest(run_dir)
+
+        vr = loaded.phase_runs[0].validation_runs[0]
+        self.assertEqual(vr.exit_code, 0)
+        self.assertEqual((vr.finished_at - vr.started_at).total_seconds(), 2)
+        self.assertIsNone(loaded.phase_runs[0].reason)
+
+    def test_manifest_round_trips_stagnation_reason_and_score(self):
+        run_dir = self._save_run("20260301_120000_fix", "fix", T0)
+        run = self.store.load_manifest(run_dir)
+        run.phase_runs.append(PhaseRun(
+            "implement", 2, "exhausted", (), "", "1 failed", T0, T0,
+            validation_runs=(ValidationRun(1, T0, T0, 1, score=3.0),),
+            reason="stagnated",
+        ))
+        self.store.save_manifest(run_dir, run)
+
+        loaded = self.store.load_manifest(run_dir).phase_runs[0]
+        self.assertEqual(loaded.reason, "stagnated")
+        self.assertEqual(loaded.validation_runs[0].score, 3.0)
+        self.assertIsNone(loaded.memoized_from)
+
+    def test_manifest_round_trips_memoized_source_run(self):
+        run_dir = self._save_run("20260301_120000_fix", "fix", T0)
+        run = self.store.load_manifest(run_dir)
+        run.phase_runs.append(PhaseRun(
+            "analyze", 0, "converged", (), "plan", None, T0, T0,
+            memoized_from="20260228_090000_fix",
+        ))
+        self.store.save_manifest(run_dir, run)
+
+        loaded = self.store.load_manifest(run_dir).phase_runs[0]
+        self.assertEqual(loaded.memoized_from, "20260228_090000_fix")
+        self.assertEqual(loaded.output, "plan")
+
+    def test_manifest_round_trips_hedged_steps(self):
+        run_dir = self._save_run("20260301_120000_fix", "fix", T0)
+        run = self.store.load_manifest(run_dir)
+        steps = (replace(make_step_run("code", "done"), hedged=True), make_step_run("lint", "ok"))
+        run.phase_runs.append(PhaseRun("fix", 1, "converged", steps, "done", None, T0, T0))
+        self.store.save_manifest(run_dir, run)
+
+        loaded = self.store.load_manifest(run_dir).phase_runs[0].step_runs
+        self.assertEqual([sr.hedged for sr in loaded], [True, False])
+
+    def test_manifest_records_step_usage_and_totals(self):
+        run_dir = self._save_run("20260301_120000_fix", "fix", T0)
+        run = self.store.load_manifest(run_dir)
+        steps = tuple(
+            replace(make_step_run(f"s{n}", "done"), usage=Usage(
+                prompt_bytes=100, input_tokens=1000, output_tokens=50, cost_usd=0.25, model="gpt-5",
+            ))
+            for n in (1, 2)
+        )
+        run.phase_runs.append(PhaseRun("implement", 1, "converged", steps, "", None, T0, T0))
+        self.store.save_manifest(run_dir, run)
+
+        data = json.loads((Path(run_dir) / "manifest.json").read_text())
+        loaded = self.store.load_manifest(run_dir)
+
+        self.assertEqual(data["usage"]["input_tokens"], 2000)
+        self.assertEqual(data["phase_runs"][0]["usage"]["cost_usd"], 0.5)
+        self.assertEqual(loaded.phase_runs[0].step_runs[0].usage, steps[0].usage)
+        self.assertEqual(loaded.usage, Usage(200, 2000, 100, None, 0.5, "gpt-5"))
+
+    def test_step_event_log_is_stored_as_a_blob(self):
+        run_dir = self._save_run("20260301_120000_fix", "fix", T0)
+        run = self.store.load_manifest(run_dir)
+        log = '{"kind": "edit", "summary": "edit a.py"}\n'
+        step = replace(make_step_run("code", "done"), events=self.store.artifact_store(run_dir).put(log))
+        run.phase_runs.append(PhaseRun("implement", 1, "converged", (step,), "", None, T0, T0))
+        self.store.save_manifest(run_dir, run)
+
+        data = json.loads((Path(run_dir) / "manifest.json").read_text())
+        loaded = self.store.load_manifest(run_dir).phase_runs[0].step_runs[0]
+
+        self.assertIn("events_ref", data["phase_runs"][0]["step_runs"][0])
+        self.assertEqual(loaded.events.text, log)
+
+    def test_packed_run_is_read_from_archive(self):
+        self._save_run("20260301_120000_fix", "fix", T0)
+        run_dir = self._save_run("20260302_120000_fix", "fix", T0 + timedelta(days=1))
+        self.store.write_artifact(run_dir, "implement/output.md", "x" * 10_000)
+
+        saved = self.store.pack_run(run_dir)
+
+        self.assertGreater(saved, 0)
+        self.assertFalse(Path(run_dir).exists())
+        self.assertTrue(self.store.is_packed(run_dir))
+        self.assertEqual(self.store.load_manifest(run_dir).id, "20260302_120000_fix")
+        self.assertEqual([r.id for r in self.store.iter_runs()], ["20260302_120000_fix", "20260301_120000_fix"])
+        latest = self.store.get_latest_run()
+        self.assertEqual(latest.artifacts_dir, run_dir + ".tar.gz")
+
+    def test_get_run_loads_by_id_from_directory_or_archive(self):
+        run_dir = self._save_run("20260301_120000_fix", "fix", T0)
+        self.assertEqual(self.store.get_run("20260301_120000_fix").artifacts_dir, run_dir)
+
+        self.store.pack_run(run_dir)
+
+        self.assertEqual(self.store.get_run("20260301_120000_fix").id, "20260301_120000_fix")
+        self.assertIsNone(self.store.get_run("20260302_120000_fix"))
+        self.assertIsNone(self.store.get_run("../runs/20260301_120000_fix"))
+
+    def test_manifest_references_stored_outputs(self):
+        run_dir = self._save_run("20260301_120000_fix", "fix", T0)
+        artifacts = self.store.artifact_store(run_dir)
+        run = self.store.load_manifest(run_dir)
+        output = artifacts.put("x" * 10_000)
+        run.phase_runs.append(PhaseRun(
+            "implement", 1, "converged", (make_step_run("code", output),),
+            output, artifacts.put("ok"), T0, T0,
+        ))
+        self.store.save_manifest(run_dir, run)
+
+        manifest = (Path(run_dir) / "manifest.json").read_text()
+        loaded = self.store.load_manifest(run_dir).phase_runs[0]
+
+        self.assertNotIn("x" * 100, manifest)
+        self.assertEqual(loaded.output.ref, output.ref)
+        self.assertEqual(loaded.output, "x" * 10_000)
+        self.assertEqual(loaded.step_runs[0].output, "x" * 10_000)
+        self.assertEqual(loaded.validation_output, "ok")
+
+    def test_inline_outputs_of_older_manifests_still_load(self):
+        run_dir = self._save_run("20260301_120000_fix", "fix", T0)
+        run = self.store.load_manifest(run_dir)
+        run.phase_runs.append(PhaseRun("implement", 1, "converged", (), "inline", None, T0, T0))
+        self.store.save_manifest(run_dir, run)
+
+        loaded = self.store.load_manifest(run_dir).phase_runs[0]
+
+        self.assertIsNone(loaded.output.ref)
+        self.assertEqual(loaded.output, "inline")
+        self.assertIsNone(loaded.validation_output)
+
+    def test_packed_run_outputs_load_from_archive(self):
+        run_dir = self._save_run("20260301_120000_fix", "fix", T0)
+        run = self.store.load_manifest(run_dir)
+        output = self.store.artifact_store(run_dir).put("packed output")
+        run.phase_runs.append(PhaseRun("implement", 1, "converged", (), output, None, T0, T0))
+        self.store.save_manifest(run_dir, run)
+        self.store.pack_run(run_dir)
+
+        loaded = self.store.load_manifest(run_dir).phase_runs[0]
+
+        self.assertEqual(loaded.output.text, "packed output")
+
+    def test_delete_run_removes_directory_or_archive(self):
+        first = self._save_run("20260301_120000_fix", "fix", T0)
+        second = self._save_run("20260302_120000_fix", "fix", T0)
+        self.store.pack_run(second)
+
+        self.assertGreater(self.store.delete_run(first), 0)
+        self.assertGreater(self.store.delete_run(second), 0)
+        self.assertEqual(list(self.store.iter_runs()), [])
+
+    def test_iter_unreadable_runs_yields_old_dirs_without_a_manifest(self):
+        runs_dir = self.workspace / ".macrocycle" / "runs"
+        self._save_run("20260301_120000_fix", "fix", T0)
+        crashed = runs_dir / "20260301_130000_fix"
+        crashed.mkdir()
+        corrupt = runs_dir / "20260301_140000_fix"
+        corrupt.mkdir()
+        (corrupt / "manifest.json").write_text("{not json", encoding="utf-8")
+        fresh = runs_dir / "20260301_150000_fix"
+        fresh.mkdir()
+        old = (T0 - timedelta(days=1)).timestamp()
+        for path in (crashed, corrupt, runs_dir / "20260301_120000_fix"):
+            os.utime(path, (old, old))
+
+        found = list(self.store.iter_unreadable_runs(T0))
+
+        self.assertEqual(found, [str(corrupt), str(crashed)])
+
+    def test_corrupt_manifest_is_skipped(self):
+        self._save_run("20260301_120000_fix", "fix", T0)
+        corrupt = self.workspace / ".macrocycle" / "runs" / "20260302_120000_fix"
+        corrupt.mkdir()
+        (corrupt / "manifest.json").write_text('{"id": "x", bad', encoding="utf-8")
+
+        self.assertEqual([r.id for r in self.store.iter_runs()], ["20260301_120000_fix"])
+        self.assertEqual(self.store.get_latest_run().run_id, "20260301_120000_fix")
+
+    def test_iter_runs_newest_first(self):
+        self._save_run("20260301_120000_fix", "fix", T0)
+        self._save_run("20260302_120000_fix", "fix", T0 + timedelta(days=1))
+
+        ids = [r.id for r in self.store.iter_runs()]
+
+        self.assertEqual(ids, ["20260302_120000_fix", "20260301_120000_fix"])
+
+    def test_iter_runs_filters_by_workflow(self):
+        self._save_run("20260301_120000_fix", "fix", T0)
+        self._save_run("20260301_130000_review", "review", T0)
+
+        ids = [r.id for r in self.store.iter_runs(workflow_id="review")]
+
+        self.assertEqual(ids, ["20260301_130000_review"])
+
+    def test_iter_runs_filters_by_since(self):
+        self._save_run("20260301_120000_fix", "fix", T0)
+        self._save_run("20260305_120000_fix", "fix", T0 + timedelta(days=4))
+
+        ids = [r.id for r in self.store.iter_runs(since=T0 + timedelta(days=1))]
+
+        self.assertEqual(ids, ["20260305_120000_fix"])
+
+    def test_iter_runs_empty_workspace(self):
+        self.assertEqual(list(self.store.iter_runs()), [])
+
+    def test_create_run_dir_is_unique_for_concurrent_runs(self):
+        dirs = {self.store.create_run_dir("fix") for _ in range(3)}
+
+        self.assertEqual(len(dirs), 3)
+        self.assertTrue(all(d.endswith("_fix") for d in dirs))
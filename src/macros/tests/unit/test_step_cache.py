@@ -0,0 +1,61 @@
+"""Tests for FileStepCache -- keys, hits, restored output files and pruning."""
+
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from macros.infrastructure.persistence.step_cache import FileStepCache
+
+
+class TestFileStepCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "package.json").write_text('{"deps": 1}')
+        self.cache = FileStepCache(workspace_dir=self.root)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key_tracks_command_and_input_contents(self):
+        key = self.cache.key("npm ci", ("package*.json",))
+
+        self.assertEqual(key, self.cache.key("npm ci", ("package*.json",)))
+        self.assertNotEqual(key, self.cache.key("npm install", ("package*.json",)))
+        (self.root / "package.json").write_text('{"deps": 2}')
+        self.assertNotEqual(key, self.cache.key("npm ci", ("package*.json",)))
+
+    def test_hit_restores_output_and_files(self):
+        (self.root / "gen").mkdir()
+        (self.root / "gen" / "api.py").write_text("generated\n")
+        key = self.cache.key("codegen", ("package.json",))
+        self.cache.save(key, ("gen/**/*.py",), 0, "wrote 1 file")
+        (self.root / "gen" / "api.py").unlink()
+
+        hit = self.cache.restore(key)
+
+        self.assertEqual(hit, (0, "wrote 1 file"))
+        self.assertEqual((self.root / "gen" / "api.py").read_text(), "generated\n")
+
+    def test_miss_returns_none(self):
+        self.assertIsNone(self.cache.restore(self.cache.key("npm ci", ("package.json",))))
+
+    def test_prune_removes_entries_unused_since_cutoff(self):
+        stale = self.cache.key("old", ("package.json",))
+        fresh = self.cache.key("new", ("package.json",))
+        self.cache.save(stale, (), 0, "old")
+        self.cache.save(fresh, (), 0, "new")
+        result = self.root / ".macrocycle" / "cache" / "steps" / stale[:2] / stale / "result.json"
+        week_ago = time.time() - 7 * 86400
+        os.utime(result, (week_ago, week_ago))
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=1)
+        self.assertEqual(self.cache.prune(cutoff, dry_run=True), 1)
+        self.assertEqual(self.cache.prune(cutoff), 1)
+
+        self.assertIsNone(self.cache.restore(stale))
+        self.assertEqual(self.cache.restore(fresh), (0, "new"))
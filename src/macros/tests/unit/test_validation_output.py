@@ -0,0 +1,53 @@
+"""Tests for validation output helpers -- normalization, failure counts and scores."""
+
+import unittest
+
+from macros.domain.model.workflow import Score
+from macros.domain.services.validation_output import (
+    normalize_output,
+    output_digest,
+    parse_failure_count,
+    parse_score,
+)
+
+
+class TestParseFailureCount(unittest.TestCase):
+
+    def test_pytest_summary_sums_failures_and_errors(self):
+        out = "FAILED tests/test_a.py::test_x\n==== 2 failed, 10 passed, 1 error in 0.52s ===="
+        self.assertEqual(parse_failure_count(out), 3)
+
+    def test_jest_uses_tests_line(self):
+        out = "Test Suites: 1 failed, 2 total\nTests:       4 failed, 8 passed, 12 total\nTime: 1.2 s"
+        self.assertEqual(parse_failure_count(out), 4)
+
+    def test_tsc_and_eslint(self):
+        self.assertEqual(parse_failure_count("Found 7 errors in 3 files."), 7)
+        self.assertEqual(parse_failure_count("✖ 12 problems (10 errors, 2 warnings)"), 12)
+
+    def test_unrecognized_output(self):
+        self.assertIsNone(parse_failure_count("Segmentation fault"))
+
+
+class TestParseScore(unittest.TestCase):
+
+    def test_default_score_is_failure_count(self):
+        self.assertEqual(parse_score("== 3 failed, 1 error in 2s ==", Score()), 4.0)
+
+    def test_pattern_uses_last_match(self):
+        score = Score(pattern=r"coverage: ([\d.]+)%")
+        self.assertEqual(parse_score("coverage: 50%\ncoverage: 72.5%", score), 72.5)
+        self.assertIsNone(parse_score("no numbers", score))
+
+
+class TestNormalizeOutput(unittest.TestCase):
+
+    def test_run_noise_does_not_change_digest(self):
+        a = "\x1b[31m1 failed\x1b[0m in 0.31s at 2026-03-01T12:00:00Z obj 0x7f3a in /tmp/pytest-1/x"
+        b = "1 failed in 1.07s at 2026-03-02T08:30:11Z obj 0x9c01 in /tmp/pytest-9/x"
+
+        self.assertEqual(output_digest(a), output_digest(b))
+        self.assertNotEqual(output_digest(a), output_digest("2 failed"))
+
+    def test_whitespace_collapsed(self):
+        self.assertEqual(normalize_output("  a\n\n b\t c "), "a b c")
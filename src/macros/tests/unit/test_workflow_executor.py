@@ -1,9 +1,10 @@
 """Tests for WorkflowExecutor -- the outer control loop."""
 
 import unittest
+from datetime import datetime
 
 from macros.domain.model.agent_config import AgentConfig
-from macros.domain.model.run import RunStatus
+from macros.domain.model.run import Run, RunStatus
 from macros.domain.model.step import LlmStep
 from macros.domain.model.workflow import Phase, Validation
 from macros.domain.services.phase_executor import PhaseExecutor
@@ -13,12 +14,48 @@ from macros.tests.helpers import (
     FakeAgent,
     FakeCommand,
     FakeConsole,
+    FakePhaseMemo,
     FakeRunStore,
+    FakeWorkspace,
     make_workflow,
     make_phase,
 )
 
 
+class RecordingMetrics:
+    """MetricsPort that remembers the runs it observed and its flushes."""
+
+    def __init__(self) -> None:
+        self.runs: list[RunStatus] = []
+        self.flushes = 0
+
+    def observe_phase(self, workflow_id, phase_run) -> None:
+        pass
+
+    def observe_run(self, run) -> None:
+        self.runs.append(run.status)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+class StatusRecordingStore(FakeRunStore):
+    """FakeRunStore that also records each saved manifest's status and finish time."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.saved: list[tuple[RunStatus, datetime | None]] = []
+
+    def save_manifest(self, run_dir: str, run: Run) -> None:
+        super().save_manifest(run_dir, run)
+        self.saved.append((run.status, run.finished_at))
+
+
+class CrashingAgent(FakeAgent):
+    def run_prompt(self, prompt: str, cwd: str | None = None) -> tuple[int, str]:
+        raise RuntimeError("agent exploded")
+
+
 class TestWorkflowExecutor(unittest.TestCase):
 
     def _make_executor(
@@ -26,6 +63,9 @@ class TestWorkflowExecutor(unittest.TestCase):
         agent: FakeAgent | None = None,
         command: FakeCommand | None = None,
         store: FakeRunStore | None = None,
+        memo: FakePhaseMemo | None = None,
+        workspace: FakeWorkspace | None = None,
+        metrics: RecordingMetrics | None = None,
     ) -> WorkflowExecutor:
         agent = agent or FakeAgent()
         command = command or FakeCommand()
@@ -48,6 +88,9 @@ class TestWorkflowExecutor(unittest.TestCase):
             phase_executor=phase_executor,
             store=store,
             console=self._console,
+            memo=memo,
+            workspace=workspace,
+            metrics=metrics,
         )
 
     def test_single_phase_workflow_completes(self):
@@ -81,9 +124,9 @@ class TestWorkflowExecutor(unittest.TestCase):
         agent = FakeAgent(auto_increment=True)
         original_run_prompt = agent.run_prompt
 
-        def tracking_run(prompt: str) -> tuple[int, str]:
+        def tracking_run(prompt: str, cwd: str | None = None) -> tuple[int, str]:
             prompts_seen.append(prompt)
-            return original_run_prompt(prompt)
+            return original_run_prompt(prompt, cwd)
 
         agent.run_prompt = tracking_run
 
@@ -102,6 +145,55 @@ class TestWorkflowExecutor(unittest.TestCase):
         last_prompt = prompts_seen[-1]
         self.assertIn("Output from call 1", last_prompt)
 
+    def test_undeclared_context_passes_only_referenced_outputs(self):
+        contexts = []
+        executor = self._make_executor(FakeAgent(auto_increment=True))
+        original_execute = executor._phase_executor.execute
+
+        def tracking_execute(phase, context, *args, **kwargs):
+            contexts.append(dict(context.phase_outputs))
+            return original_execute(phase, context, *args, **kwargs)
+
+        executor._phase_executor.execute = tracking_execute
+        wf = make_workflow(phases=(
+            make_phase("a", on_complete="b"),
+            make_phase("b", on_complete="c"),
+            make_phase("c", steps=(LlmStep(id="s3", prompt="Final: {{PHASE_OUTPUT:a}}"),)),
+        ))
+
+        executor.execute(wf, "hello")
+
+        self.assertEqual(list(contexts[1]), [])
+        self.assertEqual(list(contexts[2]), ["a"])
+
+    def test_reports_progress_events(self):
+        executor = self._make_executor(
+            FakeAgent(auto_increment=True),
+            FakeCommand(responses=[(1, "1 failed"), (0, "ok")]),
+        )
+        wf = make_workflow(phases=(
+            make_phase("fix", max_iterations=2, validation=Validation(command="pytest")),
+        ))
+
+        run = executor.execute(wf, "input")
+
+        names = [name for name, _ in self._console.events]
+        self.assertEqual(names, [
+            "run_start", "phase_start",
+            "iteration", "step_start", "step_end", "validation",
+            "iteration", "step_start", "step_end", "validation",
+            "checkpoint", "phase_end", "run_end",
+        ])
+        fields = dict(self._console.events)
+        self.assertEqual(fields["step_end"]["step_id"], "s1")
+        self.assertGreaterEqual(fields["step_end"]["duration_s"], 0)
+        self.assertEqual(fields["validation"]["exit_code"], 0)
+        self.assertEqual(fields["phase_end"]["outcome"], "converged")
+        self.assertEqual(fields["run_end"], {
+            "run_id": run.id, "status": "completed", "failure_reason": None,
+            "duration_s": fields["run_end"]["duration_s"],
+        })
+
     def test_stop_after_halts_at_specified_phase(self):
         executor = self._make_executor(FakeAgent(auto_increment=True))
         wf = make_workflow(phases=(
@@ -163,6 +255,19 @@ class TestWorkflowExecutor(unittest.TestCase):
         self.assertEqual(run.phase_runs[0].outcome, "exhausted")
         self.assertEqual(run.phase_runs[1].phase_id, "fallback")
 
+    def test_workdir_is_used_for_steps_and_validation(self):
+        agent = FakeAgent()
+        command = FakeCommand(exit_code=0)
+        executor = self._make_executor(agent=agent, command=command)
+        wf = make_workflow(phases=(
+            make_phase("fix", validation=Validation(command="pytest")),
+        ))
+
+        executor.execute(wf, "input", workdir="/tmp/run")
+
+        self.assertEqual(agent.cwds, ["/tmp/run"])
+        self.assertEqual(command.cwds, ["/tmp/run"])
+
     def test_input_saved_as_artifact(self):
         store = FakeRunStore()
         executor = self._make_executor(store=store)
@@ -198,3 +303,79 @@ class TestWorkflowExecutor(unittest.TestCase):
         ]
         self.assertEqual(len(output_artifacts), 1)
         self.assertIn("result", output_artifacts[0][2])
+
+    def test_memoized_phase_reuses_an_earlier_converged_output(self):
+        # GIVEN a memoized analyze phase feeding an implement phase
+        memo = FakePhaseMemo()
+        agent = FakeAgent(auto_increment=True)
+        wf = make_workflow(phases=(
+            make_phase("analyze", on_complete="implement", memoize=True),
+            make_phase(
+                "implement",
+                steps=(LlmStep(id="s1", prompt="Plan: {{PHASE_OUTPUT:analyze}}"),),
+            ),
+        ))
+        first = self._make_executor(
+            agent, memo=memo, workspace=FakeWorkspace(fingerprints=["clean"] * 2)
+        ).execute(wf, "ticket 42")
+
+        # WHEN the same ticket runs again on the same workspace
+        second = self._make_executor(
+            agent, memo=memo, workspace=FakeWorkspace(fingerprints=["clean"])
+        ).execute(wf, "ticket 42")
+
+        # THEN analyze is skipped and implement reads the remembered output
+        self.assertEqual(second.status, RunStatus.COMPLETED)
+        analyze = second.phase_runs[0]
+        self.assertEqual(analyze.memoized_from, first.id)
+        self.assertEqual((analyze.outcome, analyze.iteration), ("converged", 0))
+        self.assertEqual(analyze.step_runs, ())
+        self.assertEqual(agent.call_count, 3)
+        self.assertEqual(agent.prompts[-1], "Plan: Output from call 1")
+        phase_ends = [f for name, f in self._console.events if name == "phase_end"]
+        self.assertEqual(phase_ends[0]["memoized_from"], first.id)
+
+    def test_phase_that_changed_the_workspace_is_not_memoized(self):
+        memo = FakePhaseMemo()
+        wf = make_workflow(phases=(make_phase("implement", memoize=True),))
+
+        self._make_executor(
+            memo=memo, workspace=FakeWorkspace(fingerprints=["before", "after"])
+        ).execute(wf, "input")
+
+        self.assertEqual(memo.entries, {})
+
+    def test_phases_without_memoize_always_execute(self):
+        memo = FakePhaseMemo()
+        agent = FakeAgent()
+        wf = make_workflow(phases=(make_phase("analyze"),))
+
+        for _ in range(2):
+            self._make_executor(
+                agent, memo=memo, workspace=FakeWorkspace(fingerprints=["clean"] * 2)
+            ).execute(wf, "input")
+
+        self.assertEqual(memo.entries, {})
+        self.assertEqual(agent.call_count, 2)
+
+    def test_run_that_raises_is_still_counted_and_flushed(self):
+        metrics = RecordingMetrics()
+        executor = self._make_executor(CrashingAgent(), metrics=metrics)
+
+        with self.assertRaises(RuntimeError):
+            executor.execute(make_workflow(phases=(make_phase("a"),)), "input")
+
+        self.assertEqual(metrics.runs, [RunStatus.FAILED])
+        self.assertEqual(metrics.flushes, 1)
+
+    def test_run_that_raises_is_checkpointed_as_failed(self):
+        store = StatusRecordingStore()
+        executor = self._make_executor(CrashingAgent(), store=store)
+
+        with self.assertRaises(RuntimeError):
+            executor.execute(make_workflow(phases=(make_phase("a"),)), "input")
+
+        status, finished_at = store.saved[-1]
+        self.assertIs(status, RunStatus.FAILED)
+        self.assertIsNotNone(finished_at)
+        self.assertIn("agent exploded", store.manifests[-1].failure_reason)
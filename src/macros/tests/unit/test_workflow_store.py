@@ -4,7 +4,10 @@ import unittest
 import tempfile
 from pathlib import Path
 
-from macros.domain.exceptions import WorkflowNotFoundError
+from macros.domain.exceptions import WorkflowNotFoundError, WorkflowValidationError
+from macros.domain.model.step import Hedge
+from macros.domain.model.workflow import Score
+from macros.domain.services.workflow_validator import WorkflowValidator
 from macros.infrastructure.persistence.workflow_store import FileWorkflowStore
 from macros.infrastructure.runtime.utils.workspace import set_workspace
 from macros.tests.helpers import init_test_workspace, write_workflow_to_workspace, SAMPLE_WORKFLOW_DICT
@@ -91,3 +94,153 @@ class TestFileWorkflowStore(unittest.TestCase):
         cmd_steps = [s for s in implement.steps if isinstance(s, CommandStep)]
         self.assertEqual(len(cmd_steps), 1)
         self.assertEqual(cmd_steps[0].command, "pytest -q")
+
+    def test_precheck_parsed(self):
+        data = {
+            "id": "pre", "agent": {"engine": "cursor"},
+            "phases": [{
+                "id": "implement",
+                "steps": [{"id": "s", "type": "llm", "prompt": "x"}],
+                "validation": {"command": "pytest -q"},
+                "precheck": True,
+            }],
+        }
+        write_workflow_to_workspace(self.workspace, data)
+
+        wf = self.store.load_workflow("pre")
+
+        self.assertTrue(wf.phases[0].precheck)
+
+    def test_speculation_parsed(self):
+        data = {
+            "id": "spec", "agent": {"engine": "cursor"},
+            "phases": [{
+                "id": "implement",
+                "steps": [{"id": "s", "type": "llm", "prompt": "x"}],
+                "validation": {"command": "pytest -q"},
+                "speculation": {"attempts": 4, "select": "best"},
+            }],
+        }
+        write_workflow_to_workspace(self.workspace, data)
+
+        wf = self.store.load_workflow("spec")
+
+        self.assertEqual(wf.phases[0].speculation.attempts, 4)
+        self.assertEqual(wf.phases[0].speculation.select, "best")
+
+    def test_stagnation_parsed_with_defaults(self):
+        data = {
+            "id": "stag", "agent": {"engine": "cursor"},
+            "phases": [{
+                "id": "implement",
+                "steps": [{"id": "s", "type": "llm", "prompt": "x"}],
+                "validation": {"command": "pytest -q"},
+                "stagnation": {"no_progress_iterations": 3},
+            }],
+        }
+        write_workflow_to_workspace(self.workspace, data)
+
+        stagnation = self.store.load_workflow("stag").phases[0].stagnation
+
+        self.assertTrue(stagnation.identical_output)
+        self.assertTrue(stagnation.unchanged_workspace)
+        self.assertEqual(stagnation.no_progress_iterations, 3)
+
+    def test_validation_extras_rollback_and_memoize_parsed(self):
+        data = {
+            "id": "roll", "agent": {"engine": "cursor"},
+            "phases": [{
+                "id": "implement",
+                "steps": [{"id": "s", "type": "llm", "prompt": "x"}],
+                "validation": {
+                    "command": "cov",
+                    "score": {"pattern": "(\\d+)%", "maximize": True},
+                    "incremental_command": "pytest {{CHANGED_FILES}}",
+                },
+                "rollback": True,
+                "memoize": True,
+            }],
+        }
+        write_workflow_to_workspace(self.workspace, data)
+
+        phase = self.store.load_workflow("roll").phases[0]
+
+        self.assertTrue(phase.rollback)
+        self.assertTrue(phase.memoize)
+        self.assertEqual(phase.validation.score, Score(pattern="(\\d+)%", maximize=True))
+        self.assertEqual(phase.validation.incremental_command, "pytest {{CHANGED_FILES}}")
+
+    def test_command_step_cache_fields_parsed(self):
+        data = {
+            "id": "setup", "agent": {"engine": "cursor"},
+            "phases": [{
+                "id": "deps",
+                "steps": [{
+                    "id": "install", "type": "command", "command": "npm ci",
+                    "inputs": ["package.json", "package-lock.json"], "outputs": ["node_modules/**/*"],
+                }],
+            }],
+        }
+        write_workflow_to_workspace(self.workspace, data)
+
+        step = self.store.load_workflow("setup").phases[0].steps[0]
+
+        self.assertEqual(step.inputs, ("package.json", "package-lock.json"))
+        self.assertEqual(step.outputs, ("node_modules/**/*",))
+
+    def test_llm_step_hedge_parsed(self):
+        data = {
+            "id": "hedged", "agent": {"engine": "cursor"},
+            "phases": [{
+                "id": "fix",
+                "steps": [{"id": "code", "prompt": "x", "hedge": {"model": "fast", "percentile": 90}}],
+            }],
+        }
+        write_workflow_to_workspace(self.workspace, data)
+
+        step = self.store.load_workflow("hedged").phases[0].steps[0]
+
+        self.assertEqual(step.hedge, Hedge(percentile=90, model="fast"))
+
+    def test_undeclared_context_inferred_from_prompts(self):
+        data = {
+            "id": "infer", "agent": {"engine": "cursor"},
+            "phases": [
+                {"id": "analyze", "steps": [{"id": "s1", "prompt": "{{INPUT}}"}], "on_complete": "plan"},
+                {"id": "plan", "steps": [{"id": "s2", "prompt": "From {{PHASE_OUTPUT:analyze}}"}]},
+            ],
+        }
+        write_workflow_to_workspace(self.workspace, data)
+
+        wf = self.store.load_workflow("infer")
+
+        self.assertEqual(wf.phases[0].context, ())
+        self.assertEqual(wf.phases[1].context, ("analyze",))
+
+    def test_inferred_reference_to_unknown_phase_loads_with_warning(self):
+        data = {
+            "id": "typo", "agent": {"engine": "cursor"},
+            "phases": [
+                {"id": "plan", "steps": [{"id": "s1", "prompt": "From {{PHASE_OUTPUT:analyse}}"}]},
+            ],
+        }
+        write_workflow_to_workspace(self.workspace, data)
+
+        wf = self.store.load_workflow("typo")
+
+        self.assertEqual(
+            WorkflowValidator().warnings(wf),
+            ["Phase 'plan' references output of unknown phase 'analyse'"],
+        )
+
+    def test_declared_context_must_name_existing_phases(self):
+        data = {
+            "id": "typo", "agent": {"engine": "cursor"},
+            "phases": [
+                {"id": "plan", "context": ["analyse"], "steps": [{"id": "s1", "prompt": "x"}]},
+            ],
+        }
+        write_workflow_to_workspace(self.workspace, data)
+
+        with self.assertRaises(WorkflowValidationError):
+            self.store.load_workflow("typo")
@@ -3,8 +3,8 @@
 import unittest
 
 from macros.domain.exceptions import WorkflowValidationError
-from macros.domain.model.step import LlmStep
-from macros.domain.model.workflow import Phase, Validation
+from macros.domain.model.step import CommandStep, Hedge, LlmStep
+from macros.domain.model.workflow import Phase, Score, Speculation, Stagnation, Validation
 from macros.domain.services.workflow_validator import WorkflowValidator
 from macros.tests.helpers import make_workflow, make_phase
 
@@ -95,3 +95,90 @@ class TestWorkflowValidator(unittest.TestCase):
         )
         wf = make_workflow(phases=(phase,))
         self.validator.validate(wf)
+
+    def test_precheck_without_validation_rejected(self):
+        wf = make_workflow(phases=(make_phase("a", precheck=True),))
+        with self.assertRaises(WorkflowValidationError) as ctx:
+            self.validator.validate(wf)
+        self.assertIn("precheck requires a validation command", str(ctx.exception))
+
+    def test_speculation_without_validation_rejected(self):
+        wf = make_workflow(phases=(make_phase("a", speculation=Speculation(attempts=3)),))
+        with self.assertRaises(WorkflowValidationError) as ctx:
+            self.validator.validate(wf)
+        self.assertIn("speculation requires a validation command", str(ctx.exception))
+
+    def test_speculation_unknown_select_rejected(self):
+        phase = make_phase(
+            "a",
+            validation=Validation(command="pytest"),
+            speculation=Speculation(attempts=3, select="fastest"),
+        )
+        with self.assertRaises(WorkflowValidationError) as ctx:
+            self.validator.validate(make_workflow(phases=(phase,)))
+        self.assertIn("select must be 'first' or 'best'", str(ctx.exception))
+
+    def test_stagnation_without_validation_rejected(self):
+        wf = make_workflow(phases=(make_phase("a", stagnation=Stagnation()),))
+        with self.assertRaises(WorkflowValidationError) as ctx:
+            self.validator.validate(wf)
+        self.assertIn("stagnation requires a validation command", str(ctx.exception))
+
+    def test_rollback_without_validation_rejected(self):
+        wf = make_workflow(phases=(make_phase("a", rollback=True),))
+        with self.assertRaises(WorkflowValidationError) as ctx:
+            self.validator.validate(wf)
+        self.assertIn("rollback requires a validation command", str(ctx.exception))
+
+    def test_invalid_score_pattern_rejected(self):
+        phase = make_phase("a", validation=Validation(command="pytest", score=Score(pattern="(")))
+        with self.assertRaises(WorkflowValidationError) as ctx:
+            self.validator.validate(make_workflow(phases=(phase,)))
+        self.assertIn("score pattern is invalid", str(ctx.exception))
+
+    def test_command_step_outputs_without_inputs_rejected(self):
+        step = CommandStep(id="gen", command="make gen", outputs=("gen/*",))
+        wf = make_workflow(phases=(make_phase("a", steps=(step,)),))
+        with self.assertRaises(WorkflowValidationError) as ctx:
+            self.validator.validate(wf)
+        self.assertIn("declares outputs without inputs", str(ctx.exception))
+
+    def test_hedge_with_invalid_percentile_rejected(self):
+        step = LlmStep(id="code", prompt="fix", hedge=Hedge(percentile=0))
+        wf = make_workflow(phases=(make_phase("a", steps=(step,)),))
+        with self.assertRaises(WorkflowValidationError) as ctx:
+            self.validator.validate(wf)
+        self.assertIn("hedge percentile must be in (0, 100]", str(ctx.exception))
+
+    def test_stagnation_zero_window_rejected(self):
+        phase = make_phase(
+            "a",
+            validation=Validation(command="pytest"),
+            stagnation=Stagnation(no_progress_iterations=0),
+        )
+        with self.assertRaises(WorkflowValidationError) as ctx:
+            self.validator.validate(make_workflow(phases=(phase,)))
+        self.assertIn("no_progress_iterations must be >= 1", str(ctx.exception))
+
+    def test_reference_to_phase_that_can_run_earlier_has_no_warning(self):
+        wf = make_workflow(phases=(
+            make_phase("a", on_complete="b"),
+            make_phase("b", steps=(LlmStep(id="s1", prompt="{{PHASE_OUTPUT:a}}"),)),
+        ))
+        self.assertEqual(self.validator.warnings(wf), [])
+
+    def test_reference_to_later_phase_warns(self):
+        wf = make_workflow(phases=(
+            make_phase("a", on_complete="b",
+                       steps=(LlmStep(id="s1", prompt="{{PHASE_OUTPUT:b}}"),)),
+            make_phase("b"),
+        ))
+        warnings = self.validator.warnings(wf)
+        self.assertEqual(len(warnings), 1)
+        self.assertIn("'b', which can never have run before it", warnings[0])
+
+    def test_reference_to_unknown_phase_warns(self):
+        wf = make_workflow(phases=(
+            make_phase("a", steps=(LlmStep(id="s1", prompt="{{PHASE_OUTPUT:typo}}"),)),
+        ))
+        self.assertIn("unknown phase 'typo'", self.validator.warnings(wf)[0])
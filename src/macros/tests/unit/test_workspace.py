@@ -0,0 +1,95 @@
+"""Tests for workspace resolution -- process default, scopes and pinned adapters."""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from macros.application.container import Container
+from macros.infrastructure.persistence.run_store import FileRunStore
+from macros.infrastructure.runtime.subprocess_command import SubprocessCommandAdapter
+from macros.infrastructure.runtime.utils.workspace import (
+    get_workspace,
+    set_workspace,
+    use_workspace,
+)
+
+
+class TestWorkspaceScopes(unittest.TestCase):
+
+    def tearDown(self):
+        set_workspace(None)
+
+    def test_scope_overrides_process_default_and_restores(self):
+        set_workspace("/repo/default")
+
+        with use_workspace("/repo/a"):
+            self.assertEqual(get_workspace(), Path("/repo/a"))
+            with use_workspace("/repo/b"):
+                self.assertEqual(get_workspace(), Path("/repo/b"))
+            self.assertEqual(get_workspace(), Path("/repo/a"))
+
+        self.assertEqual(get_workspace(), Path("/repo/default"))
+
+    def test_concurrent_threads_see_their_own_scope(self):
+        set_workspace("/repo/default")
+        barrier = threading.Barrier(2)
+        seen: dict[str, Path] = {}
+
+        def worker(name: str) -> None:
+            with use_workspace(f"/repo/{name}"):
+                barrier.wait()
+                seen[name] = get_workspace()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in ("a", "b")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(seen, {"a": Path("/repo/a"), "b": Path("/repo/b")})
+        self.assertEqual(get_workspace(), Path("/repo/default"))
+
+
+class TestPinnedWorkspace(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        set_workspace(None)
+        self.tmp.cleanup()
+
+    def test_run_store_ignores_process_default(self):
+        set_workspace("/nonexistent")
+        store = FileRunStore(workspace_dir=self.root)
+
+        run_dir = store.create_run_dir("fix")
+
+        self.assertTrue(run_dir.startswith(str(self.root / ".macrocycle" / "runs")))
+
+    def test_command_runs_in_workspace_with_env(self):
+        command = SubprocessCommandAdapter(workspace_dir=self.root, env={"MC_TENANT": "t1"})
+
+        exit_code, output = command.run_command('echo "$PWD $MC_TENANT"')
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output.strip(), f"{self.root} t1")
+
+    def test_command_reports_timeouts_not_exit_code_124(self):
+        command = SubprocessCommandAdapter(timeout=0.2, workspace_dir=self.root)
+
+        command.run_command("sleep 5")
+        self.assertTrue(command.timed_out())
+
+        exit_code, _ = command.run_command("exit 124")
+        self.assertEqual(exit_code, 124)
+        self.assertFalse(command.timed_out())
+
+    def test_container_pins_stores_to_workspace(self):
+        container = Container(workspace_dir=self.root)
+        container.workflow_registry.init_default_workflows()
+
+        self.assertIn("fix", container.workflow_registry.list_workflows())
+        self.assertTrue((self.root / ".macrocycle" / "runs").is_dir())